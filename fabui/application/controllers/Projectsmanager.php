@@ -957,6 +957,7 @@ class Projectsmanager extends FAB_Controller {
 					
 					$file = $this->files->get($fileID, True);
 					shell_exec('sudo rm '.$file['full_path']);
+					shell_exec('sudo rm -f '.$file['full_path'].'.gcc'); // streaming cache
 					$this->files->delete( $fileID );
 				}
 				
@@ -987,6 +988,7 @@ class Projectsmanager extends FAB_Controller {
 			$this->objects->deleteFiles($objectID, $fileID);
 			$file = $this->files->get($fileID, True);
 			shell_exec('sudo rm '.$file['full_path']);
+			shell_exec('sudo rm -f '.$file['full_path'].'.gcc'); // streaming cache
 			$this->files->delete($fileID);
 		}
 		$this->output->set_content_type('application/json')->set_output(json_encode( $response ));
@@ -109,6 +109,25 @@ class FabWebSocketServer implements MessageComponentInterface {
 		);
 		return $this->buildResponse ( 'usb', $messageData );
 	}
+	/**
+	 * return trace lines starting from a sequence number (line number of the trace file)
+	 */
+	public function getTrace($params = array())
+	{
+		$CI = & get_instance ();
+		$CI->load->config('fabtotum');
+		$from  = isset($params['from']) ? intval($params['from']) : 0;
+		$lines = explode("\n", file_get_contents($CI->config->item('trace')));
+		array_pop($lines); // text after the last new line
+		//trace was restarted
+		if($from > count($lines)) $from = 0;
+		$messageData = array(
+			'content' => implode("\n", array_slice($lines, $from)),
+			'seq'     => $from,
+			'reset'   => $from == 0
+		);
+		return $this->buildResponse ( 'trace', $messageData );
+	}
 	/**
 	 * return updates json 
 	 */
@@ -30,6 +30,11 @@ fabApp = (function(app) {
 	app.dropZoneList = new Array();
 	app.favicon_interval = null;
 	app.favicon = '';
+	app.trace_html = ''; //trace console content
+	app.trace_seq = 0; //sequence number of the next trace line
+	app.trace_requested = -1; //sequence number of the requested trace backlog
+	app.task_monitor = null; //last task monitor content
+	app.task_monitor_seq = -1; //sequence number of the last task monitor message, -1 waiting for a snapshot
 	app.FabActions = function(){
 		var fabActions = {	
 			userLogout: function($this){
@@ -990,7 +995,7 @@ fabApp = (function(app) {
 						app.manageJogResponse(obj.data);
 						break;
 					case 'trace':
-						app.handleTrace(obj.data.content);
+						app.handleTrace(obj.data.content, obj.data.seq, obj.data.reset);
 						break;
 					case 'poll':
 						app.handlePollMessage(obj);
@@ -1273,10 +1278,45 @@ fabApp = (function(app) {
 				app.updateNotificationBadge();
 				break;
 			case 'monitor':
+				app.task_monitor = data.content;
+				// snapshots relayed from the monitor file have no sequence number
+				app.task_monitor_seq = (typeof data.seq !== 'undefined') ? data.seq : -1;
+				app.manageTaskMonitor(data);
+				break;
+			case 'monitor_delta':
+				if(app.task_monitor_seq < 0 || data.seq != app.task_monitor_seq + 1){
+					// a message was missed, drop the deltas until the next snapshot
+					app.task_monitor_seq = -1;
+					break;
+				}
+				app.task_monitor_seq = data.seq;
+				// changed values only, handlers get the whole monitor content
+				data.type = 'monitor';
+				data.content = app.mergeTaskMonitor(data.content);
 				app.manageTaskMonitor(data);
 				break;
 		}
 	};
+	/*
+	 * merge changed task monitor values in the last monitor content,
+	 * null groups and keys have been removed
+	 */
+	app.mergeTaskMonitor = function(delta){
+		if(app.task_monitor == null) app.task_monitor = {};
+		$.each(delta, function(group, values) {
+			if(values === null){
+				delete app.task_monitor[group];
+			}else if(typeof app.task_monitor[group] !== 'object' || app.task_monitor[group] === null || $.type(values) !== 'object'){
+				app.task_monitor[group] = values;
+			}else{
+				$.each(values, function(key, value) {
+					if(value === null) delete app.task_monitor[group][key];
+					else app.task_monitor[group][key] = value;
+				});
+			}
+		});
+		return app.task_monitor;
+	};
 	/*
 	 * set tasks
 	 */
@@ -1435,19 +1475,64 @@ fabApp = (function(app) {
 	}
 	/**
 	 * handle trace content from task/macro
-	 */
-	app.handleTrace = function(content) {
-		var contentSplitted = content.split('\n');
+	 * 
+	 * @param {String} content Trace lines
+	 * @param {Integer} seq Sequence number of the first line, undefined if content is the whole trace
+	 * @param {Boolean} reset Trace has been restarted
+	 */
+	app.handleTrace = function(content, seq, reset) {
+		var contentSplitted = content ? content.split('\n') : [];
+		var append = true;
+		
+		if(typeof seq === 'undefined'){
+			// whole trace file
+			seq = 0;
+			reset = true;
+			contentSplitted.pop(); // text after the last new line
+		}
+		
+		if(reset){
+			app.trace_html = '';
+			app.trace_seq = 0;
+			app.trace_requested = -1;
+			append = false;
+		}
+		
+		if(seq > app.trace_seq){
+			// some lines were missed, ask for the backlog
+			app.requestTrace(app.trace_seq);
+			return;
+		}
+		// skip the lines already received
+		contentSplitted = contentSplitted.slice(app.trace_seq - seq);
+		app.trace_seq += contentSplitted.length;
+		if(app.trace_requested >= 0 && app.trace_requested <= seq) app.trace_requested = -1;
+		
 		var html = '';
 		$.each(contentSplitted, function( index, value ) {
 				if(value != '')
 					html += '<p>'+ value +'</p>';
 		});
+		app.trace_html += html;
+		
 		if($(".trace-console").length > 0){
-			$(".trace-console").html(html).scrollTop(1E10);
+			if(append) $(".trace-console").append(html).scrollTop(1E10);
+			else $(".trace-console").html(app.trace_html).scrollTop(1E10);
 			$(".trace-console").parent().scrollTop(1E10);
 		}
-		waitContent(html);
+		waitContent(app.trace_html);
+	}
+	/**
+	 * ask the websocket server for the trace lines starting from a sequence number
+	 * 
+	 * @param {Integer} from Sequence number of the first line
+	 */
+	app.requestTrace = function(from) {
+		if(app.trace_requested >= 0) return; // already waiting for the backlog
+		if(socket_connected && !socket.fallback){
+			app.trace_requested = from;
+			socket.send( JSON.stringify({'function': 'getTrace', 'params': {'from': from}}) );
+		}
 	}
 	/**
 	 * Reset temperatures plot
@@ -1486,6 +1571,7 @@ fabApp = (function(app) {
 	{
 		var freezing_status = ['running', 'aborting', 'completing'];
 		$.get(task_monitor_file_url + '?' + jQuery.now(), function(data, status){
+			if(app.task_monitor == null) app.task_monitor = data; //base for the monitor deltas
 			if(data.task.hasOwnProperty('status')){
 				if(jQuery.inArray( data.task.status, freezing_status ) >= 0 ){
 					app.freezeMenu(data.task.type);
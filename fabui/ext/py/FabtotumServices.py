@@ -39,6 +39,7 @@ from fabtotum.fabui.config              import ConfigService
 from fabtotum.fabui.bootstrap           import hardwareBootstrap
 from fabtotum.fabui.monitor             import StatsMonitor
 from fabtotum.fabui.notify              import NotifyService
+from fabtotum.fabui.eventbus            import EventBus
 from fabtotum.totumduino.gcode          import GCodeService
 from fabtotum.totumduino.hardware       import reset as totumduino_reset
 from fabtotum.utils.pyro.gcodeserver    import GCodeServiceServer
@@ -58,6 +59,8 @@ def signal_handler(signal, frame):
     print "You pressed Ctrl+C!"
     logger.debug("Shutting down services. Please wait...")
     ws.close()
+    bus.stop()
+    ns.stop()
     gcserver.stop()
     gcservice.stop()
     observer.stop()
@@ -123,6 +126,10 @@ USB_FILE            = config.get('usb', 'usb_file')
 ##################################################################
 SERIAL_PORT = config.get('serial', 'PORT')
 SERIAL_BAUD = config.get('serial', 'BAUD')
+SERIAL_RX_BUFFER = int(config.get('serial', 'rx_buffer_size', 0))
+SERIAL_CHECKSUM = int(config.get('serial', 'checksum', 0)) == 1
+SERIAL_RESEND_BUFFER = int(config.get('serial', 'resend_buffer', 256))
+SERIAL_RX_RESERVE = int(config.get('serial', 'rx_reserve', SERIAL_RX_BUFFER // 4))
 ##################################################################
 FABID_ACTIVE = int(config.get('my.fabtotum.com', 'fabid_active', 0)) == 1
 
@@ -178,17 +185,23 @@ conn.close()
 #myFabototumCom = MyFabtotumCom(gcservice, config, logger)
 
 # Start gcode service
-gcservice = GCodeService(SERIAL_PORT, SERIAL_BAUD, logger=logger, fabid=FABID_ACTIVE)
+gcservice = GCodeService(SERIAL_PORT, SERIAL_BAUD, logger=logger, fabid=FABID_ACTIVE, rx_buffer_size=SERIAL_RX_BUFFER,
+                            use_checksum=SERIAL_CHECKSUM, resend_buffer=SERIAL_RESEND_BUFFER, rx_reserve=SERIAL_RX_RESERVE)
 gcservice.start()
 
+# Event bus, tasks publish their state through the Pyro GCodeService wrapper
+bus = EventBus(logger=logger)
+bus.start()
+
 # Pyro GCodeService wrapper
-gcserver = GCodeServiceServer(gcservice)
+gcserver = GCodeServiceServer(gcservice, bus)
 
 ws = WebSocketClient('ws://'+SOCKET_HOST +':'+SOCKET_PORT+'/')
 ws.connect();
 
 # Notification service
 ns = NotifyService(ws, NOTIFY_FILE, config)
+bus.subscribe('task', ns.notify)
 
 ## Folder temp monitor
 ftm = FolderTempMonitor(ns, gcservice, logger, TRACE, TASK_MONITOR)
@@ -26,6 +26,7 @@ __version__ = "1.0"
 import json
 import os
 import ConfigParser
+from StringIO import StringIO
 
 # Import external modules
 from watchdog.observers import Observer
@@ -35,6 +36,7 @@ from watchdog.events import FileSystemEventHandler
 # Import internal modules
 from fabtotum.os.paths        import LIB_PATH
 from fabtotum.utils.singleton import Singleton
+from fabtotum.utils.statefile import StateFileWriter
 
 #####################################################
 
@@ -96,16 +98,16 @@ class ConfigService:
         """
         if section == 'settings':
 
-            with open(self.HW_DEFAULT_SETTINGS, 'w') as outfile:
-                json.dump(self.settings, outfile, sort_keys=True, indent=4)
+            StateFileWriter().write(self.HW_DEFAULT_SETTINGS, json.dumps(self.settings, sort_keys=True, indent=4))
             return True
 
         for cfg in self.config:
             if section in self.config[cfg].sections():
                 data = self.config[cfg]
                 filename = os.path.join(LIB_PATH, cfg + '.ini')
-                with open(filename, 'wb') as f:
-                    data.write(f)
+                f = StringIO()
+                data.write(f)
+                StateFileWriter().write(filename, f.getvalue())
 
         return False
 
@@ -255,8 +257,7 @@ class ConfigService:
         head_file = os.path.join( self.get('hardware', 'heads'), head_name + '.json');
 
         if os.path.exists(head_file):
-            with open(head_file, 'w') as json_f:
-                json.dump(info, json_f, sort_keys=True, indent=4)
+            StateFileWriter().write(head_file, json.dumps(info, sort_keys=True, indent=4))
 
         return None
 
@@ -360,16 +361,14 @@ class ConfigService:
 
                 head['feeder'] = info
 
-                with open(head_file, 'w') as json_f:
-                    json.dump(head, json_f, sort_keys=True, indent=4)
+                StateFileWriter().write(head_file, json.dumps(head, sort_keys=True, indent=4))
                 return True
 
             except Exception as e:
                 return False
 
         try:
-            with open(feeder_file, 'w') as json_f:
-                json.dump(info, json_f, sort_keys=True, indent=4)
+            StateFileWriter().write(feeder_file, json.dumps(info, sort_keys=True, indent=4))
         except Exception as e:
             return False
 
@@ -0,0 +1,163 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import time
+import logging
+from threading import Thread, RLock
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+# Subscribe with this event type to receive all events
+ALL_EVENTS = '*'
+
+class EventBus(object):
+    """
+    In-memory publish/subscribe bus of FabtotumServices. Tasks publish their
+    state through the gcode service connection, see `GCodeServiceServer`,
+    and the subscribers (websocket notifier, file monitor) get the data
+    directly instead of reading it back from the temp files.
+
+    Events are queued by `publish` and delivered by a dispatcher thread so a
+    publisher never waits for a slow subscriber. When the queue is full the
+    oldest event is dropped.
+
+    :param max_queue: Maximum number of pending events
+    :param logger: Logger used to report subscriber errors
+    """
+
+    def __init__(self, max_queue = 256, logger = None):
+        self.lock = RLock()
+        self.subscribers = {}
+        self.last_events = {}
+        self.queue = queue.Queue(max_queue)
+        self.running = False
+        self.dispatcher = None
+        self.dropped = 0
+
+        if logger:
+            self.log = logger
+        else:
+            self.log = logging.getLogger('EventBus')
+
+    def subscribe(self, event_type, callback):
+        """
+        Register **callback** for events of **event_type**. The callback is
+        called as ``callback(event_type, data)`` from the dispatcher thread.
+
+        :param event_type: Event type or `ALL_EVENTS`
+        """
+        with self.lock:
+            callbacks = self.subscribers.setdefault(event_type, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+
+    def unsubscribe(self, event_type, callback):
+        with self.lock:
+            callbacks = self.subscribers.get(event_type, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, event_type, data):
+        """
+        Queue an event for delivery.
+
+        :returns: ``False`` if the bus is not running
+        :rtype: bool
+        """
+        if not self.running:
+            return False
+
+        event = (event_type, data, time.time())
+        while True:
+            try:
+                self.queue.put_nowait(event)
+                return True
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def last(self, event_type):
+        """
+        Get the data and time of the last delivered event of **event_type**.
+
+        :returns: (data, timestamp) or ``None``
+        """
+        return self.last_events.get(event_type)
+
+    def __dispatch(self, event_type, data):
+        with self.lock:
+            callbacks = self.subscribers.get(event_type, []) + self.subscribers.get(ALL_EVENTS, [])
+
+        for callback in callbacks:
+            try:
+                callback(event_type, data)
+            except Exception as e:
+                self.log.error("EventBus: '%s' subscriber failed, %s", event_type, str(e))
+
+    def __dispatcher_thread(self):
+        self.log.debug("EventBus thread: started")
+        while self.running:
+            event = self.queue.get()
+            if event is None:
+                break
+
+            event_type, data, timestamp = event
+            self.last_events[event_type] = (data, timestamp)
+            self.__dispatch(event_type, data)
+
+        self.log.debug("EventBus thread: stopped")
+
+    ### API ###
+
+    def start(self):
+        self.running = True
+        self.dispatcher = Thread( name = "EventBus", target = self.__dispatcher_thread )
+        self.dispatcher.daemon = True
+        self.dispatcher.start()
+
+    def loop(self):
+        if self.dispatcher:
+            self.dispatcher.join()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            # The dispatcher checks running after the current event
+            pass
@@ -31,7 +31,7 @@ import argparse
 import time
 import gettext
 import logging
-from threading import Event, Thread, RLock
+from threading import Event, Thread, RLock, Timer
 
 
 # Import external modules
@@ -39,7 +39,12 @@ from threading import Event, Thread, RLock
 # Import internal modules
 from fabtotum.utils.translation import _, setLanguage
 from fabtotum.fabui.config import ConfigService
+from fabtotum.fabui.monitorstats import MonitorStats, MONITOR
 from fabtotum.utils.gcodefile import GCodeFile, GCodeInfo
+from fabtotum.utils.gcodetime import PrintTimeEstimator, MotionConfig
+from fabtotum.utils.gcodecache import GCodeCache
+from fabtotum.utils.statefile import StateFileWriter
+from fabtotum.totumduino.format import parseM503
 from fabtotum.utils.gmacro import GMacroHandler
 from fabtotum.utils.pyro.gcodeclient import GCodeServiceClient
 from fabtotum.database      import Database, timestamp2datetime, TableItem
@@ -76,6 +81,8 @@ class GCodePusher(object):
     TYPE_LASER          = 'laser'
     
     UPDATE_PERIOD       = 2 # seconds
+    SNAPSHOT_PERIOD     = 10 # seconds, full monitor snapshots when the event bus is used
+    MONITOR_COALESCE    = 0.1 # seconds, monitor updates published together
     
     def __init__(self, log_trace = None, monitor_file = None, gcs = None, 
 				 config = None, use_callback = True, use_stdout = False, 
@@ -114,7 +121,9 @@ class GCodePusher(object):
             'line_total'            : 0,
             'line_current'          : 0,
             'type'                  : GCodeInfo.RAW,
-            'first_move'            : False
+            'first_move'            : False,
+            # Monitor updates are published on the event bus
+            'event_bus'             : True
         }
         
         # Pusher/File specific attributes
@@ -170,6 +179,16 @@ class GCodePusher(object):
         
         self.progress_monitor = None
         self.db = Database(self.config)
+        
+        # Planner based time estimate of the current file
+        self.time_estimate = None
+        self.file_start_offset = 0
+        
+        # Monitor updates go through the event bus as deltas, the file is a snapshot
+        self.use_bus = True
+        self.monitor_stats = MonitorStats(self.standardized_stats, self.SNAPSHOT_PERIOD)
+        self.monitor_timer = None
+        self.snapshot_status = None
     
     def send_notification_email(self, action):
         
@@ -226,18 +245,66 @@ class GCodePusher(object):
         if group not in ['task', 'override', 'gpusher']:
             del self.standardized_stats[group]
     
-    def update_monitor_file(self):
+    def publish_event(self, event_type, data):
         """
-        Write stats to monitor file
-        """
-        # Update duration
-        self.task_stats['duration'] = str( time.time() - float(self.task_stats['started_time']) )
+        Publish an event on the FabtotumServices event bus.
         
-        if self.monitor_file:
-            with open(self.monitor_file,'w+') as file:
-                file.write( json.dumps(self.standardized_stats) )
+        :param event_type: Event type
+        :param data: Event data
+        :returns: ``True`` if the event was published
+        :rtype: bool
+        """
+        if not self.use_bus:
+            return False
         
+        try:
+            if self.gcs.publish(event_type, data):
+                return True
+        except Exception:
+            pass
+        
+        # Local gcode service or no event bus, the file monitor relays the
+        # monitor file from now on
+        self.use_bus = False
+        self.pusher_stats['event_bus'] = False
+        return False
     
+    def update_monitor_file(self):
+        """
+        Publish stats on the event bus and write them to monitor file.
+        Updates within `MONITOR_COALESCE` seconds are published together.
+        """
+        with self.monitor_lock:
+            if self.monitor_timer is None:
+                self.monitor_timer = Timer(self.MONITOR_COALESCE, self.__publish_monitor)
+                self.monitor_timer.start()
+    
+    def __publish_monitor(self):
+        """
+        Publish the changed stats. A full snapshot is published on status
+        changes and every `SNAPSHOT_PERIOD` seconds and only then written to
+        monitor file, unless the event bus is not available.
+        """
+        with self.monitor_lock:
+            self.monitor_timer = None
+            
+            # Update duration
+            self.task_stats['duration'] = str( time.time() - float(self.task_stats['started_time']) )
+            
+            status = self.task_stats['status']
+            message = None
+            published = False
+            if self.use_bus:
+                message = self.monitor_stats.message(full = status != self.snapshot_status)
+                published = message is None or self.publish_event('task', message)
+            
+            if published and (message is None or message['type'] != MONITOR):
+                return
+            
+            self.snapshot_status = status
+            if self.monitor_file:
+                StateFileWriter().write(self.monitor_file, json.dumps(self.standardized_stats))
+        
     def trace(self, log_msg):
         """ 
         Write to log message to trace file
@@ -580,8 +647,13 @@ class GCodePusher(object):
                 
                 first_move = self.pusher_stats['first_move']
                 
+                estimate = self.time_estimate
+                
                 if progress == 0.0 or first_move == False:
                     self.task_stats['estimated_time'] = 0
+                elif estimate:
+                    offset = self.file_start_offset + (estimate.size - self.file_start_offset) * progress / 100.0
+                    self.task_stats['estimated_time'] = dur + estimate.remaining(offset)
                 else:
                     self.task_stats['estimated_time'] = (( dur / float(progress)) * 100.0)
                 
@@ -597,6 +669,25 @@ class GCodePusher(object):
 
             time.sleep(GCodePusher.UPDATE_PERIOD)
     
+    def __time_estimate_thread(self, gcode_file, gfile):
+        """
+        Estimate the print time of **gcode_file** with the motion settings of
+        the unit, the result replaces the linear extrapolation of the progress.
+        """
+        config = MotionConfig()
+        try:
+            config.update_from_eeprom( parseM503( self.gcs.send('M503') ) )
+            config.update_from_head( self.config.get_current_head_info() )
+        except Exception as e:
+            # Keep the firmware defaults
+            pass
+        
+        try:
+            self.time_estimate = PrintTimeEstimator(config).process_file(gcode_file, gfile)
+        except Exception as e:
+            # Progress is extrapolated linearly without an estimate
+            pass
+    
     def prepare_task(self, task_id, task_type = 'unknown', task_controller = 'make', gcode_file = None):
         
         self.task_stats['type']             = task_type
@@ -635,6 +726,12 @@ class GCodePusher(object):
             self.pusher_stats['type']              = gfile.info['type']
             self.pusher_stats['first_move']        = False
             
+            self.time_estimate = None
+            self.file_start_offset = 0
+            if gfile.info['type'] == GCodeInfo.PRINT:
+                estimator = Thread( target=self.__time_estimate_thread, args=(gcode_file, gfile) )
+                estimator.daemon = True
+                estimator.start()
             
             if gfile.info['type'] == GCodeInfo.PRINT:
                 engine = 'unknown'
@@ -745,14 +842,32 @@ class GCodePusher(object):
             
         #TODO: ConnectionClosedError
         return self.gcs.send(code, block=block, timeout=timeout, group=group, expected_reply=expected_reply)
+    
+    def send_batch(self, codes, block = True, timeout = None, trace = None, group = 'gcode', expected_reply = 'ok'):
+        """
+        Send a sequence of gcode commands at once and display trace message.
+        Replies are returned in the same order as the commands.
+        """
+        if trace:
+            self.trace(trace)
         
-    def send_file(self, filename):
+        return self.gcs.send_batch(codes, block=block, timeout=timeout, group=group, expected_reply=expected_reply)
+        
+    def send_file(self, filename, layer = None, pipeline = None):
         """
         Send a file to totumduino. File will be send line by line and it's progress 
         can be monitored using `get_progress` function.
         When the file has been completely sent `file_done_callback` will be called.
+        
+        :param layer: Layer to start from, used to resume an interrupted print.
+        :param pipeline: Transformations applied to the file, see `GCodePipeline.from_config`
         """
-        return self.gcs.send_file(filename)
+        self.file_start_offset = 0
+        if layer is not None:
+            record = GCodeFile(filename).get_layer(layer)
+            if record:
+                self.file_start_offset = record['offset']
+        return self.gcs.send_file(filename, layer, pipeline)
  
     def get_temperature_history(self):
         """
@@ -825,6 +940,7 @@ class GCodePusher(object):
                     os.remove(f)
                 except Exception as e: 
                     pass
+                GCodeCache.remove(f)
     
     def pause(self):
         self.gcs.pause()
@@ -42,6 +42,7 @@ from fabtotum.fabui.config import ConfigService
 #~ from fabtotum.utils.gcodefile import GCodeFile, GCodeInfo
 from fabtotum.utils.pyro.gcodeclient import GCodeServiceClient
 from fabtotum.totumduino.format import parseM105
+from fabtotum.utils.statefile import StateFileWriter
 
 # Set up message catalog access
 tr = gettext.translation('gpusher', 'locale', fallback=True)
@@ -50,6 +51,7 @@ _ = tr.ugettext
 class StatsMonitor:
     
     MAX_DELTA_TIME  = 60    # Maximum allowed delta time
+    REPORT_TIMEOUT  = 3     # Missed auto-report periods before falling back to M105 polling
     
     def __init__(self, stats_file, gcs = None, config = None, logger = None):
 
@@ -81,6 +83,9 @@ class StatsMonitor:
         self.ev_update = Event()
         self.backtrack = int(self.config.get('monitor', 'backtrack', 20))
         self.update_period = float(self.config.get('monitor', 'period'))
+        # Temperature auto-report period in seconds, 0 to poll with M105
+        self.auto_report = float(self.config.get('monitor', 'auto_report', 0))
+        self.last_report_time = None
         
         ## Monitor variables, fill arrays with zeros
         self.ext_temp           = [0.0] * self.backtrack
@@ -101,6 +106,7 @@ class StatsMonitor:
         
         self.backtrack = int(self.config.get('monitor', 'backtrack'))
         self.update_period = float(self.config.get('monitor', 'period'))
+        self.auto_report = float(self.config.get('monitor', 'auto_report', 0))
     
         if old_backtrack != self.backtrack:
             self.ext_temp           = [0.0] * self.backtrack
@@ -158,6 +164,16 @@ class StatsMonitor:
                 
         self.log.debug("StatsMonitor write thread: stopped")
     
+    def __has_reports(self):
+        """
+        Check whether temperature auto-reports are arriving in time.
+        """
+        if not self.auto_report or self.last_report_time is None:
+            return False
+        
+        timeout = max(self.auto_report * StatsMonitor.REPORT_TIMEOUT, self.update_period)
+        return (time.time() - self.last_report_time) < timeout
+    
     def __monitor_thread(self):
         """
         Thread for periodic temperature reading.
@@ -165,6 +181,15 @@ class StatsMonitor:
         self.log.debug("StatsMonitor thread: started")
         while self.running:
             
+            if self.__has_reports():
+                # Temperatures are updated by the reports, no need to poll
+                time.sleep(self.update_period)
+                continue
+            
+            if self.auto_report:
+                # (Re)enable the reports, they are disabled after a Totumduino reset
+                self.gcs.send('M155 S{0}'.format( int(max(1, round(self.auto_report))) ), group = 'monitor', block=True)
+            
             # Get temperature
             # Timeout is to prevent waiting for too long when there is a long running
             # command like M109,M190,G29 or G28
@@ -201,6 +226,7 @@ class StatsMonitor:
             self.log.debug("Ext: %f, Bed: %f", float(data[0]), float(data[1]) )
             self.__update_values(ext_temp=float(data[0]), bed_temp=float(data[1]))
         elif action == 'all':
+            self.last_report_time = time.time()
             self.log.debug("Ext: %f/%f, Bed: %f/%f", float(data[0]), float(data[1]), float(data[2]), float(data[3]) )
             self.__update_values(float(data[0]), float(data[1]), float(data[2]), float(data[3]) )
         elif action == 'bed':
@@ -247,8 +273,7 @@ class StatsMonitor:
             'delta'             : self.delta
         }
         
-        with open(self.stats_file, 'w') as f:
-            f.write( json.dumps(stats) )
+        StateFileWriter().write(self.stats_file, json.dumps(stats))
     
     ### API ###
     
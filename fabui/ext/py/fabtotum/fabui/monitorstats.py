@@ -0,0 +1,115 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import time
+import copy
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+MONITOR         = 'monitor'
+MONITOR_DELTA   = 'monitor_delta'
+
+class MonitorStats(object):
+    """
+    Change tracking of the task monitor groups. Tasks keep modifying the
+    group dictionaries in place, see `GCodePusher.standardized_stats`, and
+    the dirty keys are found by comparing them with a copy of the last
+    published values.
+
+    Messages are either a full snapshot (``monitor``) or the changed keys
+    of each group (``monitor_delta``), removed groups and keys are ``None``.
+    Nested values are sent whole when any part of them changes. Every
+    message has a sequence number so that clients can tell when they missed
+    one and wait for the next snapshot.
+
+    :param groups: Dictionary of monitor groups
+    :param snapshot_period: Seconds between full snapshots
+    """
+
+    def __init__(self, groups, snapshot_period = 10):
+        self.groups = groups
+        self.snapshot_period = snapshot_period
+        self.published = None
+        self.snapshot_time = 0
+        self.seq = 0
+
+    def changes(self):
+        """
+        Get the values changed since the last message.
+
+        :returns: Changed keys by group
+        :rtype: dict
+        """
+        published = self.published or {}
+        changes = {}
+        for name, group in self.groups.iteritems():
+            last = published.get(name)
+            if last is None or not isinstance(group, dict):
+                if last != group:
+                    changes[name] = group
+                continue
+
+            delta = {}
+            for key, value in group.iteritems():
+                if key not in last or last[key] != value:
+                    delta[key] = value
+            for key in last:
+                if key not in group:
+                    delta[key] = None
+            if delta:
+                changes[name] = delta
+
+        for name in published:
+            if name not in self.groups:
+                changes[name] = None
+        return changes
+
+    def message(self, full = False):
+        """
+        Get the next monitor message, a full snapshot is returned every
+        `snapshot_period` seconds.
+
+        :param full: Force a full snapshot
+        :returns: Message or ``None`` if nothing changed
+        :rtype: dict
+        """
+        now = time.time()
+        if full or self.published is None or (now - self.snapshot_time) >= self.snapshot_period:
+            message_type = MONITOR
+            content = self.groups
+            self.snapshot_time = now
+        else:
+            message_type = MONITOR_DELTA
+            content = self.changes()
+            if not content:
+                return None
+
+        self.published = copy.deepcopy(self.groups)
+        self.seq += 1
+        return {'type': message_type, 'seq': self.seq, 'content': content}
@@ -27,13 +27,19 @@ import json
 import time
 import gettext
 import logging
-from threading import Event, Thread, RLock
+from collections import deque
+from threading import Event, Thread, RLock, Timer
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 # Import external modules
 from ws4py.client.threadedclient import WebSocketClient
 
 # Import internal modules
 from fabtotum.fabui.config import ConfigService
+from fabtotum.utils.statefile import StateFileWriter
 #~ from fabtotum.database      import Database, timestamp2datetime
 #~ from fabtotum.database.task import Task
 
@@ -46,8 +52,17 @@ class NotifyService(object):
     Notification service. Handles all notification by sending the messages to
     an opened websocket and writing the same messages to a NOTIFY_FILE file as a 
     fallback in case websocket is not supported.
+    
+    The last `backtrack` events are kept in a ring buffer. Messages are sent
+    by a sender thread so a stalled websocket never blocks the caller, when
+    the send queue is full the oldest message is dropped. NOTIFY_FILE is
+    written `SNAPSHOT_DELAY` seconds after the first new event.
     """
     
+    SNAPSHOT_DELAY  = 0.5 # seconds
+    SEND_QUEUE_SIZE = 256
+    STOP_TIMEOUT    = 2.0 # seconds
+    
     def __init__(self, WebSocket = None, notify_file = None, config = None):
         
         self.notify_lock = RLock()
@@ -72,7 +87,14 @@ class NotifyService(object):
         
         self.backtrack = int(self.config.get('notify', 'backtrack', 30))
         self.event_id = 0
-        self.events = []
+        self.events = deque(maxlen=self.backtrack)
+        self.snapshot_timer = None
+        
+        self.send_queue = queue.Queue(self.SEND_QUEUE_SIZE)
+        self.dropped = 0
+        self.sender = Thread( name = "NotifySender", target = self.__sender_thread )
+        self.sender.daemon = True
+        self.sender.start()
             
     def notify(self, event_type, event_data):
         
@@ -80,6 +102,22 @@ class NotifyService(object):
             self.__add_event(event_type, event_data)
             self.__send_message(event_type, event_data)
     
+    def stop(self):
+        """
+        Write the pending NOTIFY_FILE snapshot and stop the sender thread.
+        """
+        with self.notify_lock:
+            timer = self.snapshot_timer
+            if timer:
+                timer.cancel()
+        
+        if timer:
+            self.__write_snapshot()
+            StateFileWriter().flush()
+        
+        self.__queue_message(None)
+        self.sender.join(self.STOP_TIMEOUT)
+    
     def get_last(self):
         if self.events:
             return self.events[-1]
@@ -87,33 +125,69 @@ class NotifyService(object):
     
     def __add_event(self, event_type, event_data):
         """
-        Add a new event to the event list and write the list to NOTIFY_FILE.
+        Add a new event to the event list and schedule the NOTIFY_FILE write.
         """
         self.event_id += 1 # Increment the event ID number
         
         event = {'id': self.event_id, 'type': event_type, 'data':event_data}
         
-        if len(self.events) >= self.backtrack:
-            self.events = self.events[1:] + [event]
-        else:
-            self.events.append(event)
+        # Oldest event is dropped by the ring buffer
+        self.events.append(event)
+        
+        if self.snapshot_timer is None:
+            self.snapshot_timer = Timer(self.SNAPSHOT_DELAY, self.__write_snapshot)
+            self.snapshot_timer.daemon = True
+            self.snapshot_timer.start()
+    
+    def __write_snapshot(self):
+        """
+        Write the event list to NOTIFY_FILE.
+        """
+        with self.notify_lock:
+            self.snapshot_timer = None
+            events = list(self.events)
         
         wrapper = {
-            'events' : self.events,
-            'last_event' : event
+            'events' : events,
+            'last_event' : events[-1]
         }
         
-        with open(self.notify_file, 'w') as f:
-            f.write( json.dumps(wrapper) )
+        StateFileWriter().write(self.notify_file, json.dumps(wrapper))
     
     def __send_message(self, type, data):
         """
-        Send message to WebSocket server.
+        Queue message for the WebSocket server.
         
         :param type: Message type
         :param data: Message data
         :type type: string
         :type data: string
         """
-        message = {'type': type, 'data':data}
-        self.ws.send(json.dumps(message))
+        self.__queue_message( json.dumps({'type': type, 'data':data}) )
+    
+    def __queue_message(self, message):
+        """
+        Queue message for the sender thread, the oldest message is dropped
+        if the queue is full. ``None`` stops the sender thread.
+        """
+        while True:
+            try:
+                self.send_queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    self.send_queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+    
+    def __sender_thread(self):
+        while True:
+            message = self.send_queue.get()
+            if message is None:
+                break
+            try:
+                self.ws.send(message)
+            except Exception:
+                # Clients can still read the messages from NOTIFY_FILE
+                pass
@@ -0,0 +1,127 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import logging
+import unittest
+from threading import Event
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.fabui.eventbus import EventBus, ALL_EVENTS
+
+#############################################
+
+# Subscriber errors are expected
+log = logging.getLogger('EventBusTest')
+log.addHandler( logging.NullHandler() )
+
+class EventBusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus(max_queue = 4, logger = log)
+        self.events = []
+        self.done = Event()
+
+    def tearDown(self):
+        self.bus.stop()
+        self.bus.loop()
+
+    def record(self, name):
+        def callback(event_type, data):
+            self.events.append( (name, event_type, data) )
+            if data == 'last':
+                self.done.set()
+        return callback
+
+    def test_fan_out(self):
+        task = self.record('task')
+        usb = self.record('usb')
+        everything = self.record('all')
+        self.bus.subscribe('task', task)
+        self.bus.subscribe('task', task)
+        self.bus.subscribe('usb', usb)
+        self.bus.subscribe(ALL_EVENTS, everything)
+        self.bus.start()
+
+        self.bus.publish('task', 1)
+        self.bus.publish('usb', 2)
+        self.bus.publish('other', 'last')
+        self.assertTrue( self.done.wait(5) )
+
+        # Each subscriber once, type subscribers before the ones of all events
+        self.assertEqual( self.events, [
+            ('task', 'task', 1), ('all', 'task', 1),
+            ('usb', 'usb', 2), ('all', 'usb', 2),
+            ('all', 'other', 'last')
+        ])
+        self.assertEqual( self.bus.last('task')[0], 1 )
+        self.assertIsNone( self.bus.last('temperature') )
+
+    def test_failing_subscriber(self):
+        def failing(event_type, data):
+            raise ValueError(data)
+        self.bus.subscribe('task', failing)
+        self.bus.subscribe('task', self.record('task'))
+        self.bus.start()
+
+        self.bus.publish('task', 'last')
+        self.assertTrue( self.done.wait(5) )
+        self.assertEqual( self.events, [('task', 'task', 'last')] )
+
+    def test_unsubscribe(self):
+        task = self.record('task')
+        self.bus.subscribe('task', task)
+        self.bus.subscribe(ALL_EVENTS, self.record('all'))
+        self.bus.unsubscribe('task', task)
+        self.bus.start()
+
+        self.bus.publish('task', 'last')
+        self.assertTrue( self.done.wait(5) )
+        self.assertEqual( self.events, [('all', 'task', 'last')] )
+
+    def test_not_running(self):
+        self.assertFalse( self.bus.publish('task', 1) )
+
+    def test_queue_full(self):
+        entered = Event()
+        release = Event()
+        def slow(event_type, data):
+            entered.set()
+            release.wait(5)
+        self.bus.subscribe('slow', slow)
+        self.bus.subscribe('task', self.record('task'))
+        self.bus.start()
+
+        self.bus.publish('slow', None)
+        self.assertTrue( entered.wait(5) )
+        for i in range(6):
+            self.bus.publish('task', i)
+        self.bus.publish('task', 'last')
+        release.set()
+
+        # The oldest are dropped, the publisher never blocks
+        self.assertTrue( self.done.wait(5) )
+        self.assertEqual( self.bus.dropped, 3 )
+        self.assertEqual( [ data for name, event_type, data in self.events ], [3, 4, 5, 'last'] )
+
+if __name__ == '__main__':
+    unittest.main()
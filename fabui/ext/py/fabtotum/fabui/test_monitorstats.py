@@ -0,0 +1,87 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.fabui.monitorstats import MonitorStats, MONITOR, MONITOR_DELTA
+
+#############################################
+
+class MonitorStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.groups = {
+            'task'      : {'status': 'running', 'percent': 0.0},
+            'gpusher'   : {'file': {'name': 'a.gcode'}, 'line_current': 0}
+        }
+        self.stats = MonitorStats(self.groups, snapshot_period = 3600)
+
+    def test_first_message_is_snapshot(self):
+        message = self.stats.message()
+        self.assertEqual( message['type'], MONITOR )
+        self.assertEqual( message['seq'], 1 )
+        self.assertEqual( message['content'], self.groups )
+
+    def test_no_changes(self):
+        self.stats.message()
+        self.assertEqual( self.stats.changes(), {} )
+        self.assertIsNone( self.stats.message() )
+
+    def test_changed_keys(self):
+        self.stats.message()
+        self.groups['task']['percent'] = 12.5
+        self.groups['gpusher']['file']['name'] = 'b.gcode'
+
+        message = self.stats.message()
+        self.assertEqual( message['type'], MONITOR_DELTA )
+        self.assertEqual( message['seq'], 2 )
+        # Nested values are sent whole
+        self.assertEqual( message['content'], {
+            'task'      : {'percent': 12.5},
+            'gpusher'   : {'file': {'name': 'b.gcode'}}
+        })
+
+    def test_added_and_removed(self):
+        self.stats.message()
+        self.groups['print'] = {'layer_current': 1}
+        self.groups['task']['message'] = 'Homing'
+        del self.groups['task']['percent']
+        del self.groups['gpusher']
+
+        self.assertEqual( self.stats.changes(), {
+            'print'     : {'layer_current': 1},
+            'task'      : {'message': 'Homing', 'percent': None},
+            'gpusher'   : None
+        })
+
+    def test_full_snapshot(self):
+        self.stats.message()
+        self.groups['task']['percent'] = 50.0
+        message = self.stats.message(full = True)
+        self.assertEqual( message['type'], MONITOR )
+        self.assertEqual( message['content']['task']['percent'], 50.0 )
+        self.assertIsNone( self.stats.message() )
+
+if __name__ == '__main__':
+    unittest.main()
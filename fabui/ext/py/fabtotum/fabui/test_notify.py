@@ -0,0 +1,122 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from threading import Event
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.singleton import Singleton
+from fabtotum.utils.statefile import StateFileWriter
+from fabtotum.fabui.notify import NotifyService
+
+#############################################
+
+class FakeConfig(object):
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, section, key, default = None):
+        return self.values.get(section, {}).get(key, default)
+
+class FakeWebSocket(object):
+    """ Records the sent messages, send blocks while `release` is not set. """
+
+    def __init__(self):
+        self.messages = []
+        self.sending = Event()
+        self.release = Event()
+        self.release.set()
+
+    def send(self, message):
+        self.sending.set()
+        self.release.wait()
+        self.messages.append( json.loads(message) )
+
+class SmallQueueNotifyService(NotifyService):
+    SEND_QUEUE_SIZE = 2
+
+class NotifyServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.notify_file = os.path.join(self.directory, 'notify.json')
+        Singleton._instances.pop(StateFileWriter, None)
+        self.ws = FakeWebSocket()
+        self.config = FakeConfig({'notify': {'backtrack': 3}})
+
+    def tearDown(self):
+        Singleton._instances.pop(StateFileWriter, None)
+        shutil.rmtree(self.directory)
+
+    def read_snapshot(self):
+        with open(self.notify_file) as f:
+            return json.load(f)
+
+    def test_ring_buffer(self):
+        ns = NotifyService(self.ws, self.notify_file, self.config)
+        for i in range(5):
+            ns.notify('task', {'n': i})
+        ns.stop()
+
+        self.assertEqual( [ event['id'] for event in ns.events ], [3, 4, 5] )
+        self.assertEqual( ns.get_last()['data'], {'n': 4} )
+
+        snapshot = self.read_snapshot()
+        self.assertEqual( [ event['id'] for event in snapshot['events'] ], [3, 4, 5] )
+        self.assertEqual( snapshot['last_event']['id'], 5 )
+        # Every message is sent, only the history is limited
+        self.assertEqual( len(self.ws.messages), 5 )
+
+    def test_snapshot_written_on_stop(self):
+        ns = NotifyService(self.ws, self.notify_file, self.config)
+        ns.SNAPSHOT_DELAY = 3600
+        ns.notify('usb', {'status': 'inserted'})
+        self.assertTrue( ns.snapshot_timer.daemon )
+        self.assertFalse( os.path.exists(self.notify_file) )
+
+        ns.stop()
+        self.assertIsNone( ns.snapshot_timer )
+        self.assertEqual( self.read_snapshot()['last_event']['type'], 'usb' )
+
+    def test_send_queue_drop(self):
+        ns = SmallQueueNotifyService(self.ws, self.notify_file, self.config)
+        self.ws.release.clear()
+        ns.notify('task', {'n': 0})
+        # Sender thread is stalled on the first message
+        self.assertTrue( self.ws.sending.wait(5) )
+        for i in range(1, 5):
+            ns.notify('task', {'n': i})
+        self.assertEqual( ns.dropped, 2 )
+
+        self.ws.release.set()
+        ns.stop()
+        self.assertEqual( [ message['data']['n'] for message in self.ws.messages ], [0, 3, 4] )
+        self.assertFalse( ns.sender.is_alive() )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,10 +67,20 @@ class ConfigMonitor(PatternMatchingEventHandler):
         """
         Watchdog callback triggered when file is modified.
         """
+        self.__file_changed(event.src_path)
+    
+    def on_moved(self, event):
+        """
+        Watchdog callback triggered when file is renamed. Config files are
+        replaced by renaming a temporary file, see `StateFileWriter`.
+        """
+        self.__file_changed(event.dest_path)
+    
+    def __file_changed(self, path):
                 
-        if (  event.src_path == CONFIG_INI 
-           or event.src_path == SERIAL_INI
-           or event.src_path == self.HW_DEFAULT_SETTINGS
+        if (  path == CONFIG_INI 
+           or path == SERIAL_INI
+           or path == self.HW_DEFAULT_SETTINGS
            ):
 
             self.HW_DEFAULT_SETTINGS = self.config.get('hardware', 'settings')
@@ -23,6 +23,7 @@ __license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
 __version__ = "1.0"
 
 # Import standard python module
+import os
 import json
 import time
 import gettext
@@ -44,6 +45,9 @@ _ = tr.ugettext
 ###################################################################################################################
 class FolderTempMonitor(PatternMatchingEventHandler):
     
+    # Bytes of the trace file start used to detect a rewritten trace
+    TRACE_HEAD = 64
+    
     patterns = []
     ignore_directories = None
     ignore_patterns = None 
@@ -68,31 +72,84 @@ class FolderTempMonitor(PatternMatchingEventHandler):
         self.case_sensitive = None
         self.ns = notifyservice
         
+        # Trace tail state, sequence numbers are line numbers in the trace file
+        self.trace_offset = 0
+        self.trace_seq = 0
+        self.trace_head = ''
+        self.trace_partial = ''
+        
     def on_modified(self, event):
         """
         Watchdog callback triggered when file is modified.
         """
+        self.__file_changed(event.src_path)
+    
+    def on_moved(self, event):
+        """
+        Watchdog callback triggered when file is renamed. State files are
+        replaced by renaming a temporary file, see `StateFileWriter`.
+        """
+        self.__file_changed(event.dest_path)
+    
+    def __file_changed(self, path):
         
         messageType = ''
         messageData = ''
         
-        #print "Monitor:", event.src_path
+        #print "Monitor:", path
                 
-        if event.src_path == self.TRACE:
-            messageData = {'content': str(self.getFileContent(self.TRACE))}
-            messageType = "trace"
-            self.ns.notify(messageType, messageData)
+        if path == self.TRACE:
+            seq, lines, reset = self.__read_trace()
+            if lines or reset:
+                messageData = {'content': '\n'.join(lines), 'seq': seq, 'reset': reset}
+                messageType = "trace"
+                self.ns.notify(messageType, messageData)
         
-        elif event.src_path == self.TASK_MONITOR:
+        elif path == self.TASK_MONITOR:
             tmp = str(self.getFileContent(self.TASK_MONITOR))
             if tmp:
                 try:
                     messageData = {'type': 'monitor', 'content': json.loads(tmp)}
                     messageType = 'task'
-                    self.ns.notify(messageType, messageData)
+                    # Snapshots of tasks publishing on the event bus were
+                    # already delivered by it, see `GCodePusher.publish_event`
+                    if not messageData['content'].get('gpusher', {}).get('event_bus'):
+                        self.ns.notify(messageType, messageData)
                 except:
                     pass
         
+    def __read_trace(self):
+        """
+        Read the lines appended to the trace file since the last call. The
+        trace starts again when the file is truncated or rewritten, see
+        `GCodePusher.resetTrace`.
+        
+        :returns: (sequence number of the first line, lines, reset)
+        """
+        reset = False
+        with open(self.TRACE, 'r') as f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(self.TRACE_HEAD)
+            n = min(len(head), len(self.trace_head))
+            if size < self.trace_offset or head[:n] != self.trace_head[:n]:
+                reset = True
+                self.trace_offset = 0
+                self.trace_seq = 0
+                self.trace_partial = ''
+            self.trace_head = head
+            
+            f.seek(self.trace_offset)
+            data = f.read()
+        
+        self.trace_offset += len(data)
+        lines = (self.trace_partial + data).split('\n')
+        # Keep the incomplete last line for the next read
+        self.trace_partial = lines.pop()
+        
+        seq = self.trace_seq
+        self.trace_seq += len(lines)
+        return seq, lines, reset
+    
     def on_created(self, event):
         #self.process(event)
         self.log.debug("CRAETED: " + event.src_path)
@@ -0,0 +1,491 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Micro-benchmarks of the GCodeService send and receive paths, and file
+streaming throughput against the firmware simulator.
+
+Usage: python -m fabtotum.totumduino.benchmark -F <file.gcode> [-C <capture>]
+       python -m fabtotum.totumduino.benchmark -F <file.gcode> --stream [--rx-buffer 128]
+"""
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import sys
+import json
+import operator
+import argparse
+import logging
+import time
+import subprocess
+from threading import Event
+from collections import deque
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodefile import GCodeFile
+from fabtotum.totumduino.hooks import action_hook
+from fabtotum.totumduino.transport import LineFramer, data_checksum
+
+#############################################
+
+class NullSerial(object):
+    """
+    Serial port replacement that discards everything written to it.
+    """
+
+    def __init__(self):
+        self.in_waiting = 0
+        self.timeout = 1
+        self.bytes_written = 0
+        self.lines_written = 0
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        self.lines_written += 1
+        return len(data)
+
+    def read(self, size = 1):
+        return ''
+
+    def flush(self):
+        pass
+
+    def flushInput(self):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        pass
+
+class ReplaySerial(NullSerial):
+    """
+    Serial port replacement that replays captured Totumduino output at the 
+    rate given by **baud** (10 bits per byte). Each read returns all the 
+    data that would have arrived since the previous one.
+    
+    :param data: Captured data
+    :param baud: Baudrate, 0 returns all the data in the first read
+    """
+    
+    def __init__(self, data, baud = 250000):
+        super(ReplaySerial, self).__init__()
+        self.data = data
+        self.offset = 0
+        self.rate = baud / 10.0
+        self.started = None
+    
+    def __available(self):
+        if not self.rate:
+            return len(self.data) - self.offset
+        if self.started is None:
+            self.started = time.time()
+        arrived = int( (time.time() - self.started) * self.rate )
+        return min(arrived, len(self.data)) - self.offset
+    
+    @property
+    def finished(self):
+        return self.offset >= len(self.data)
+    
+    def read(self, size = 1):
+        size = max(size, self.__available())
+        if self.rate:
+            # Block until at least one byte has arrived
+            while self.__available() < 1 and not self.finished:
+                time.sleep(1.0 / self.rate)
+        size = min(size, len(self.data) - self.offset)
+        chunk = self.data[self.offset:self.offset+size]
+        self.offset += size
+        return chunk
+    
+    def __getattr__(self, attr):
+        if attr == 'in_waiting':
+            return max(0, self.__available())
+        raise AttributeError(attr)
+
+class TimingSerial(object):
+    """
+    Serial port wrapper measuring the round-trip time of each written line.
+    Lines are paired with ``ok`` replies in order.
+    
+    :param ser: Serial port
+    """
+    
+    def __init__(self, ser):
+        self.ser = ser
+        self.sent = deque()
+        self.tail = b''
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def write(self, data):
+        self.sent.append( time.time() )
+        return self.ser.write(data)
+    
+    def read(self, size = 1):
+        data = self.ser.read(size)
+        if data:
+            now = time.time()
+            lines = (self.tail + data).split(b'\n')
+            self.tail = lines.pop()
+            for line in lines:
+                if line[:2] == b'ok' and self.sent:
+                    rtt = now - self.sent.popleft()
+                    self.count += 1
+                    self.total += rtt
+                    self.max = max(self.max, rtt)
+        return data
+    
+    def __getattr__(self, attr):
+        return getattr(self.ser, attr)
+
+class _LegacyFramer(object):
+    """ Previous receiver framing, kept as a reference for the benchmark. """
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def feed(self, data):
+        lines = []
+        self.buffer.extend(data)
+        while b'\n' in self.buffer:
+            line_raw, self.buffer = self.buffer.split(b'\n', 1)
+            lines.append( line_raw.decode('utf-8', 'replace') )
+        return lines
+
+def _legacy_checksum(data):
+    """ Per character checksum, kept as a reference for the benchmark. """
+    cs = 0
+    for c in data:
+        cs ^= ord(c)
+    return cs
+
+def _bytes_checksum(data):
+    """ Per byte checksum, kept as a reference for the benchmark. """
+    return reduce(operator.xor, bytearray(data), 0)
+
+class _HookState(object):
+    """ Minimal stand-in for GCodeService used by the hooks. """
+    def __init__(self):
+        self.gcode_state = {
+            "axis_relative_mode" : {
+                'x' : False,
+                'y' : False,
+                'z' : False,
+                'e' : False
+            },
+            "feedrate": 1000.0
+        }
+
+def load_lines(filename):
+    """
+    Load all the gcode lines of a file the same way GCodeService pushes them,
+    so that file reading is not part of the measurements.
+    """
+    lines = []
+    for line, attrs in GCodeFile(filename):
+        line = line.rstrip()
+        if line:
+            lines.append(line)
+    return lines
+
+def bench_hooks(lines, repeat = 1):
+    """
+    Run all the lines through the action hook only.
+
+    :returns: Lines per second
+    :rtype: float
+    """
+    gcs = _HookState()
+    raw_lines = [ line + '\r\n' for line in lines ]
+    process_command = action_hook.process_command
+
+    t0 = time.time()
+    for i in xrange(repeat):
+        for line in raw_lines:
+            process_command(gcs, line)
+    duration = time.time() - t0
+
+    return (len(raw_lines) * repeat) / duration
+
+def bench_send_path(gcs, lines, z_override = 0.0, repeat = 1):
+    """
+    Run all the lines through the GCodeService send path with a `NullSerial`.
+    Replies are dropped from the reply queue right away.
+
+    :returns: Lines per second
+    :rtype: float
+    """
+    gcs.serial = NullSerial()
+    gcs.z_override = z_override
+    send = gcs._GCodeService__send_gcode_command
+    rq = gcs.rq
+
+    t0 = time.time()
+    for i in xrange(repeat):
+        for line in lines:
+            send(line, group='file')
+            rq.get_nowait()
+    duration = time.time() - t0
+
+    gcs.z_override = 0.0
+
+    return (len(lines) * repeat) / duration
+
+def bench_checksum(lines, fn = data_checksum, repeat = 1):
+    """
+    Compute the data checksum of all the lines with **fn**.
+
+    :returns: Lines per second
+    :rtype: float
+    """
+    t0 = time.time()
+    for i in xrange(repeat):
+        for line in lines:
+            fn(line)
+    duration = time.time() - t0
+
+    return (len(lines) * repeat) / duration
+
+def sample_traffic():
+    """
+    Generate Totumduino output similar to a capture: M105 replies,
+    M303 autotune output, an M503 dump and plain acknowledgements.
+    """
+    lines = []
+    for i in xrange(200):
+        lines.append('ok T:{0:.1f} /210.0 B:{1:.1f} /60.0 T0:{0:.1f} /210.0 @:127 B@:0'.format(200 + i % 10, 55 + i % 5))
+        lines.append('ok')
+    for i in xrange(100):
+        lines.append(' T:{0:.2f} @:{1}'.format(190 + i * 0.2, i % 128))
+        lines.append(' bias: 92 d: 92 min: 196.56 max: 203.75')
+    lines.append('echo:Steps per unit:')
+    lines.append('echo:  M92 X72.58 Y72.58 Z2133.33 E3048.16')
+    lines.append('echo:Maximum feedrates (mm/s):')
+    lines.append('echo:  M203 X550.00 Y550.00 Z15.00 E12.00')
+    lines.append('echo:Maximum Acceleration (mm/s2):')
+    lines.append('echo:  M201 X4000 Y4000 Z100 E10000')
+    lines.append('echo:PID settings:')
+    lines.append('echo:   M301 P15.00 I5.00 D30.00')
+    lines.append('ok')
+    return '\n'.join(lines * 10) + '\n'
+
+def bench_receive(data, framer, baud = 250000):
+    """
+    Feed replayed serial data through a line framer the way the receiver
+    thread does.
+    
+    :returns: Tuple of (lines, time spent framing in seconds, wall time in seconds)
+    :rtype: tuple
+    """
+    ser = ReplaySerial(data, baud)
+    count = 0
+    cpu = 0.0
+    
+    t0 = time.time()
+    while not ser.finished:
+        chunk = ser.read(ser.in_waiting or 1)
+        c0 = time.time()
+        for line in framer.feed(chunk):
+            count += 1
+        cpu += time.time() - c0
+    wall = time.time() - t0
+    
+    return count, cpu, wall
+
+def start_simulator(args):
+    """
+    Start the firmware simulator in its own process so that its CPU time is 
+    not accounted to GCodeService.
+    
+    :returns: Tuple of (process, serial port path)
+    """
+    cmd = [sys.executable, '-m', 'fabtotum.totumduino.simulator',
+            '--planner', str(args.planner),
+            '--rx-buffer', str(args.sim_rx_buffer),
+            '--move-time', str(args.move_time),
+            '--long-time', str(args.long_time),
+            '--baud', str(args.baud),
+            '--error-rate', str(args.error_rate)]
+    
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    line = proc.stdout.readline().split()
+    if len(line) != 2 or line[0] != 'PORT':
+        proc.kill()
+        raise RuntimeError("Firmware simulator failed to start")
+    
+    return proc, line[1]
+
+def stop_simulator(proc):
+    """
+    Stop the firmware simulator.
+    
+    :returns: Simulator statistics
+    :rtype: dict
+    """
+    proc.stdin.close()
+    stats = json.loads( proc.stdout.readline() )
+    proc.wait()
+    return stats
+
+def bench_stream(gcs, filename, timeout = None):
+    """
+    Stream a file with `send_file` and measure it.
+    
+    :returns: Dictionary with the streamed `lines`, `duration`, `lines_per_sec`, 
+              average and maximum round-trip time (`rtt_avg`, `rtt_max`) and `cpu_per_line`
+              or ``None`` on timeout
+    :rtype: dict
+    """
+    done = Event()
+    
+    def callback(name, data):
+        if name == 'file_done':
+            done.set()
+    
+    gcs.register_callback(callback)
+    gcs.serial = timing = TimingSerial(gcs.serial)
+    
+    c0 = sum(os.times()[:2])
+    t0 = time.time()
+    
+    gcs.send_file(filename)
+    finished = done.wait(timeout)
+    
+    duration = time.time() - t0
+    cpu = sum(os.times()[:2]) - c0
+    
+    gcs.serial = timing.ser
+    gcs.unregister_callback(callback)
+    
+    if not finished:
+        return None
+    
+    lines = gcs.group_ack['file']
+    
+    return {
+        'lines'         : lines,
+        'duration'      : duration,
+        'lines_per_sec' : lines / duration,
+        'rtt_avg'       : (timing.total / timing.count) if timing.count else 0.0,
+        'rtt_max'       : timing.max,
+        'cpu_per_line'  : (cpu / lines) if lines else 0.0
+    }
+
+def main_stream(args):
+    from fabtotum.totumduino.gcode import GCodeService
+    
+    log = logging.getLogger('GCodeService-benchmark')
+    log.addHandler(logging.NullHandler())
+    log.propagate = False
+    
+    proc, port = start_simulator(args)
+    
+    gcs = GCodeService(port, args.baud, use_checksum=args.checksum, logger=log,
+                        rx_buffer_size=args.rx_buffer)
+    gcs.start()
+    # send_file needs the sender thread to be idle
+    time.sleep(0.5)
+    
+    stats = bench_stream(gcs, args.file_name, args.timeout)
+    
+    gcs.stop()
+    sim = stop_simulator(proc)
+    
+    if not stats:
+        print "Timeout"
+        return
+    
+    print "Lines: {0} in {1:.2f}s, {2:.1f} lines/s".format(stats['lines'], stats['duration'], stats['lines_per_sec'])
+    print "Round trip: avg {0:.2f}ms, max {1:.2f}ms".format(stats['rtt_avg'] * 1000, stats['rtt_max'] * 1000)
+    print "CPU per line: {0:.1f}us".format(stats['cpu_per_line'] * 1e6)
+    print "Planner idle: {0} gaps, {1:.3f}s total, {2:.2f}ms max".format(sim['idle_gaps'], sim['idle_time'], sim['idle_max'] * 1000)
+    print "Firmware: {0} lines, {1} rejected, {2} bytes lost by RX overflow, {3} bytes cleared after errors".format(
+                sim['lines'], sim['errors'], sim['overflow'], sim['flushed'])
+
+def main():
+    from fabtotum.totumduino.gcode import GCodeService
+
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-F", "--file-name",   help="GCode file to replay.", required=True)
+    parser.add_argument("-R", "--repeat",      help="Number of times the file is replayed.", type=int, default=1)
+    parser.add_argument("-C", "--capture",     help="Captured Totumduino output to replay, a generated sample is used if not specified.")
+    parser.add_argument("-B", "--baud",        help="Replay and simulation baudrate.", type=int, default=250000)
+    parser.add_argument("--checksum",          help="Use line numbers and checksums.", action='store_true', default=False)
+    parser.add_argument("--stream",            help="Stream the file to the firmware simulator.", action='store_true', default=False)
+    parser.add_argument("--rx-buffer",         help="GCodeService RX buffer size, 0 for one command in flight.", type=int, default=0)
+    parser.add_argument("--sim-rx-buffer",     help="Simulated RX buffer size.", type=int, default=128)
+    parser.add_argument("--planner",           help="Simulated planner blocks.", type=int, default=16)
+    parser.add_argument("--move-time",         help="Simulated move execution time in seconds.", type=float, default=0.005)
+    parser.add_argument("--long-time",         help="Simulated homing and heating time in seconds.", type=float, default=0.5)
+    parser.add_argument("--error-rate",        help="Simulated line corruption probability.", type=float, default=0.0)
+    parser.add_argument("--timeout",           help="Streaming timeout in seconds.", type=float, default=600)
+
+    args = parser.parse_args()
+    
+    if args.stream:
+        main_stream(args)
+        return
+
+    log = logging.getLogger('GCodeService-benchmark')
+    log.addHandler(logging.NullHandler())
+
+    lines = load_lines(args.file_name)
+    print "Lines: {0}".format(len(lines))
+
+    gcs = GCodeService('/dev/null', 115200, use_checksum=args.checksum, logger=log)
+
+    results = [
+        ('hook dispatch',           bench_hooks(lines, args.repeat) ),
+        ('send path',               bench_send_path(gcs, lines, 0.0, args.repeat) ),
+        ('send path + z override',  bench_send_path(gcs, lines, 0.1, args.repeat) ),
+        ('checksum legacy',         bench_checksum(lines, _legacy_checksum, args.repeat) ),
+        ('checksum bytes',          bench_checksum(lines, _bytes_checksum, args.repeat) ),
+        ('checksum',                bench_checksum(lines, data_checksum, args.repeat) ),
+    ]
+
+    for name, rate in results:
+        print "{0:<24} {1:>10.0f} lines/s".format(name, rate)
+    
+    if args.capture:
+        with open(args.capture, 'rb') as f:
+            traffic = f.read()
+    else:
+        traffic = sample_traffic()
+    
+    print "Receive: {0} bytes".format(len(traffic))
+    for baud in [args.baud, 0]:
+        for name, framer in [('legacy', _LegacyFramer()), ('framer', LineFramer())]:
+            count, cpu, wall = bench_receive(traffic, framer, baud)
+            print "{0:<8} {1:>7} baud {2:>7} lines, framing {3:.3f}s, wall {4:.3f}s".format(name, baud or 'burst', count, cpu, wall)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+from threading import Thread, Lock, Condition
+from collections import deque
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+# Events for which only the latest pending value is of interest
+COALESCE_PREFIX = ('temp_change:',)
+# Events that can be dropped when a subscriber falls behind
+DROPPABLE_PREFIX = ('temp_change:', 'gcode_comment', 'gcode_action:message')
+# Events delivered ahead of the queued ones, they are never dropped
+CONTROL_EVENTS = ('self_descruct',)
+# States of `state_change` that end the running task
+CONTROL_STATES = ('aborted', 'terminated')
+
+def is_control_event(callback_name, data):
+    """ Check whether an event must be delivered ahead of the queued ones. """
+    if callback_name in CONTROL_EVENTS:
+        return True
+    return callback_name == 'state_change' and data in CONTROL_STATES
+
+class _Event(object):
+    """ Callback event shared by all the subscriber queues. """
+
+    __slots__ = ['name', 'data', 'pending', 'on_delivered', 'control']
+
+    def __init__(self, name, data, pending, on_delivered, control = False):
+        self.name = name
+        self.data = data
+        self.pending = pending
+        self.on_delivered = on_delivered
+        self.control = control
+
+class _Subscriber(object):
+    """ Callback function with its own ordered event queue. """
+
+    def __init__(self, fun):
+        self.fun = fun
+        self.events = deque()
+        # Control events at the head of the queue
+        self.controls = 0
+        # Coalescable events waiting in the queue, by name
+        self.latest = {}
+        # Subscriber is in the ready queue or being served by a worker
+        self.scheduled = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+class CallbackExecutor(object):
+    """
+    Deliver callback events to the registered functions using a small pool
+    of worker threads. Each subscriber has its own queue that is served by
+    one worker at a time, so events are delivered to it in the same order
+    they were submitted and a slow subscriber does not delay the others.
+
+    Control events (`is_control_event`) are put ahead of the events waiting
+    in the queue and their subscribers are served first, so a task gets
+    ``self_descruct`` or an abort right after its current callback returns
+    instead of after all its backlog.
+
+    A subscriber queue holds **queue_size** events. When it is full a new
+    droppable event (`DROPPABLE_PREFIX`) is discarded, any other event
+    discards the oldest queued droppable event. If there is none the queue
+    grows past **queue_size**, events that are not droppable are never lost.
+    Discarded events count as delivered for ``on_delivered``.
+
+    :param workers: Number of worker threads
+    :param queue_size: Maximum number of pending events per subscriber
+    :param batch: Number of events delivered to a subscriber before giving the worker to the next one
+    :param logger: Logger
+    :type workers: int
+    :type queue_size: int
+    :type batch: int
+    """
+
+    def __init__(self, workers = 2, queue_size = 256, batch = 16, logger = None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch = batch
+        self.log = logger
+
+        self.lock = Lock()
+        # Subscribers with pending events waiting for a worker
+        self.ready = deque()
+        self.ready_cond = Condition(self.lock)
+        self.subscribers = []
+
+        self.submitted = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self.running = True
+        self.threads = []
+        for i in xrange(self.workers):
+            t = Thread( name="CallbackExecutor-worker-{0}".format(i), target = self.__worker_thread )
+            t.daemon = True
+            t.start()
+            self.threads.append(t)
+
+    def __worker_thread(self):
+        while True:
+            with self.lock:
+                while self.running and not self.ready:
+                    self.ready_cond.wait()
+                if not self.running:
+                    break
+                sub = self.ready.popleft()
+
+            for i in xrange(self.batch):
+                with self.lock:
+                    if not sub.events:
+                        break
+                    ev = sub.events.popleft()
+                    if ev.control:
+                        sub.controls -= 1
+                    if sub.latest.get(ev.name) is ev:
+                        del sub.latest[ev.name]
+
+                try:
+                    sub.fun(ev.name, ev.data)
+                except Exception as e:
+                    if self.log:
+                        self.log.error("callback %s failed: %s", ev.name, str(e))
+
+                sub.delivered += 1
+                self.__delivered(ev)
+
+            with self.lock:
+                if sub.events:
+                    # Let the other subscribers be served first
+                    self.__schedule(sub, sub.controls > 0)
+                else:
+                    sub.scheduled = False
+
+    def __schedule(self, sub, urgent = False):
+        """
+        Put **sub** in the ready queue. Must be called with `lock` acquired.
+        """
+        if urgent:
+            self.ready.appendleft(sub)
+        else:
+            self.ready.append(sub)
+        self.ready_cond.notify()
+
+    def __enqueue(self, sub, ev):
+        """
+        Add **ev** to the queue of **sub** making room for it when the queue
+        is full. Must be called with `lock` acquired.
+
+        :returns: The discarded event or ``None``
+        """
+        dropped = None
+        if len(sub.events) >= self.queue_size:
+            for queued in sub.events:
+                if not queued.control and queued.name.startswith(DROPPABLE_PREFIX):
+                    dropped = queued
+                    break
+            if dropped:
+                sub.events.remove(dropped)
+                if sub.latest.get(dropped.name) is dropped:
+                    del sub.latest[dropped.name]
+                sub.dropped += 1
+                self.dropped += 1
+
+        if ev.control:
+            # Behind the control events that are already waiting
+            sub.events.rotate(-sub.controls)
+            sub.events.appendleft(ev)
+            sub.events.rotate(sub.controls)
+            sub.controls += 1
+            if not sub.scheduled:
+                sub.scheduled = True
+                self.__schedule(sub, True)
+            elif sub in self.ready:
+                # Waiting behind the other subscribers, move it to the front
+                self.ready.remove(sub)
+                self.__schedule(sub, True)
+        else:
+            sub.events.append(ev)
+            if not sub.scheduled:
+                sub.scheduled = True
+                self.__schedule(sub)
+
+        return dropped
+
+    def __delivered(self, ev):
+        with self.lock:
+            ev.pending -= 1
+            done = (ev.pending == 0)
+        if done and ev.on_delivered:
+            try:
+                ev.on_delivered()
+            except Exception as e:
+                if self.log:
+                    self.log.error("callback %s on_delivered failed: %s", ev.name, str(e))
+
+    def register(self, fun):
+        """
+        Register a callback function `fun(callback_name, data)`.
+        """
+        with self.lock:
+            if not [s for s in self.subscribers if s.fun == fun]:
+                self.subscribers.append( _Subscriber(fun) )
+
+    def unregister(self, fun):
+        """
+        Unregister a previously registered callback function. Events that are
+        still queued for it are discarded.
+        """
+        events = []
+        with self.lock:
+            for sub in [s for s in self.subscribers if s.fun == fun]:
+                self.subscribers.remove(sub)
+                events.extend(sub.events)
+                sub.events.clear()
+                sub.latest.clear()
+                sub.controls = 0
+
+        for ev in events:
+            self.__delivered(ev)
+
+    def submit(self, callback_name, data, on_delivered = None):
+        """
+        Queue an event for all the registered functions.
+
+        :param callback_name: Callback name
+        :param data: Callback data
+        :param on_delivered: Function called once the event has been delivered to all the subscribers.
+                             It is not supported for coalesced events and gets called right away.
+        """
+        control = is_control_event(callback_name, data)
+        coalesce = callback_name.startswith(COALESCE_PREFIX) and not control
+        droppable = callback_name.startswith(DROPPABLE_PREFIX) and not control
+
+        discarded = []
+        overflow = []
+        with self.lock:
+            self.submitted += 1
+            ev = _Event(callback_name, data, 0, on_delivered, control)
+
+            for sub in self.subscribers:
+                if coalesce:
+                    queued = sub.latest.get(callback_name)
+                    if queued is not None:
+                        # Replace the data of the event waiting in the queue
+                        queued.data = data
+                        sub.coalesced += 1
+                        self.coalesced += 1
+                        continue
+
+                if droppable and len(sub.events) >= self.queue_size:
+                    sub.dropped += 1
+                    self.dropped += 1
+                    continue
+
+                if coalesce:
+                    # Each subscriber gets its own copy so it can be updated independently
+                    queued = _Event(callback_name, data, 1, None)
+                    sub.latest[callback_name] = queued
+                else:
+                    ev.pending += 1
+                    queued = ev
+
+                dropped = self.__enqueue(sub, queued)
+                if dropped:
+                    discarded.append(dropped)
+                elif len(sub.events) == self.queue_size + 1:
+                    overflow.append(sub)
+
+            no_delivery = (ev.pending == 0)
+
+        for dropped in discarded:
+            self.__delivered(dropped)
+
+        if discarded and self.log:
+            self.log.warning("callback queue full, discarded %d events", len(discarded))
+
+        if self.log:
+            for sub in overflow:
+                self.log.warning("callback queue of %s has more than %d events",
+                                 getattr(sub.fun, '__name__', str(sub.fun)), self.queue_size)
+
+        if no_delivery and on_delivered:
+            on_delivered()
+
+    def stats(self):
+        """
+        Get executor statistics.
+
+        :returns: Dictionary with totals and per subscriber queue depth, delivered, dropped and coalesced counters
+        :rtype: dict
+        """
+        with self.lock:
+            subscribers = []
+            for sub in self.subscribers:
+                subscribers.append({
+                    'name'      : getattr(sub.fun, '__name__', str(sub.fun)),
+                    'depth'     : len(sub.events),
+                    'delivered' : sub.delivered,
+                    'dropped'   : sub.dropped,
+                    'coalesced' : sub.coalesced
+                })
+
+            return {
+                'workers'       : self.workers,
+                'submitted'     : self.submitted,
+                'dropped'       : self.dropped,
+                'coalesced'     : self.coalesced,
+                'ready'         : len(self.ready),
+                'subscribers'   : subscribers
+            }
+
+    def stop(self):
+        """ Stop the worker threads. """
+        with self.lock:
+            self.running = False
+            self.ready_cond.notify_all()
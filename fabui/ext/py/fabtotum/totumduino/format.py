@@ -317,3 +317,26 @@ def partialTemp(line):
             }
     except:
         return {}
+
+RE_TEMP_REPORT = re.compile('T:\s*([-0-9.]+)\s*/\s*([-0-9.]+)\s+B:\s*([-0-9.]+)\s*/\s*([-0-9.]+)')
+
+def parseTempReport(line):
+    """
+        Parse unsolicited temperature report (M155 auto-report)
+        >> T:27.2 /0.0 B:27.8 /0.0 T0:27.2 /0.0 @:0 B@:0
+        [new]>> T: 27.2/0.0 B: 27.8/0.0 T0: 27.2/0.0 @: 0 B@: 0
+    """
+    match = RE_TEMP_REPORT.match(line.lstrip())
+    if match:
+        try:
+            return {
+                'T' : float(match.group(1)),
+                'B' : float(match.group(3)),
+                'target' : {
+                    'T' : float(match.group(2)),
+                    'B' : float(match.group(4))
+                }
+            }
+        except ValueError:
+            pass
+    return {}
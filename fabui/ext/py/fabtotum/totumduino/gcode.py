@@ -24,7 +24,8 @@ import time
 import re
 import os
 import threading
-from threading import Event, Thread, RLock
+from threading import Event, Thread, Lock, RLock, Condition
+from collections import deque
 try:
     import queue
 except ImportError:
@@ -36,12 +37,18 @@ import serial
 # Import internal modules
 from fabtotum.utils.singleton import Singleton
 from fabtotum.utils.gcodefile import GCodeFile
+from fabtotum.utils.gcodepipeline import GCodePipeline, GLine
+from fabtotum.utils.gcodecache import GCodeCache
 from fabtotum.totumduino.hooks import action_hook
 from fabtotum.totumduino.hardware import reset as totumduino_reset
 from fabtotum.fabui.bootstrap import hardwareBootstrap
 from fabtotum.database import Database
 from fabtotum.database.task import Task
-from fabtotum.totumduino.format import partialM109, partialM190, partialM303
+from fabtotum.totumduino.format import partialM109, partialM190, partialM303, parseTempReport
+from fabtotum.totumduino.transport import ResendBuffer, LineFramer, frame, parse_resend
+from fabtotum.totumduino.executor import CallbackExecutor
+from fabtotum.totumduino.lanes import LaneQueue, LANE_CONTROL, LANE_INTERACTIVE, LANE_MONITOR, LANE_BULK
+from fabtotum.totumduino.telemetry import Telemetry
 from fabtotum.fabui.myfabtotum          import MyFabtotumCom
 #############################################
 
@@ -76,6 +83,9 @@ class Command(object):
     RESET   = 'reset'
     TERMINATE   = 'terminate'
     
+    # Shared by all the commands, only guards the done callback lists
+    __done_lock = Lock()
+    
     def __init__(self, id, data = None, expected_reply = 'ok', group = 'raw', timeout = None, async = False):
         self.id = id
         self.aborted = False
@@ -86,8 +96,20 @@ class Command(object):
         self.__ev = Event()
         self.expected_reply = expected_reply
         self.group = group
+        # Time the command was created and queued
         self.timestamp = time.time()
+        # Time of the first transmission
+        self.sent_time = None
         self.timeout = timeout
+        # Number of bytes that were written to the serial port
+        self.size = 0
+        # Line number used for the last transmission with checksum
+        self.line_number = None
+        # Precomputed checksum of the data, see `data_checksum`
+        self.data_cs = None
+        # Command queue lane, assigned when the command is queued or sent
+        self.lane = None
+        self.__done_callbacks = []
 
     def __str__(self):
         msg = 'cmd: ' + self.id
@@ -111,7 +133,49 @@ class Command(object):
         """
         self.aborted = abort
         self.expired = expire
-        self.__ev.set()
+        
+        with Command.__done_lock:
+            self.__ev.set()
+            callbacks = self.__done_callbacks
+            self.__done_callbacks = []
+        
+        for fn in callbacks:
+            fn(self)
+    
+    def done(self):
+        """
+        Check whether the command has been answered or aborted.
+        """
+        return self.__ev.is_set()
+    
+    def result(self, timeout = None):
+        """
+        Wait for the reply and return it.
+        
+        :param timeout: Time in seconds to wait for the reply. If this parameter is omitted no timeout will be used.
+        :type timeout: float, None
+        :returns: Reply lines or ``None`` if the command was aborted or the timeout expired
+        :rtype: list
+        """
+        if not self.__ev.wait(timeout):
+            return None
+        if self.aborted:
+            return None
+        return self.reply
+    
+    def add_done_callback(self, fn):
+        """
+        Call **fn** with this command as argument once the reply is received
+        or the command is aborted. If that already happened **fn** is called 
+        right away. It is called from the receiver thread so it must not block.
+        
+        :param fn: Callback function `fn(command)`
+        """
+        with Command.__done_lock:
+            if not self.__ev.is_set():
+                self.__done_callbacks.append(fn)
+                return
+        fn(self)
         
     def wait(self, timeout = None):
         """
@@ -234,14 +298,21 @@ class Command(object):
         return cls(Command.ZMODIFY, z)
 
     @classmethod
-    def file(cls, filename):
+    def file(cls, filename, layer = None, pipeline = None):
         """
         Constructor for ``FILE`` command.
         
         :param filename: Filename of file to be pushed.
+        :param layer: Layer to start from, ``None`` to start from the beginning.
+        :param pipeline: Pipeline configuration, see `GCodePipeline.from_config`
         :type filename: string
+        :type layer: int
+        :type pipeline: dict
         """
-        return cls(Command.FILE, filename, 'file')
+        cmd = cls(Command.FILE, filename, 'file')
+        cmd.start_layer = layer
+        cmd.pipeline = pipeline
+        return cmd
 
 
 class GCodeService:
@@ -317,8 +388,26 @@ class GCodeService:
     UNICODE_HANDLING = 'replace'
     
     REPLY_QUEUE_SIZE = 1 
+    
+    # Number of consecutive queued commands after which a file line is pushed
+    # before anything but control commands is taken from the queue again
+    FILE_STARVATION_LIMIT = 8
+    
+    # Seconds a reset waits for the tasks to get `self_descruct`
+    SELF_DESTRUCT_TIMEOUT = 2.0
+    
+    # Reply to a line that is not a command, followed by the line itself
+    UNKNOWN_COMMAND = 'echo:Unknown command: "'
+    
+    # Seconds without any reply after which a retransmission that was not
+    # accepted yet is started again
+    RESEND_TIMEOUT = 2.0
+    
+    # Commands always sent through the control lane
+    CONTROL_GCODES = ('M112', 'M410', 'M999')
+    CONTROL_GROUPS = ('*', 'emergency')
         
-    def __init__(self, serial_port, serial_baud, serial_timeout = 5, use_checksum = False, logger = None, fabid = False):
+    def __init__(self, serial_port, serial_baud, serial_timeout = 5, use_checksum = False, logger = None, fabid = False, rx_buffer_size = 0, resend_buffer = 256, rx_reserve = None):
         
         self.running = False
         self.released = False
@@ -328,26 +417,54 @@ class GCodeService:
         self.SERIAL_BAUD = serial_baud
         self.SERIAL_TIMEOUT = serial_timeout
         
+        # Character-counting streaming mode. When enabled the reply queue is
+        # not limited and the number of unacknowledged bytes is kept below
+        # the size of the Totumduino RX buffer instead.
+        self.rx_buffer_size = int(rx_buffer_size)
+        self.rx_cond = Condition()
+        # Part of the RX buffer that file lines leave free so that jog and
+        # override commands can be written right away during a print
+        if rx_reserve is None:
+            rx_reserve = self.rx_buffer_size // 4
+        self.rx_reserve = min(int(rx_reserve), self.rx_buffer_size // 2)
+        
+        # Line numbered and checksummed transport. Sent lines are kept in 
+        # a ring buffer to be retransmitted when the firmware asks for it.
+        self.use_checksum = use_checksum
+        self.resend_buffer = ResendBuffer(resend_buffer)
+        self.resend_count = 0
         
+        # Retransmissions are done by the receiver thread so the reply queue
+        # must never block. Flow control is done by __wait_rx_space instead,
+        # with a zero sized buffer it falls back to one command in flight.
+        self.flow_control = bool(self.rx_buffer_size or self.use_checksum)
         
         # Inter-thread communication
         # Must be defined before any thread is created
-        self.cq = queue.Queue() # Command Queue
-        self.rq = queue.PriorityQueue(self.REPLY_QUEUE_SIZE) # Reply Queue
+        self.cq = LaneQueue(self.__command_lane) # Command Queue
+        # Replies arrive in the same order as the commands were written so 
+        # the reply queue has to be a FIFO
+        if self.flow_control:
+            self.rq = queue.Queue() # Reply Queue
+        else:
+            self.rq = queue.Queue(self.REPLY_QUEUE_SIZE) # Reply Queue
 
         self.ev_tx_started = Event()
         self.ev_rx_started = Event()
         
         self.atomic_sync_lock = RLock()
         
-        self.re_z_override = re.compile('(?<=Z)([+|-]*[0-9]*.[0-9]*)')
-        self.__init_state()
-                        
-        # Callback handler
-        self.callback = []
+        # Splits the received data into lines
+        self.framer = LineFramer(self.READ_TERM, self.ENCODING, self.UNICODE_HANDLING)
         
-        self.use_checksum = use_checksum
+        # Command latencies and serial traffic
+        self.telemetry = Telemetry()
+        
+        # Line iterator of the file being pushed
+        self.file_iter = None
         
+        self.__init_state()
+                        
         if logger:
             self.log = logger
         else:
@@ -358,6 +475,9 @@ class GCodeService:
             ch.setFormatter(formatter)
             self.log.addHandler(ch)
         
+        # Callback handler
+        self.executor = CallbackExecutor(workers = 2, logger = self.log)
+        
         if(fabid == True):
             self.log.info("MyFabtotumCom - service enabled")
             self.mfc = MyFabtotumCom(self, logger)
@@ -404,69 +524,104 @@ class GCodeService:
         self.total_line_number = 0
         self.z_override = 0.0
         
-        # Note: experimental feature
+        # Line number of the last line sent with checksum, 0 means that 
+        # the firmware line counter has to be synchronized first.
         self.line_number = 0
         
         self.group_ack = {'gcode' : 0, 'file' : 0, 'macro' : 0, 'override' : 0, 'monitor' : 0}
         self.atomic_group = None
         self.is_atomic = False
         self.file_state = GCodeService.FILE_NONE
+        self.__close_file()
         self.last_command = None
         self.first_move = False
         self.gcode_count = 0
+        # Byte offsets used for the file progress: where streaming started,
+        # file size and end of the last acknowledged line
+        self.file_start_offset = 0
+        self.file_size = 0
+        # Offset of the file line being sent, lines expanded by the
+        # pipeline share the offset of their source line
+        self.file_line_offset = 0
+        # File lines come with their checksum from the compiled cache
+        self.file_checksums = False
+        self.file_acked_offset = 0
+        # File commands waiting for a reply with the offset of their line end
+        self.file_sent = deque()
         self.printer_halted = False
+        # Queued commands sent since the last file line
+        self.file_starved = 0
+        
+        # Release the sender if it is waiting for RX buffer space
+        with self.rx_cond:
+            self.rx_pending = 0
+            self.resend_from = 0
+            self.resend_pending = False
+            self.resend_swallow = 0
+            self.resend_request = None
+            self.unknown_line = False
+            self.resend_buffer.clear()
+            self.rx_cond.notify_all()
+        
+        self.cq.reset_inflight()
     
-    @staticmethod
-    def __is_number(s):
-        """ Check whether a string is a valid number """
-        try:
-            float(s)
-            return True
-        except ValueError:
-            return False
+    def __close_file(self):
+        """
+        Stop reading the file being pushed.
+        """
+        if self.file_iter:
+            self.file_iter.close()
     
-    def __file_done_thread(self, last_command):
+    def __update_progress(self):
         """
-        To ensure that the callback function cannot block sender/receiver threads
-        calling it must be done from a separate thread.
+        Update the progress with the byte offset of the last acknowledged file line.
         """
-        if last_command:
-            self.log.debug("waiting for last_command %s", str(last_command))
-            last_command.wait()
+        file_sent = self.file_sent
+        while file_sent and file_sent[0][0].done():
+            self.file_acked_offset = file_sent.popleft()[1]
         
+        size = self.file_size - self.file_start_offset
+        if size > 0:
+            self.progress = 100 * float(self.file_acked_offset - self.file_start_offset) / float(size)
+    
+    def __file_done(self, last_command):
+        """
+        Called once the last command of a file has been answered.
+        """
         self.log.debug("last command finished")
         
         self.progress = 100.0
-        
-        if self.callback:
-            for cb in self.callback:
-                cb('file_done', None)
+        self.executor.submit('file_done', None, on_delivered = self.__file_done_delivered)
+    
+    def __file_done_delivered(self):
+        """
+        Called once `file_done` has been delivered to all the callbacks.
+        """
+        stats = self.get_stream_stats()
+        if stats:
+            self.log.info("File streamed: %d lines in %.1fs, %.1f lines/s [%s]",
+                            stats['lines'], stats['duration'], stats['lines_per_sec'], stats['mode'])
         
         self.progress = 0.0
         # Make sure z_override is reset
         self.z_override = 0.0
     
     def __trigger_file_done(self, last_command):
+        """
+        Trigger `file_done` once **last_command** gets its reply. To ensure that 
+        the callback functions cannot block sender/receiver threads they are
+        called from the callback executor.
+        """
         self.log.debug("trigger_callback %s %s", 'file_done', str(last_command) )
-        callback_thread = Thread( 
-                target = self.__file_done_thread, 
-                args=( [last_command] ) 
-                )
-        callback_thread.start()
-        
-    def __callback_thread(self, callback_name, data):
-        if self.callback:
-            for cb in self.callback:
-                cb(callback_name, data)
+        if last_command:
+            self.log.debug("waiting for last_command %s", str(last_command))
+            last_command.add_done_callback(self.__file_done)
+        else:
+            self.__file_done(None)
         
     def __trigger_callback(self, callback_name, data):
         self.log.debug("trigger_callback %s %s", callback_name, str(data) )
-        callback_thread = Thread( 
-                name="GCodeService-callback-{0}".format(callback_name),
-                target = self.__callback_thread, 
-                args=( [callback_name, data] ) 
-                )
-        callback_thread.start()
+        self.executor.submit(callback_name, data)
     
     """ APIs *public* functions """
     def trigger(self, callback_name, data):
@@ -475,8 +630,12 @@ class GCodeService:
     
     def __reset_thread(self, trigger_file_done = False, destroy_scripts=True):
         if destroy_scripts:
-            self.__trigger_callback('self_descruct', None)
-            time.sleep(0.1)
+            # Delivered ahead of the queued events, see `CallbackExecutor`
+            self.log.debug("trigger_callback %s %s", 'self_descruct', None )
+            delivered = Event()
+            self.executor.submit('self_descruct', None, on_delivered = delivered.set)
+            if not delivered.wait(self.SELF_DESTRUCT_TIMEOUT):
+                self.log.warning("self_descruct not delivered, resetting anyway")
             
         self.__reset_totumduino()
         if trigger_file_done:
@@ -488,13 +647,16 @@ class GCodeService:
             args = ([trigger_file_done, destroy_scripts]) )
         callback_thread.start()
     
-    def __send_gcode_command(self, code, group = 'gcode', modify = True):
+    def __send_gcode_command(self, code, group = 'gcode', modify = True, data_cs = None):
         """
         Internal gcode send function.
+        
+        :param data_cs: Precomputed checksum of **code**, see `data_checksum`
         """
         if isinstance(code, str):
             gcode_raw = code + '\r\n'
             gcode_command = Command.gcode(gcode_raw, group=group)
+            gcode_command.data_cs = data_cs
         elif isinstance(code, Command):
             gcode_raw = code.data + '\r\n'
             gcode_command = code
@@ -502,57 +664,314 @@ class GCodeService:
             self.log.info("Unknown command")
             raise AttributeError
         
-        gcode_label = gcode_raw.split()[0]
+        gcode_label = gcode_raw.split(None, 1)[0]
+        if gcode_label[0] not in 'GM':
+            # Let the hooks find the command word
+            gcode_label = None
+        elif ';' in gcode_label:
+            gcode_label = gcode_label.split(';', 1)[0]
         
         for hook in HOOKS:
-            trigger, callback_name, callback_data = hook.process_command(self, gcode_raw)
+            trigger, callback_name, callback_data = hook.process_command(self, gcode_raw, gcode_label)
             if trigger:
                 self.__trigger_callback(callback_name, callback_data)
         
         # Z Override modification
         if (self.z_override != 0.0) and ('Z' in gcode_raw) and modify:
-            get_z_match = self.re_z_override.search(gcode_raw[:-2])
-            if get_z_match:
-                num_orig = get_z_match.group(1)
-                str_orig = 'Z' + num_orig
-                if self.__is_number(num_orig):
-                    new_z = float(num_orig)+float(self.z_override)
-                    str_new = 'Z' + str(new_z) # Safer to use 'Z{num}' then just '{num}'
-                    new_cmd = gcode_raw[:-2].replace(str_orig, str_new)
-                    self.log.debug('MODIFIED [%s] -> [%s]', gcode_raw[:-2], new_cmd )
-                    gcode_raw = new_cmd + '\r\n'
-        
-        priority = 1
-                                
-        # Note: experimental feature
-        if self.use_checksum:
-            data = gcode_raw[:-2]
-            self.line_number += 1
-            new_code = "N{0} {1}".format(self.line_number, data)
+            new_cmd = self.__override_z(gcode_raw[:-2])
+            if new_cmd:
+                self.log.debug('MODIFIED [%s] -> [%s]', gcode_raw[:-2], new_cmd )
+                gcode_raw = new_cmd + '\r\n'
+                gcode_command.data_cs = None
+        
+        if ( self.file_state != GCodeService.FILE_WAIT and
+             self.file_state != GCodeService.FILE_PAUSED_WAIT):
+            self.__transmit(gcode_command, gcode_raw[:-2])
+        else:
+            self.log.debug("FILE_WAIT in progress, ignorig command [%s]", gcode_raw[:-2])
+            gcode_command.notify(abort=True)
+
+        return gcode_command
+    
+    def __override_z(self, data):
+        """
+        Add `z_override` to the Z value of a line. Parameters are found by 
+        their letter, so compact lines like ``G1Z0.3F1200`` work as well.
+        
+        :returns: Modified line or ``None`` if there is no Z value to modify.
+        :rtype: string
+        """
+        code, sep, comment = data.partition(';')
+        line = GLine(code)
+        z = line.get('Z')
+        if z is None:
+            return None
+        line.set('Z', z + float(self.z_override))
+        # Keep the spacing before the comment
+        return str(line) + code[len(code.rstrip()):] + sep + comment
+    
+    def __command_lane(self, cmd):
+        """
+        Get the command queue lane of **cmd** and store it in ``cmd.lane``.
+        """
+        if cmd.lane is None:
+            if cmd.id == Command.GCODE:
+                if cmd.group in self.CONTROL_GROUPS or cmd.data[:4] in self.CONTROL_GCODES:
+                    cmd.lane = LANE_CONTROL
+                elif cmd.group == 'monitor':
+                    cmd.lane = LANE_MONITOR
+                elif cmd.group == 'file':
+                    cmd.lane = LANE_BULK
+                else:
+                    cmd.lane = LANE_INTERACTIVE
+            elif cmd.id == Command.FILE or cmd.id == Command.ZMODIFY:
+                cmd.lane = LANE_INTERACTIVE
+            else:
+                cmd.lane = LANE_CONTROL
+        
+        return cmd.lane
+    
+    def __transmit(self, cmd, data):
+        """
+        Write **data** to the serial port and queue **cmd** for the reply.
+        With checksum enabled the line gets numbered and stored for resend.
+        """
+        lane = self.__command_lane(cmd)
+        
+        if not self.flow_control:
+            # One command in flight: wait for the reply of the previous one
+            # here, without holding rx_cond, so that a reset can still get it.
+            # Only the sender thread writes in this mode, so the command is 
+            # queued before it is written as the receiver expects.
+            self.rq.put( (1, cmd) )
+        
+        with self.rx_cond:
+            if self.is_resetting:
+                # Released by a reset, the queues are cleaned up by it
+                cmd.notify(abort=True)
+                return
+            
+            if self.use_checksum:
+                if not self.line_number:
+                    self.__sync_line_number()
+                size = len(data) + len(str(self.line_number + 1)) + 8
+            else:
+                size = len(data) + 2
             
-            checksum = 0
+            if self.flow_control:
+                if lane == LANE_BULK:
+                    self.__wait_rx_space(size, self.rx_reserve)
+                else:
+                    self.__wait_rx_space(size)
+                
+                if self.is_resetting:
+                    cmd.notify(abort=True)
+                    return
             
-            for c in new_code:
-                checksum = int(checksum) ^ ord(c)
-            checksum = checksum & 0xff
+            self.cq.sent(lane)
             
-            # Modify original command
-            gcode_complete = "{0}*{1}\r\n".format(new_code, checksum)
+            if self.use_checksum:
+                self.line_number += 1
+                self.__write_line(cmd, data, self.line_number)
+            else:
+                self.__write_line(cmd, data)
+    
+    def __write_line(self, cmd, data, line_number = None, resend = False):
+        """
+        Write **cmd** to the serial port. With flow control the command is
+        queued for the reply as well, the reply queue is not limited then so 
+        this never blocks. Otherwise `__transmit` has already queued it.
+        
+        Must be called with `rx_cond` acquired.
+        """
+        
+        if line_number is not None:
+            gcode_complete = frame(line_number, data, cmd.data_cs)
+            cmd.line_number = line_number
+            if not resend:
+                self.resend_buffer.put(line_number, (cmd, data) )
         else:
-            gcode_complete = gcode_raw
+            gcode_complete = data + '\r\n'
         
-        if ( self.file_state != GCodeService.FILE_WAIT and
-             self.file_state != GCodeService.FILE_PAUSED_WAIT):
-            
+        cmd.size = len(gcode_complete)
+        
+        now = time.time()
+        if cmd.sent_time is None:
+            cmd.sent_time = now
+        self.telemetry.sent(cmd.size, now)
+        
+        if self.flow_control:
+            self.rx_pending += cmd.size
+        
+        if resend:
+            self.log.debug("<< %s [RQ: %d, resend]", gcode_complete[:-2], self.rq.qsize() )
+        else:
             self.log.debug("<< %s [RQ: %d]", gcode_complete[:-2], self.rq.qsize() )
+        
+        if self.flow_control:
+            self.rq.put_nowait( (1, cmd) )
+        self.serial.write(gcode_complete)
+    
+    def __sync_line_number(self):
+        """
+        Reset the firmware line counter, ``N0 M110`` sets the last line number to 0.
+        
+        Must be called with `rx_cond` acquired.
+        """
+        self.__write_line(Command.gcode('M110', group=None), 'M110', 0)
+    
+    def __wait_rx_space(self, size, reserve = 0):
+        """
+        Block until there is enough free space in the Totumduino RX buffer
+        for `size` bytes, leaving `reserve` bytes free. A command is always 
+        let through when nothing is pending so that lines longer than the 
+        buffer can still be sent.
+        
+        Must be called with `rx_cond` acquired.
+        """
+        limit = self.rx_buffer_size - reserve
+        while ( self.rx_pending and (self.rx_pending + size) > limit and
+                self.running and not self.is_resetting ):
+            self.rx_cond.wait(0.5)
+    
+    def __release_rx_space(self, cmd):
+        """
+        Release RX buffer space occupied by an acknowledged command.
+        """
+        if self.flow_control:
+            with self.rx_cond:
+                self.rx_pending = max(0, self.rx_pending - cmd.size)
+                
+                if cmd.line_number is not None and cmd.line_number >= self.resend_from:
+                    # A retransmitted line was accepted so the stale lines 
+                    # are all answered, see `__handle_resend`
+                    self.resend_pending = False
+                    self.resend_swallow = 0
+                
+                self.rx_cond.notify()
+    
+    def __release_lane(self, cmd):
+        """
+        Account an answered command in its command queue lane. The firmware 
+        line counter sync is not queued so it has no lane.
+        """
+        if cmd.lane is not None:
+            self.cq.done(cmd.lane)
+    
+    def __handle_resend(self, line_number):
+        """
+        Handle a ``Resend: <line_number>`` request and retransmit the lines 
+        from **line_number** right away.
+        
+        On an error the firmware clears its RX buffer and sends a single 
+        resend request, the lines that were in the RX buffer are lost without
+        a reply. Lines already in its command buffer are accepted and still 
+        get their reply, so only the commands from **line_number** on are 
+        taken out of the reply queue and written again.
+        
+        Lines, or what is left of them, that were still on the way when the 
+        RX buffer was cleared are rejected one by one with the same request.
+        Up to one such request per line in flight is ignored until a 
+        retransmitted line is accepted. If it was the retransmission that 
+        got rejected, or it was cleared with the RX buffer by a later error,
+        the replies stop and it is started again after `RESEND_TIMEOUT`, 
+        see `__check_resend_stall`.
+        """
+        with self.rx_cond:
+            if line_number == self.resend_from and self.resend_swallow:
+                self.resend_swallow -= 1
+                self.log.debug("Ignored repeated resend request of line %d", line_number)
+                return
             
-            self.rq.put( (priority, gcode_command) )
-            self.serial.write(gcode_complete)
+            self.resend_count += 1
+            
+            # Split the commands waiting for a reply into the accepted and 
+            # the rejected ones, both keep their order
+            rejected = []
+            accepted = []
+            if self.active_cmd:
+                if self.__is_rejected(self.active_cmd, line_number):
+                    rejected.append(self.active_cmd)
+                    self.active_cmd = None
+            while True:
+                try:
+                    priority, cmd = self.rq.get_nowait()
+                except queue.Empty:
+                    break
+                if self.__is_rejected(cmd, line_number):
+                    rejected.append(cmd)
+                else:
+                    accepted.append( (priority, cmd) )
+            for item in accepted:
+                self.rq.put_nowait(item)
+            
+            for cmd in rejected:
+                cmd.reply = []
+                self.rx_pending = max(0, self.rx_pending - cmd.size)
+            
+            self.log.warning("Communication error. Resend requested from line %d, %d lines rejected", line_number, len(rejected))
+            
+            self.resend_from = line_number
+            self.resend_pending = True
+            self.resend_swallow = max(0, self.line_number - line_number)
+            
+            self.__retransmit(rejected)
+            self.rx_cond.notify_all()
+    
+    def __check_resend_stall(self):
+        """
+        Start the retransmission again if no reply arrived for `RESEND_TIMEOUT`
+        before any of the retransmitted lines was accepted.
+        """
+        with self.rx_cond:
+            if not self.resend_pending:
+                return
+            if time.time() - self.idle_time_started < self.RESEND_TIMEOUT:
+                return
+            self.resend_swallow = 0
+            if not self.active_cmd and self.rq.empty():
+                self.resend_pending = False
+                return
+            self.log.warning("No reply after resend of line %d, retransmitting", self.resend_from)
+            self.__handle_resend(self.resend_from)
+    
+    @staticmethod
+    def __is_rejected(cmd, line_number):
+        return cmd.line_number is not None and cmd.line_number >= line_number
+    
+    def __retransmit(self, rejected):
+        """
+        Retransmit all the lines starting from `resend_from`.
+        
+        Must be called with `rx_cond` acquired.
+        
+        :param rejected: Commands rejected by the firmware, in order
+        """
+        entries = self.resend_buffer.since(self.resend_from)
+        
+        if entries is None:
+            # The firmware line counter does not match the buffer (lost
+            # M110 or the line is too old), so number the rejected lines 
+            # again starting from the one the firmware expects.
+            self.log.warning("Line %d is not available for resend, renumbering", self.resend_from)
+            lines = []
+            for cmd in rejected:
+                # Written data, it can differ from the command (Z override)
+                entry = self.resend_buffer.get(cmd.line_number)
+                if entry and entry[0] is cmd:
+                    lines.append( (cmd, entry[1]) )
+                else:
+                    lines.append( (cmd, cmd.data.rstrip()) )
+            
+            self.resend_buffer.clear()
+            self.line_number = self.resend_from - 1
+            
+            for cmd, data in lines:
+                self.line_number += 1
+                self.__write_line(cmd, data, self.line_number)
         else:
-            self.log.debug("FILE_WAIT in progress, ignorig command [%s]", gcode_complete[:-2])
-            gcode_command.notify(abort=True)
-
-        return gcode_command
+            for line_number, (cmd, data) in entries:
+                self.__write_line(cmd, data, line_number, resend=True)
 
     def __push_line(self):
         try:
@@ -565,7 +984,6 @@ class GCodeService:
 
                     # Access optimization
                     line2 = line[:2]
-                    line3 = line[:3]
                     line4 = line[:4]
 
                     if attrs:
@@ -578,15 +996,16 @@ class GCodeService:
                             self.__trigger_callback('first_move', None)
                             self.first_move = True
                     
-                    self.current_line_number += 1
+                    if self.file_iter.offset != self.file_line_offset:
+                        self.file_line_offset = self.file_iter.offset
+                        self.current_line_number += 1
                     
-                    self.progress = 100 * float(self.group_ack['file']) / float(self.gcode_count)
+                    self.__update_progress()
                     
                     if line:
-                        if( line3 in ['G29', 'G28', 'G27'] ) : # homing gcodes not nedeed during a print
-                            return False
-                        
-                        self.last_command = self.__send_gcode_command(line, group='file')
+                        data_cs = self.file_iter.checksum if self.file_checksums else None
+                        self.last_command = self.__send_gcode_command(line, group='file', data_cs=data_cs)
+                        self.file_sent.append( (self.last_command, self.file_iter.offset) )
                         
                         if ( line4 == 'M109' or line4 == 'M190') :
                             """ 
@@ -612,6 +1031,7 @@ class GCodeService:
             # to get it's reply and call the callback function if one
             # was specified.
             self.file_state = GCodeService.FILE_NONE
+            self.__close_file()
             self.__trigger_file_done(self.last_command)
             
             return False
@@ -633,18 +1053,29 @@ class GCodeService:
                 continue
             
             if self.file_state > GCodeService.FILE_NONE:
+                # Queued commands go first, but the file must keep going
+                # so after a while only control commands can overtake it
+                if self.file_starved >= self.FILE_STARVATION_LIMIT:
+                    lanes = [LANE_CONTROL]
+                else:
+                    lanes = None
                 try:
                     # Try to get a command
-                    cmd = self.cq.get_nowait()
+                    cmd = self.cq.get_nowait(lanes)
+                    self.file_starved += 1
                 except queue.Empty as e:
                     # No queued commands, send a line from the file
                     cmd = Command.NONE
+                    self.file_starved = 0
                     self.__push_line()
                     
             else:
                 cmd = self.cq.get()
 
             if self.is_resetting:
+                # Taken after the reset cleaned up the queues, release it
+                if cmd != Command.NONE:
+                    cmd.notify(abort=True)
                 time.sleep(1)
                 continue
 
@@ -692,16 +1123,50 @@ class GCodeService:
                 self.z_override = 0.0
                 self.progress = 0.0
                 
+                self.__close_file()
+                
                 try:                
                     gfile = GCodeFile(filename)
                     
                     self.total_line_number = gfile.info['line_count']
                     self.current_line_number = 0
                     self.group_ack['file'] = 0
-                    self.file_iter = iter(gfile)
+                    self.file_start_offset = 0
+                    # Homing codes are removed by the pipeline, they are not needed during a print
+                    pipeline = GCodePipeline.from_config(cmd.pipeline)
+                    # The compiled cache holds the output of the default pipeline
+                    cache = GCodeCache.open(filename) if not cmd.pipeline else None
+                    self.file_checksums = cache is not None
+                    
+                    if cmd.start_layer is not None:
+                        record = gfile.get_layer(cmd.start_layer)
+                        if not record:
+                            self.log.error("gcode file loading, layer %d not found in %s", cmd.start_layer, filename)
+                            continue
+                        
+                        # Restore the modal state and seek directly to the layer
+                        preamble = GCodeFile.resume_gcode(record)
+                        if cache:
+                            self.file_iter = cache.iter_from(record['offset'], preamble)
+                        else:
+                            self.file_iter = gfile.iter_from(record['offset'], preamble, prefetch=True, pipeline=pipeline)
+                        self.file_start_offset = record['offset']
+                        # Preamble lines have the start offset, they are not counted
+                        self.current_line_number = record['line']
+                        self.log.info("Resuming %s from layer %d, line %d", filename, cmd.start_layer, record['line'])
+                    elif cache:
+                        # Lines are decoded in chunks, there is no need to read ahead
+                        self.file_iter = cache.iter_from()
+                    else:
+                        self.file_iter = gfile.iter_from(prefetch=True, pipeline=pipeline)
                     
                     self.gcode_count = self.total_line_number = gfile.info['gcode_count']
+                    self.file_size = os.path.getsize(filename)
+                    self.file_acked_offset = self.file_start_offset
+                    self.file_line_offset = self.file_start_offset
+                    self.file_sent.clear()
                     
+                    self.file_time_started = time.time()
                     self.file_state = GCodeService.FILE_PUSH
                 except Exception as e:
                     self.log.error("gcode file loading, %s", str(e))
@@ -740,6 +1205,7 @@ class GCodeService:
                     else:
                         self.file_state = GCodeService.FILE_NONE
                         self.__trigger_file_done(self.last_command)
+                    self.__close_file()
                                     
             elif cmd == Command.ABORT:
                 
@@ -775,6 +1241,7 @@ class GCodeService:
                     else:
                         self.file_state = GCodeService.FILE_NONE
                         self.__trigger_file_done(self.last_command)
+                    self.__close_file()
                 
                 # Make sure z_override is reset
                 self.z_override = 0.0
@@ -794,30 +1261,31 @@ class GCodeService:
                 
         self.log.info("sender thread: stopped")
     
-    def __handle_line(self, line_raw):
+    def __handle_line(self, line):
         """
-        Process a one line of reply message.
+        Process a one line of reply message. The line is already decoded
+        according to selected ENCODING by the framer.
         """
         
-        #~ self.log.debug("__handle_line %s [%s]", line_raw, self.active_cmd)
+        #~ self.log.debug("__handle_line %s [%s]", line, self.active_cmd)
         
         if self.is_resetting:
             return
         
-        try:
-            # The received packet is a bytearray so it has to be converted to a
-            # string type according to selected ENCODING
-            line = line_raw.decode(self.ENCODING, self.UNICODE_HANDLING)
-        except Exception as e:
-            print e
-            return
-        
         if not line:
             #print "__handle_line: return line_empty"
             return
         
+        # Unsolicited temperature report (M155), it is not part of any reply.
+        # M105 replies start with 'ok' and M109/M190 progress has no targets.
+        if line[0] == 'T' or line[:2] == ' T':
+            temps = parseTempReport(line)
+            if temps:
+                self.__trigger_callback('temp_change:all', [temps['T'], temps['target']['T'], temps['B'], temps['target']['B']])
+                return
+        
         # Update idle time start
-        self.idle_time_started = time.time()
+        self.idle_time_started = now = time.time()
         
         # If there is no active command try to get it from the reply queue
         if not self.active_cmd:
@@ -834,14 +1302,37 @@ class GCodeService:
         else:
             self.log.debug("  >> [%s] [%s]", 'None', line.rstrip())
         
+        if self.use_checksum:
+            if self.resend_request is not None and line[:2] == 'ok':
+                # The resend request is closed by an 'ok' of its own
+                self.__handle_resend(self.resend_request)
+                self.resend_request = None
+                return
+            
+            if self.unknown_line and line[:2] == 'ok':
+                self.unknown_line = False
+                return
+            
+            if line.startswith(self.UNKNOWN_COMMAND) and line[len(self.UNKNOWN_COMMAND):][:1] != 'N':
+                # All the lines are numbered, so this is what was left of a 
+                # line cleared from the RX buffer after an error. It is 
+                # acknowledged without being one of the commands.
+                self.log.debug("Ignored reply of a partial line")
+                self.unknown_line = True
+                return
+            
+            resend = parse_resend(line)
+            if resend is not None and not (self.active_cmd and self.active_cmd.data[:4] in ('M999', 'M998')):
+                self.resend_request = resend
+                if self.active_cmd and self.active_cmd.reply and self.active_cmd.reply[-1].startswith('Error:'):
+                    # Error message of the rejected line
+                    self.active_cmd.reply.pop()
+                return
+        
         if self.active_cmd:
             # Get the active command as this is the on waiting for the reply.
             cmd = self.active_cmd
             
-            if cmd.async:
-                # TODO: async mode
-                pass
-            
             #~ if cmd.data[:4] == 'M303':
                 #~ if line[:2] != 'ok':
                     #~ cmd.reply.append( line )
@@ -849,16 +1340,14 @@ class GCodeService:
             cmd.reply.append( line )
 
             if cmd.hasExpectedReply(line):
-                
-                # TODO: should a lost command be resent?
-                if len(cmd.reply) > 1:
-                    if cmd.reply[-2].startswith("Resend:") and cmd.data[:4]: # Second to last line of reply
-                        if cmd.data[:4] != 'M999' and cmd.data[:4] != 'M998':
-                            resend, line_no = cmd.reply[-2].split(':')
-                            self.line_number = int(line_no) -1
-                            self.log.error("Communication error. Need to resend command [{0}]".format(cmd.data))
-                        
                 cmd.notify()
+                self.__release_rx_space(cmd)
+                self.__release_lane(cmd)
+                self.telemetry.done(cmd, now)
+                
+                if cmd.async:
+                    # Reply is sent to the callbacks as well
+                    self.__trigger_callback('gcode_reply', [cmd.data, cmd.reply])
                 
                 group = self.active_cmd.group
                 if group:
@@ -877,9 +1366,12 @@ class GCodeService:
                 if cmd.reply[-1].startswith('Error:Printer halted.') or cmd.reply[-1].startswith('Printer stopped due to errors.'):
                     self.log.info("Printer halted [%s]", cmd.data)
                     cmd.notify(abort=True)
+                    self.__release_rx_space(cmd)
+                    self.__release_lane(cmd)
                     #~ self.printer_halted = True
                     if self.file_state > GCodeService.FILE_NONE:
                         self.file_state = GCodeService.FILE_NONE
+                        self.__close_file()
                     # self.terminate()
                     # Note: was a fallback for gpiomonitor, not it can trigger a termination (emergency restart)
                     # and leave gpiomonitor frozen for a moment in M730 check so that it does not send the notification
@@ -942,11 +1434,12 @@ class GCodeService:
                     break
             else:
                 if data:
-                    self.buffer.extend(data)
-                    
-                    while self.READ_TERM in self.buffer:
-                        line_raw, self.buffer = self.buffer.split(self.READ_TERM, 1)
-                        self.__handle_line(line_raw)
+                    self.telemetry.received(len(data), time.time())
+                    for line in self.framer.feed(data):
+                        self.__handle_line(line)
+                
+                if self.resend_pending:
+                    self.__check_resend_stall()
         
         self.log.info("receiver thread: stopped")
     
@@ -1003,24 +1496,26 @@ class GCodeService:
         time.sleep(0.2)
         
         # Release all threads waiting for a reply (from reply queue)
-        while not self.rq.empty:
+        while not self.rq.empty():
             #print "reply queue is not empty"
             try:
                 priority, cmd = self.rq.get_nowait()
                 cmd.notify(abort=True)
-                print "notifing ", cmd
+                self.log.debug("Aborted [%s]", str(cmd))
             except queue.Empty as e:
                 break
         
         time.sleep(0.2)
         
-        # Release all threads waiting for a reply (from command queue)
-        while not self.cq.empty:
+        # Release all threads waiting for a reply (from command queue),
+        # lanes at their in-flight limit would be skipped otherwise
+        self.cq.reset_inflight()
+        while not self.cq.empty():
             #print "command queue is not empty"
             try:
                 cmd = self.cq.get_nowait()
                 cmd.notify(abort=True)
-                print "notifing ", cmd
+                self.log.debug("Aborted [%s]", str(cmd))
             except queue.Empty as e:
                 break
                 
@@ -1043,7 +1538,7 @@ class GCodeService:
                                 timeout = self.SERIAL_TIMEOUT
                                 )
         self.serial.flushInput()
-        self.buffer = bytearray()
+        self.framer.reset()
         self.__init_state()
         self.serial.flushInput()
         
@@ -1214,15 +1709,17 @@ class GCodeService:
     def register_callback(self, callback_fun):
         """
         Callbacks: update, file_done, paused, resumed
+        
+        Each callback function gets the events in the order they were triggered,
+        consecutive temperature updates not yet delivered are merged into the latest one.
         """
-        if callback_fun not in self.callback:
-            self.callback.append(callback_fun)
+        self.executor.register(callback_fun)
         
     def unregister_callback(self, callback_fun):
         """
         Unregister previously registered callback function.
         """
-        self.callback.remove(callback_fun)
+        self.executor.unregister(callback_fun)
     
     def set_atomic_group(self, group):
         """
@@ -1258,9 +1755,77 @@ class GCodeService:
         self.atomic_group = None
         self.atomic_sync_lock.release()
     
+    def __queue_gcode(self, code, expected_reply, group, timeout, async):
+        """
+        Create a gcode command and put it on the command queue.
+        Pause and resume commands are handled by the service itself.
+        """
+        if code == 'M25' or code == 'M0':
+            self.pause()
+            cmd = Command.gcode(code, expected_reply, group = group)
+            cmd.reply = ['ok']
+            cmd.notify()
+            return cmd
+        elif code == 'M24':
+            self.resume()
+            cmd = Command.gcode(code, expected_reply, group = group)
+            cmd.reply = ['ok']
+            cmd.notify()
+            return cmd
+        
+        self.log.debug("put on command queue: %s,%s", code, group)
+        
+        cmd = Command.gcode(code, expected_reply, group = group, timeout = timeout, async = async)
+        self.cq.put(cmd)
+        
+        return cmd
+    
+    def __wait_reply(self, cmd, timeout, sent_timestamp):
+        """
+        Wait for the reply of a queued command.
+        
+        :returns: Reply lines or ``None`` if the command was aborted, timed out or the service was stopped.
+        """
+        # Protection #1 in case the service is stopped
+        if not self.running or self.released:
+            return None
+        # Last resort protection #2 if service is stopped
+        # As this function is called from a separate thread from 'sender'
+        # and 'receiver' it can be active after they have been terminated.
+        # In which case no one will trigger cmd.ev event to unlock it.
+        # Timeout is a safety measure to handle this corner case.
+        while not cmd.wait(3):
+            self.log.debug("Waiting (3) for [%s,%s] aborted: %s", cmd.data, cmd.group, str(cmd.aborted))
+            
+            if self.is_resetting or self.released:
+                cmd.notify(abort=True)
+                time.sleep(1)
+                return None
+            
+            if not self.running or self.released:
+                # Aborting because the service has been stopped
+                self.log.info('Aborting reply due to stop. [%s]', cmd.data)
+                return None
+            if timeout:
+                if ( time.time() - sent_timestamp ) >= timeout:
+                    self.log.info('Timeout for [%s]', cmd.data)
+                    return None
+                    
+        if cmd.aborted:
+            self.log.info('Command aborted. [%s]', cmd.data)
+            return None
+                    
+        return cmd.reply
+    
     def send(self, code, block = True, timeout = None, group = 'gcode', expected_reply = 'ok', async = False):
         """
         Send GCode and return reply.
+        
+        :param block: Wait for the reply. If ``False`` the command is returned 
+                      right away and can be used as a handle, see ``Command.result``,
+                      ``Command.add_done_callback`` and ``wait_all``.
+        :param async: Reply is also sent to the callbacks as ``gcode_reply``
+        :returns: Reply lines, or the ``Command`` if **block** is ``False``. ``None`` on failure.
         """
         if self.is_resetting or self.released:
             time.sleep(1)
@@ -1269,54 +1834,71 @@ class GCodeService:
         code = code.encode('latin-1')
         if self.running:
             sent_timestamp = time.time()
-            if code == 'M25' or code == 'M0':
-                self.pause()
-                return ['ok']
-            elif code == 'M24':
-                self.resume()
-                return ['ok']
-            
-            self.log.debug("put on command queue: %s,%s", code, group)
             
-            cmd = Command.gcode(code, expected_reply, group = group, timeout = timeout, async = async)
-            self.cq.put(cmd)
+            cmd = self.__queue_gcode(code, expected_reply, group, timeout, async)
             
             # Don't block, return immediately 
             if not block:
-                return None
+                return cmd
             
-            # Protection #1 in case the service is stopped
-            if not self.running or self.released:
-                return None
-            # Last resort protection #2 if service is stopped
-            # As this function is called from a separate thread from 'sender'
-            # and 'receiver' it can be active after they have been terminated.
-            # In which case no one will trigger cmd.ev event to unlock it.
-            # Timeout is a safety measure to handle this corner case.
-            while not cmd.wait(3):
-                self.log.debug("Waiting (3) for [%s,%s] aborted: %s", code, group, str(cmd.aborted))
-                
-                if self.is_resetting or self.released:
-                    cmd.notify(abort=True)
-                    time.sleep(1)
-                    return None
-                
-                if not self.running or self.released:
-                    # Aborting because the service has been stopped
-                    self.log.info('Aborting reply due to stop. [%s]', code)
-                    return None
-                if timeout:
-                    if ( time.time() - sent_timestamp ) >= timeout:
-                        self.log.info('Timeout for [%s]', code)
-                        return None
-                        
-            if cmd.aborted:
-                self.log.info('Command aborted. [%s]', code)
-                return None
-                        
-            return cmd.reply
+            return self.__wait_reply(cmd, timeout, sent_timestamp)
         else:
             return None
+    
+    def send_batch(self, codes, block = True, timeout = None, group = 'gcode', expected_reply = 'ok'):
+        """
+        Queue a sequence of GCode commands at once. Commands are sent to the 
+        Totumduino one after the other without waiting for the caller and 
+        replies keep the same order.
+        
+        :param codes: List of GCode commands
+        :param expected_reply: Expected reply for all the commands or a list with one for each command
+        :param timeout: Timeout for each command
+        :returns: List of replies (``None`` for failed commands), or the list of 
+                  ``Command`` handles if **block** is ``False``. ``None`` on failure.
+        """
+        if self.is_resetting or self.released:
+            time.sleep(1)
+            return None
+        
+        if not self.running:
+            return None
+        
+        if isinstance(expected_reply, (list, tuple)):
+            expected = expected_reply
+        else:
+            expected = [expected_reply] * len(codes)
+        
+        sent_timestamp = time.time()
+        
+        commands = []
+        for code, reply in zip(codes, expected):
+            commands.append( self.__queue_gcode(code.encode('latin-1'), reply, group, timeout, False) )
+        
+        if not block:
+            return commands
+        
+        return self.wait_all(commands, timeout, sent_timestamp)
+    
+    def wait_all(self, commands, timeout = None, sent_timestamp = None):
+        """
+        Wait for the replies of commands returned by a non-blocking ``send`` or ``send_batch``.
+        
+        :param commands: List of ``Command`` handles
+        :param timeout: Timeout for each command
+        :returns: List of replies, ``None`` for commands that were aborted or timed out
+        :rtype: list
+        """
+        if sent_timestamp is None:
+            sent_timestamp = time.time()
+        
+        replies = []
+        for cmd in commands:
+            replies.append( self.__wait_reply(cmd, timeout, sent_timestamp) )
+            # Timeout of the next command starts once this one is answered
+            sent_timestamp = time.time()
+        
+        return replies
         
     def push(self, id, data):
         """
@@ -1325,11 +1907,18 @@ class GCodeService:
         self.__trigger_callback(id, data)
         return True
         
-    def send_file(self, filename):
+    def send_file(self, filename, layer = None, pipeline = None):
         """
         Send GCode from a file.
         Returns ``False`` if a file is already being pushed.
         
+        :param layer: Layer to start from. The file is not read up to the
+                      layer, streaming starts at its offset in the gcode index
+                      after restoring temperatures, position, extruder and
+                      feedrate as they were at the start of the layer.
+        :param pipeline: Transformations applied to the lines ahead of the sender,
+                         see `GCodePipeline.from_config`. Homing codes are
+                         always removed unless ``strip_homing`` is ``False``.
         :rtype: bool
         """
         if self.is_resetting or self.released:
@@ -1337,7 +1926,7 @@ class GCodeService:
         
         if self.running:
             if self.state == GCodeService.IDLE:
-                cmd = Command.file(filename)
+                cmd = Command.file(filename, layer, pipeline)
                 self.cq.put(cmd)
                 return True
                 
@@ -1345,7 +1934,8 @@ class GCodeService:
             
     def get_progress(self):
         """
-        Return current file progress.
+        Return current file progress, the percentage of file bytes acknowledged
+        by the firmware.
         After file_done callback is finished executing, progress will be set to 0.
         """
         return self.progress
@@ -1355,11 +1945,76 @@ class GCodeService:
         Return amount of time that no command was executed from a file.
         """
         return self.idle_time_started - time.time()
+    
+    def get_stream_stats(self):
+        """
+        Return file streaming statistics of the current (or last) file push.
+        The sustained rate is calculated from the acknowledged file lines.
+        
+        :returns: Dictionary with `mode`, `lines`, `duration` and `lines_per_sec` or ``None`` if no file was pushed yet.
+        :rtype: dict
+        """
+        if not self.file_time_started:
+            return None
+        
+        lines = self.group_ack['file']
+        duration = time.time() - self.file_time_started
+        
+        if self.rx_buffer_size:
+            mode = 'streaming:{0}'.format(self.rx_buffer_size)
+        else:
+            mode = 'ping-pong'
         
+        return {
+            'mode'          : mode,
+            'lines'         : lines,
+            'duration'      : duration,
+            'lines_per_sec' : (lines / duration) if duration > 0 else 0.0
+        }
+        
+    def get_telemetry(self):
+        """
+        Return serial link telemetry: command latencies per class and group
+        (in milliseconds), transferred bytes and rates, and queue depths.
+        
+        :rtype: dict
+        """
+        telemetry = self.telemetry.snapshot()
+        telemetry['queues'] = {
+            'lanes'         : self.cq.stats(),
+            'reply'         : self.rq.qsize(),
+            'rx_pending'    : self.rx_pending,
+            'callbacks'     : sum( sub['depth'] for sub in self.executor.stats()['subscribers'] )
+        }
+        return telemetry
+    
     def debug_info(self, args):
         
         self.log.debug("=== Debug Info: BEGIN ===")
         self.log.debug("Thread count: %d", threading.active_count())
+        self.log.debug("RX pending: %d / %d bytes, reserve %d", self.rx_pending, self.rx_buffer_size, self.rx_reserve)
+        for name, lane in sorted(self.cq.stats().items()):
+            self.log.debug("Lane %s: depth %d, in flight %d / %s, queued %d",
+                        name, lane['depth'], lane['inflight'], lane['limit'] or '-', lane['queued'])
+        self.log.debug("Resend requests: %d, line number: %d", self.resend_count, self.line_number)
+        self.log.debug("Stream stats: %s", str(self.get_stream_stats()))
+        telemetry = self.telemetry.snapshot()
+        self.log.debug("Serial: tx %d bytes (%.1f B/s), rx %d bytes (%.1f B/s)",
+                        telemetry['bytes']['tx'], telemetry['bytes']['tx_rate'],
+                        telemetry['bytes']['rx'], telemetry['bytes']['rx_rate'])
+        for kind in ['class', 'group']:
+            for name, latency in sorted(telemetry[kind].items()):
+                for stage in ['queue', 'ack']:
+                    h = latency[stage]
+                    if h['count']:
+                        self.log.debug("Latency %s %s %s: count %d, mean %.2fms, p50 %.2fms, p99 %.2fms, max %.2fms",
+                                        kind, name, stage, h['count'], h['mean'], h['p50'], h['p99'], h['max'])
+        stats = self.executor.stats()
+        self.log.debug("Callbacks: submitted %d, dropped %d, coalesced %d, ready %d",
+                        stats['submitted'], stats['dropped'], stats['coalesced'], stats['ready'])
+        for sub in stats['subscribers']:
+            self.log.debug("  %s: depth %d, delivered %d, dropped %d, coalesced %d",
+                        sub['name'], sub['depth'], sub['delivered'], sub['dropped'], sub['coalesced'])
         self.log.debug("Thread enumeration:")
         for e in threading.enumerate():
             self.log.debug("%s", str(e))
@@ -50,104 +50,120 @@ def parse_gcode(raw_code):
     
     return code, fields
 
-def process_command(gcs, line):
+def _set_xyz_mode(gcs, relative):
+    mode = gcs.gcode_state['axis_relative_mode']
+    mode['x'] = relative
+    mode['y'] = relative
+    mode['z'] = relative
+
+def _set_e_mode(gcs, relative):
+    gcs.gcode_state['axis_relative_mode']['e'] = relative
+
+def _modal(handler, relative):
+    """ Create an action updating the modal gcode state. """
+    def action(gcs, line, code):
+        handler(gcs, relative)
+        return False, '', []
+    return action
+
+def _trigger(name):
+    """ Create an action triggering `gcode_action:<name>` with the S field as data. """
+    callback_name = 'gcode_action:' + name
+    def action(gcs, line, code):
+        callback_data = [code]
+        code, fields = parse_gcode(line)
+        if 'S' in fields:
+            callback_data.append(fields['S'])
+        return True, callback_name, callback_data
+    return action
+
+def _message(gcs, line, code):
+    """ UI action """
+    return True, 'gcode_action:message', line.split("M117")[1].strip()
+
+def _pause(gcs, line, code):
+    """ PAUSE ACTION """
+    return True, 'gcode_action:pause', [code]
+
+_milling  = _trigger('milling')
+_heating  = _trigger('heating')
+_cooling  = _trigger('cooling')
+_printing = _trigger('printing')
+_scanning = _trigger('scanning')
+
+# Dispatch table keyed on the command word. Commands that are not listed
+# (G0, G1 and the most of the file content) do not trigger anything and 
+# are not parsed at all.
+ACTIONS = {
+    'G90'   : _modal(_set_xyz_mode, False), # Abs XYZ mode
+    'G91'   : _modal(_set_xyz_mode, True),  # Rel XYZ mode
+    'M82'   : _modal(_set_e_mode, False),   # Abs E mode
+    'M83'   : _modal(_set_e_mode, True),    # Rel E mode
+    # Milling action
+    'M1'    : _milling, # Same as M0
+    'M3'    : _milling, # Spindle CounterClocwise
+    'M4'    : _milling, # Spindle Clocwise
+    'M6'    : _milling, # Laser
+    # Heating action
+    'M104'  : _heating, # Set extruder temp
+    'M109'  : _heating, # Wait for extruder temp
+    'M140'  : _heating, # Set bed temp
+    'M190'  : _heating, # wait for bed temp
+    # Cooling action
+    'M106'  : _cooling, # Fan ON
+    'M107'  : _cooling, # Fan OFF
+    # Printing action
+    'M220'  : _printing, # Set speed factor
+    'M221'  : _printing, # Set extruder factor
+    # Scanning action
+    'M240'  : _scanning, # Trigger camera
+    'M401'  : _scanning, # Lower probe
+    #'M700' : _scanning, # Scanning laser
+    'M402'  : _scanning, # Raise probe
+    # UI action
+    'M117'  : _message,  # Display message
+    # PAUSE ACTION
+    'M0'    : _pause,
+    'M25'   : _pause,
+    'M226'  : _pause,
+}
+
+def command_word(line):
     """
-    Process command line and decide whether a trigger action should be taken.
+    Get the command word (``G1``, ``M104``...) of a gcode line without
+    parsing the rest of it.
     
-    :param line: Line to be processed.
+    :param line: Full GCode string.
     :type line: string
+    :returns: Command word or ``None`` if there is none
+    :rtype: string
     """
-    
-    trigger = False
-    callback_name = 'gcode_action'
-    callback_data = line
-    code = None
-    
+    tags = line.split(None, 1)
+    if not tags:
+        return None
+    code = tags[0]
+    if code[0] in "GM":
+        return code.split(';', 1)[0]
+    # Line number or tool change before the command, do a full parse
     code, fields = parse_gcode(line)
+    return code
+
+def process_command(gcs, line, code = None):
+    """
+    Process command line and decide whether a trigger action should be taken.
     
+    :param line: Line to be processed.
+    :param code: Command word of the line if it is already known.
+    :type line: string
+    :type code: string
+    :returns: A tuple of (trigger, callback_name, callback_data)
+    :rtype: tuple(bool, string, list)
+    """
     if code is None:
-        return False, '', []
-    
-    callback_data = [code]
+        code = command_word(line)
     
-    if (code == 'G0' or 
-        code == 'G1'):
-        # @TODO: monitor feedrate
-        pass
-        
-    elif code == 'G90': # Abs XYZ mode
-        gcs.gcode_state['axis_relative_mode']['x'] = False
-        gcs.gcode_state['axis_relative_mode']['y'] = False
-        gcs.gcode_state['axis_relative_mode']['z'] = False
-        
-    elif code == 'G91': # Rel XYZ mode
-        gcs.gcode_state['axis_relative_mode']['x'] = True
-        gcs.gcode_state['axis_relative_mode']['y'] = True
-        gcs.gcode_state['axis_relative_mode']['z'] = True
-    
-    elif code == 'M82': # Abs E mode
-        gcs.gcode_state['axis_relative_mode']['e'] = False
-        
-    elif code == 'M83': # Rel E mode
-        gcs.gcode_state['axis_relative_mode']['e'] = True
-    
-    elif ( code == 'M1' or # Same as M0
-        code == 'M3' or # Spindle CounterClocwise
-        code == 'M4' or # Spindle Clocwise
-        code == 'M6' ): # Laser
-        """ Milling action """
-        callback_name += ':milling'
-        if 'S' in fields:
-            callback_data.append(fields['S'])
-        trigger = True
-        
-    elif (code == 'M104' or # Set extruder temp
-          code == 'M109' or # Wait for extruder temp
-          code == 'M140' or # Set bed temp
-          code == 'M190' ): # wait for bed temp
-        """ Heating action """
-        callback_name += ':heating'
-        if 'S' in fields:
-            callback_data.append(fields['S'])
-        trigger = True
-         
-    elif (code == 'M106' or # Fan ON
-          code == 'M107' ): # Fan OFF
-        """ Cooling action """
-        callback_name += ':cooling'
-        if 'S' in fields:
-            callback_data.append(fields['S'])
-        trigger = True
-         
-    elif (code == 'M220' or # Set speed factor
-          code == 'M221' ): # Set extruder factor 
-        """ Printing action """
-        callback_name += ':printing'
-        if 'S' in fields:
-            callback_data.append(fields['S'])
-        trigger = True
-         
-    elif (code == 'M240' or # Trigger camera
-          code == 'M401' or # Lower probe
-          #code == 'M700' or # Scanning laser
-          code == 'M402' ): # Raise probe
-        """ Scanning action """
-        callback_name += ':scanning'
-        if 'S' in fields:
-            callback_data.append(fields['S'])
-        trigger = True
-        
-    elif (code == 'M117'):  # Display message
-        """ UI action """
-        callback_name += ':message'
-        callback_data = line.split("M117")[1].strip()
-        trigger = True
+    action = ACTIONS.get(code)
+    if action is None:
+        return False, '', []
     
-    elif (code == 'M0' or
-          code == 'M25' or
-          code == 'M226' ):
-        """ PAUSE ACTION """
-        callback_name += ':pause'
-        trigger = True
-        
-    return trigger, callback_name, callback_data
+    return action(gcs, line, code)
@@ -0,0 +1,169 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import time
+from threading import Condition
+from collections import deque
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+# Lanes in priority order
+LANE_CONTROL        = 0 # Emergency and service control commands
+LANE_INTERACTIVE    = 1 # UI, jog, macros and overrides
+LANE_MONITOR        = 2 # Periodic status polling
+LANE_BULK           = 3 # File streaming
+
+LANE_NAMES = ['control', 'interactive', 'monitor', 'bulk']
+
+# Maximum number of commands of a lane waiting for a reply, 0 means no limit
+LANE_INFLIGHT_LIMIT = [0, 0, 1, 0]
+
+class LaneQueue(object):
+    """
+    Command queue with one FIFO lane per traffic class. `get` returns the
+    oldest item of the highest priority lane that has not reached its
+    in-flight limit. It can replace a `queue.Queue` for the command queue.
+
+    :param classify: Function returning the lane of an item
+    :param limits: In-flight limit of each lane, 0 means no limit
+    :type classify: function
+    :type limits: list
+    """
+
+    def __init__(self, classify, limits = None):
+        self.classify = classify
+        self.limits = list(limits or LANE_INFLIGHT_LIMIT)
+        self.lanes = [ deque() for name in LANE_NAMES ]
+        self.inflight = [0] * len(LANE_NAMES)
+        self.queued = [0] * len(LANE_NAMES)
+        self.cond = Condition()
+
+    def __pop(self, lanes):
+        for lane in lanes:
+            if self.lanes[lane]:
+                limit = self.limits[lane]
+                if limit and self.inflight[lane] >= limit:
+                    continue
+                return self.lanes[lane].popleft()
+        raise queue.Empty
+
+    def put(self, item, lane = None):
+        """
+        Put **item** on its lane.
+
+        :param lane: Lane to use instead of the one returned by `classify`
+        """
+        if lane is None:
+            lane = self.classify(item)
+
+        with self.cond:
+            self.lanes[lane].append(item)
+            self.queued[lane] += 1
+            self.cond.notify()
+
+    def get(self, block = True, timeout = None, lanes = None):
+        """
+        Remove and return an item.
+
+        :param block: Wait for an item to become available
+        :param timeout: Maximum time to wait
+        :param lanes: Lanes to take the item from, all of them if not specified
+        :raises queue.Empty: If no item is available
+        """
+        if lanes is None:
+            lanes = xrange(len(self.lanes))
+
+        with self.cond:
+            if not block:
+                return self.__pop(lanes)
+
+            if timeout is not None:
+                end = time.time() + timeout
+
+            while True:
+                try:
+                    return self.__pop(lanes)
+                except queue.Empty:
+                    if timeout is None:
+                        self.cond.wait()
+                    else:
+                        remaining = end - time.time()
+                        if remaining <= 0:
+                            raise
+                        self.cond.wait(remaining)
+
+    def get_nowait(self, lanes = None):
+        """ Remove and return an item if one is available, see `get`. """
+        return self.get(False, lanes = lanes)
+
+    def sent(self, lane):
+        """ Account a command of **lane** as waiting for a reply. """
+        with self.cond:
+            self.inflight[lane] += 1
+
+    def done(self, lane):
+        """ Account a command of **lane** as answered. """
+        with self.cond:
+            self.inflight[lane] = max(0, self.inflight[lane] - 1)
+            self.cond.notify()
+
+    def reset_inflight(self):
+        """ Forget about all the commands waiting for a reply. """
+        with self.cond:
+            self.inflight = [0] * len(self.lanes)
+            self.cond.notify_all()
+
+    def qsize(self):
+        with self.cond:
+            return sum( len(lane) for lane in self.lanes )
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def stats(self):
+        """
+        Get lane statistics.
+
+        :returns: Dictionary with `depth`, `inflight`, `limit` and `queued` (total) for each lane
+        :rtype: dict
+        """
+        with self.cond:
+            result = {}
+            for lane, name in enumerate(LANE_NAMES):
+                result[name] = {
+                    'depth'     : len(self.lanes[lane]),
+                    'inflight'  : self.inflight[lane],
+                    'limit'     : self.limits[lane],
+                    'queued'    : self.queued[lane]
+                }
+            return result
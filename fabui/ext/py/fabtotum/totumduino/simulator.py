@@ -0,0 +1,511 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Simulated Totumduino firmware on a pseudo terminal.
+
+Usage: python -m fabtotum.totumduino.simulator [options]
+
+The path of the pty is printed as ``PORT <path>`` on the first line of the
+output. The simulator runs until its standard input is closed and then
+prints its statistics as JSON.
+"""
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import sys
+import tty
+import json
+import time
+import random
+import select
+import argparse
+from threading import Thread, Condition, Lock
+from collections import deque
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.totumduino.transport import data_checksum, line_number_checksum
+
+#############################################
+
+# Commands going through the planner
+MOVE_GCODES = ('G0', 'G1', 'G2', 'G3')
+# Commands waiting for the planner to be empty and then blocking for `long_time`
+LONG_GCODES = ('G27', 'G28', 'G29', 'G30', 'G38', 'M303')
+
+class FirmwareSimulator(object):
+    """
+    Simulated firmware speaking the Totumduino serial protocol over a pty.
+
+    Received bytes are stored in an RX buffer of **rx_buffer_size** bytes
+    and bytes that do not fit are lost, as on the real board. Lines are
+    moved to a command buffer of **buffer_size** entries and executed in
+    order. Each command is acknowledged with ``ok`` once it has been
+    executed; moves are executed by putting them in a planner of
+    **planner_size** blocks that takes **move_time** seconds per block.
+
+    Line numbered lines are checked like FABlin does when they are moved
+    to the command buffer. A rejected line clears the RX buffer and gets a
+    single ``Error:`` / ``Resend: <N>`` / ``ok`` reply, the lines that were
+    in the RX buffer are lost without a reply while the ones already in
+    the command buffer are still executed. What is left of a line that was
+    partially cleared is taken as a new line, as on the real board, and 
+    ends up rejected or reported as an unknown command. Blocking commands 
+    report ``echo:busy: processing`` every **busy_interval** seconds.
+
+    :param planner_size: Number of planner blocks
+    :param buffer_size: Number of command buffer entries
+    :param rx_buffer_size: Size of the serial RX buffer in bytes
+    :param move_time: Execution time of a move in seconds
+    :param command_time: Execution time of the other commands in seconds
+    :param long_time: Execution time of homing, probing and heating commands in seconds
+    :param baud: Baudrate of the simulated link (10 bits per byte), 0 for no limit
+    :param error_rate: Probability of a received line being corrupted
+    :param busy_interval: Interval of the busy messages in seconds, 0 to disable them
+    """
+
+    def __init__(self, planner_size = 16, buffer_size = 4, rx_buffer_size = 128,
+                 move_time = 0.01, command_time = 0.0, long_time = 2.0,
+                 baud = 250000, error_rate = 0.0, busy_interval = 2.0):
+        self.planner_size = planner_size
+        self.buffer_size = buffer_size
+        self.rx_buffer_size = rx_buffer_size
+        self.move_time = move_time
+        self.command_time = command_time
+        self.long_time = long_time
+        self.rate = baud / 10.0
+        self.error_rate = error_rate
+        self.busy_interval = busy_interval
+
+        self.master = None
+        self.slave = None
+        self.port = None
+        self.running = False
+        self.threads = []
+
+        # Serial RX buffer, filled by the reader and consumed by the main loop
+        self.rx = bytearray()
+        self.rx_cond = Condition()
+
+        # Planner blocks, executed by the stepper thread
+        self.planner = deque()
+        self.planner_cond = Condition()
+
+        self.tx = queue.Queue()
+
+        self.last_line = 0
+        # Line numbers to corrupt on their next reception
+        self.corrupt = set()
+        self.temperature = {'T' : 25.0, 'B' : 25.0}
+        self.target = {'T' : 0.0, 'B' : 0.0}
+        self.auto_report = 0
+
+        self.stats_lock = Lock()
+        self.counters = {
+            'lines'         : 0,
+            'commands'      : 0,
+            'moves'         : 0,
+            'errors'        : 0,
+            'overflow'      : 0,
+            'flushed'       : 0,
+            'bytes_rx'      : 0,
+            'bytes_tx'      : 0,
+            'idle_gaps'     : 0,
+            'idle_time'     : 0.0,
+            'idle_max'      : 0.0
+        }
+        self.idle_since = None
+
+    def __count(self, name, value = 1):
+        with self.stats_lock:
+            self.counters[name] += value
+
+    def __throttle(self, clock, size):
+        """ Sleep as long as **size** bytes take on the link. """
+        if not self.rate:
+            return clock
+        now = time.time()
+        clock = max(clock, now) + size / self.rate
+        if clock > now:
+            time.sleep(clock - now)
+        return clock
+
+    def __send(self, line):
+        self.tx.put(line + '\n')
+
+    ### Threads ###
+
+    def __reader_thread(self):
+        """ Move received bytes to the RX buffer at the link speed. """
+        clock = 0.0
+        while self.running:
+            if not select.select([self.master], [], [], 0.2)[0]:
+                continue
+            try:
+                data = os.read(self.master, 64)
+            except OSError:
+                break
+
+            clock = self.__throttle(clock, len(data))
+            self.__count('bytes_rx', len(data))
+
+            with self.rx_cond:
+                free = self.rx_buffer_size - len(self.rx)
+                if len(data) > free:
+                    self.__count('overflow', len(data) - free)
+                    data = data[:max(0, free)]
+                self.rx.extend(data)
+                self.rx_cond.notify()
+
+    def __writer_thread(self):
+        """ Write queued replies at the link speed. """
+        clock = 0.0
+        while self.running:
+            try:
+                data = self.tx.get(timeout = 0.2)
+            except queue.Empty:
+                continue
+            clock = self.__throttle(clock, len(data))
+            self.__count('bytes_tx', len(data))
+            try:
+                os.write(self.master, data)
+            except OSError:
+                break
+
+    def __stepper_thread(self):
+        """ Execute the planner blocks. """
+        while self.running:
+            with self.planner_cond:
+                if not self.planner:
+                    self.planner_cond.wait(0.2)
+                    continue
+                duration = self.planner[0]
+
+            time.sleep(duration)
+
+            with self.planner_cond:
+                self.planner.popleft()
+                if not self.planner:
+                    self.idle_since = time.time()
+                self.planner_cond.notify_all()
+
+    def __report_thread(self):
+        """ Temperature auto-report (M155). """
+        while self.running:
+            if self.auto_report:
+                time.sleep(self.auto_report)
+                self.__send(self.__temperature_report())
+            else:
+                time.sleep(0.2)
+
+    def __main_thread(self):
+        """ Firmware main loop, fill the command buffer and execute it. """
+        commands = deque()
+        while self.running:
+            with self.rx_cond:
+                while len(commands) < self.buffer_size:
+                    end = self.rx.find(b'\n')
+                    if end < 0:
+                        break
+                    line = str(self.rx[:end])
+                    del self.rx[:end+1]
+                    command = self.__parse_line(line)
+                    if command is not None:
+                        commands.append( (line.strip(), command) )
+
+                if not commands:
+                    self.rx_cond.wait(0.2)
+                    continue
+
+            line, command = commands.popleft()
+            if command:
+                self.__execute(command, line)
+            else:
+                self.__send('ok')
+
+    ### Protocol ###
+
+    def __request_resend(self, error):
+        """ Reject a line, the RX buffer is cleared as FlushSerialRequestResend does. """
+        self.__count('errors')
+        with self.rx_cond:
+            self.__count('flushed', len(self.rx))
+            del self.rx[:]
+        self.__send('Error:{0}, Last Line: {1}'.format(error, self.last_line))
+        self.__send('Resend: {0}'.format(self.last_line + 1))
+        self.__send('ok')
+
+    def __parse_line(self, line):
+        """
+        Check a received line and strip the line number, checksum and comments.
+
+        :returns: Command, empty if there is nothing to execute, or ``None`` if the line was rejected
+        """
+        line = line.strip()
+        if not line:
+            return None
+
+        self.__count('lines')
+
+        if self.error_rate and random.random() < self.error_rate:
+            # Flip one bit of a random character
+            i = random.randrange(len(line))
+            line = line[:i] + chr(ord(line[i]) ^ 0x04) + line[i+1:]
+        elif self.corrupt and line[0] == 'N':
+            number, sep, data = line.partition(' ')
+            if number[1:].isdigit() and int(number[1:]) in self.corrupt and data:
+                self.corrupt.discard( int(number[1:]) )
+                line = number + sep + chr(ord(data[0]) ^ 0x04) + data[1:]
+
+        star = line.rfind('*')
+
+        if line[0] == 'N':
+            space = line.find(' ')
+            try:
+                line_number = int(line[1:space])
+            except ValueError:
+                line_number = None
+
+            if line_number is None or (line_number != self.last_line + 1 and 'M110' not in line):
+                self.__request_resend('Line Number is not Last Line Number+1')
+                return None
+
+            if star < 0:
+                self.__request_resend('No Checksum with line number')
+                return None
+
+            data = line[space+1:star]
+            try:
+                checksum = int(line[star+1:])
+            except ValueError:
+                checksum = None
+
+            if checksum != line_number_checksum(line_number) ^ data_checksum(data):
+                self.__request_resend('checksum mismatch')
+                return None
+
+            self.last_line = line_number
+            line = data
+        elif star >= 0:
+            self.__request_resend('No Line Number with checksum')
+            return None
+
+        return line.split(';', 1)[0].strip()
+
+    def __temperature_report(self, prefix = ''):
+        return '{0}T:{1:.1f} /{2:.1f} B:{3:.1f} /{4:.1f} T0:{1:.1f} /{2:.1f} @:0 B@:0'.format(
+                    prefix, self.temperature['T'], self.target['T'], self.temperature['B'], self.target['B'])
+
+    @staticmethod
+    def __get_param(tags, name, default = None):
+        for tag in tags[1:]:
+            if tag[0] == name:
+                try:
+                    return float(tag[1:])
+                except ValueError:
+                    return default
+        return default
+
+    def __plan(self, duration):
+        """ Add a block to the planner, waiting for a free one. """
+        with self.planner_cond:
+            while len(self.planner) >= self.planner_size and self.running:
+                self.planner_cond.wait(0.2)
+
+            if self.idle_since is not None:
+                gap = time.time() - self.idle_since
+                with self.stats_lock:
+                    self.counters['idle_gaps'] += 1
+                    self.counters['idle_time'] += gap
+                    self.counters['idle_max'] = max(self.counters['idle_max'], gap)
+                self.idle_since = None
+
+            self.planner.append(duration)
+            self.planner_cond.notify_all()
+
+    def __synchronize(self):
+        """ Wait for the planner to be empty. """
+        with self.planner_cond:
+            while self.planner and self.running:
+                self.planner_cond.wait(0.2)
+            # Waiting on purpose is not an idle gap
+            self.idle_since = None
+
+    def __busy(self, duration):
+        """ Block for **duration** seconds reporting the busy state. """
+        end = time.time() + duration
+        while self.running:
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            if self.busy_interval and remaining > self.busy_interval:
+                time.sleep(self.busy_interval)
+                self.__send('echo:busy: processing')
+            else:
+                time.sleep(remaining)
+
+    def __execute(self, command, line):
+        """ Execute a command and acknowledge it. """
+        tags = command.split()
+        code = tags[0].upper()
+
+        self.__count('commands')
+
+        if code[0] not in 'GMT' or not code[1:].isdigit():
+            # The whole received line is reported
+            self.__send('echo:Unknown command: "{0}"'.format(line))
+        elif code in MOVE_GCODES:
+            self.__count('moves')
+            self.__plan(self.move_time)
+        elif code == 'M400':
+            self.__synchronize()
+        elif code in LONG_GCODES:
+            self.__synchronize()
+            self.__busy(self.long_time)
+        elif code in ('M104', 'M109'):
+            self.target['T'] = self.__get_param(tags, 'S', self.target['T'])
+            if code == 'M109':
+                self.__synchronize()
+                self.__busy(self.long_time)
+                self.temperature['T'] = self.target['T']
+        elif code in ('M140', 'M190'):
+            self.target['B'] = self.__get_param(tags, 'S', self.target['B'])
+            if code == 'M190':
+                self.__synchronize()
+                self.__busy(self.long_time)
+                self.temperature['B'] = self.target['B']
+        elif code == 'M105':
+            self.__send(self.__temperature_report('ok '))
+            return
+        elif code == 'M155':
+            self.auto_report = self.__get_param(tags, 'S', 0)
+        elif code == 'M110':
+            self.last_line = int(self.__get_param(tags, 'N', self.last_line))
+        elif self.command_time:
+            time.sleep(self.command_time)
+
+        self.__send('ok')
+
+    ### API ###
+
+    def open(self):
+        """
+        Create the pseudo terminal.
+
+        :returns: Path of the serial port to connect to
+        :rtype: string
+        """
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+        return self.port
+
+    def start(self):
+        """ Start the simulator threads. """
+        if not self.port:
+            self.open()
+
+        self.running = True
+        for target in [self.__reader_thread, self.__writer_thread, self.__stepper_thread,
+                       self.__report_thread, self.__main_thread]:
+            t = Thread( name = "FirmwareSimulator-" + target.__name__.split('__')[-1], target = target )
+            t.daemon = True
+            t.start()
+            self.threads.append(t)
+
+    def stop(self):
+        """ Stop the simulator threads and close the pseudo terminal. """
+        self.running = False
+        for t in self.threads:
+            t.join()
+        self.threads = []
+        os.close(self.master)
+        os.close(self.slave)
+        self.port = None
+
+    def corrupt_line(self, line_number):
+        """
+        Corrupt the next reception of line **line_number**.
+
+        :param line_number: Line number
+        :type line_number: int
+        """
+        with self.rx_cond:
+            self.corrupt.add(line_number)
+
+    def stats(self):
+        """
+        Get simulator statistics.
+
+        :returns: Dictionary with the received `lines`, executed `commands` and `moves`,
+                  rejected lines (`errors`), bytes lost by RX buffer `overflow`,
+                  bytes cleared from the RX buffer after an error (`flushed`),
+                  `bytes_rx`, `bytes_tx` and the planner `idle_gaps` count, total `idle_time` and `idle_max`
+        :rtype: dict
+        """
+        with self.stats_lock:
+            return dict(self.counters)
+
+def main():
+    parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("--planner",       help="Planner blocks.", type=int, default=16)
+    parser.add_argument("--buffer",        help="Command buffer entries.", type=int, default=4)
+    parser.add_argument("--rx-buffer",     help="Serial RX buffer size in bytes.", type=int, default=128)
+    parser.add_argument("--move-time",     help="Move execution time in seconds.", type=float, default=0.01)
+    parser.add_argument("--command-time",  help="Execution time of the other commands in seconds.", type=float, default=0.0)
+    parser.add_argument("--long-time",     help="Homing, probing and heating time in seconds.", type=float, default=2.0)
+    parser.add_argument("-B", "--baud",    help="Link baudrate, 0 for no limit.", type=int, default=250000)
+    parser.add_argument("--error-rate",    help="Probability of a line being corrupted.", type=float, default=0.0)
+    parser.add_argument("--seed",          help="Random seed.", type=int)
+
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    sim = FirmwareSimulator(planner_size = args.planner, buffer_size = args.buffer, rx_buffer_size = args.rx_buffer,
+                            move_time = args.move_time, command_time = args.command_time, long_time = args.long_time,
+                            baud = args.baud, error_rate = args.error_rate)
+
+    print "PORT {0}".format(sim.open())
+    sys.stdout.flush()
+
+    sim.start()
+
+    try:
+        sys.stdin.read()
+    except KeyboardInterrupt:
+        pass
+
+    sim.stop()
+    print json.dumps(sim.stats())
+
+if __name__ == "__main__":
+    main()
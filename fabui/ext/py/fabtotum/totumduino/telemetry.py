@@ -0,0 +1,273 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import time
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+# Command classes by command word
+COMMAND_CLASS = {
+    'G0'    : 'move',
+    'G1'    : 'move',
+    'G2'    : 'move',
+    'G3'    : 'move',
+    'M104'  : 'temp',
+    'M105'  : 'temp',
+    'M109'  : 'temp',
+    'M140'  : 'temp',
+    'M190'  : 'temp',
+    'M400'  : 'sync',
+    'G27'   : 'homing',
+    'G28'   : 'homing',
+    'G29'   : 'homing',
+    'G30'   : 'homing',
+    'G38'   : 'homing'
+}
+
+def command_class(data):
+    """
+    Get the class of a gcode line: ``move``, ``temp``, ``sync``, ``homing`` or ``other``.
+    """
+    if not data:
+        return 'other'
+    return COMMAND_CLASS.get(data.split(None, 1)[0], 'other')
+
+class LatencyHistogram(object):
+    """
+    Log-linear latency histogram with microsecond resolution. Values are
+    counted in buckets that keep `precision` significant bits, so every
+    recorded value is known within 1/2^(precision-1) of its magnitude while
+    recording stays a constant time integer operation.
+
+    :param precision: Significant bits kept for each value
+    :param max_value: Largest value in seconds, larger values are clamped
+    """
+
+    def __init__(self, precision = 5, max_value = 3600):
+        self.sub = 1 << precision
+        self.bits = precision + 1
+        self.size = self.__index( int(max_value * 1e6) ) + 1
+        self.reset()
+
+    def __index(self, value):
+        if value < self.sub:
+            return value
+        shift = value.bit_length() - self.bits
+        return self.sub + shift * self.sub + (value >> shift) - self.sub
+
+    def __value(self, index):
+        """ Highest value of the bucket **index** in microseconds. """
+        if index < self.sub:
+            return index
+        shift, mantissa = divmod(index - self.sub, self.sub)
+        return ((mantissa + self.sub + 1) << shift) - 1
+
+    def reset(self):
+        self.counts = [0] * self.size
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, seconds):
+        """ Record a latency in seconds. """
+        value = int(seconds * 1e6)
+        if value < 0:
+            value = 0
+        index = self.__index(value)
+        if index >= self.size:
+            index = self.size - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def percentile(self, p):
+        """
+        Get the value below which **p** percent of the recorded values are.
+
+        :returns: Latency in seconds
+        :rtype: float
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(self.__value(index), self.max) / 1e6
+        return self.max / 1e6
+
+    def summary(self):
+        """
+        Get the histogram summary in milliseconds.
+
+        :returns: Dictionary with `count`, `mean`, `min`, `p50`, `p90`, `p99` and `max`
+        :rtype: dict
+        """
+        if not self.count:
+            return {'count' : 0}
+        return {
+            'count' : self.count,
+            'mean'  : self.total / 1e3 / self.count,
+            'min'   : self.min / 1e3,
+            'p50'   : self.percentile(50) * 1e3,
+            'p90'   : self.percentile(90) * 1e3,
+            'p99'   : self.percentile(99) * 1e3,
+            'max'   : self.max / 1e3
+        }
+
+class RateCounter(object):
+    """
+    Count events in one second slots to get the rate over the last **window** seconds.
+    Only `add` modifies the slots so `rate` can be called from any thread.
+    """
+
+    def __init__(self, window = 10):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.slots = [0] * self.window
+        self.seconds = [0] * self.window
+        self.total = 0
+
+    def add(self, n, now):
+        second = int(now)
+        index = second % self.window
+        if self.seconds[index] != second:
+            self.seconds[index] = second
+            self.slots[index] = 0
+        self.slots[index] += n
+        self.total += n
+
+    def rate(self, now = None):
+        """ Average per second over the last `window` seconds. """
+        second = int(now or time.time())
+        total = 0
+        for index in xrange(self.window):
+            if second - self.seconds[index] < self.window:
+                total += self.slots[index]
+        return total / float(self.window)
+
+class _Latency(object):
+    """ Queue and acknowledge latency histograms of a command class or group. """
+
+    def __init__(self):
+        self.queue = LatencyHistogram()
+        self.ack = LatencyHistogram()
+
+    def summary(self):
+        return {
+            'queue' : self.queue.summary(),
+            'ack'   : self.ack.summary()
+        }
+
+class Telemetry(object):
+    """
+    Serial link telemetry of GCodeService. Command latencies are split in
+    the time spent waiting to be written (queue) and the time waiting for
+    the firmware acknowledge (ack), and aggregated per command class and
+    per group.
+
+    Commands are recorded by the receiver thread and bytes by the thread
+    doing the transfer, so recording needs no locking.
+
+    :param window: Window of the transfer rates in seconds
+    """
+
+    def __init__(self, window = 10):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """ Drop all the collected data. """
+        self.started = time.time()
+        self.classes = {}
+        self.groups = {}
+        self.tx = RateCounter(self.window)
+        self.rx = RateCounter(self.window)
+
+    def sent(self, size, now):
+        """ Account **size** bytes written to the serial port. """
+        self.tx.add(size, now)
+
+    def received(self, size, now):
+        """ Account **size** bytes read from the serial port. """
+        self.rx.add(size, now)
+
+    def done(self, cmd, now):
+        """
+        Record the latencies of an acknowledged command. ``cmd.timestamp``
+        is the time the command was created and queued, ``cmd.sent_time``
+        the time of its first transmission.
+        """
+        if cmd.sent_time is None:
+            return
+
+        queued = cmd.sent_time - cmd.timestamp
+        acked = now - cmd.sent_time
+
+        name = command_class(cmd.data)
+        latency = self.classes.get(name)
+        if latency is None:
+            latency = self.classes[name] = _Latency()
+        latency.queue.record(queued)
+        latency.ack.record(acked)
+
+        if cmd.group:
+            latency = self.groups.get(cmd.group)
+            if latency is None:
+                latency = self.groups[cmd.group] = _Latency()
+            latency.queue.record(queued)
+            latency.ack.record(acked)
+
+    def snapshot(self):
+        """
+        Get the telemetry data, latencies are in milliseconds.
+
+        :returns: Dictionary with `uptime`, `class` and `group` latency summaries and `bytes` transfer totals and rates
+        :rtype: dict
+        """
+        now = time.time()
+        return {
+            'uptime'    : now - self.started,
+            'class'     : dict( (name, latency.summary()) for name, latency in self.classes.items() ),
+            'group'     : dict( (name, latency.summary()) for name, latency in self.groups.items() ),
+            'bytes'     : {
+                'tx'        : self.tx.total,
+                'rx'        : self.rx.total,
+                'tx_rate'   : self.tx.rate(now),
+                'rx_rate'   : self.rx.rate(now)
+            }
+        }
@@ -0,0 +1,187 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import time
+import unittest
+from threading import Event, Lock
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.totumduino.executor import CallbackExecutor
+
+#############################################
+
+class Recorder(object):
+    """ Callback recording the events, optionally blocking on the first one. """
+
+    def __init__(self, block = False):
+        self.lock = Lock()
+        self.events = []
+        self.entered = Event()
+        self.release = Event()
+        if not block:
+            self.release.set()
+        self.done = Event()
+        self.expected = None
+
+    def __call__(self, name, data):
+        self.entered.set()
+        self.release.wait(5)
+        with self.lock:
+            self.events.append( (name, data) )
+            if self.expected is not None and len(self.events) >= self.expected:
+                self.done.set()
+
+    def wait_for(self, count):
+        with self.lock:
+            self.expected = count
+            if len(self.events) >= count:
+                return True
+        return self.done.wait(5)
+
+    def wait_for_event(self, event, timeout = 5):
+        end = time.time() + timeout
+        while time.time() < end:
+            with self.lock:
+                if event in self.events:
+                    return True
+            time.sleep(0.01)
+        return False
+
+class CallbackExecutorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = CallbackExecutor(workers = 2, queue_size = 8)
+
+    def tearDown(self):
+        self.executor.stop()
+
+    def test_order(self):
+        sub = Recorder()
+        self.executor.register(sub)
+        for i in xrange(100):
+            self.executor.submit('gcode_reply', i)
+
+        self.assertTrue( sub.wait_for(100) )
+        # Replies are never dropped, the queue grows instead
+        self.assertEqual( [ data for name, data in sub.events ], range(100) )
+
+    def test_coalesce(self):
+        sub = Recorder(block = True)
+        self.executor.register(sub)
+        self.executor.submit('state_change', 'running')
+        self.assertTrue( sub.entered.wait(5) )
+        for i in xrange(5):
+            self.executor.submit('temp_change:all', i)
+        sub.release.set()
+
+        self.assertTrue( sub.wait_for(2) )
+        self.assertEqual( sub.events, [('state_change', 'running'), ('temp_change:all', 4)] )
+
+    def test_blocked_subscriber(self):
+        slow = Recorder(block = True)
+        fast = Recorder()
+        self.executor.register(slow)
+        self.executor.register(fast)
+
+        self.executor.submit('first_move', None)
+        self.assertTrue( slow.entered.wait(5) )
+        for i in xrange(20):
+            self.executor.submit('gcode_reply', i)
+        self.executor.submit('self_descruct', None)
+
+        # The other subscriber is not delayed
+        self.assertTrue( fast.wait_for_event( ('gcode_reply', 19) ) )
+        self.assertTrue( fast.wait_for_event( ('self_descruct', None) ) )
+        self.assertEqual( len(slow.events), 0 )
+
+        # Control event first, then the queued replies
+        slow.release.set()
+        self.assertTrue( slow.wait_for(1 + 1 + 20) )
+        self.assertEqual( slow.events[0], ('first_move', None) )
+        self.assertEqual( slow.events[1], ('self_descruct', None) )
+        self.assertEqual( [ data for name, data in slow.events[2:] ], range(20) )
+
+        stats = self.executor.stats()
+        self.assertEqual( stats['subscribers'][0]['dropped'], 0 )
+
+    def test_full_queue(self):
+        sub = Recorder(block = True)
+        self.executor.register(sub)
+        self.executor.submit('first_move', None)
+        self.assertTrue( sub.entered.wait(5) )
+
+        for i in xrange(4):
+            self.executor.submit('gcode_comment', i)
+        for i in xrange(10):
+            self.executor.submit('gcode_reply', i)
+        # Queue is full of events that can not be dropped
+        self.executor.submit('gcode_action:message', 'skipped')
+        self.executor.submit('state_change', 'running')
+
+        stats = self.executor.stats()
+        self.assertEqual( stats['dropped'], 5 )
+        self.assertEqual( stats['subscribers'][0]['depth'], 11 )
+
+        sub.release.set()
+        self.assertTrue( sub.wait_for(1 + 11) )
+        self.assertEqual( [ name for name, data in sub.events ],
+                          ['first_move'] + ['gcode_reply'] * 10 + ['state_change'] )
+        self.assertEqual( [ data for name, data in sub.events[1:11] ], range(10) )
+
+    def test_control_order(self):
+        sub = Recorder(block = True)
+        self.executor.register(sub)
+        self.executor.submit('first_move', None)
+        self.assertTrue( sub.entered.wait(5) )
+        self.executor.submit('gcode_reply', 1)
+        self.executor.submit('state_change', 'aborted')
+        self.executor.submit('self_descruct', None)
+        sub.release.set()
+
+        self.assertTrue( sub.wait_for(4) )
+        self.assertEqual( [ name for name, data in sub.events ],
+                          ['first_move', 'state_change', 'self_descruct', 'gcode_reply'] )
+
+    def test_on_delivered(self):
+        sub = Recorder(block = True)
+        self.executor.register(sub)
+        delivered = Event()
+        self.executor.submit('file_done', None, on_delivered = delivered.set)
+        self.assertFalse( delivered.wait(0.1) )
+        sub.release.set()
+        self.assertTrue( delivered.wait(5) )
+
+        # Events discarded by an overflow count as delivered
+        sub = Recorder(block = True)
+        self.executor.register(sub)
+        self.executor.submit('first_move', None)
+        self.assertTrue( sub.entered.wait(5) )
+        dropped = Event()
+        self.executor.submit('gcode_comment', 'layer 1', on_delivered = dropped.set)
+        for i in xrange(8):
+            self.executor.submit('gcode_reply', i)
+        self.assertTrue( dropped.wait(1) )
+        sub.release.set()
+
+if __name__ == '__main__':
+    unittest.main()
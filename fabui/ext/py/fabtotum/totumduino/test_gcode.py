@@ -0,0 +1,244 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+GCodeService tests against the firmware simulator.
+
+Usage: python -m unittest fabtotum.totumduino.test_gcode
+"""
+
+# Import standard python module
+import random
+import logging
+import unittest
+from threading import Thread, Event
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.singleton import Singleton
+from fabtotum.totumduino import gcode
+from fabtotum.totumduino.lanes import LANE_MONITOR, LANE_BULK
+from fabtotum.totumduino.simulator import FirmwareSimulator
+
+#############################################
+
+# A reset takes about 10 seconds (board reset and bootstrap delays)
+RESET_TIMEOUT = 30
+
+class RecordingSerial(object):
+    """ Serial port replacement keeping the written lines. """
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, data):
+        self.lines.append(data)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+class GCodeServiceOverrideTest(unittest.TestCase):
+
+    def setUp(self):
+        # Fresh service for every test
+        Singleton._instances.pop(gcode.GCodeService, None)
+        log = logging.getLogger('GCodeServiceTest')
+        log.addHandler(logging.NullHandler())
+        self.gcs = gcode.GCodeService('/dev/null', 250000, logger = log)
+        self.gcs.serial = RecordingSerial()
+
+    def tearDown(self):
+        self.gcs.executor.stop()
+        Singleton._instances.pop(gcode.GCodeService, None)
+
+    def send(self, line, z_override):
+        """ Send **line** with **z_override** and get the written line. """
+        self.gcs.z_override = z_override
+        self.gcs._GCodeService__send_gcode_command(line, group='file')
+        self.gcs.rq.get_nowait()
+        return self.gcs.serial.lines[-1].rstrip()
+
+    def test_spaced_line(self):
+        self.assertEqual( self.send('G1 X10 Z0.3 F1200', 0.1), 'G1 X10 Z0.4 F1200' )
+        self.assertEqual( self.send('G0 Z-1 ; lift', 0.5), 'G0 Z-0.5 ; lift' )
+
+    def test_compact_line(self):
+        self.assertEqual( self.send('G1Z0.3F1200', 0.1), 'G1 Z0.4 F1200' )
+        self.assertEqual( self.send('G1X5Y5Z10', -0.25), 'G1 X5 Y5 Z9.75' )
+
+    def test_unmodified(self):
+        self.assertEqual( self.send('G1 X10 Z0.3', 0.0), 'G1 X10 Z0.3' )
+        self.assertEqual( self.send('G1 X10 ; Z1', 0.1), 'G1 X10 ; Z1' )
+        self.assertEqual( self.send('M117 Zero', 0.1), 'M117 Zero' )
+
+class GCodeServiceCleanupTest(unittest.TestCase):
+
+    def setUp(self):
+        Singleton._instances.pop(gcode.GCodeService, None)
+        log = logging.getLogger('GCodeServiceTest')
+        log.addHandler(logging.NullHandler())
+        self.gcs = gcode.GCodeService('/dev/null', 250000, logger = log)
+        self.gcs.serial = RecordingSerial()
+
+    def tearDown(self):
+        self.gcs.executor.stop()
+        Singleton._instances.pop(gcode.GCodeService, None)
+
+    def test_abort_queued_commands(self):
+        cq = self.gcs.cq
+        # A monitor command waiting for its reply blocks the monitor lane
+        cq.sent(LANE_MONITOR)
+        cmds = [ gcode.Command.gcode('M105\r\n') for i in xrange(3) ]
+        for cmd in cmds:
+            cq.put(cmd, lane = LANE_MONITOR)
+        cq.put( gcode.Command.gcode('G1 X10\r\n'), lane = LANE_BULK )
+
+        self.gcs._GCodeService__cleanup()
+
+        self.assertTrue( cq.empty() )
+        for cmd in cmds:
+            self.assertTrue( cmd.aborted )
+
+class GCodeServiceSimulatorTest(unittest.TestCase):
+
+    def setUp(self):
+        # No board to reset and nothing to bootstrap
+        self.totumduino_reset = gcode.totumduino_reset
+        self.hardware_bootstrap = gcode.hardwareBootstrap
+        gcode.totumduino_reset = lambda: None
+        gcode.hardwareBootstrap = lambda *args, **kwargs: None
+
+        self.sim = FirmwareSimulator(long_time = 2.0, busy_interval = 0)
+        self.port = self.sim.open()
+        self.sim.start()
+        self.gcs = None
+        Singleton._instances.pop(gcode.GCodeService, None)
+
+    def tearDown(self):
+        if self.gcs:
+            self.gcs.stop()
+        self.sim.stop()
+        Singleton._instances.pop(gcode.GCodeService, None)
+        gcode.totumduino_reset = self.totumduino_reset
+        gcode.hardwareBootstrap = self.hardware_bootstrap
+
+    def start_service(self, **kwargs):
+        log = logging.getLogger('GCodeServiceTest')
+        log.addHandler(logging.NullHandler())
+        self.gcs = gcode.GCodeService(self.port, 250000, logger = log, **kwargs)
+        self.gcs.start()
+        return self.gcs
+
+    def reset(self):
+        """ Reset from another thread, as the Pyro server does, and wait for it. """
+        done = Event()
+        def reset_thread():
+            self.gcs.reset()
+            done.set()
+        t = Thread(target = reset_thread)
+        t.daemon = True
+        t.start()
+        self.assertTrue( done.wait(RESET_TIMEOUT), "reset did not finish" )
+
+    def assert_temperature_reply(self, reply):
+        self.assertTrue(reply, "no reply")
+        self.assertTrue(reply[-1].startswith('ok T:'), reply)
+
+    def test_reset_with_homing_in_flight(self):
+        gcs = self.start_service()
+        self.assert_temperature_reply( gcs.send('M105', timeout = 5) )
+
+        homing = gcs.send('G28', block = False)
+        queued = gcs.send('M105', block = False)
+        self.reset()
+
+        self.assertTrue( homing.wait(1) )
+        self.assertTrue( queued.wait(1) )
+        self.assert_temperature_reply( gcs.send('M105', timeout = 5) )
+
+    def test_reset_with_commands_in_flight(self):
+        gcs = self.start_service(use_checksum = True, rx_buffer_size = 128)
+        self.assert_temperature_reply( gcs.send('M105', timeout = 5) )
+
+        cmds = [ gcs.send('G28', block = False) ]
+        cmds += [ gcs.send('G1 X{0} Y{0}'.format(i), block = False) for i in xrange(8) ]
+        cmds += [ gcs.send('M105', block = False) for i in xrange(4) ]
+        self.reset()
+
+        for cmd in cmds:
+            self.assertTrue( cmd.wait(1), str(cmd) )
+        self.assertTrue( gcs.rq.empty() )
+
+        # Stale commands left in the reply queue would take these replies
+        for i in xrange(3):
+            self.assert_temperature_reply( gcs.send('M105', timeout = 5) )
+        self.assertEqual( gcs.send('G1 X10', timeout = 5), ['ok'] )
+
+    def test_resend_with_lines_in_flight(self):
+        gcs = self.start_service(use_checksum = True, rx_buffer_size = 128)
+        self.assert_temperature_reply( gcs.send('M105', timeout = 5) )
+
+        # Lines 3 and 20 are rejected while the lines after them are in
+        # the RX buffer or on the way
+        self.sim.corrupt_line(3)
+        self.sim.corrupt_line(20)
+        cmds = []
+        for i in xrange(40):
+            if i % 10 == 5:
+                cmds.append( gcs.send('M105', block = False) )
+            cmds.append( gcs.send('G1 X{0} Y{0}'.format(i), block = False) )
+
+        for cmd in cmds:
+            self.assertTrue( cmd.wait(10), str(cmd) )
+            self.assertFalse( cmd.aborted, str(cmd) )
+            if cmd.data.startswith('M105'):
+                self.assert_temperature_reply( cmd.reply )
+            else:
+                self.assertEqual( cmd.reply, ['ok'], str(cmd) )
+
+        # Every move was executed once
+        stats = self.sim.stats()
+        self.assertEqual( stats['moves'], 40 )
+        self.assertGreaterEqual( stats['errors'], 2 )
+        self.assertEqual( gcs.send('G1 X10', timeout = 5), ['ok'] )
+
+    def test_resend_random_errors(self):
+        random.seed(1)
+        self.sim.error_rate = 0.05
+        gcs = self.start_service(use_checksum = True, rx_buffer_size = 128)
+
+        cmds = [ gcs.send('G1 X{0} Y{0} E{0}.12345'.format(i), block = False) for i in xrange(300) ]
+        for cmd in cmds:
+            self.assertTrue( cmd.wait(30), str(cmd) )
+            self.assertEqual( cmd.reply, ['ok'], str(cmd) )
+
+        stats = self.sim.stats()
+        self.assertEqual( stats['moves'], 300 )
+        self.assertGreater( stats['errors'], 0 )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Import standard python module
+import unittest
+from threading import Thread
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.totumduino.lanes import LaneQueue, LANE_CONTROL, LANE_INTERACTIVE, LANE_MONITOR, LANE_BULK
+
+#############################################
+
+class LaneQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        # Items are (lane, value) tuples
+        self.lq = LaneQueue(lambda item: item[0])
+
+    def drain(self, **kwargs):
+        items = []
+        while True:
+            try:
+                items.append( self.lq.get_nowait(**kwargs) )
+            except queue.Empty:
+                return items
+
+    def test_priority_order(self):
+        for item in [(LANE_BULK, 1), (LANE_MONITOR, 1), (LANE_BULK, 2),
+                     (LANE_INTERACTIVE, 1), (LANE_CONTROL, 1), (LANE_INTERACTIVE, 2)]:
+            self.lq.put(item)
+
+        self.assertEqual( self.lq.qsize(), 6 )
+        self.assertEqual( self.drain(), [
+            (LANE_CONTROL, 1),
+            (LANE_INTERACTIVE, 1),
+            (LANE_INTERACTIVE, 2),
+            (LANE_MONITOR, 1),
+            (LANE_BULK, 1),
+            (LANE_BULK, 2)
+        ])
+        self.assertTrue( self.lq.empty() )
+
+    def test_lane_override(self):
+        self.lq.put( (LANE_BULK, 1) )
+        self.lq.put( (LANE_BULK, 2), lane = LANE_CONTROL )
+        self.assertEqual( self.drain(), [(LANE_BULK, 2), (LANE_BULK, 1)] )
+
+    def test_lane_selection(self):
+        self.lq.put( (LANE_CONTROL, 1) )
+        self.lq.put( (LANE_BULK, 1) )
+        self.assertEqual( self.drain(lanes = [LANE_BULK]), [(LANE_BULK, 1)] )
+        self.assertEqual( self.drain(), [(LANE_CONTROL, 1)] )
+
+    def test_inflight_limit(self):
+        # Only one monitor command waits for a reply at a time
+        self.lq.put( (LANE_MONITOR, 1) )
+        self.lq.put( (LANE_MONITOR, 2) )
+        self.lq.put( (LANE_BULK, 1) )
+
+        self.assertEqual( self.lq.get_nowait(), (LANE_MONITOR, 1) )
+        self.lq.sent(LANE_MONITOR)
+        # The limited lane is skipped, not the lanes after it
+        self.assertEqual( self.lq.get_nowait(), (LANE_BULK, 1) )
+        self.assertRaises( queue.Empty, self.lq.get_nowait )
+
+        self.lq.done(LANE_MONITOR)
+        self.assertEqual( self.lq.get_nowait(), (LANE_MONITOR, 2) )
+
+        stats = self.lq.stats()
+        self.assertEqual( stats['monitor']['limit'], 1 )
+        self.assertEqual( stats['monitor']['inflight'], 0 )
+        self.assertEqual( stats['monitor']['queued'], 2 )
+        self.assertEqual( stats['monitor']['depth'], 0 )
+
+    def test_reset_inflight(self):
+        self.lq.put( (LANE_MONITOR, 1) )
+        self.lq.sent(LANE_MONITOR)
+        self.assertRaises( queue.Empty, self.lq.get_nowait )
+        self.lq.reset_inflight()
+        self.assertEqual( self.lq.get_nowait(), (LANE_MONITOR, 1) )
+
+    def test_unlimited_lanes(self):
+        for i in xrange(5):
+            self.lq.put( (LANE_BULK, i) )
+            self.lq.sent(LANE_BULK)
+        self.assertEqual( len(self.drain()), 5 )
+
+    def test_timeout(self):
+        self.assertRaises( queue.Empty, self.lq.get, True, 0.05 )
+
+    def test_blocking_get(self):
+        self.lq.put( (LANE_MONITOR, 1) )
+        self.lq.sent(LANE_MONITOR)
+        result = []
+        t = Thread(target = lambda: result.append( self.lq.get(timeout = 5) ))
+        t.daemon = True
+        t.start()
+
+        # The waiting get is woken up by the reply
+        self.lq.done(LANE_MONITOR)
+        t.join(5)
+        self.assertEqual( result, [(LANE_MONITOR, 1)] )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import random
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.totumduino.telemetry import LatencyHistogram, RateCounter, Telemetry, command_class
+
+#############################################
+
+class Command(object):
+
+    def __init__(self, data, timestamp, sent_time, group = None):
+        self.data = data
+        self.timestamp = timestamp
+        self.sent_time = sent_time
+        self.group = group
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual( histogram.summary(), {'count' : 0} )
+        self.assertEqual( histogram.percentile(50), 0.0 )
+
+    def test_small_values_exact(self):
+        histogram = LatencyHistogram()
+        for us in range(1, 21):
+            histogram.record(us / 1e6)
+        self.assertAlmostEqual( histogram.percentile(50), 10e-6 )
+        self.assertAlmostEqual( histogram.percentile(90), 18e-6 )
+
+    def test_precision(self):
+        random.seed(1)
+        for i in range(1000):
+            us = random.randint(1, 10**9)
+            histogram = LatencyHistogram(precision = 5)
+            histogram.record(us / 1e6)
+            # A larger value so that the bucket bound is not clamped by max
+            histogram.record(2 * us / 1e6 + 1)
+            value = histogram.percentile(50) * 1e6
+            self.assertGreaterEqual( round(value), us )
+            self.assertLessEqual( value - us, us / 16.0 )
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for i in range(90):
+            histogram.record(0.001)
+        for i in range(10):
+            histogram.record(0.1)
+
+        summary = histogram.summary()
+        self.assertEqual( summary['count'], 100 )
+        self.assertAlmostEqual( summary['mean'], 10.9 )
+        self.assertAlmostEqual( summary['min'], 1.0 )
+        self.assertAlmostEqual( summary['max'], 100.0 )
+        self.assertAlmostEqual( summary['p50'], 1.0, delta = 1.0 / 16 )
+        self.assertAlmostEqual( summary['p90'], 1.0, delta = 1.0 / 16 )
+        self.assertAlmostEqual( summary['p99'], 100.0, delta = 100.0 / 16 )
+
+    def test_clamp(self):
+        histogram = LatencyHistogram(max_value = 1)
+        histogram.record(-1)
+        histogram.record(10)
+        self.assertEqual( histogram.count, 2 )
+        self.assertEqual( histogram.min, 0 )
+        self.assertEqual( histogram.counts[-1], 1 )
+        self.assertLessEqual( histogram.percentile(100), 10 )
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.5)
+        histogram.reset()
+        self.assertEqual( histogram.summary(), {'count' : 0} )
+
+class RateCounterTest(unittest.TestCase):
+
+    def test_window(self):
+        counter = RateCounter(window = 10)
+        for second in range(100, 110):
+            counter.add(50, second + 0.5)
+        self.assertEqual( counter.rate(109.9), 50.0 )
+        self.assertEqual( counter.total, 500 )
+        # Slots older than the window are not counted
+        counter.add(100, 115)
+        self.assertEqual( counter.rate(115), (4 * 50 + 100) / 10.0 )
+        self.assertEqual( counter.rate(200), 0.0 )
+
+class TelemetryTest(unittest.TestCase):
+
+    def test_command_class(self):
+        self.assertEqual( command_class('G1 X10'), 'move' )
+        self.assertEqual( command_class('M105'), 'temp' )
+        self.assertEqual( command_class('G28'), 'homing' )
+        self.assertEqual( command_class('M117 Hello'), 'other' )
+        self.assertEqual( command_class(''), 'other' )
+
+    def test_done(self):
+        telemetry = Telemetry()
+        telemetry.done( Command('G1 X1', 100.0, 100.010, 'print'), 100.030 )
+        telemetry.done( Command('G1 X2', 100.0, 100.020, 'print'), 100.060 )
+        telemetry.done( Command('M105', 100.0, 100.001), 100.002 )
+        # Never sent
+        telemetry.done( Command('M105', 100.0, None), 101.0 )
+
+        snapshot = telemetry.snapshot()
+        move = snapshot['class']['move']
+        self.assertEqual( move['queue']['count'], 2 )
+        self.assertAlmostEqual( move['queue']['max'], 20.0, places = 2 )
+        self.assertAlmostEqual( move['ack']['max'], 40.0, places = 2 )
+        self.assertEqual( snapshot['class']['temp']['ack']['count'], 1 )
+        self.assertEqual( snapshot['group'].keys(), ['print'] )
+        self.assertEqual( snapshot['group']['print']['ack']['count'], 2 )
+
+    def test_bytes(self):
+        telemetry = Telemetry()
+        telemetry.sent(10, 100.0)
+        telemetry.sent(20, 101.0)
+        telemetry.received(3, 101.0)
+        snapshot = telemetry.snapshot()
+        self.assertEqual( snapshot['bytes']['tx'], 30 )
+        self.assertEqual( snapshot['bytes']['rx'], 3 )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Import standard python module
+import operator
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.totumduino.transport import data_checksum, checksum, frame, parse_resend, ResendBuffer, LineFramer
+
+#############################################
+
+def reference_checksum(line):
+    """ Marlin checksum, XOR of all the bytes of the line. """
+    return reduce(operator.xor, bytearray(line), 0)
+
+class ChecksumTest(unittest.TestCase):
+
+    def test_data_checksum(self):
+        # Every padding length
+        for data in ['', 'G', 'G2', 'G28', 'M105', 'G1 X10', 'G1 X10 Y20 Z0.3 F1200 E0.01234', '\xff' * 17]:
+            self.assertEqual( data_checksum(data), reference_checksum(data), repr(data) )
+
+    def test_checksum(self):
+        for n in [0, 1, 9, 10, 9999, 10000, 10001, 123456789]:
+            line = 'N{0} G1 X1 Y2'.format(n)
+            self.assertEqual( checksum(n, 'G1 X1 Y2'), reference_checksum(line), n )
+            self.assertEqual( checksum(n, 'G1 X1 Y2', data_checksum('G1 X1 Y2')), reference_checksum(line) )
+
+    def test_frame(self):
+        self.assertEqual( frame(1, 'M105'), 'N1 M105*{0}\r\n'.format(reference_checksum('N1 M105')) )
+
+class ParseResendTest(unittest.TestCase):
+
+    def test_resend(self):
+        self.assertEqual( parse_resend('Resend: 42'), 42 )
+        self.assertEqual( parse_resend('Resend:7\r'), 7 )
+
+    def test_other_lines(self):
+        self.assertIsNone( parse_resend('ok') )
+        self.assertIsNone( parse_resend('Error:Line Number is not Last Line Number+1, Last Line: 41') )
+        self.assertIsNone( parse_resend('Resend: x') )
+        self.assertIsNone( parse_resend('') )
+
+class ResendBufferTest(unittest.TestCase):
+
+    def test_get(self):
+        rb = ResendBuffer(4)
+        self.assertIsNone( rb.get(1) )
+        rb.put(1, 'a')
+        rb.put(2, 'b')
+        self.assertEqual( rb.get(1), 'a' )
+        self.assertTrue( 2 in rb )
+        self.assertFalse( 3 in rb )
+        self.assertEqual( rb.last, 2 )
+
+    def test_overwrite(self):
+        rb = ResendBuffer(4)
+        for n in xrange(1, 7):
+            rb.put(n, n)
+        # Lines 1 and 2 were replaced by 5 and 6
+        self.assertIsNone( rb.get(1) )
+        self.assertIsNone( rb.get(2) )
+        self.assertEqual( rb.get(3), 3 )
+        self.assertEqual( rb.get(6), 6 )
+
+    def test_since(self):
+        rb = ResendBuffer(4)
+        for n in xrange(1, 7):
+            rb.put(n, str(n))
+        self.assertEqual( rb.since(4), [(4, '4'), (5, '5'), (6, '6')] )
+        self.assertEqual( rb.since(3), [(3, '3'), (4, '4'), (5, '5'), (6, '6')] )
+        # Nothing left to resend
+        self.assertEqual( rb.since(7), [] )
+        # Dropped or never sent
+        self.assertIsNone( rb.since(2) )
+        self.assertIsNone( rb.since(8) )
+
+    def test_clear(self):
+        rb = ResendBuffer(4)
+        rb.put(1, 'a')
+        rb.clear()
+        self.assertIsNone( rb.get(1) )
+        self.assertIsNone( rb.last )
+        self.assertIsNone( rb.since(1) )
+
+class LineFramerTest(unittest.TestCase):
+
+    def test_chunks(self):
+        lf = LineFramer()
+        self.assertEqual( lf.feed(b'o'), [] )
+        self.assertEqual( lf.feed(b'k\nok T:2'), [u'ok'] )
+        self.assertEqual( lf.feed(b'10.0\nResend: 3\nech'), [u'ok T:210.0', u'Resend: 3'] )
+        self.assertEqual( lf.feed(b'o\n'), [u'echo'] )
+
+    def test_crlf(self):
+        lf = LineFramer(b'\r\n')
+        self.assertEqual( lf.feed(b'ok\r'), [] )
+        self.assertEqual( lf.feed(b'\nok\r\n'), [u'ok', u'ok'] )
+
+if __name__ == '__main__':
+    unittest.main()
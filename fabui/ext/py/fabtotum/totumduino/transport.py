@@ -0,0 +1,259 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import sys
+import codecs
+import struct
+import operator
+
+# Import external modules
+
+# Import internal modules
+
+#############################################
+
+# XOR of the ASCII digits of every number that fits in a block of 4 digits.
+# _DIGITS_XOR is used for the leading block (no padding), _BLOCK_XOR for
+# the following zero padded ones.
+_DIGITS_XOR = [ reduce(operator.xor, bytearray(str(n)), 0) for n in xrange(10000) ]
+_BLOCK_XOR  = [ reduce(operator.xor, bytearray('%04d' % n), 0) for n in xrange(10000) ]
+# 'N' ^ ' '
+_PREFIX_XOR = ord('N') ^ ord(' ')
+
+# Data checksums XOR whole words that still fit in a python int and fold
+# the result down to one byte. Zero padding does not change the XOR.
+if sys.maxint > 2**32:
+    _WORD_SIZE, _WORD_FORMAT = 8, 'q'
+else:
+    _WORD_SIZE, _WORD_FORMAT = 4, 'i'
+_WORD_PADDING = [ '\0' * (-n % _WORD_SIZE) for n in xrange(_WORD_SIZE) ]
+# Unpackers by number of words
+_WORD_STRUCTS = {}
+
+def data_checksum(data):
+    """
+    Calculate the XOR checksum of a line without the line number prefix.
+    The result can be reused for every retransmission of the same line.
+
+    :param data: Line content without the line terminator
+    :type data: string
+    :rtype: int
+    """
+    data += _WORD_PADDING[len(data) % _WORD_SIZE]
+    count = len(data) // _WORD_SIZE
+    unpack = _WORD_STRUCTS.get(count)
+    if unpack is None:
+        unpack = _WORD_STRUCTS[count] = struct.Struct('<{0}{1}'.format(count, _WORD_FORMAT)).unpack
+
+    cs = reduce(operator.xor, unpack(data), 0)
+    if _WORD_SIZE == 8:
+        cs ^= cs >> 32
+    cs ^= cs >> 16
+    cs ^= cs >> 8
+    return cs & 0xff
+
+def line_number_checksum(line_number):
+    """
+    Calculate the XOR checksum of the ``N<line_number> `` prefix using the
+    precomputed digit tables.
+
+    :param line_number: Line number
+    :type line_number: int
+    :rtype: int
+    """
+    cs = _PREFIX_XOR
+    while line_number >= 10000:
+        line_number, block = divmod(line_number, 10000)
+        cs ^= _BLOCK_XOR[block]
+    return cs ^ _DIGITS_XOR[line_number]
+
+def checksum(line_number, data, data_cs = None):
+    """
+    Calculate the checksum of ``N<line_number> <data>``.
+
+    :param line_number: Line number
+    :param data: Line content without the line terminator
+    :param data_cs: Precomputed checksum of **data**, see `data_checksum`
+    :type line_number: int
+    :type data: string
+    :type data_cs: int
+    :rtype: int
+    """
+    if data_cs is None:
+        data_cs = data_checksum(data)
+    # XOR is associative so the prefix and the data can be computed separately
+    return line_number_checksum(line_number) ^ data_cs
+
+def frame(line_number, data, data_cs = None):
+    """
+    Build a line numbered and checksummed line ready to be written to the
+    serial port.
+
+    :param line_number: Line number
+    :param data: Line content without the line terminator
+    :param data_cs: Precomputed checksum of **data**, see `data_checksum`
+    :returns: ``N<line_number> <data>*<checksum>\\r\\n``
+    :rtype: string
+    """
+    return "N{0} {1}*{2}\r\n".format(line_number, data, checksum(line_number, data, data_cs))
+
+def parse_resend(line):
+    """
+    Get the requested line number from a ``Resend: <N>`` reply.
+
+    :param line: Reply line
+    :type line: string
+    :returns: Requested line number or ``None`` if the line is not a resend request
+    :rtype: int
+    """
+    if line[:7] != 'Resend:':
+        return None
+    try:
+        return int(line[7:].strip())
+    except ValueError:
+        return None
+
+class ResendBuffer(object):
+    """
+    Ring buffer keeping the last **size** transmitted lines indexed by their
+    line number so that they can be transmitted again when the firmware
+    requests a resend.
+
+    :param size: Number of lines to keep
+    :type size: int
+    """
+
+    def __init__(self, size = 256):
+        self.size = max(1, int(size))
+        self.clear()
+
+    def clear(self):
+        """ Remove all the stored lines. """
+        self.__numbers = [None] * self.size
+        self.__entries = [None] * self.size
+        self.last = None
+
+    def put(self, line_number, entry):
+        """
+        Store **entry** for **line_number**. The oldest line is dropped
+        when the buffer is full.
+        """
+        idx = line_number % self.size
+        self.__numbers[idx] = line_number
+        self.__entries[idx] = entry
+
+        if self.last is None or line_number > self.last:
+            self.last = line_number
+
+    def get(self, line_number):
+        """
+        Get the entry stored for **line_number**.
+
+        :returns: Stored entry or ``None`` if the line is not available anymore
+        """
+        idx = line_number % self.size
+        if self.__numbers[idx] == line_number:
+            return self.__entries[idx]
+        return None
+
+    def __contains__(self, line_number):
+        return self.__numbers[line_number % self.size] == line_number
+
+    def since(self, line_number):
+        """
+        Get all the entries from **line_number** up to the last stored line.
+
+        :returns: List of ``(line_number, entry)`` tuples or ``None`` if
+                  **line_number** is not available anymore.
+        :rtype: list
+        """
+        if self.last is None or line_number > self.last + 1:
+            return None
+
+        entries = []
+        for n in xrange(line_number, self.last + 1):
+            entry = self.get(n)
+            if entry is None:
+                return None
+            entries.append( (n, entry) )
+        return entries
+
+class LineFramer(object):
+    """
+    Split the data received from the serial port into lines.
+    
+    Incoming data is appended to a reusable buffer which is searched for
+    the terminator only from where the previous search stopped. All the 
+    complete lines are decoded at once through a `memoryview` of the 
+    buffer and split afterwards, so the cost is linear in the amount of 
+    received data regardless of how it is chunked.
+    
+    :param terminator: Line terminator
+    :param encoding: Encoding used to decode the lines
+    :param errors: Decode error handling
+    :type terminator: string
+    :type encoding: string
+    :type errors: string
+    """
+    
+    def __init__(self, terminator = b'\n', encoding = 'utf-8', errors = 'replace'):
+        self.terminator = terminator
+        self.uterminator = terminator.decode(encoding)
+        self.decode = codecs.getdecoder(encoding)
+        self.errors = errors
+        self.reset()
+    
+    def reset(self):
+        """ Drop all the buffered data. """
+        self.buffer = bytearray()
+        self.scan = 0
+    
+    def feed(self, data):
+        """
+        Add received **data** and get all the lines that are complete.
+        
+        :param data: Received data
+        :type data: bytes
+        :returns: List of decoded lines without the terminator
+        :rtype: list
+        """
+        buf = self.buffer
+        buf.extend(data)
+        
+        end = buf.rfind(self.terminator, self.scan)
+        if end < 0:
+            # Next time search only the new data
+            self.scan = max(0, len(buf) - len(self.terminator) + 1)
+            return []
+        
+        view = memoryview(buf)
+        block, size = self.decode(view[:end], self.errors)
+        # The buffer can not be resized while a view is exported
+        del view
+        
+        del buf[:end + len(self.terminator)]
+        self.scan = 0
+        
+        return block.split(self.uterminator)
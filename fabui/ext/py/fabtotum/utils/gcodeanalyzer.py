@@ -0,0 +1,329 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import math
+import time
+import datetime
+import argparse
+import resource
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodefile import GCodeFileIter
+
+#############################################
+
+INF = float('inf')
+
+# Parameters scaled by G20 (inches)
+UNIT_PARAMS = 'XYZEF'
+
+class GCodeAnalyzer(object):
+    """
+    Single pass gcode analyzer. It computes the same values as
+    `printrun.gcoder.GCode` (dimensions, number of layers, filament length and
+    an estimated duration) without keeping the lines in memory, only numeric
+    accumulators and the set of the layer heights are stored.
+
+    Layers are the distinct heights with extruding moves, the dimensions are
+    the bounding box of the extruding moves (all moves if nothing is
+    extruded) and the duration accounts for acceleration between moves with
+    different feedrates.
+
+    :param acceleration: Acceleration used for the duration estimate in mm/s^2
+    """
+
+    ACCELERATION = 2000.0
+
+    def __init__(self, acceleration = ACCELERATION):
+        self.acceleration = acceleration
+        self.reset()
+
+    def reset(self):
+        self.imperial = False
+        self.relative = False
+        self.relative_e = False
+        # Machine position and G92 offsets
+        self.position = [0.0, 0.0, 0.0]
+        self.offset = [0.0, 0.0, 0.0]
+        self.current_e = 0.0
+        self.offset_e = 0.0
+        self.total_e = 0.0
+        self.max_e = 0.0
+        self.feedrate = 0.0
+        # Height used for the layers, None until the first Z move
+        self.z = None
+        self.zs = set()
+        # Bounding boxes [xmin, ymin, xmax, ymax] of extruding and of all moves
+        self.bbox_e = [INF, INF, -INF, -INF]
+        self.bbox = [INF, INF, -INF, -INF]
+        # Duration estimate
+        self.last_f = 0.0
+        self.last_dx = 0.0
+        self.last_dy = 0.0
+        self.duration = 0.0
+        self.lines = 0
+
+    def __args(self, tokens):
+        args = {}
+        factor = 25.4 if self.imperial else 1.0
+        for tag in tokens[1:]:
+            code = tag[:1]
+            try:
+                value = float(tag[1:])
+            except ValueError:
+                continue
+            if code in UNIT_PARAMS:
+                value *= factor
+            args[code] = value
+        return args
+
+    @staticmethod
+    def __extend(bbox, x, y):
+        if x < bbox[0]:
+            bbox[0] = x
+        if x > bbox[2]:
+            bbox[2] = x
+        if y < bbox[1]:
+            bbox[1] = y
+        if y > bbox[3]:
+            bbox[3] = y
+
+    def __move(self, command, args):
+        position = self.position
+        offset = self.offset
+        last_x, last_y, last_z = position
+        last_e = self.current_e
+
+        for axis, code in enumerate('XYZ'):
+            value = args.get(code)
+            if value is not None:
+                if self.relative:
+                    position[axis] += value
+                else:
+                    position[axis] = value + offset[axis]
+
+        f = args.get('F')
+        if f is not None:
+            self.feedrate = f
+
+        # Extrusion
+        extruding = False
+        e = args.get('E')
+        if e is not None:
+            if self.relative_e:
+                extruding = e > 0
+                self.total_e += e
+                self.current_e += e
+            else:
+                new_e = e + self.offset_e
+                extruding = new_e > self.current_e
+                self.total_e += new_e - self.current_e
+                self.current_e = new_e
+            if self.total_e > self.max_e:
+                self.max_e = self.total_e
+
+        x, y, z = position
+        if extruding:
+            self.__extend(self.bbox_e, x, y)
+        if self.max_e <= 0:
+            self.__extend(self.bbox, x, y)
+
+        # Layers
+        value = args.get('Z')
+        if value is not None:
+            if self.relative and self.z is not None:
+                self.z += value
+            else:
+                self.z = value
+        if extruding and self.z is not None:
+            self.zs.add(self.z)
+
+        # Duration, only for linear moves
+        if command == 'G0' or command == 'G1':
+            dx = x - last_x
+            dy = y - last_y
+            f = self.feedrate / 60.0
+            last_f = self.last_f
+            # Full stop when reversing direction
+            if dx * self.last_dx + dy * self.last_dy <= 0:
+                last_f = 0.0
+
+            travel = math.hypot(dx, dy)
+            if travel == 0:
+                travel = abs(z - last_z) or abs(self.current_e - last_e)
+
+            if f == last_f:
+                duration = travel / f if f else 0.0
+            else:
+                # Distance to accelerate and decelerate between the feedrates
+                distance = 2 * abs((last_f + f) * (f - last_f) * 0.5 / self.acceleration)
+                if distance <= travel and last_f + f != 0 and f != 0:
+                    duration = 2 * distance / (last_f + f) + (travel - distance) / f
+                else:
+                    duration = 2 * travel / (last_f + f)
+
+            self.duration += duration
+            self.last_dx = dx
+            self.last_dy = dy
+            self.last_f = f
+
+    def process_line(self, line):
+        """
+        Process a gcode line without comments.
+        """
+        self.lines += 1
+        tokens = line.split()
+        if not tokens:
+            return
+        command = tokens[0]
+
+        if command[0] == 'G':
+            if command in ('G0', 'G1', 'G2', 'G3'):
+                self.__move(command, self.__args(tokens))
+            elif command == 'G90':
+                self.relative = False
+                self.relative_e = False
+            elif command == 'G91':
+                self.relative = True
+                self.relative_e = True
+            elif command == 'G92':
+                args = self.__args(tokens)
+                for axis, code in enumerate('XYZ'):
+                    if code in args:
+                        self.offset[axis] = self.position[axis] - args[code]
+                if 'E' in args:
+                    self.offset_e = self.current_e - args['E']
+                if 'Z' in args:
+                    self.z = args['Z']
+            elif command == 'G28':
+                axes = [ tag[:1] for tag in tokens[1:] ]
+                home_all = not ('X' in axes or 'Y' in axes or 'Z' in axes)
+                for axis, code in enumerate('XYZ'):
+                    if home_all or code in axes:
+                        self.offset[axis] = 0.0
+                        self.position[axis] = 0.0
+            elif command == 'G4':
+                args = self.__args(tokens)
+                self.duration += args.get('P', 0) / 1000.0 + args.get('S', 0)
+            elif command == 'G20':
+                self.imperial = True
+            elif command == 'G21':
+                self.imperial = False
+        elif command == 'M82':
+            self.relative_e = False
+        elif command == 'M83':
+            self.relative_e = True
+
+    def process_file(self, filename):
+        """
+        Analyze a gcode file.
+        """
+        for line, attrs in GCodeFileIter(filename):
+            if line:
+                self.process_line(line)
+        return self
+
+    def result(self):
+        """
+        Get the analysis result.
+
+        :returns: Dictionary with `width`, `depth`, `height` in mm, `layers`,
+                  `filament` length in mm and `duration` in seconds
+        :rtype: dict
+        """
+        bbox = self.bbox_e if self.max_e > 0 else self.bbox
+        xmin, ymin, xmax, ymax = [ 0 if math.isinf(v) else v for v in bbox ]
+        zs = self.zs | set([0])
+
+        return {
+            'width'     : xmax - xmin,
+            'depth'     : ymax - ymin,
+            'height'    : max(zs) - min(zs),
+            'layers'    : len(self.zs),
+            'filament'  : self.max_e,
+            'duration'  : self.duration
+        }
+
+    def attributes(self):
+        """
+        Get the analysis result in the format stored as file attributes.
+
+        :rtype: dict
+        """
+        result = self.result()
+        return {
+            "dimensions" : {
+                "x" : str(result['width']),
+                "y" : str(result['depth']),
+                "z" : str(result['height'])
+            },
+            "number_of_layers" : str(result['layers']),
+            "filament": str(result['filament']),
+            "estimated_time": str(datetime.timedelta(seconds = int(result['duration'])))
+        }
+
+def _max_rss():
+    """ Peak resident memory of the process in KB. """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze gcode files and compare the result with printrun.')
+    parser.add_argument('files', nargs='+', help='GCode files')
+    parser.add_argument('--compare', action='store_true', help='Also analyze with printrun GCode, this can use a lot of memory')
+    args = parser.parse_args()
+
+    # Memory is measured as peak growth, run the streaming analyzer first
+    for filename in args.files:
+        rss = _max_rss()
+        t = time.time()
+        attributes = GCodeAnalyzer().process_file(filename).attributes()
+        print "{0}:".format(filename)
+        print "  analyzer: {0:.2f}s, +{1}KB peak".format(time.time() - t, _max_rss() - rss)
+        print "  ", attributes
+
+    if args.compare:
+        from printrun.gcoder import GCode
+
+        for filename in args.files:
+            rss = _max_rss()
+            t = time.time()
+            gcode = GCode(open(filename, "rU"))
+            print "{0}:".format(filename)
+            print "  printrun: {0:.2f}s, +{1}KB peak".format(time.time() - t, _max_rss() - rss)
+            print "  ", {
+                "dimensions" : {
+                    "x" : str(gcode.width),
+                    "y" : str(gcode.depth),
+                    "z" : str(gcode.height)
+                },
+                "number_of_layers" : str(gcode.layers_count),
+                "filament": str(gcode.filament_length),
+                "estimated_time": str(gcode.estimate_duration()[1])
+            }
+
+if __name__ == "__main__":
+    main()
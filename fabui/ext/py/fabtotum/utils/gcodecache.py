@@ -0,0 +1,347 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import sys
+import json
+import time
+import bisect
+import array
+import struct
+import hashlib
+import argparse
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodefile import GCodeFile
+from fabtotum.utils.gcodeindex import file_key, TAIL_SIZE
+from fabtotum.utils.gcodepipeline import GCodePipeline
+from fabtotum.totumduino.transport import data_checksum
+
+#############################################
+
+# Cache files are stored next to the gcode file
+CACHE_SUFFIX    = '.gcc'
+CACHE_MAGIC     = 'FGCC'
+# Bump when the format changes so that old caches get recompiled
+CACHE_VERSION   = 2
+# Lines stored in a chunk
+CHUNK_LINES     = 1024
+
+# Magic, version, source size, mtime and inode, content hash, number of lines, trailer position
+HEADER = struct.Struct('<4sHQdQ20sIQ')
+# Number of lines and length of the line data of a chunk
+CHUNK = struct.Struct('<II')
+
+def cache_file(filename):
+    """ Path of the cache of **filename**. """
+    return filename + CACHE_SUFFIX
+
+def content_hash(filename, size):
+    """
+    Hash of the first and the last `TAIL_SIZE` bytes of **filename**, it
+    detects a file rewritten with the same size, mtime and inode.
+    """
+    h = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        h.update( f.read(TAIL_SIZE) )
+        if size > TAIL_SIZE:
+            f.seek( max(TAIL_SIZE, size - TAIL_SIZE) )
+            h.update( f.read(TAIL_SIZE) )
+    return h.digest()
+
+def _pack_chunk(lines, offsets, checksums):
+    data = '\n'.join(lines)
+    offsets = array.array('I', offsets)
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    return CHUNK.pack(len(lines), len(data)) + offsets.tostring() + bytearray(checksums) + data
+
+class GCodeCache(object):
+    """
+    Compiled form of a gcode file. Lines are stored without comments, empty
+    lines and homing codes, like the default `GCodePipeline` output, with
+    their checksum already computed, see `data_checksum`.
+    
+    Lines are grouped in length prefixed chunks of `CHUNK_LINES` lines
+    holding the source offset of the line ends, the checksums and the
+    lines, so that a whole chunk is decoded at once. Slicer attributes and
+    a seek table with the position of every chunk are stored in a trailer.
+
+    A cache is valid as long as the size, mtime, inode and `content_hash` of
+    the source file do not change, `open` returns ``None`` otherwise. The
+    cache has to be removed together with the source file, see `remove`.
+
+    :param filename: Source gcode file
+    :param header: Header values read by `open`
+    """
+
+    def __init__(self, filename, header):
+        self.filename = filename
+        self.path = cache_file(filename)
+        self.count = header[6]
+        self.trailer_pos = header[7]
+        self.attrs = None
+        self.seek_table = None
+
+    @classmethod
+    def open(cls, filename):
+        """
+        Get the cache of **filename**.
+
+        :returns: Cache or ``None`` if there is no valid cache
+        :rtype: GCodeCache
+        """
+        try:
+            key = file_key(filename)
+            with open(cache_file(filename), 'rb') as f:
+                header = HEADER.unpack( f.read(HEADER.size) )
+        except (IOError, OSError, struct.error):
+            return None
+
+        magic, version, size, mtime, inode, digest = header[:6]
+        if (magic != CACHE_MAGIC or version != CACHE_VERSION or
+            size != key['size'] or mtime != key['mtime'] or inode != key['inode']):
+            return None
+
+        try:
+            if digest != content_hash(filename, size):
+                return None
+        except (IOError, OSError):
+            return None
+
+        return cls(filename, header)
+
+    @staticmethod
+    def compile(filename, gfile = None):
+        """
+        Create the cache of **filename**, the file is written to a temporary
+        file first so that a partial cache is never used.
+
+        :param gfile: Already scanned `GCodeFile` of **filename**
+        :returns: Number of lines
+        """
+        key = file_key(filename)
+        digest = content_hash(filename, key['size'])
+        if gfile is None:
+            gfile = GCodeFile(filename)
+
+        gcode_iter = gfile.iter_from(pipeline = GCodePipeline.from_config())
+        path = cache_file(filename)
+        tmp_path = path + '.tmp'
+
+        attrs = []
+        seek_table = []
+        lines = []
+        offsets = []
+        checksums = []
+        count = 0
+        start = 0
+        pos = HEADER.size
+        with open(tmp_path, 'wb') as f:
+            f.write( '\0' * HEADER.size )
+            for code, line_attrs in gcode_iter:
+                # The pipeline returns an empty line for removed lines with attributes
+                if not code and not line_attrs:
+                    start = gcode_iter.offset
+                    continue
+
+                if not lines:
+                    seek_table.append( (start, count, pos) )
+                if line_attrs:
+                    attrs.append( (count, line_attrs) )
+
+                lines.append(code)
+                offsets.append(gcode_iter.offset)
+                checksums.append( data_checksum(code) )
+                count += 1
+                start = gcode_iter.offset
+
+                if len(lines) == CHUNK_LINES:
+                    chunk = _pack_chunk(lines, offsets, checksums)
+                    f.write(chunk)
+                    pos += len(chunk)
+                    lines, offsets, checksums = [], [], []
+
+            if lines:
+                chunk = _pack_chunk(lines, offsets, checksums)
+                f.write(chunk)
+                pos += len(chunk)
+
+            json.dump({'attrs' : attrs, 'seek' : seek_table}, f)
+            f.seek(0)
+            f.write( HEADER.pack(CACHE_MAGIC, CACHE_VERSION, key['size'], key['mtime'], key['inode'], digest, count, pos) )
+
+        os.rename(tmp_path, path)
+        return count
+
+    @staticmethod
+    def remove(filename):
+        """ Remove the cache of **filename**. """
+        try:
+            os.remove( cache_file(filename) )
+        except OSError:
+            pass
+
+    def __load_trailer(self):
+        if self.attrs is not None:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self.trailer_pos)
+            trailer = json.load(f)
+        self.attrs = dict( (index, attrs) for index, attrs in trailer['attrs'] )
+        self.seek_table = [ tuple(entry) for entry in trailer['seek'] ]
+
+    def iter_from(self, offset = 0, preamble = None):
+        """
+        Return iterable object starting at the line at byte **offset** of
+        the source file, same as `GCodeFile.iter_from`.
+
+        :param preamble: GCode lines to return before the file content
+        :rtype: GCodeCacheIter
+        """
+        self.__load_trailer()
+        i = bisect.bisect_right(self.seek_table, (offset, self.count, self.trailer_pos))
+        start, index, pos = self.seek_table[i-1] if i else (0, 0, HEADER.size)
+        cache_iter = GCodeCacheIter(self.path, self.attrs, index, pos, self.trailer_pos, preamble)
+        cache_iter.skip_to(offset)
+        return cache_iter
+
+    def __iter__(self):
+        return self.iter_from()
+
+class GCodeCacheIter(object):
+    """
+    Iterate through the lines of a gcode cache returning the line and the
+    slicer attributes. `offset` is the source offset of the end of the last
+    returned line and `checksum` its checksum, see `data_checksum`.
+
+    :param path: Cache file
+    :param attrs: Slicer attributes by line index
+    :param index: Index of the first line of the chunk at **pos**
+    :param pos: Position of the first chunk to read
+    :param end: Position of the end of the chunks
+    :param preamble: GCode lines returned before the file content
+    """
+
+    def __init__(self, path, attrs, index, pos, end, preamble = None):
+        self.fd = open(path, 'rb')
+        self.fd.seek(pos)
+        self.attrs = attrs
+        self.base = index
+        self.remaining = end - pos
+        self.offset = 0
+        self.checksum = None
+        self.preamble = list(preamble or [])
+        self.lines = []
+        self.offsets = []
+        self.checksums = bytearray()
+        self.index = 0
+
+    def __iter__(self):
+        return self
+
+    def __read_chunk(self):
+        """
+        Decode the next chunk, returns ``False`` at the end of the cache.
+        """
+        self.base += len(self.lines)
+        self.lines = []
+        self.index = 0
+        if self.remaining <= 0 or self.fd.closed:
+            return False
+
+        header = self.fd.read(CHUNK.size)
+        if len(header) < CHUNK.size:
+            return False
+        count, length = CHUNK.unpack(header)
+        size = 4*count + count + length
+        data = self.fd.read(size)
+        if len(data) < size:
+            # Truncated cache
+            return False
+        self.remaining -= CHUNK.size + size
+
+        offsets = array.array('I')
+        offsets.fromstring(data[:4*count])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        self.offsets = offsets
+        self.checksums = bytearray(data[4*count:5*count])
+        self.lines = data[5*count:].split('\n')
+        return True
+
+    def skip_to(self, offset):
+        """ Skip the lines ending before byte **offset**. """
+        while True:
+            if not self.lines and not self.__read_chunk():
+                break
+            if self.offsets[-1] > offset:
+                self.index = bisect.bisect_right(self.offsets, offset)
+                break
+            self.index = len(self.lines)
+            if not self.__read_chunk():
+                break
+        self.offset = offset
+
+    def next(self):
+        if self.preamble:
+            line = self.preamble.pop(0)
+            self.checksum = data_checksum(line)
+            return line, None
+
+        i = self.index
+        if i >= len(self.lines):
+            if not self.__read_chunk():
+                self.close()
+                raise StopIteration
+            i = 0
+
+        self.index = i + 1
+        self.offset = self.offsets[i]
+        self.checksum = self.checksums[i]
+        return self.lines[i], self.attrs.get(self.base + i)
+
+    def close(self):
+        """ Close the cache file. """
+        self.fd.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile gcode files to the streaming cache format.')
+    parser.add_argument('files', nargs='+', help='GCode files')
+    parser.add_argument('-f', '--force', action='store_true', help='Compile even if the cache is valid')
+    args = parser.parse_args()
+
+    for filename in args.files:
+        if not args.force and GCodeCache.open(filename):
+            print "{0}: cache is valid".format(filename)
+            continue
+        t = time.time()
+        count = GCodeCache.compile(filename)
+        print "{0}: {1} lines in {2:.2f}s, {3} bytes".format(filename, count, time.time() - t, os.path.getsize(cache_file(filename)))
+
+if __name__ == "__main__":
+    main()
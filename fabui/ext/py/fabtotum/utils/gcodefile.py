@@ -20,6 +20,13 @@
 
 # Import standard python module
 import os
+import re
+import mmap
+from threading import Thread
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 # Import external modules
 
@@ -28,30 +35,194 @@ from fabtotum.utils.slicer.cura_utils import Parser as CuraParser
 from fabtotum.utils.slicer.slic3r_utils import Parser as Slic3rParser
 from fabtotum.utils.slicer.simplify_utils import Parser as SimplifyParser
 from fabtotum.utils.common import rpi_version
+from fabtotum.utils.gcodeindex import GCodeIndex
+
+# Bytes counted at once by the bulk line counter
+SCAN_BLOCK_SIZE = 1024*1024
+# Bytes read at once when iterating through a file
+READ_BLOCK_SIZE = 64*1024
+# Lines passed at once from the prefetch thread and number of batches read ahead
+PREFETCH_BATCH_SIZE = 256
+PREFETCH_BATCHES = 16
+# First line telling the gcode type, same as the line checks in the full scan
+RE_GCODE_TYPE = re.compile(r'^(M109|M3 S|M4 S|M450)', re.M)
+
+def _number(value):
+    """ Format a gcode parameter value without trailing zeros. """
+    return ('%.4f' % value).rstrip('0').rstrip('.')
 
 class GCodeFileIter:
+    """
+    Iterate through the gcode lines of a file returning the code without
+    comments and the slicer attributes of the line. `offset` is the byte
+    offset of the next line to be read.
+    
+    The file is read in blocks of **block_size** bytes split in lines at
+    once, and only the lines with a comment are handed to the attribute
+    parser as slicer attributes are always in comments.
+    
+    :param filename: GCode file
+    :param attr_parser: Slicer attribute parser
+    :param offset: Byte offset of the line to start from
+    :param preamble: GCode lines returned before the file content
+    :param block_size: Number of bytes read at once
+    """
     
-    def __init__(self, filename, attr_parser = None):
-        self.fd = open(filename, 'r')
+    def __init__(self, filename, attr_parser = None, offset = 0, preamble = None, block_size = READ_BLOCK_SIZE):
+        self.fd = open(filename, 'rb')
         self.parser = attr_parser
-        
+        self.preamble = list(preamble or [])
+        self.offset = offset
+        self.block_size = block_size
+        self.lines = []
+        self.index = 0
+        self.partial = ''
+        self.newline = 1
+        if offset:
+            self.fd.seek(offset)
+    
+    def __iter__(self):
+        return self
+    
+    def __read(self):
+        """
+        Read the next block of lines, returns ``False`` at the end of the file.
+        """
+        data = self.fd.read(self.block_size)
+        if data:
+            lines = (self.partial + data).split('\n')
+            # Keep the incomplete last line for the next block
+            self.partial = lines.pop()
+            self.newline = 1
+        else:
+            # Last line of the file without a newline
+            lines = [self.partial] if self.partial else []
+            self.partial = ''
+            self.newline = 0
+        self.lines = lines
+        self.index = 0
+        return bool(data or lines)
+    
     def next(self):
-        line = self.fd.readline()
-        if line:
-            
+        if self.preamble:
+            return self.preamble.pop(0), None
+        
+        while self.index >= len(self.lines):
+            if self.fd.closed or not self.__read():
+                self.close()
+                raise StopIteration
+        
+        line = self.lines[self.index]
+        self.index += 1
+        self.offset += len(line) + self.newline
+        
+        if ';' in line:
             if self.parser:
-                attrs = self.parser.process_line(line)
+                attrs = self.parser.process_line(line + '\n')
             else:
                 attrs = None
-            
-            tags = line.strip().split(';')
-            if len(tags) > 0:
-                return tags[0].strip(), attrs
-            return '', attrs
-        else:
-            self.fd.close()
-            raise StopIteration
+            return line.split(';', 1)[0].strip(), attrs
+        
+        return line.strip(), None
+    
+    def close(self):
+        """ Close the file. """
+        self.fd.close()
 
+class GCodePrefetchIter(object):
+    """
+    Read ahead a gcode iterator in a producer thread so that disk reads and
+    comment parsing do not delay the consumer. Lines are passed in batches
+    through a bounded queue, `offset` is the byte offset of the line after
+    the last one returned, as for `GCodeFileIter`.
+    
+    The iterator must be closed with `close` if it is not consumed to the end,
+    the producer thread has stopped and the file is closed when it returns.
+    
+    :param source: GCode iterator with an `offset` attribute
+    :param batch_size: Number of lines in a batch
+    :param batches: Maximum number of batches read ahead
+    """
+    
+    def __init__(self, source, batch_size = PREFETCH_BATCH_SIZE, batches = PREFETCH_BATCHES):
+        self.source = source
+        self.offset = source.offset
+        self.batch_size = batch_size
+        self.queue = queue.Queue(batches)
+        self.batch = []
+        self.index = 0
+        self.finished = False
+        self.closed = False
+        self.thread = Thread(target=self.__producer, name='GCodePrefetch')
+        self.thread.daemon = True
+        self.thread.start()
+    
+    def __iter__(self):
+        return self
+    
+    def __put(self, item):
+        while not self.closed:
+            try:
+                self.queue.put(item, timeout = 0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def __producer(self):
+        source = self.source
+        try:
+            while not self.closed:
+                batch = []
+                try:
+                    for i in xrange(self.batch_size):
+                        code, attrs = source.next()
+                        batch.append( (code, attrs, source.offset) )
+                except StopIteration:
+                    if batch:
+                        self.__put(batch)
+                    self.__put(None)
+                    return
+                if not self.__put(batch):
+                    return
+        except Exception as e:
+            self.__put(e)
+        finally:
+            source.close()
+    
+    def next(self):
+        if self.index >= len(self.batch):
+            if self.finished:
+                raise StopIteration
+            
+            batch = self.queue.get()
+            if batch is None:
+                self.finished = True
+                raise StopIteration
+            elif isinstance(batch, Exception):
+                self.finished = True
+                raise batch
+            
+            self.batch = batch
+            self.index = 0
+        
+        code, attrs, self.offset = self.batch[self.index]
+        self.index += 1
+        return code, attrs
+    
+    def close(self):
+        """ Stop reading ahead and close the file. """
+        self.closed = True
+        self.finished = True
+        self.batch = []
+        self.index = 0
+        # Make room for the producer if it is waiting on a full queue
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        self.thread.join()
 
 class GCodeInfo:
     
@@ -82,93 +253,305 @@ class GCodeFile:
     
     MAX_FILE_SIZE = 30 #MB - limit for lite_parsing to be triggered
     
-    def __init__(self, filename, lite_parsing=False):
+    def __init__(self, filename, lite_parsing=False, use_index=True):
         self.info = GCodeInfo(filename)
         self.cura_p   = CuraParser()
         self.slic3r_p = Slic3rParser()
         self.simplify_p = SimplifyParser()
-        self.process_file(filename, lite_parsing)
+        self.process_file(filename, lite_parsing, use_index)
         
     def __iter__(self):
         """
         Return iterable object used to iterate though gcode.
         """
-        parser = None
+        return GCodeFileIter(self.info['filename'], self.get_parser())
+    
+    def iter_from(self, offset = 0, preamble = None, prefetch = False, pipeline = None):
+        """
+        Return iterable object starting at byte **offset**, see `get_layer`.
+        
+        :param preamble: GCode lines to return before the file content
+        :param prefetch: Read ahead in a separate thread, the iterator has to be closed
+                         with `close` if it is not consumed to the end
+        :param pipeline: `GCodePipeline` applied to the lines, in the prefetch thread
+                         when **prefetch** is set
+        """
+        gcode_iter = GCodeFileIter(self.info['filename'], self.get_parser(), offset, preamble)
+        if pipeline:
+            gcode_iter = pipeline.wrap(gcode_iter)
+        if prefetch:
+            return GCodePrefetchIter(gcode_iter)
+        return gcode_iter
+    
+    def get_layer(self, layer):
+        """
+        Get the start of a layer.
+        
+        :param layer: Layer number
+        :returns: Dictionary with the byte `offset`, `line` and `gcode` number of the
+                  first line of the layer and the modal `state` at that point,
+                  or ``None`` if the layer is not in the file
+        :rtype: dict
+        """
+        for record in self.info.attribs.get('layers', []):
+            if record['layer'] == layer:
+                return record
+        return None
+    
+    @staticmethod
+    def resume_gcode(record):
+        """
+        GCode restoring the modal state of a layer returned by `get_layer`.
+        Temperatures are set and waited for, the head is moved to the
+        layer height before moving on the plane, then the extruder position,
+        feedrate and positioning modes are restored.
+        
+        :rtype: list
+        """
+        state = record['state']
+        x, y, z = state['position']
+        gcode = []
+        
+        if state['bed_temp']:
+            gcode.append('M140 S' + _number(state['bed_temp']))
+        if state['ext_temp']:
+            gcode.append('M104 S' + _number(state['ext_temp']))
+        if state['bed_temp']:
+            gcode.append('M190 S' + _number(state['bed_temp']))
+        if state['ext_temp']:
+            gcode.append('M109 S' + _number(state['ext_temp']))
+        if state['fan']:
+            gcode.append('M106 S' + _number(state['fan']))
+        
+        gcode.append('G90')
+        gcode.append('G0 Z' + _number(z))
+        gcode.append('G0 X' + _number(x) + ' Y' + _number(y))
+        gcode.append('M83' if state['e_relative'] else 'M82')
+        gcode.append('G92 E' + _number(state['e']))
+        if state['feedrate']:
+            gcode.append('G1 F' + _number(state['feedrate']))
+        if state['relative']:
+            gcode.append('G91')
+        
+        return gcode
+    
+    def get_parser(self):
+        """
+        Get the slicer attribute parser of the file, ``None`` if the slicer is unknown.
+        """
         if 'slicer' in self.info:
             slicer = self.info['slicer']
             if slicer == 'CURA':
-                parser = self.cura_p
+                return self.cura_p
             elif slicer == 'SLIC3R':
-                parser = self.slic3r_p
+                return self.slic3r_p
             elif slicer == 'SIMPLIFY3D':
-                parser = self.simplify_p
-        return GCodeFileIter(self.info['filename'], parser)
+                return self.simplify_p
+        return None
+
+    @staticmethod
+    def __map(fd):
+        """
+        Map a file read-only, returns ``None`` for an empty file.
+        """
+        if not os.fstat(fd.fileno()).st_size:
+            return None
+        return mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
 
     @staticmethod
     def __tail(f, n):
-        stdin,stdout = os.popen2('tail -n {0} "{1}"'.format(n,f))
-        stdin.close()
-        lines = stdout.readlines(); 
-        stdout.close()
-        return lines
+        with open(f, 'rb') as fd:
+            mm = GCodeFile.__map(fd)
+            if mm is None:
+                return []
+            try:
+                # Search the newlines backwards, only the tail gets paged in
+                end = start = mm.size()
+                for i in xrange(n+1):
+                    start = mm.rfind('\n', 0, start)
+                    if start < 0:
+                        start = 0
+                        break
+                data = mm[start:end]
+            finally:
+                mm.close()
+        return [ line + '\n' for line in data.split('\n')[-n-1:] if line ]
 
     @staticmethod
     def __head(f, n):
-        stdin,stdout = os.popen2('head -n {0} "{1}"'.format(n,f))
-        stdin.close()
-        lines = stdout.readlines(); 
-        stdout.close()
+        lines = []
+        with open(f, 'rb') as fd:
+            for line in fd:
+                lines.append(line)
+                if len(lines) >= n:
+                    break
         return lines
     
     @staticmethod
     def __size(f):
-        stdin,stdout = os.popen2('wc -c < "{0}"'.format(f))
-        stdin.close()
-        size = stdout.readline()
-        stdout.close()
-        return size #return byte size
+        return os.path.getsize(f) #return byte size
     
-
-    def process_file(self, filename, lite_parsing):
+    @staticmethod
+    def __ends_with_newline(f):
+        with open(f, 'rb') as fd:
+            fd.seek(0, os.SEEK_END)
+            if not fd.tell():
+                return False
+            fd.seek(-1, os.SEEK_END)
+            return fd.read(1) == '\n'
+    
+    @staticmethod
+    def __new_state():
+        return {
+            'offset'        : 0,
+            'count'         : 0,
+            'gcode_count'   : 0,
+            'max_layer'     : 0,
+            'layer_count'   : 0,
+            'type'          : None,
+            'slicer'        : None,
+            'layers'        : [],
+            'bbox'          : None,
+            'position'      : [0.0, 0.0, 0.0],
+            'relative'      : False,
+            'e'             : 0.0,
+            'e_relative'    : False,
+            'feedrate'      : None,
+            'ext_temp'      : 0.0,
+            'bed_temp'      : 0.0,
+            'fan'           : 0.0
+        }
+    
+    def __detect_slicer(self, lines):
         """
-        Go threough the whole gcode file and extract usefull information about it.
-        This information include gcode type, code count, layer count...
+        Check GCode profile (deduce slicer)
         """
-        count = 0
-        gcode_count = 0
-        max_layer = 0
-        layer_count = 0
-        slicer = None
-        gcode_type = None
-        stop_parsing = False
-        
-        head_lines = self.__head(filename, 50)
-        tail_lines = self.__tail(filename, 50)
-        file_size  = float(self.__size(filename))/1000000
-        rpi        = rpi_version()
-        
-        lines = head_lines + tail_lines
-        
-        if(rpi == "Raspberry Pi Model B" and file_size > self.MAX_FILE_SIZE):
-            lite_parsing = True # On Rasperry Pi Model B it would take too much time to process the file
-            
-        # Check GCode profile (deduce slicer)
         for line in lines:
             if self.cura_p.is_cura(line):
-                slicer = 'CURA'
-                break
+                return 'CURA'
             elif self.slic3r_p.check_profile(line):
-                slicer = 'SLIC3R'
-                break
+                return 'SLIC3R'
             elif self.simplify_p.is_simplify(line):
-                slicer = 'SIMPLIFY3D'
-                break
-        if slicer:
-            self.info['slicer'] = slicer
+                return 'SIMPLIFY3D'
+        return None
+    
+    @staticmethod
+    def __track_gcode(state, line):
+        """
+        Update the modal state (position, extruder, feedrate, temperatures)
+        and the bounding box with a G/M command.
+        """
+        tags = line.split(';', 1)[0].split()
+        if not tags:
+            return
+        code = tags[0]
+        
+        if code in ('G0', 'G1', 'G2', 'G3', 'G92'):
+            position = state['position']
+            moved = False
+            for tag in tags[1:]:
+                axis = 'XYZEF'.find(tag[:1])
+                if axis < 0:
+                    continue
+                try:
+                    value = float(tag[1:])
+                except ValueError:
+                    continue
+                if axis == 4:
+                    state['feedrate'] = value
+                elif code == 'G92':
+                    if axis == 3:
+                        state['e'] = value
+                    else:
+                        position[axis] = value
+                elif axis == 3:
+                    if state['relative'] or state['e_relative']:
+                        state['e'] += value
+                    else:
+                        state['e'] = value
+                else:
+                    if state['relative']:
+                        position[axis] += value
+                    else:
+                        position[axis] = value
+                    moved = True
             
-        #print slicer
+            if moved:
+                bbox = state['bbox']
+                if bbox is None:
+                    state['bbox'] = position + position
+                else:
+                    for axis in xrange(3):
+                        if position[axis] < bbox[axis]:
+                            bbox[axis] = position[axis]
+                        elif position[axis] > bbox[axis+3]:
+                            bbox[axis+3] = position[axis]
+        elif code == 'G90':
+            state['relative'] = False
+        elif code == 'G91':
+            state['relative'] = True
+        elif code == 'M82':
+            state['e_relative'] = False
+        elif code == 'M83':
+            state['e_relative'] = True
+        elif code in ('M104', 'M109', 'M140', 'M190', 'M106'):
+            for tag in tags[1:]:
+                if tag[:1] == 'S':
+                    try:
+                        value = float(tag[1:])
+                    except ValueError:
+                        break
+                    if code == 'M106':
+                        state['fan'] = value
+                    elif code[:3] == 'M10':
+                        state['ext_temp'] = value
+                    else:
+                        state['bed_temp'] = value
+                    break
+        elif code == 'M107':
+            state['fan'] = 0.0
+    
+    @staticmethod
+    def __modal_state(state):
+        """
+        Copy of the modal state needed to resume printing from the current position.
+        """
+        return {
+            'position'      : list(state['position']),
+            'relative'      : state['relative'],
+            'e'             : state['e'],
+            'e_relative'    : state['e_relative'],
+            'feedrate'      : state['feedrate'],
+            'ext_temp'      : state['ext_temp'],
+            'bed_temp'      : state['bed_temp'],
+            'fan'           : state['fan']
+        }
+    
+    def __scan(self, filename, state):
+        """
+        Scan the file from ``state['offset']`` updating **state**.
+        """
+        count       = state['count']
+        gcode_count = state['gcode_count']
+        max_layer   = state['max_layer']
+        layer_count = state['layer_count']
+        gcode_type  = state['type']
+        layers      = state['layers']
+        offset      = state['offset']
+        last_layer  = layers[-1]['layer'] if layers else None
+        
+        slicer = state['slicer']
+        if slicer == 'CURA':
+            parser = self.cura_p
+        elif slicer == 'SLIC3R':
+            parser = self.slic3r_p
+        elif slicer == 'SIMPLIFY3D':
+            parser = self.simplify_p
+        else:
+            parser = None
         
-        with open(filename, 'r+') as file:
+        with open(filename, 'rb') as file:
+            file.seek(offset)
             for line in file:
                 count += 1
                 
@@ -176,46 +559,161 @@ class GCodeFile:
                     head = line[:4]
                     
                     if head == 'M109':
-                        gcode_type = self.info['type'] = GCodeInfo.PRINT
-                        if lite_parsing:
-                            break
+                        gcode_type = GCodeInfo.PRINT
                     elif head == 'M3 S' or head == 'M4 S':
-                        gcode_type = self.info['type'] = GCodeInfo.MILL
-                        if lite_parsing:
-                            break
+                        gcode_type = GCodeInfo.MILL
                     elif head == 'M450':
-                        gcode_type = self.info['type'] = GCodeInfo.LASER
-                        if lite_parsing:
-                            break
-                            
-                if not stop_parsing and not lite_parsing:
-                    attrs = {}
-                    
-                    if slicer == 'CURA':
-                        attrs = self.cura_p.process_line(line)
-                    elif slicer == 'SLIC3R':
-                        attrs = self.slic3r_p.process_line(line)
-                    elif slicer == 'SIMPLIFY3D':
-                        attrs = self.simplify_p.process_line(line)
+                        gcode_type = GCodeInfo.LASER
+                
+                # Slicer attributes are always in comments
+                if parser and ';' in line:
+                    attrs = parser.process_line(line)
                     
                     if attrs:
                         if 'type' in attrs:
-                            gcode_type = self.info['type'] = attrs['type']
+                            gcode_type = attrs['type']
                             
-                        if 'layer_count' in attrs:
-                            layer_count = self.info['layer_count'] = attrs['layer_count']
-                            stop_parsing = True
+                        if 'layer_count' in attrs and not layer_count:
+                            layer_count = int(attrs['layer_count'])
                             
                         if 'layer' in attrs:
                             layer = int(attrs['layer'])
                             if layer > max_layer:
                                 max_layer = layer
-                                
+                            if layer != last_layer:
+                                # Where the layer starts and the state needed to start printing from there
+                                layers.append({
+                                    'layer'     : layer,
+                                    'offset'    : offset,
+                                    'line'      : count - 1,
+                                    'gcode'     : gcode_count,
+                                    'state'     : self.__modal_state(state)
+                                })
+                                last_layer = layer
+                
+                if line[0] == 'G' or line[0] == 'M':
+                    self.__track_gcode(state, line)
+                            
                 if line[0] != ';':
                     gcode_count += 1
-                        
-        if not layer_count and gcode_type == GCodeInfo.PRINT and max_layer > 0:
-            self.info['layer_count'] = max_layer
+                
+                offset += len(line)
+        
+        state['count']          = count
+        state['gcode_count']    = gcode_count
+        state['max_layer']      = max_layer
+        state['layer_count']    = layer_count
+        state['type']           = gcode_type
+        state['offset']         = offset
+
+    @staticmethod
+    def __scan_lite(filename, state):
+        """
+        Find the gcode type and count lines and gcodes with bulk searches
+        on the mapped file instead of going through it line by line.
+        Memory use does not depend on the file size.
+        """
+        with open(filename, 'rb') as fd:
+            mm = GCodeFile.__map(fd)
+            if mm is None:
+                return
+            try:
+                match = RE_GCODE_TYPE.search(mm)
+                if match:
+                    head = match.group(1)
+                    if head == 'M109':
+                        state['type'] = GCodeInfo.PRINT
+                    elif head == 'M450':
+                        state['type'] = GCodeInfo.LASER
+                    else:
+                        state['type'] = GCodeInfo.MILL
+                
+                size = mm.size()
+                lines = 0
+                comments = 1 if mm[0] == ';' else 0
+                offset = 0
+                while offset < size:
+                    # Overlap one byte so that "\n;" across blocks is found
+                    block = mm[offset:offset + SCAN_BLOCK_SIZE + 1]
+                    lines += block.count('\n', 0, SCAN_BLOCK_SIZE)
+                    comments += block.count('\n;')
+                    offset += SCAN_BLOCK_SIZE
+                
+                # Last line without a newline
+                if mm[size-1] != '\n':
+                    lines += 1
+                
+                state['count'] = lines
+                state['gcode_count'] = lines - comments
+                state['offset'] = size
+            finally:
+                mm.close()
+
+    def process_file(self, filename, lite_parsing, use_index=True):
+        """
+        Go threough the whole gcode file and extract usefull information about it.
+        This information include gcode type, code count, layer count...
+        
+        The result is stored in the gcode index so the next time the same
+        file is used it is not scanned again. If the file has been appended
+        to since it was indexed only the new data is scanned.
+        """
+        index = GCodeIndex() if use_index else None
+        
+        if index:
+            info = index.load(filename, lite_parsing)
+            if info:
+                self.info.attribs.update(info)
+                return
+        
+        file_size  = float(self.__size(filename))/1000000
+        rpi        = rpi_version()
+        
+        if(rpi == "Raspberry Pi Model B" and file_size > self.MAX_FILE_SIZE):
+            lite_parsing = True # On Rasperry Pi Model B it would take too much time to process the file
+        
+        state = None
+        if index and not lite_parsing:
+            state = index.resumable(filename)
+        
+        if not state:
+            state = self.__new_state()
+            head_lines = self.__head(filename, 50)
+            tail_lines = self.__tail(filename, 50)
+            state['slicer'] = self.__detect_slicer(head_lines + tail_lines)
+        
+        if lite_parsing:
+            self.__scan_lite(filename, state)
+        else:
+            self.__scan(filename, state)
+        
+        info = {}
+        if state['slicer']:
+            info['slicer'] = state['slicer']
+        if state['type']:
+            info['type'] = state['type']
+        
+        if state['layer_count']:
+            info['layer_count'] = state['layer_count']
+        elif state['type'] == GCodeInfo.PRINT and state['max_layer'] > 0:
+            info['layer_count'] = state['max_layer']
+        
+        info['line_count'] = state['count']
+        info['gcode_count'] = state['gcode_count']
+        
+        if not lite_parsing:
+            info['layers'] = state['layers']
+            bbox = state['bbox']
+            if bbox:
+                info['bbox'] = {
+                    'x' : [bbox[0], bbox[3]],
+                    'y' : [bbox[1], bbox[4]],
+                    'z' : [bbox[2], bbox[5]]
+                }
+        
+        self.info.attribs.update(info)
         
-        self.info['line_count'] = count
-        self.info['gcode_count'] = gcode_count
+        if index:
+            # A scan can be resumed only if the file ends with a complete line
+            resumable = not lite_parsing and self.__ends_with_newline(filename)
+            index.save(filename, info, lite_parsing, state if resumable else None)
@@ -0,0 +1,216 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import json
+import hashlib
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.os.paths import BIGTEMP_PATH
+
+#############################################
+
+INDEX_PATH      = os.path.join(BIGTEMP_PATH, 'gcodeindex')
+# Bump when the stored data changes so that old indexes get regenerated
+INDEX_VERSION   = 3
+# Number of indexes kept, the least recently used are removed
+INDEX_MAX_FILES = 64
+# Bytes before the end of the scanned part used to detect appended files
+TAIL_SIZE       = 4096
+
+def file_key(filename):
+    """
+    Get the identity of a file: real path, size, mtime and inode.
+
+    :rtype: dict
+    """
+    st = os.stat(filename)
+    return {
+        'path'  : os.path.realpath(filename),
+        'size'  : st.st_size,
+        'mtime' : st.st_mtime,
+        'inode' : st.st_ino
+    }
+
+def tail_hash(filename, offset):
+    """
+    Hash of the `TAIL_SIZE` bytes before **offset**.
+    """
+    start = max(0, offset - TAIL_SIZE)
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        return hashlib.sha1( f.read(offset - start) ).hexdigest()
+
+class GCodeIndex(object):
+    """
+    Persistent store of the metadata extracted from gcode files, so that a
+    file is scanned only once. One index is kept for each file path and it
+    is valid as long as the file size, mtime and inode do not change.
+
+    An index of a file that only had data appended can be used to resume
+    the scan from where it stopped, see `resumable`.
+
+    :param path: Directory where the indexes are stored
+    """
+
+    def __init__(self, path = INDEX_PATH):
+        self.path = path
+
+    def __index_file(self, key):
+        return os.path.join(self.path, hashlib.sha1(key['path']).hexdigest() + '.json')
+
+    def __read(self, key):
+        try:
+            with open(self.__index_file(key), 'r') as f:
+                index = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if index.get('version') != INDEX_VERSION or index.get('path') != key['path']:
+            return None
+
+        return index
+
+    def load(self, filename, lite = False):
+        """
+        Get the stored metadata of **filename**.
+
+        :param lite: Accept an index created by lite parsing
+        :returns: Metadata dictionary or ``None`` if there is no valid index
+        :rtype: dict
+        """
+        try:
+            key = file_key(filename)
+        except OSError:
+            return None
+
+        index = self.__read(key)
+        if not index:
+            return None
+
+        if (index['size'] != key['size'] or
+            index['mtime'] != key['mtime'] or
+            index['inode'] != key['inode']):
+            return None
+
+        if index['lite'] and not lite:
+            return None
+
+        try:
+            # Mark as recently used
+            os.utime(self.__index_file(key), None)
+        except OSError:
+            pass
+
+        return index['info']
+
+    def resumable(self, filename):
+        """
+        Get the scan state of **filename** if the file is the same one that
+        was indexed with data appended to it.
+
+        :returns: Scan state or ``None`` if the file has to be scanned from the start
+        :rtype: dict
+        """
+        try:
+            key = file_key(filename)
+        except OSError:
+            return None
+
+        index = self.__read(key)
+        if not index or index['lite'] or not index.get('state'):
+            return None
+
+        state = index['state']
+        if (index['inode'] != key['inode'] or
+            index['size'] >= key['size'] or
+            state['offset'] != index['size']):
+            return None
+
+        try:
+            if tail_hash(filename, state['offset']) != state['tail_hash']:
+                return None
+        except (IOError, OSError):
+            return None
+
+        state['layers'] = index['info'].get('layers', [])
+        return state
+
+    def save(self, filename, info, lite = False, state = None):
+        """
+        Store the metadata of **filename**. Failures are ignored, the index
+        is only an optimization.
+
+        :param info: Metadata dictionary
+        :param lite: Metadata was created by lite parsing
+        :param state: Scan state needed to resume scanning after an append,
+                      its ``layers`` are the ones of **info** and are not stored again
+        """
+        try:
+            key = file_key(filename)
+            if state:
+                state = dict(state)
+                state.pop('layers', None)
+                state['tail_hash'] = tail_hash(filename, state['offset'])
+
+            index = dict(key)
+            index['version'] = INDEX_VERSION
+            index['lite'] = lite
+            index['info'] = info
+            index['state'] = state
+
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+
+            index_file = self.__index_file(key)
+            tmp_file = index_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(index, f)
+            os.rename(tmp_file, index_file)
+
+            self.prune()
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+
+    def remove(self, filename):
+        """ Remove the index of **filename**. """
+        try:
+            os.remove( self.__index_file({'path' : os.path.realpath(filename)}) )
+        except OSError:
+            pass
+
+    def prune(self, max_files = INDEX_MAX_FILES):
+        """ Remove the least recently used indexes above **max_files**. """
+        try:
+            files = [ os.path.join(self.path, name) for name in os.listdir(self.path) if name.endswith('.json') ]
+            if len(files) <= max_files:
+                return
+            files.sort(key = os.path.getmtime)
+            for name in files[:len(files) - max_files]:
+                os.remove(name)
+        except OSError:
+            pass
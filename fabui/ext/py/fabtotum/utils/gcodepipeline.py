@@ -0,0 +1,539 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import re
+import math
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodefile import _number
+from fabtotum.utils.mesh import BedMesh
+
+#############################################
+
+AXES = 'XYZE'
+MOVE_GCODES = ('G0', 'G1', 'G2', 'G3')
+ARC_GCODES = ('G2', 'G3')
+# Homing and probing codes not needed during a print
+HOMING_GCODES = ('G27', 'G28', 'G29')
+# Words of a line, the letter and value may be written without spaces (G1Z0.3F1200)
+_COMMAND_RE = re.compile(r'\s*([A-Za-z][^A-Za-z\s]*)')
+# A value may have an exponent (X-1.5e-3) if the word ends after it, so that
+# G1X10E5 is still read as an extrusion
+_WORD_RE = re.compile(r'([A-Za-z])\s*([-+]?(?:\d+\.?\d*|\.\d+)[eE][-+]?\d+(?=[\s;*]|$)|[^A-Za-z\s]*)')
+
+class GLine(object):
+    """
+    GCode line without comments. Parameters are parsed only when they are
+    accessed and the line is formatted again only if it was modified.
+    Words do not need to be separated by spaces.
+
+    :param raw: Line text
+    :param command: Command, taken from **raw** if not given
+    :param params: List of [code, value text] pairs
+    """
+
+    __slots__ = ('raw', 'command', '_params')
+
+    def __init__(self, raw, command = None, params = None):
+        self.raw = raw
+        if command is None:
+            match = _COMMAND_RE.match(raw) if raw else None
+            command = match.group(1).upper() if match else ''
+        self.command = command
+        self._params = params
+
+    @classmethod
+    def make(cls, command, params):
+        """
+        Create a new line.
+
+        :param params: List of (code, value) pairs, ``None`` values are skipped
+        """
+        return cls(None, command, [ [code, _number(value)] for code, value in params if value is not None ])
+
+    @property
+    def params(self):
+        if self._params is None:
+            match = _COMMAND_RE.match(self.raw)
+            start = match.end() if match else 0
+            self._params = [ [code.upper(), value] for code, value in _WORD_RE.findall(self.raw, start) ]
+        return self._params
+
+    def get(self, code, default = None):
+        """ Get the numeric value of parameter **code**. """
+        for param in self.params:
+            if param[0] == code:
+                try:
+                    return float(param[1])
+                except ValueError:
+                    return default
+        return default
+
+    def has(self, code):
+        for param in self.params:
+            if param[0] == code:
+                return True
+        return False
+
+    def set(self, code, value):
+        """ Set the value of parameter **code**, it is added if missing. """
+        params = self.params
+        self.raw = None
+        for param in params:
+            if param[0] == code:
+                param[1] = _number(value)
+                return
+        params.append( [code, _number(value)] )
+
+    def __str__(self):
+        if self.raw is None:
+            self.raw = ' '.join( [self.command] + [ code + value for code, value in self._params ] )
+        return self.raw
+
+class Position(object):
+    """
+    Track the position and the positioning modes of a gcode stream,
+    values are in the coordinates of the stream.
+    """
+
+    def __init__(self):
+        self.position = [0.0, 0.0, 0.0, 0.0]
+        self.relative = False
+        self.relative_e = False
+
+    def is_relative(self, axis):
+        return self.relative or (axis == 3 and self.relative_e)
+
+    def target(self, line):
+        """
+        Position after move **line**.
+
+        :rtype: list
+        """
+        target = list(self.position)
+        for axis, code in enumerate(AXES):
+            value = line.get(code)
+            if value is not None:
+                if self.is_relative(axis):
+                    target[axis] += value
+                else:
+                    target[axis] = value
+        return target
+
+    def update(self, line):
+        """ Account the effect of **line**. """
+        command = line.command
+        if command in MOVE_GCODES:
+            self.position = self.target(line)
+        elif command == 'G90':
+            self.relative = False
+        elif command == 'G91':
+            self.relative = True
+        elif command == 'M82':
+            self.relative_e = False
+        elif command == 'M83':
+            self.relative_e = True
+        elif command == 'G92':
+            values = [ line.get(code) for code in AXES ]
+            if values == [None] * 4:
+                values = [0.0] * 4
+            for axis, value in enumerate(values):
+                if value is not None:
+                    self.position[axis] = value
+        elif command == 'G28':
+            homed = [ code for code in 'XYZ' if line.has(code) ] or 'XYZ'
+            for code in homed:
+                self.position[AXES.index(code)] = 0.0
+
+class Stage(object):
+    """
+    Pipeline stage, `process` gets a line and returns the list of lines
+    replacing it.
+    """
+
+    def process(self, line):
+        return [line]
+
+class StripStage(Stage):
+    """
+    Remove empty lines, left by comments, and homing codes.
+
+    :param homing: Remove `HOMING_GCODES`
+    """
+
+    def __init__(self, homing = True):
+        self.homing = homing
+
+    def process(self, line):
+        if not line.command:
+            return []
+        if self.homing and line.command in HOMING_GCODES:
+            return []
+        return [line]
+
+class ArcStage(Stage):
+    """
+    Replace G2/G3 arcs with linear moves, given either the center offset
+    (I, J) or the radius (R). Arcs in relative mode are left untouched.
+
+    :param segment_length: Length of the linear segments in mm
+    """
+
+    def __init__(self, segment_length = 1.0):
+        self.segment_length = segment_length
+        self.position = Position()
+
+    def __center(self, line, start, target):
+        radius = line.get('R')
+        if radius is None:
+            return start[0] + line.get('I', 0.0), start[1] + line.get('J', 0.0)
+
+        # Center from the radius, a negative radius selects the long arc
+        dx = target[0] - start[0]
+        dy = target[1] - start[1]
+        chord = math.hypot(dx, dy)
+        if chord == 0:
+            return None
+        h = math.sqrt( max(0.0, radius*radius - chord*chord/4) ) / chord
+        if (line.command == 'G3') != (radius < 0):
+            h = -h
+        return start[0] + dx/2 + h*dy, start[1] + dy/2 - h*dx
+
+    def __linearize(self, line):
+        position = self.position
+        start = position.position
+        target = position.target(line)
+        center = self.__center(line, start, target)
+        if center is None:
+            return [line]
+        cx, cy = center
+
+        radius = math.hypot(start[0] - cx, start[1] - cy)
+        start_angle = math.atan2(start[1] - cy, start[0] - cx)
+        travel = math.atan2(target[1] - cy, target[0] - cx) - start_angle
+        if line.command == 'G2':
+            if travel >= 0:
+                travel -= 2*math.pi
+        elif travel <= 0:
+            travel += 2*math.pi
+
+        segments = max(1, int(abs(travel) * radius / self.segment_length))
+        relative_e = position.is_relative(3)
+        e = line.get('E')
+        feedrate = line.get('F')
+
+        lines = []
+        for i in xrange(1, segments + 1):
+            if i == segments:
+                x, y = target[0], target[1]
+            else:
+                angle = start_angle + travel * i / segments
+                x = cx + radius * math.cos(angle)
+                y = cy + radius * math.sin(angle)
+
+            z = None
+            if target[2] != start[2]:
+                z = start[2] + (target[2] - start[2]) * i / segments
+
+            segment_e = None
+            if e is not None:
+                if relative_e:
+                    segment_e = e / segments
+                else:
+                    segment_e = start[3] + (target[3] - start[3]) * i / segments
+
+            lines.append( GLine.make('G1', [('X', x), ('Y', y), ('Z', z), ('E', segment_e), ('F', feedrate)]) )
+            feedrate = None
+        return lines
+
+    def process(self, line):
+        if line.command in ARC_GCODES and not self.position.relative:
+            lines = self.__linearize(line)
+        else:
+            lines = [line]
+        self.position.update(line)
+        return lines
+
+class MeshStage(Stage):
+    """
+    Compensate the bed height on absolute moves. Moves are split where they
+    cross the grid lines of the mesh, so that the correction is linear
+    along every segment, and every segment gets the Z of the stream plus
+    the correction at its end point.
+
+    Above **fade_height** the correction is no longer applied and the lines
+    are passed through, below it the correction is reduced linearly.
+
+    :param mesh: Bed mesh, see `BedMesh`
+    :param segment_length: Maximum length of the segments in mm, for bicubic meshes
+    :param fade_height: Height in mm where the correction ends, ``None`` to always apply it
+    """
+
+    def __init__(self, mesh, segment_length = None, fade_height = None):
+        self.mesh = mesh
+        self.segment_length = segment_length
+        self.fade_height = fade_height
+        self.position = Position()
+
+    def __correction(self, x, y, z):
+        if self.fade_height:
+            if z >= self.fade_height:
+                return 0.0
+            return self.mesh.height(x, y) * (1.0 - max(z, 0.0) / self.fade_height)
+        return self.mesh.height(x, y)
+
+    def __compensate(self, line, start, target, relative_e):
+        dx = target[0] - start[0]
+        dy = target[1] - start[1]
+        cuts = self.mesh.split(start[0], start[1], target[0], target[1]) if (dx or dy) else []
+        if self.segment_length:
+            segments = int(math.ceil(math.hypot(dx, dy) / self.segment_length))
+            if segments > 1:
+                cuts = sorted( cuts + [ float(i) / segments for i in xrange(1, segments) ] )
+
+        if not cuts:
+            line.set('Z', target[2] + self.__correction(target[0], target[1], target[2]))
+            return [line]
+
+        e = line.get('E')
+        feedrate = line.get('F')
+        lines = []
+        last_t = 0.0
+        for t in cuts + [1.0]:
+            x = start[0] + dx * t
+            y = start[1] + dy * t
+            z = start[2] + (target[2] - start[2]) * t
+
+            segment_e = None
+            if e is not None:
+                if relative_e:
+                    segment_e = e * (t - last_t)
+                else:
+                    segment_e = start[3] + (target[3] - start[3]) * t
+
+            lines.append( GLine.make(line.command, [('X', x), ('Y', y), ('Z', z + self.__correction(x, y, z)),
+                                                    ('E', segment_e), ('F', feedrate)]) )
+            feedrate = None
+            last_t = t
+        return lines
+
+    def process(self, line):
+        position = self.position
+        if line.command in MOVE_GCODES and not position.relative:
+            start = position.position
+            target = position.target(line)
+            relative_e = position.is_relative(3)
+            # Track the stream coordinates before the line is modified
+            position.update(line)
+            if self.fade_height and start[2] >= self.fade_height and target[2] >= self.fade_height:
+                return [line]
+            return self.__compensate(line, start, target, relative_e)
+        position.update(line)
+        return [line]
+
+class ZOffsetStage(Stage):
+    """
+    Shift the Z of absolute moves and of G92 Z by **offset** mm.
+    """
+
+    def __init__(self, offset):
+        self.offset = offset
+        self.position = Position()
+
+    def process(self, line):
+        command = line.command
+        if (command in MOVE_GCODES and not self.position.relative) or command == 'G92':
+            z = line.get('Z')
+            if z is not None:
+                line.set('Z', z + self.offset)
+        # Only the positioning mode is used
+        self.position.update(line)
+        return [line]
+
+class FeedScaleStage(Stage):
+    """
+    Scale the feedrate of moves by **factor**.
+    """
+
+    def __init__(self, factor):
+        self.factor = factor
+
+    def process(self, line):
+        if line.command in MOVE_GCODES:
+            feedrate = line.get('F')
+            if feedrate is not None:
+                line.set('F', feedrate * self.factor)
+        return [line]
+
+class FlowScaleStage(Stage):
+    """
+    Scale the extruded length by **factor**. In absolute extrusion mode the
+    scaled E values are accumulated from the E differences of the stream.
+    """
+
+    def __init__(self, factor):
+        self.factor = factor
+        self.position = Position()
+        self.e = 0.0
+
+    def process(self, line):
+        command = line.command
+        position = self.position
+        if command in MOVE_GCODES:
+            e = line.get('E')
+            if e is not None:
+                relative_e = position.is_relative(3)
+                last_e = position.position[3]
+                # Track the stream coordinates before the line is modified
+                position.update(line)
+                if relative_e:
+                    line.set('E', e * self.factor)
+                else:
+                    self.e += (e - last_e) * self.factor
+                    line.set('E', self.e)
+                return [line]
+        elif command == 'G92':
+            e = line.get('E')
+            if e is not None:
+                self.e = e
+            elif not line.params:
+                self.e = 0.0
+        position.update(line)
+        return [line]
+
+class GCodePipeline(object):
+    """
+    Chain of stages transforming a gcode stream line by line. Each line is
+    parsed once and the parameters are shared by all the stages.
+
+    The pipeline is meant to run in the prefetch thread of the file
+    iterator, see `wrap`, so the cost of the stages is paid ahead of the
+    serial sender.
+
+    :param stages: List of `Stage` applied in order
+    """
+
+    def __init__(self, stages = None):
+        self.stages = list(stages or [])
+
+    @classmethod
+    def from_config(cls, config = None, mesh = None):
+        """
+        Create a pipeline from a dictionary of plain values, so that it can
+        be passed to the gcode service.
+
+        Keys are ``strip_homing`` (default ``True``), ``arc_segment`` (mm),
+        ``mesh`` (``True`` for the stored bed mesh or the path of a mesh
+        file), ``mesh_segment`` (mm), ``mesh_fade`` (mm, default 10),
+        ``z_offset`` (mm), ``feed`` and ``flow`` (scale factors). Stages are
+        applied in that order.
+
+        :param mesh: Bed mesh, see `BedMesh`, overrides the ``mesh`` key
+        """
+        config = config or {}
+        stages = [ StripStage( config.get('strip_homing', True) ) ]
+        if config.get('arc_segment'):
+            stages.append( ArcStage( float(config['arc_segment']) ) )
+        if mesh is None and config.get('mesh'):
+            filename = config['mesh']
+            mesh = BedMesh.load() if filename is True else BedMesh.load(filename)
+        if mesh:
+            segment_length = config.get('mesh_segment')
+            fade_height = config.get('mesh_fade', 10.0)
+            stages.append( MeshStage( mesh,
+                                      float(segment_length) if segment_length else None,
+                                      float(fade_height) if fade_height else None ) )
+        if config.get('z_offset'):
+            stages.append( ZOffsetStage( float(config['z_offset']) ) )
+        if config.get('feed', 1.0) != 1.0:
+            stages.append( FeedScaleStage( float(config['feed']) ) )
+        if config.get('flow', 1.0) != 1.0:
+            stages.append( FlowScaleStage( float(config['flow']) ) )
+        return cls(stages)
+
+    def process(self, code):
+        """
+        Transform a line without comments.
+
+        :returns: List of output lines
+        :rtype: list
+        """
+        lines = [ GLine(code) ]
+        for stage in self.stages:
+            if len(lines) == 1:
+                lines = stage.process(lines[0])
+            else:
+                result = []
+                for line in lines:
+                    result.extend( stage.process(line) )
+                lines = result
+        return [ str(line) for line in lines ]
+
+    def wrap(self, source):
+        """
+        Apply the pipeline to a gcode iterator.
+
+        :rtype: GCodePipelineIter
+        """
+        return GCodePipelineIter(source, self)
+
+class GCodePipelineIter(object):
+    """
+    Iterate through the output of a `GCodePipeline` applied to a gcode
+    iterator. Lines produced from the same input line share its `offset`
+    and the slicer attributes come with the first one. An input line
+    removed by the pipeline is returned empty to keep its attributes.
+
+    :param source: GCode iterator with an `offset` attribute
+    :param pipeline: Pipeline to apply
+    """
+
+    def __init__(self, source, pipeline):
+        self.source = source
+        self.pipeline = pipeline
+        self.offset = source.offset
+        self.pending = []
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self.pending:
+            return self.pending.pop(), None
+
+        code, attrs = self.source.next()
+        self.offset = self.source.offset
+        lines = self.pipeline.process(code)
+        if not lines:
+            return '', attrs
+        if len(lines) > 1:
+            self.pending = lines[:0:-1]
+        return lines[0], attrs
+
+    def close(self):
+        """ Close the source. """
+        self.source.close()
@@ -0,0 +1,690 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import math
+import time
+import bisect
+import argparse
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodefile import GCodeFile
+
+#############################################
+
+AXES = 'XYZE'
+
+# Planner constants of the firmware
+PLANNER_BUFFER_SIZE     = 16
+MINIMUM_PLANNER_SPEED   = 0.05 # mm/s
+# Blocks planned at once, the last PLANNER_BUFFER_SIZE ones are kept for the next round
+PLAN_CHUNK_SIZE         = 4096
+# Elapsed time is recorded every CHECKPOINT_BLOCKS moves and at every layer start
+CHECKPOINT_BLOCKS       = 1000
+
+# Length of the segments arcs are split in by the firmware
+MM_PER_ARC_SEGMENT      = 1.0
+# Bytes of the file passed to the planner at once
+READ_BLOCK_SIZE         = 256*1024
+
+MOVE_GCODES = ('G0', 'G1', 'G2', 'G3')
+ARC_GCODES = ('G2', 'G3')
+# Commands that wait for the planner buffer to be empty
+SYNC_GCODES = ('G4', 'G28', 'G29', 'G30', 'M400', 'M109', 'M190', 'M0', 'M1')
+
+class MotionConfig(object):
+    """
+    Motion limits used by the firmware planner. Defaults are the Marlin ones,
+    use `update_from_eeprom` with the result of `parseM503` to get the values
+    of the unit.
+
+    :param max_feedrate: Maximum feedrate of X, Y, Z and E in mm/s (M203)
+    :param max_acceleration: Maximum acceleration of X, Y, Z and E in mm/s^2 (M201)
+    :param acceleration: Acceleration of moves in mm/s^2 (M204 S)
+    :param retract_acceleration: Acceleration of extruder only moves in mm/s^2 (M204 T)
+    :param jerk: Maximum instant speed change of XY, Z and E in mm/s (M205 X Z E)
+    :param min_feedrate: Minimum feedrate of printing moves in mm/s (M205 S)
+    :param min_travel_feedrate: Minimum feedrate of travel moves in mm/s (M205 T)
+    """
+
+    def __init__(self, max_feedrate = (500.0, 500.0, 5.0, 25.0),
+                       max_acceleration = (9000.0, 9000.0, 100.0, 10000.0),
+                       acceleration = 3000.0, retract_acceleration = 3000.0,
+                       jerk = (20.0, 0.4, 5.0),
+                       min_feedrate = 0.0, min_travel_feedrate = 0.0):
+        self.max_feedrate = list(max_feedrate)
+        self.max_acceleration = list(max_acceleration)
+        self.acceleration = acceleration
+        self.retract_acceleration = retract_acceleration
+        self.xy_jerk, self.z_jerk, self.e_jerk = jerk
+        self.min_feedrate = min_feedrate
+        self.min_travel_feedrate = min_travel_feedrate
+
+    @staticmethod
+    def __float(values, key, default):
+        try:
+            return float(values[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def update_from_eeprom(self, eeprom):
+        """
+        Use the values read from the EEPROM.
+
+        :param eeprom: Result of `parseM503`
+        :type eeprom: dict
+        """
+        get = self.__float
+        values = eeprom.get('maximum_feedrates') or {}
+        self.max_feedrate = [ get(values, axis, self.max_feedrate[i]) for i, axis in enumerate('xyze') ]
+
+        values = eeprom.get('maximum_accelaration') or {}
+        self.max_acceleration = [ get(values, axis, self.max_acceleration[i]) for i, axis in enumerate('xyze') ]
+
+        values = eeprom.get('acceleration') or {}
+        self.acceleration = get(values, 's', self.acceleration)
+        self.retract_acceleration = get(values, 't', self.retract_acceleration)
+
+        values = eeprom.get('advanced_variables') or {}
+        self.min_feedrate = get(values, 's', self.min_feedrate)
+        self.min_travel_feedrate = get(values, 't', self.min_travel_feedrate)
+        self.xy_jerk = get(values, 'x', self.xy_jerk)
+        self.z_jerk = get(values, 'z', self.z_jerk)
+        self.e_jerk = get(values, 'e', self.e_jerk)
+
+    def update_from_head(self, head):
+        """
+        Use the motion limits of a head, the head description can override
+        the EEPROM values with the optional ``max_feedrate``, ``max_acceleration``
+        (lists of X, Y, Z, E values), ``acceleration``, ``retract_acceleration``
+        and ``jerk`` (list of XY, Z, E values) fields.
+
+        :param head: Head description
+        :type head: dict
+        """
+        try:
+            if 'max_feedrate' in head:
+                self.max_feedrate = [ float(v) for v in head['max_feedrate'] ]
+            if 'max_acceleration' in head:
+                self.max_acceleration = [ float(v) for v in head['max_acceleration'] ]
+            if 'acceleration' in head:
+                self.acceleration = float(head['acceleration'])
+            if 'retract_acceleration' in head:
+                self.retract_acceleration = float(head['retract_acceleration'])
+            if 'jerk' in head:
+                self.xy_jerk, self.z_jerk, self.e_jerk = [ float(v) for v in head['jerk'] ]
+        except (TypeError, ValueError):
+            pass
+
+class TimeEstimate(object):
+    """
+    Result of `PrintTimeEstimator`.
+
+    :param total: Estimated duration in seconds
+    :param checkpoints: Sorted list of (byte offset, elapsed seconds)
+    :param layers: List of (layer, byte offset, elapsed seconds) at the start of each layer
+    :param size: Size of the file in bytes
+    """
+
+    def __init__(self, total, checkpoints, layers, size = 0):
+        self.total = total
+        self.size = size
+        self.checkpoints = checkpoints
+        self.offsets = [ offset for offset, elapsed in checkpoints ]
+        self.layers = layers
+
+    def elapsed_at(self, offset):
+        """
+        Estimated time to reach byte **offset** of the file.
+        """
+        i = bisect.bisect_right(self.offsets, offset)
+        if i == 0:
+            return 0.0
+        o0, t0 = self.checkpoints[i-1]
+        if i == len(self.offsets):
+            # After the last checkpoint up to the end of the file
+            if offset >= self.size:
+                return self.total
+            o1, t1 = self.size, self.total
+        else:
+            o1, t1 = self.checkpoints[i]
+        if o1 == o0:
+            return t0
+        return t0 + (t1 - t0) * (offset - o0) / float(o1 - o0)
+
+    def remaining(self, offset):
+        """
+        Estimated time left once byte **offset** of the file has been executed.
+        """
+        return max(0.0, self.total - self.elapsed_at(offset))
+
+    def layer_times(self):
+        """
+        Duration of each layer.
+
+        :returns: List of (layer, seconds)
+        :rtype: list
+        """
+        result = []
+        for i, (layer, offset, start) in enumerate(self.layers):
+            end = self.layers[i+1][2] if i + 1 < len(self.layers) else self.total
+            result.append( (layer, end - start) )
+        return result
+
+class PyPlanner(object):
+    """
+    Simulation of the look-ahead planner of the firmware: per axis feedrate
+    and acceleration limits, jerk limited junction speeds and trapezoidal
+    speed profiles planned over a buffer of `PLANNER_BUFFER_SIZE` moves.
+    Arcs are split in segments of `MM_PER_ARC_SEGMENT` like the firmware does.
+
+    Moves are planned in chunks and only the few values needed by the
+    planner are kept, so memory use does not depend on the file size.
+
+    This is the python implementation, `Planner` is the compiled one from
+    the speedups when it is available. Both give the same results.
+
+    :param config: Motion limits
+    :type config: MotionConfig
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.position = [0.0, 0.0, 0.0, 0.0]
+        self.relative = False
+        self.relative_e = False
+        self.feedrate = 1500.0 / 60.0
+        # Speed vector and nominal speed of the last move for the junction speed
+        self.previous_speed = None
+        self.previous_nominal = 0.0
+        # Moves not yet planned: length, acceleration, nominal speed,
+        # maximum entry speed and byte offset of the line end
+        self.lengths = []
+        self.accelerations = []
+        self.nominals = []
+        self.max_entries = []
+        self.offsets = []
+        # Entry speed of the first move not yet planned
+        self.entry = 0.0
+        self.elapsed = 0.0
+        self.moves = 0
+        # Pending layer starts as (move index, layer, offset)
+        self.layer_marks = []
+        self.layers = []
+        self.checkpoints = [(0, 0.0)]
+
+    def __add_move(self, dx, dy, dz, de, offset):
+        cfg = self.config
+        length = math.sqrt(dx*dx + dy*dy + dz*dz)
+        extruder_only = length < 0.000001
+        if extruder_only:
+            length = abs(de)
+            if length < 0.000001:
+                return
+        ax = abs(dx)
+        ay = abs(dy)
+        az = abs(dz)
+        ae = abs(de)
+
+        speed = self.feedrate
+        if de == 0:
+            if speed < cfg.min_travel_feedrate:
+                speed = cfg.min_travel_feedrate
+        elif speed < cfg.min_feedrate:
+            speed = cfg.min_feedrate
+
+        # Per axis feedrate limit, the time of the move is set by the slowest axis
+        max_feedrate = cfg.max_feedrate
+        duration = length / speed
+        t = max(ax / max_feedrate[0], ay / max_feedrate[1], az / max_feedrate[2], ae / max_feedrate[3])
+        if t > duration:
+            duration = t
+        nominal = length / duration
+        vx = dx / duration
+        vy = dy / duration
+        vz = dz / duration
+        ve = de / duration
+
+        # Per axis acceleration limit
+        acceleration = cfg.retract_acceleration if extruder_only else cfg.acceleration
+        max_acceleration = cfg.max_acceleration
+        if acceleration * ax > max_acceleration[0] * length:
+            acceleration = max_acceleration[0] * length / ax
+        if acceleration * ay > max_acceleration[1] * length:
+            acceleration = max_acceleration[1] * length / ay
+        if acceleration * az > max_acceleration[2] * length:
+            acceleration = max_acceleration[2] * length / az
+        if acceleration * ae > max_acceleration[3] * length:
+            acceleration = max_acceleration[3] * length / ae
+
+        # Junction speed limited by the jerk settings
+        previous = self.previous_speed
+        if previous and self.previous_nominal > 0.0001:
+            factor = 1.0
+            jerk = math.hypot(vx - previous[0], vy - previous[1])
+            if jerk > cfg.xy_jerk:
+                factor = cfg.xy_jerk / jerk
+            jerk = abs(vz - previous[2])
+            if jerk > cfg.z_jerk:
+                factor = min(factor, cfg.z_jerk / jerk)
+            jerk = abs(ve - previous[3])
+            if jerk > cfg.e_jerk:
+                factor = min(factor, cfg.e_jerk / jerk)
+            max_entry = min(self.previous_nominal, nominal * factor)
+        else:
+            # Safe speed to start from a full stop
+            max_entry = cfg.xy_jerk / 2
+            if abs(vz) > cfg.z_jerk / 2:
+                max_entry = min(max_entry, cfg.z_jerk / 2)
+            if abs(ve) > cfg.e_jerk / 2:
+                max_entry = min(max_entry, cfg.e_jerk / 2)
+            max_entry = min(max_entry, nominal)
+
+        self.previous_speed = (vx, vy, vz, ve)
+        self.previous_nominal = nominal
+
+        self.lengths.append(length)
+        self.accelerations.append(acceleration)
+        self.nominals.append(nominal)
+        self.max_entries.append(max_entry)
+        self.offsets.append(offset)
+        self.moves += 1
+
+        if len(self.lengths) >= PLAN_CHUNK_SIZE + PLANNER_BUFFER_SIZE:
+            self.__plan(PLAN_CHUNK_SIZE)
+
+    def __add_arc(self, x, y, delta, i, j, r, clockwise, offset):
+        """
+        Add the segments of an arc from **x**, **y** given either the center
+        offset (**i**, **j**) or the radius (**r**), the same way `ArcStage` does.
+        """
+        dx, dy, dz, de = delta
+        if r is not None:
+            chord = math.hypot(dx, dy)
+            if chord == 0:
+                self.__add_move(dx, dy, dz, de, offset)
+                return
+            # A negative radius selects the long arc
+            h = math.sqrt( max(0.0, r*r - chord*chord/4) ) / chord
+            if (not clockwise) != (r < 0):
+                h = -h
+            cx = x + dx/2 + h*dy
+            cy = y + dy/2 - h*dx
+        else:
+            cx = x + (i or 0.0)
+            cy = y + (j or 0.0)
+
+        radius = math.hypot(x - cx, y - cy)
+        start_angle = math.atan2(y - cy, x - cx)
+        travel = math.atan2(y + dy - cy, x + dx - cx) - start_angle
+        if clockwise:
+            if travel >= 0:
+                travel -= 2*math.pi
+        elif travel <= 0:
+            travel += 2*math.pi
+
+        # Helix length for the number of segments, like the firmware
+        segments = max(1, int(math.hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT))
+        last_x = x
+        last_y = y
+        for k in xrange(1, segments + 1):
+            if k == segments:
+                sx = x + dx
+                sy = y + dy
+            else:
+                angle = start_angle + travel * k / segments
+                sx = cx + radius * math.cos(angle)
+                sy = cy + radius * math.sin(angle)
+            self.__add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+            last_x = sx
+            last_y = sy
+
+    def __plan(self, count, final = False):
+        """
+        Plan the pending moves and account the time of the first **count** ones.
+        """
+        lengths = self.lengths
+        accelerations = self.accelerations
+        nominals = self.nominals
+        max_entries = self.max_entries
+        n = len(lengths)
+        if not n:
+            return
+
+        # Reverse pass, the last move in the buffer has to stop. Without
+        # the final flush entry speeds are also limited to what allows a stop
+        # within the planner buffer.
+        entries = [0.0] * (n + 1)
+        entries[n] = MINIMUM_PLANNER_SPEED
+        window = PLANNER_BUFFER_SIZE
+        stop = [ 2 * accelerations[i] * lengths[i] for i in xrange(n) ]
+        stop_sum = 0.0
+        next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+        for i in xrange(n - 1, -1, -1):
+            stop_sum += stop[i]
+            if i + window < n:
+                stop_sum -= stop[i + window]
+            v_sq = next_sq + stop[i]
+            if not final and v_sq > stop_sum:
+                v_sq = stop_sum
+            max_entry = max_entries[i]
+            if v_sq > max_entry * max_entry:
+                v_sq = max_entry * max_entry
+            entries[i] = v_sq
+            next_sq = v_sq
+
+        # Forward pass, the first entry speed was fixed by the previous round
+        entries[0] = min(entries[0], self.entry * self.entry)
+        for i in xrange(1, n):
+            v_sq = entries[i-1] + stop[i-1]
+            if entries[i] > v_sq:
+                entries[i] = v_sq
+        entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+
+        # Trapezoid time of each move
+        elapsed = self.elapsed
+        marks = self.layer_marks
+        base = self.moves - n
+        checkpoints = self.checkpoints
+        count = min(count, n)
+        for i in xrange(count):
+            while marks and marks[0][0] <= base + i:
+                index, layer, offset = marks.pop(0)
+                self.layers.append( (layer, offset, elapsed) )
+                checkpoints.append( (offset, elapsed) )
+
+            a = accelerations[i]
+            d = lengths[i]
+            vn = nominals[i]
+            v0 = math.sqrt(entries[i])
+            v1 = math.sqrt(entries[i+1])
+            if v0 > vn:
+                v0 = vn
+            if v1 > vn:
+                v1 = vn
+            d_acc = (vn*vn - v0*v0) / (2*a)
+            d_dec = (vn*vn - v1*v1) / (2*a)
+            if d_acc + d_dec <= d:
+                elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn
+            else:
+                # Never reaches the nominal speed
+                vp = math.sqrt( max(v0*v0, v1*v1, (2*a*d + v0*v0 + v1*v1) / 2) )
+                elapsed += (vp - v0) / a + (vp - v1) / a
+
+            if (base + i + 1) % CHECKPOINT_BLOCKS == 0:
+                checkpoints.append( (self.offsets[i], elapsed) )
+
+        self.elapsed = elapsed
+        self.entry = math.sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+        del lengths[:count]
+        del accelerations[:count]
+        del nominals[:count]
+        del max_entries[:count]
+        del self.offsets[:count]
+
+    def synchronize(self):
+        """
+        Plan all the pending moves, like the firmware does when it waits for
+        the planner buffer to be empty.
+        """
+        self.__plan(len(self.lengths), final = True)
+        self.entry = 0.0
+        self.previous_speed = None
+        self.previous_nominal = 0.0
+
+    def mark_layer(self, layer, offset):
+        """ Record the start of **layer** before the next move. """
+        self.layer_marks.append( (self.moves, layer, offset) )
+
+    def process_line(self, line, offset = 0):
+        """
+        Process a gcode line without comments.
+
+        :param offset: Byte offset of the end of the line
+        """
+        tokens = line.split()
+        if not tokens:
+            return
+        command = tokens[0]
+
+        if command in MOVE_GCODES:
+            position = self.position
+            x = position[0]
+            y = position[1]
+            delta = [0.0, 0.0, 0.0, 0.0]
+            i = j = r = None
+            for tag in tokens[1:]:
+                code = tag[:1]
+                try:
+                    value = float(tag[1:])
+                except ValueError:
+                    continue
+                if code == 'F':
+                    if value > 0:
+                        self.feedrate = value / 60.0
+                    continue
+                axis = AXES.find(code)
+                if axis < 0:
+                    if code == 'I':
+                        i = value
+                    elif code == 'J':
+                        j = value
+                    elif code == 'R':
+                        r = value
+                    continue
+                if self.relative or (axis == 3 and self.relative_e):
+                    delta[axis] = value
+                    position[axis] += value
+                else:
+                    delta[axis] = value - position[axis]
+                    position[axis] = value
+            if command in ARC_GCODES:
+                self.__add_arc(x, y, delta, i, j, r, command == 'G2', offset)
+            else:
+                self.__add_move(delta[0], delta[1], delta[2], delta[3], offset)
+        elif command == 'G90':
+            self.relative = False
+        elif command == 'G91':
+            self.relative = True
+        elif command == 'M82':
+            self.relative_e = False
+        elif command == 'M83':
+            self.relative_e = True
+        elif command == 'G92':
+            for tag in tokens[1:]:
+                axis = AXES.find(tag[:1])
+                if axis >= 0:
+                    try:
+                        self.position[axis] = float(tag[1:])
+                    except ValueError:
+                        pass
+        elif command in SYNC_GCODES:
+            self.synchronize()
+            if command == 'G4':
+                for tag in tokens[1:]:
+                    try:
+                        if tag[0] == 'P':
+                            self.elapsed += float(tag[1:]) / 1000.0
+                        elif tag[0] == 'S':
+                            self.elapsed += float(tag[1:])
+                    except ValueError:
+                        pass
+            elif command == 'G28':
+                self.position[:3] = [0.0, 0.0, 0.0]
+
+    def __process_raw(self, line, offset, get_layer):
+        if ';' in line:
+            if get_layer:
+                layer = get_layer(line)
+                if layer is not None:
+                    self.mark_layer(layer, offset)
+            line = line.split(';', 1)[0]
+        self.process_line(line, offset)
+
+    def process_block(self, data, offset, get_layer = None):
+        """
+        Process complete lines of a file, comments included. Only the last
+        line of the file may have no newline.
+
+        :param data: File content
+        :param offset: Byte offset of **data** in the file
+        :param get_layer: Function returning the layer started by a line with a comment or ``None``
+        """
+        lines = data.split('\n')
+        # Empty if data ends with a newline
+        last = lines.pop()
+        for line in lines:
+            offset += len(line) + 1
+            self.__process_raw(line, offset, get_layer)
+        if last:
+            self.__process_raw(last, offset + len(last), get_layer)
+
+    def finish(self):
+        """
+        Plan the remaining moves.
+
+        :returns: Total time, checkpoints and layer starts, see `TimeEstimate`
+        :rtype: tuple
+        """
+        self.synchronize()
+        for index, layer, offset in self.layer_marks:
+            self.layers.append( (layer, offset, self.elapsed) )
+        self.layer_marks = []
+        return self.elapsed, self.checkpoints, self.layers
+
+# The compiled planner is much faster, it is built with the speedups
+try:
+    from fabtotum.speedups.gcodetime_planner import Planner
+except ImportError:
+    Planner = PyPlanner
+
+class PrintTimeEstimator(object):
+    """
+    Estimate the execution time of gcode by simulating the look-ahead
+    planner of the firmware, see `PyPlanner`.
+
+    :param config: Motion limits
+    :param planner: Planner class, `Planner` by default
+    :type config: MotionConfig
+    """
+
+    def __init__(self, config = None, planner = None):
+        self.config = config or MotionConfig()
+        self.planner_class = planner or Planner
+        self.reset()
+
+    def reset(self):
+        self.planner = self.planner_class(self.config)
+
+    @property
+    def moves(self):
+        """ Number of planned moves, arcs count as their segments. """
+        return self.planner.moves
+
+    def synchronize(self):
+        """
+        Plan all the pending moves, like the firmware does when it waits for
+        the planner buffer to be empty.
+        """
+        self.planner.synchronize()
+
+    def process_line(self, line, offset = 0, attrs = None):
+        """
+        Process a gcode line without comments.
+
+        :param offset: Byte offset of the end of the line
+        :param attrs: Slicer attributes of the line
+        """
+        if attrs and 'layer' in attrs:
+            self.planner.mark_layer(attrs['layer'], offset)
+        self.planner.process_line(line, offset)
+
+    def finish(self, size = 0):
+        """
+        Plan the remaining moves and get the result.
+
+        :param size: Size of the processed file in bytes
+        :rtype: TimeEstimate
+        """
+        total, checkpoints, layers = self.planner.finish()
+        return TimeEstimate(total, checkpoints, layers, size)
+
+    def process_file(self, filename, gfile = None):
+        """
+        Estimate the execution time of a gcode file. The file is passed to
+        the planner in blocks of lines, only the lines with a comment go
+        through the slicer attribute parser.
+
+        :param gfile: Already scanned `GCodeFile` of **filename**
+        :rtype: TimeEstimate
+        """
+        if gfile is None:
+            gfile = GCodeFile(filename)
+        parser = gfile.get_parser()
+        get_layer = None
+        if parser:
+            def get_layer(line):
+                attrs = parser.process_line(line + '\n')
+                if attrs:
+                    return attrs.get('layer')
+                return None
+
+        offset = 0
+        partial = ''
+        with open(filename, 'rb') as f:
+            while True:
+                data = f.read(READ_BLOCK_SIZE)
+                if not data:
+                    break
+                data = partial + data
+                end = data.rfind('\n') + 1
+                # Keep the incomplete last line for the next block
+                partial = data[end:]
+                if end:
+                    self.planner.process_block(data[:end], offset, get_layer)
+                    offset += end
+        if partial:
+            self.planner.process_block(partial, offset, get_layer)
+            offset += len(partial)
+        return self.finish(offset)
+
+def main():
+    parser = argparse.ArgumentParser(description='Estimate the print time of gcode files.')
+    parser.add_argument('files', nargs='+', help='GCode files')
+    parser.add_argument('-l', '--layers', action='store_true', help='Show the time of each layer')
+    args = parser.parse_args()
+
+    for filename in args.files:
+        t = time.time()
+        estimator = PrintTimeEstimator()
+        estimate = estimator.process_file(filename)
+        print "{0}: {1:.0f}s ({2} moves, computed in {3:.2f}s)".format(filename, estimate.total, estimator.moves, time.time() - t)
+        if args.layers:
+            for layer, duration in estimate.layer_times():
+                print "  layer {0}: {1:.1f}s".format(layer, duration)
+
+if __name__ == "__main__":
+    main()
@@ -79,10 +79,15 @@ class GMacroHandler:
         if verbose:
             self.trace(message)
         
-        reply = self.gcs.send(command, expected_reply=final_reply, block=True, timeout=timeout, group='macro')
-        
         if('G0 ' in command):
-            reply = self.gcs.send('M400', block=True, timeout=timeout, group='macro')
+            # Queue the move and M400 together, the reply of M400 is the one checked
+            replies = self.gcs.send_batch([command, 'M400'], expected_reply=[final_reply, 'ok'], block=True, timeout=timeout, group='macro')
+            if replies and replies[0] is not None:
+                reply = replies[-1]
+            else:
+                reply = None
+        else:
+            reply = self.gcs.send(command, expected_reply=final_reply, block=True, timeout=timeout, group='macro')
         
         if reply is None:
             if warning:
@@ -0,0 +1,284 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import json
+import math
+import argparse
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.os.paths import USERDATA_PATH
+
+#############################################
+
+BED_MESH_FILE = os.path.join(USERDATA_PATH, 'settings', 'bed_mesh.json')
+
+BILINEAR    = 'bilinear'
+BICUBIC     = 'bicubic'
+
+# Bicubic interpolation matrix, coefficients are M * F * M^T
+_BICUBIC_M = (
+    ( 1,  0,  0,  0),
+    ( 0,  0,  1,  0),
+    (-3,  3, -2, -1),
+    ( 2, -2,  1,  1)
+)
+
+def _multiply(a, b):
+    return [ [ sum(a[i][k] * b[k][j] for k in xrange(4)) for j in xrange(4) ] for i in xrange(4) ]
+
+def _transpose(a):
+    return [ list(row) for row in zip(*a) ]
+
+class BedMesh(object):
+    """
+    Bed height map measured on a regular grid. The coefficients of the
+    interpolation polynomial of every cell are computed once, so the cost
+    of `height` does not depend on the grid size.
+
+    Outside of the grid the height of the nearest edge is used.
+
+    :param origin: X and Y of the first grid point
+    :param step: Distance between the grid points along X and Y
+    :param heights: Rows of heights, ``heights[j][i]`` is at ``origin + (i, j) * step``
+    :param interpolation: `BILINEAR` or `BICUBIC`
+    """
+
+    def __init__(self, origin, step, heights, interpolation = BILINEAR):
+        self.x0, self.y0 = float(origin[0]), float(origin[1])
+        self.dx, self.dy = float(step[0]), float(step[1])
+        self.heights = [ [ float(z) for z in row ] for row in heights ]
+        self.ny = len(self.heights)
+        self.nx = len(self.heights[0]) if self.heights else 0
+        self.interpolation = interpolation
+
+        if self.nx < 2 or self.ny < 2:
+            raise ValueError("Bed mesh needs at least 2x2 points")
+        if [ len(row) for row in self.heights ] != [self.nx] * self.ny:
+            raise ValueError("Bed mesh rows have different lengths")
+        if self.dx <= 0 or self.dy <= 0:
+            raise ValueError("Bed mesh step must be positive")
+
+        if interpolation == BILINEAR:
+            self.cells = self.__bilinear_cells()
+        elif interpolation == BICUBIC:
+            self.cells = self.__bicubic_cells()
+        else:
+            raise ValueError("Unknown interpolation '{0}'".format(interpolation))
+
+    def __bilinear_cells(self):
+        z = self.heights
+        cells = []
+        for j in xrange(self.ny - 1):
+            for i in xrange(self.nx - 1):
+                z00, z10, z01, z11 = z[j][i], z[j][i+1], z[j+1][i], z[j+1][i+1]
+                cells.append( (z00, z10 - z00, z01 - z00, z11 - z10 - z01 + z00) )
+        return cells
+
+    def __slope(self, i, j, di, dj):
+        """ Central difference at grid point (i, j), in units per cell. """
+        i0 = max(0, i - di)
+        i1 = min(self.nx - 1, i + di)
+        j0 = max(0, j - dj)
+        j1 = min(self.ny - 1, j + dj)
+        return (self.heights[j1][i1] - self.heights[j0][i0]) / float( (i1 - i0) + (j1 - j0) )
+
+    def __cross_slope(self, i, j):
+        i0 = max(0, i - 1)
+        i1 = min(self.nx - 1, i + 1)
+        j0 = max(0, j - 1)
+        j1 = min(self.ny - 1, j + 1)
+        z = self.heights
+        return (z[j1][i1] - z[j0][i1] - z[j1][i0] + z[j0][i0]) / float( (i1 - i0) * (j1 - j0) )
+
+    def __bicubic_cells(self):
+        z = self.heights
+        fx = [ [ self.__slope(i, j, 1, 0) for i in xrange(self.nx) ] for j in xrange(self.ny) ]
+        fy = [ [ self.__slope(i, j, 0, 1) for i in xrange(self.nx) ] for j in xrange(self.ny) ]
+        fxy = [ [ self.__cross_slope(i, j) for i in xrange(self.nx) ] for j in xrange(self.ny) ]
+        mt = _transpose(_BICUBIC_M)
+
+        cells = []
+        for j in xrange(self.ny - 1):
+            for i in xrange(self.nx - 1):
+                f = [
+                    [ z[j][i],    z[j+1][i],    fy[j][i],    fy[j+1][i]    ],
+                    [ z[j][i+1],  z[j+1][i+1],  fy[j][i+1],  fy[j+1][i+1]  ],
+                    [ fx[j][i],   fx[j+1][i],   fxy[j][i],   fxy[j+1][i]   ],
+                    [ fx[j][i+1], fx[j+1][i+1], fxy[j][i+1], fxy[j+1][i+1] ]
+                ]
+                a = _multiply(_multiply(_BICUBIC_M, f), mt)
+                cells.append( tuple( tuple(row) for row in a ) )
+        return cells
+
+    def height(self, x, y):
+        """
+        Height correction of the bed at (**x**, **y**).
+
+        :rtype: float
+        """
+        u = (x - self.x0) / self.dx
+        i = int(math.floor(u))
+        if i < 0:
+            i = 0
+        elif i > self.nx - 2:
+            i = self.nx - 2
+        u -= i
+        if u < 0.0:
+            u = 0.0
+        elif u > 1.0:
+            u = 1.0
+
+        v = (y - self.y0) / self.dy
+        j = int(math.floor(v))
+        if j < 0:
+            j = 0
+        elif j > self.ny - 2:
+            j = self.ny - 2
+        v -= j
+        if v < 0.0:
+            v = 0.0
+        elif v > 1.0:
+            v = 1.0
+
+        cell = self.cells[j * (self.nx - 1) + i]
+        if self.interpolation == BILINEAR:
+            a, b, c, d = cell
+            return a + u * (b + d * v) + c * v
+
+        result = 0.0
+        for row in reversed(cell):
+            result = result * u + (((row[3] * v + row[2]) * v + row[1]) * v + row[0])
+        return result
+
+    def split(self, x0, y0, x1, y1):
+        """
+        Get where the move from (**x0**, **y0**) to (**x1**, **y1**) crosses
+        the grid lines.
+
+        :returns: Sorted list of the fractions of the move in (0, 1)
+        :rtype: list
+        """
+        cuts = []
+        for start, end, origin, step, count in ( (x0, x1, self.x0, self.dx, self.nx),
+                                                  (y0, y1, self.y0, self.dy, self.ny) ):
+            if start == end:
+                continue
+            a = (start - origin) / step
+            b = (end - origin) / step
+            lo, hi = min(a, b), max(a, b)
+            first = max(0, int(math.floor(lo)) + 1)
+            last = min(count - 1, int(math.ceil(hi)) - 1)
+            for k in xrange(first, last + 1):
+                cuts.append( (k - a) / (b - a) )
+
+        cuts.sort()
+        # Drop the duplicates when a grid point is crossed
+        result = []
+        for t in cuts:
+            if 0.0 < t < 1.0 and (not result or t - result[-1] > 1e-6):
+                result.append(t)
+        return result
+
+    @classmethod
+    def from_points(cls, points, interpolation = BILINEAR, digits = 3):
+        """
+        Create a mesh from probed points on a regular grid. Heights are
+        stored relative to their mean so that the mesh only corrects the
+        shape of the bed and not the Z offset.
+
+        :param points: List of (x, y, z)
+        :param digits: Decimal digits used to match the X and Y of the points
+        """
+        xs = sorted(set( round(p[0], digits) for p in points ))
+        ys = sorted(set( round(p[1], digits) for p in points ))
+        if len(xs) < 2 or len(ys) < 2:
+            raise ValueError("Bed mesh needs at least 2x2 points")
+
+        grid = {}
+        for x, y, z in ( p[:3] for p in points ):
+            grid[ (round(x, digits), round(y, digits)) ] = z
+        if len(grid) != len(xs) * len(ys):
+            raise ValueError("Probed points are not on a regular grid")
+
+        mean = sum(grid.values()) / len(grid)
+        heights = [ [ grid[(x, y)] - mean for x in xs ] for y in ys ]
+
+        # Grid lines may not be evenly spaced, use the average step
+        step = ( (xs[-1] - xs[0]) / (len(xs) - 1), (ys[-1] - ys[0]) / (len(ys) - 1) )
+        return cls( (xs[0], ys[0]), step, heights, interpolation )
+
+    def to_dict(self):
+        return {
+            'origin'        : [self.x0, self.y0],
+            'step'          : [self.dx, self.dy],
+            'heights'       : self.heights,
+            'interpolation' : self.interpolation
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['origin'], data['step'], data['heights'], data.get('interpolation', BILINEAR))
+
+    def save(self, filename = BED_MESH_FILE):
+        """ Store the mesh as json. """
+        tmp_file = filename + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
+        os.rename(tmp_file, filename)
+
+    @classmethod
+    def load(cls, filename = BED_MESH_FILE):
+        """
+        Load a stored mesh.
+
+        :returns: Mesh or ``None`` if there is no valid mesh
+        :rtype: BedMesh
+        """
+        try:
+            with open(filename, 'r') as f:
+                return cls.from_dict( json.load(f) )
+        except (IOError, OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Show the stored bed mesh.')
+    parser.add_argument('-f', '--file', help='Bed mesh file', default=BED_MESH_FILE)
+    args = parser.parse_args()
+
+    mesh = BedMesh.load(args.file)
+    if not mesh:
+        print "No valid bed mesh in {0}".format(args.file)
+        return
+
+    print "{0}x{1} points from ({2}, {3}) every ({4}, {5}) mm, {6}".format(
+            mesh.nx, mesh.ny, mesh.x0, mesh.y0, mesh.dx, mesh.dy, mesh.interpolation)
+    for row in reversed(mesh.heights):
+        print ' '.join( '{0:+.3f}'.format(z) for z in row )
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ from Pyro4.errors import CommunicationError
 
 # Import internal modules
 from fabtotum.totumduino.gcode import GCodeService
+from fabtotum.utils.statefile import StateFileWriter
 
 ###############################
 
@@ -36,8 +37,9 @@ PYRO_URI_FILE = '/run/gcodeservice.uri'
 GCS = None
 
 class GCodeServiceServerPyroWrapper(object):
-    def __init__(self, gcs):
+    def __init__(self, gcs, bus = None):
         self.gcs = gcs
+        self.bus = bus
         self.client_callback = None
         self.callback_list = []
     
@@ -78,7 +80,18 @@ class GCodeServiceServerPyroWrapper(object):
         return self.gcs.push(id, data)
     
     def send(self, code, block = True, timeout = None, group = 'gcode', expected_reply = 'ok', async = False):
-        return self.gcs.send(code.encode('latin-1'), block, timeout, group, expected_reply, async)
+        reply = self.gcs.send(code.encode('latin-1'), block, timeout, group, expected_reply, async)
+        if block:
+            return reply
+        # Command handles can not be passed to remote clients
+        return None
+    
+    def send_batch(self, codes, block = True, timeout = None, group = 'gcode', expected_reply = 'ok'):
+        codes = [ code.encode('latin-1') for code in codes ]
+        replies = self.gcs.send_batch(codes, block, timeout, group, expected_reply)
+        if block:
+            return replies
+        return None
     
     def atomic_end(self):
         return self.gcs.atomic_end()
@@ -92,12 +105,22 @@ class GCodeServiceServerPyroWrapper(object):
     def debug(self, args):
         return self.gcs.debug(args)
     
-    def send_file(self, filename):
-        return self.gcs.send_file(filename)
+    def send_file(self, filename, layer = None, pipeline = None):
+        return self.gcs.send_file(filename, layer, pipeline)
     
     def trigger(self, callback_name, data):
         return self.gcs.trigger(callback_name, data)
     
+    def publish(self, event_type, data):
+        """
+        Publish an event on the services event bus.
+        
+        :returns: ``False`` if there is no event bus
+        """
+        if self.bus:
+            return self.bus.publish(event_type, data)
+        return False
+    
     def __callback_handler(self, action, data):
         if self.callback_list:
             for tup in self.callback_list:
@@ -135,10 +158,19 @@ class GCodeServiceServerPyroWrapper(object):
 
     def get_idle_time(self):
         return self.gcs.get_idle_time()
+    
+    def get_telemetry(self):
+        return self.gcs.get_telemetry()
+    
+    def get_state_file_stats(self):
+        """
+        Get the write counters of the state files written by the services.
+        """
+        return StateFileWriter().stats()
 
 class GCodeServiceServer(object):
     
-    def __init__(self, gcs = None):
+    def __init__(self, gcs = None, bus = None):
         
         if gcs:
             self.gcs = gcs
@@ -149,7 +181,7 @@ class GCodeServiceServer(object):
             self.gcs_external = False
         
         daemon = Pyro4.Daemon()
-        wrapper = GCodeServiceServerPyroWrapper(self.gcs)
+        wrapper = GCodeServiceServerPyroWrapper(self.gcs, bus)
         uri = daemon.register(wrapper, objectId='GCodeService')
         
         self.daemon = daemon
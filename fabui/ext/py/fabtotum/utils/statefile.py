@@ -0,0 +1,172 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Import standard python module
+import os
+import stat
+import hashlib
+from threading import RLock, Timer
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.singleton import Singleton
+
+#############################################
+
+FSYNC_DELAY = 5 # seconds
+
+class StateFileWriter(object):
+    """
+    Writer of the state files shared with the PHP side (task monitor,
+    temperatures, notifications, settings).
+
+    Content is written to a temporary file in the same directory and renamed
+    over the target so readers never see a partial file, the mode and owner
+    of the target are kept. Writes with the same content as the last one are
+    skipped unless the file was changed by someone else. Files are synced
+    to the storage together, `FSYNC_DELAY` seconds after the first pending
+    write.
+
+    :param fsync_delay: Seconds before the pending files are synced, ``None`` to never sync them
+    """
+    __metaclass__ = Singleton
+
+    def __init__(self, fsync_delay = FSYNC_DELAY):
+        self.lock = RLock()
+        self.fsync_delay = fsync_delay
+        self.files = {}
+        self.counters = {}
+        self.pending = set()
+        self.timer = None
+
+    def __is_unchanged(self, path, digest):
+        last = self.files.get(path)
+        if not last or last[0] != digest:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return (st.st_mtime, st.st_size) == last[1:]
+
+    def write(self, filename, content):
+        """
+        Write **content** to **filename**.
+
+        :param filename: Target file, symbolic links are followed
+        :param content: File content
+        :returns: ``False`` if the write was skipped
+        :rtype: bool
+        """
+        if isinstance(content, unicode):
+            content = content.encode('utf-8')
+
+        path = os.path.realpath(filename)
+        digest = hashlib.md5(content).digest()
+
+        with self.lock:
+            counters = self.counters.setdefault(path, {'writes': 0, 'skipped': 0, 'bytes': 0, 'fsyncs': 0})
+            if self.__is_unchanged(path, digest):
+                counters['skipped'] += 1
+                return False
+
+            try:
+                old = os.stat(path)
+            except OSError:
+                old = None
+
+            directory, name = os.path.split(path)
+            tmp_path = os.path.join(directory, '.{0}.{1}.tmp'.format(name, os.getpid()))
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+
+            if old:
+                try:
+                    os.chmod(tmp_path, stat.S_IMODE(old.st_mode))
+                    os.chown(tmp_path, old.st_uid, old.st_gid)
+                except OSError:
+                    # Not allowed to give the file away, keep our owner
+                    pass
+
+            os.rename(tmp_path, path)
+
+            st = os.stat(path)
+            self.files[path] = (digest, st.st_mtime, st.st_size)
+            counters['writes'] += 1
+            counters['bytes'] += len(content)
+
+            self.pending.add(path)
+            if self.fsync_delay is not None and self.timer is None:
+                self.timer = Timer(self.fsync_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+        return True
+
+    @staticmethod
+    def __fsync(path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def flush(self):
+        """
+        Sync the written files and their directories to the storage.
+        """
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            pending = self.pending
+            self.pending = set()
+
+        directories = set()
+        for path in pending:
+            try:
+                self.__fsync(path)
+            except OSError:
+                continue
+            with self.lock:
+                self.counters[path]['fsyncs'] += 1
+            directories.add( os.path.dirname(path) )
+
+        # The renames are only durable once the directories are synced
+        for directory in directories:
+            try:
+                self.__fsync(directory)
+            except OSError:
+                pass
+
+    def stats(self):
+        """
+        Get the write counters of every file.
+
+        :returns: Counters (``writes``, ``skipped``, ``bytes``, ``fsyncs``) by file
+        :rtype: dict
+        """
+        with self.lock:
+            return dict( (path, dict(counters)) for path, counters in self.counters.iteritems() )
@@ -0,0 +1,123 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import shutil
+import tempfile
+import unittest
+
+# Import external modules
+from printrun.gcoder import GCode
+
+# Import internal modules
+from fabtotum.utils.gcodeanalyzer import GCodeAnalyzer
+
+#############################################
+
+# Relative moves, G92 offsets and relative extrusion
+MODES_GCODE = """G21
+G90
+M82
+G28
+G92 E0
+G1 Z0.3 F1200
+G1 X10 Y10 F3000
+G1 X50 Y10 E2.0 F1800 ; perimeter
+G1 X50 Y40 E3.5
+G1 X10 Y40 E5.5
+G1 E4.5 F2400
+G0 X60 Y60 F6000
+G92 E0
+G1 Z0.6
+G1 E1.0 F2400
+G1 X20 Y60 E3.0 F1800
+G91
+G1 X-5 Y-5 E0.5
+G90
+M83
+G1 X30 Y30 E1.0
+G4 P500
+G1 Z10 F600
+"""
+
+def print_gcode(layers, moves):
+    """ Absolute positioning print with retractions and travel moves. """
+    lines = ['G21', 'G90', 'M82', 'G28', 'G92 E0']
+    e = 0.0
+    for layer in range(layers):
+        lines.append('G0 Z{0:.2f} F1200'.format(0.2 * (layer + 1)))
+        lines.append('G0 X{0} Y{0} F9000'.format(20 + layer))
+        lines.append('G1 E{0:.4f} F2400'.format(e))
+        for i in range(moves):
+            e += 0.05 * (1 + i % 3)
+            lines.append('G1 X{0:.3f} Y{1:.3f} E{2:.4f} F{3}'.format(
+                20 + (i * 37) % 150, 30 + (i * 53) % 140, e, 1200 + 600 * (i % 4)))
+        e -= 1.0
+        lines.append('G1 E{0:.4f} F2400'.format(e))
+        lines.append('G4 P200')
+    return '\n'.join(lines) + '\n'
+
+class GCodeAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def analyze(self, content):
+        filename = os.path.join(self.directory, 'file.gcode')
+        with open(filename, 'w') as f:
+            f.write(content)
+        return GCodeAnalyzer().process_file(filename).result(), GCode(content.splitlines())
+
+    def assertSameGeometry(self, result, gcode):
+        self.assertAlmostEqual( result['width'], gcode.width )
+        self.assertAlmostEqual( result['depth'], gcode.depth )
+        self.assertAlmostEqual( result['height'], gcode.height )
+        self.assertEqual( result['layers'], gcode.layers_count )
+        self.assertAlmostEqual( result['filament'], gcode.filament_length )
+
+    def test_modes(self):
+        result, gcode = self.analyze(MODES_GCODE)
+        self.assertSameGeometry(result, gcode)
+        self.assertEqual( (result['width'], result['depth'], result['layers'], result['filament']),
+                          (50.0, 50.0, 2, 9.0) )
+
+    def test_print(self):
+        result, gcode = self.analyze( print_gcode(5, 200) )
+        self.assertSameGeometry(result, gcode)
+        self.assertEqual( result['layers'], 5 )
+        # printrun truncates the duration to seconds
+        self.assertGreater( result['duration'], 60 )
+        self.assertEqual( int(result['duration']), gcode.duration.seconds )
+
+    def test_attributes(self):
+        analyzer = GCodeAnalyzer()
+        for line in MODES_GCODE.splitlines():
+            analyzer.process_line( line.split(';', 1)[0] )
+        attributes = analyzer.attributes()
+        self.assertEqual( attributes['dimensions'], {'x' : '50.0', 'y' : '50.0', 'z' : '0.6'} )
+        self.assertEqual( attributes['number_of_layers'], '2' )
+        self.assertEqual( attributes['filament'], '9.0' )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Import external modules
+
+# Import internal modules
+import fabtotum.utils.gcodefile as gcodefile
+from fabtotum.utils.gcodefile import GCodeFile
+from fabtotum.utils.gcodepipeline import GCodePipeline
+from fabtotum.utils.gcodecache import GCodeCache, HEADER, CHUNK_LINES, CACHE_MAGIC, CACHE_VERSION, cache_file
+from fabtotum.totumduino.transport import data_checksum
+
+#############################################
+
+def cura_gcode(layers, moves):
+    """ Cura like print with **moves** moves in each layer. """
+    lines = [';Generated with Cura_SteamEngine 2.3', ';Layer count: {0}'.format(layers),
+             'M109 S210', 'G28', 'G90']
+    e = 0.0
+    for layer in range(layers):
+        lines.append(';LAYER:{0}'.format(layer))
+        lines.append('G0 F9000 X10 Y10 Z{0:.2f}'.format(0.2 * (layer + 1)))
+        for i in range(moves):
+            e += 0.1
+            lines.append('G1 X{0:.3f} Y{1:.3f} E{2:.4f} ; move'.format(10 + i % 50, 20 + i % 70, e))
+        lines.append('')
+    lines.append('M104 S0')
+    return '\n'.join(lines) + '\n'
+
+class GCodeCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # Not running on a Raspberry Pi, always do a full scan
+        self.rpi_version = gcodefile.rpi_version
+        gcodefile.rpi_version = lambda: 'Raspberry Pi 3 Model B'
+
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'print.gcode')
+        with open(self.filename, 'w') as f:
+            f.write( cura_gcode(5, 500) )
+        self.gfile = GCodeFile(self.filename, use_index = False)
+
+    def tearDown(self):
+        gcodefile.rpi_version = self.rpi_version
+        shutil.rmtree(self.directory)
+
+    def expected(self, offset = 0):
+        """ Lines and attributes returned by the pipeline without a cache. """
+        result = []
+        for code, attrs in self.gfile.iter_from(offset, pipeline = GCodePipeline.from_config()):
+            if code or attrs:
+                # The cache has no attributes instead of empty ones
+                result.append( (code, attrs or None) )
+        return result
+
+    def test_round_trip(self):
+        count = GCodeCache.compile(self.filename, self.gfile)
+        expected = self.expected()
+        self.assertEqual( count, len(expected) )
+        self.assertGreater( count, CHUNK_LINES )
+
+        cache = GCodeCache.open(self.filename)
+        self.assertEqual( cache.count, count )
+        self.assertEqual( list(cache), expected )
+        # Homing is removed, layer changes carry the slicer attributes
+        self.assertNotIn( 'G28', [ code for code, attrs in expected ] )
+        self.assertEqual( len([ attrs for code, attrs in expected if attrs ]), 5 )
+
+    def test_header_and_trailer(self):
+        count = GCodeCache.compile(self.filename, self.gfile)
+        with open(cache_file(self.filename), 'rb') as f:
+            header = HEADER.unpack( f.read(HEADER.size) )
+            f.seek(header[7])
+            trailer = json.load(f)
+
+        magic, version, size, mtime, inode, digest, lines, trailer_pos = header
+        st = os.stat(self.filename)
+        self.assertEqual( (magic, version), (CACHE_MAGIC, CACHE_VERSION) )
+        self.assertEqual( (size, mtime, inode), (st.st_size, st.st_mtime, st.st_ino) )
+        self.assertEqual( lines, count )
+        # One seek table entry for each chunk
+        self.assertEqual( len(trailer['seek']), (count + CHUNK_LINES - 1) // CHUNK_LINES )
+        self.assertEqual( trailer['seek'][0][1:], [0, HEADER.size] )
+        self.assertEqual( len(trailer['attrs']), 5 )
+
+    def test_checksums(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        cache_iter = GCodeCache.open(self.filename).iter_from(preamble = ['M117 Start'])
+        for code, attrs in cache_iter:
+            self.assertEqual( cache_iter.checksum, data_checksum(code) )
+
+    def test_content_changed(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        st = os.stat(self.filename)
+        # Same size, mtime and inode with a different content
+        with open(self.filename, 'r+b') as f:
+            f.write(';')
+        os.utime(self.filename, (st.st_atime, st.st_mtime))
+        self.assertEqual( os.stat(self.filename).st_ino, st.st_ino )
+        self.assertIsNone( GCodeCache.open(self.filename) )
+
+    def test_size_changed(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        with open(self.filename, 'a') as f:
+            f.write('M84\n')
+        self.assertIsNone( GCodeCache.open(self.filename) )
+
+    def test_skip_to(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        cache = GCodeCache.open(self.filename)
+        offsets = [ self.gfile.get_layer(layer)['offset'] for layer in range(5) ]
+        # Layer starts in different chunks and a line in the middle of a chunk
+        with open(self.filename, 'rb') as f:
+            offsets.append( f.read().index('\n', offsets[2] + 1000) + 1 )
+        for offset in offsets:
+            cache_iter = cache.iter_from(offset)
+            self.assertEqual( cache_iter.offset, offset )
+            self.assertEqual( list(cache_iter), self.expected(offset) )
+
+    def test_skip_to_end(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        cache = GCodeCache.open(self.filename)
+        self.assertEqual( list( cache.iter_from( os.path.getsize(self.filename) ) ), [] )
+
+    def test_remove(self):
+        GCodeCache.compile(self.filename, self.gfile)
+        GCodeCache.remove(self.filename)
+        self.assertFalse( os.path.exists(cache_file(self.filename)) )
+        self.assertIsNone( GCodeCache.open(self.filename) )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+# Import external modules
+
+# Import internal modules
+import fabtotum.utils.gcodefile as gcodefile
+from fabtotum.utils.gcodefile import GCodeFile, GCodeFileIter, GCodePrefetchIter, GCodeInfo
+
+#############################################
+
+PRINT_GCODE = ''.join(
+    [';Generated with Cura_SteamEngine 2.3\n', 'M109 S210\n', 'G28\n', '\n'] +
+    [ ';LAYER:{0}\nG1 X{0} Y1 E0.1 ; move\nG1 X{0} Y2\n'.format(i) for i in range(40) ] +
+    ['M104 S0'] )
+
+class GCodeFileTest(unittest.TestCase):
+
+    def setUp(self):
+        # Not running on a Raspberry Pi, always do a full scan
+        self.rpi_version = gcodefile.rpi_version
+        gcodefile.rpi_version = lambda: 'Raspberry Pi 3 Model B'
+        self.scan_block_size = gcodefile.SCAN_BLOCK_SIZE
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        gcodefile.rpi_version = self.rpi_version
+        gcodefile.SCAN_BLOCK_SIZE = self.scan_block_size
+        shutil.rmtree(self.directory)
+
+    def write(self, content):
+        filename = os.path.join(self.directory, 'file.gcode')
+        with open(filename, 'wb') as f:
+            f.write(content)
+        return filename
+
+    def counts(self, filename, lite_parsing):
+        info = GCodeFile(filename, lite_parsing, use_index = False).info
+        return info['type'], info['line_count'], info['gcode_count']
+
+    def test_lite_counts(self):
+        contents = [
+            PRINT_GCODE,
+            PRINT_GCODE + '\n',
+            'M3 S10000\nG1 X1\n;end\n',
+            ';only a comment\n\n\n',
+            'G1 X1'
+        ]
+        # Small blocks so that lines and comments cross the block ends
+        for block_size in [3, 16, 1024*1024]:
+            gcodefile.SCAN_BLOCK_SIZE = block_size
+            for content in contents:
+                filename = self.write(content)
+                self.assertEqual( self.counts(filename, True), self.counts(filename, False),
+                                  'block size {0}: {1!r}'.format(block_size, content[:20]) )
+
+    def test_type(self):
+        filename = self.write(PRINT_GCODE)
+        self.assertEqual( self.counts(filename, True)[0], GCodeInfo.PRINT )
+
+    def test_block_read(self):
+        filename = self.write(PRINT_GCODE)
+        expected = []
+        offset = 0
+        lines = PRINT_GCODE.split('\n')
+        for i, line in enumerate(lines):
+            # Last line has no newline
+            offset += len(line) + (1 if i < len(lines) - 1 else 0)
+            expected.append( (line.split(';', 1)[0].strip(), offset) )
+
+        result = []
+        gcode_iter = GCodeFileIter(filename, block_size = 7)
+        for code, attrs in gcode_iter:
+            result.append( (code, gcode_iter.offset) )
+        self.assertEqual( result, expected )
+
+    def test_prefetch(self):
+        filename = self.write(PRINT_GCODE)
+        expected = []
+        gcode_iter = GCodeFileIter(filename)
+        for code, attrs in gcode_iter:
+            expected.append( (code, gcode_iter.offset) )
+
+        result = []
+        prefetch_iter = GCodePrefetchIter( GCodeFileIter(filename), batch_size = 4, batches = 2 )
+        for code, attrs in prefetch_iter:
+            result.append( (code, prefetch_iter.offset) )
+        self.assertEqual( result, expected )
+
+    def test_prefetch_close(self):
+        filename = self.write(PRINT_GCODE)
+        source = GCodeFileIter(filename)
+        prefetch_iter = GCodePrefetchIter( source, batch_size = 4, batches = 2 )
+        prefetch_iter.next()
+        # Producer is waiting on the full queue
+        for i in range(500):
+            if prefetch_iter.queue.full():
+                break
+            time.sleep(0.01)
+        self.assertTrue( prefetch_iter.queue.full() )
+
+        prefetch_iter.close()
+        self.assertFalse( prefetch_iter.thread.is_alive() )
+        self.assertTrue( source.fd.closed )
+        self.assertRaises( StopIteration, prefetch_iter.next )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodeindex import GCodeIndex, TAIL_SIZE
+
+#############################################
+
+class GCodeIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index = GCodeIndex( os.path.join(self.directory, 'index') )
+        self.filename = self.write('print.gcode', 'G1 X1\nG1 X2\n')
+        self.info = {'line_count': 2, 'layers': [{'layer': 1, 'offset': 0}]}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, content, mode = 'w'):
+        filename = os.path.join(self.directory, name)
+        with open(filename, mode) as f:
+            f.write(content)
+        return filename
+
+    def index_files(self):
+        return sorted( os.listdir(self.index.path) )
+
+    def test_load(self):
+        self.assertIsNone( self.index.load(self.filename) )
+        self.index.save(self.filename, self.info)
+        self.assertEqual( self.index.load(self.filename), self.info )
+
+    def test_size_changed(self):
+        self.index.save(self.filename, self.info)
+        self.write('print.gcode', 'G1 X3\n', 'a')
+        self.assertIsNone( self.index.load(self.filename) )
+
+    def test_mtime_changed(self):
+        self.index.save(self.filename, self.info)
+        st = os.stat(self.filename)
+        os.utime(self.filename, (st.st_atime, st.st_mtime + 10))
+        self.assertIsNone( self.index.load(self.filename) )
+
+    def test_inode_changed(self):
+        self.index.save(self.filename, self.info)
+        st = os.stat(self.filename)
+        # Same content, size and mtime in a new file
+        copy = self.write('copy.gcode', 'G1 X1\nG1 X2\n')
+        os.utime(copy, (st.st_atime, st.st_mtime))
+        os.rename(copy, self.filename)
+        self.assertIsNone( self.index.load(self.filename) )
+
+    def test_lite_upgrade(self):
+        lite_info = {'line_count': 2}
+        self.index.save(self.filename, lite_info, lite = True)
+        self.assertEqual( self.index.load(self.filename, lite = True), lite_info )
+        # Lite metadata is not enough for a full load
+        self.assertIsNone( self.index.load(self.filename) )
+
+        self.index.save(self.filename, self.info)
+        self.assertEqual( self.index.load(self.filename), self.info )
+        self.assertEqual( self.index.load(self.filename, lite = True), self.info )
+        self.assertEqual( len(self.index_files()), 1 )
+
+    def test_resume_after_append(self):
+        size = os.path.getsize(self.filename)
+        state = {'offset': size, 'count': 2, 'layers': self.info['layers']}
+        self.index.save(self.filename, self.info, state = state)
+
+        # Layers are stored once
+        with open( os.path.join(self.index.path, self.index_files()[0]) ) as f:
+            stored = json.load(f)
+        self.assertNotIn( 'layers', stored['state'] )
+
+        # Nothing appended
+        self.assertIsNone( self.index.resumable(self.filename) )
+
+        self.write('print.gcode', 'G1 X3\n', 'a')
+        resumed = self.index.resumable(self.filename)
+        self.assertEqual( resumed['offset'], size )
+        self.assertEqual( resumed['count'], 2 )
+        self.assertEqual( resumed['layers'], self.info['layers'] )
+
+    def test_no_resume_after_rewrite(self):
+        size = os.path.getsize(self.filename)
+        self.index.save(self.filename, self.info, state = {'offset': size, 'layers': []})
+        # Longer file with different content before the scanned offset
+        self.write('print.gcode', 'G1 Y1\nG1 Y2\nG1 Y3\n', 'r+')
+        self.assertIsNone( self.index.resumable(self.filename) )
+
+    def test_resume_large_file(self):
+        content = 'G1 X1 Y1 E0.1\n' * (TAIL_SIZE // 7)
+        self.write('print.gcode', content)
+        state = {'offset': len(content), 'layers': []}
+        self.index.save(self.filename, self.info, state = state)
+
+        self.write('print.gcode', 'G1 X3\n', 'a')
+        self.assertEqual( self.index.resumable(self.filename)['offset'], len(content) )
+
+    def test_lite_not_resumable(self):
+        size = os.path.getsize(self.filename)
+        self.index.save(self.filename, {'line_count': 2}, lite = True, state = {'offset': size, 'layers': []})
+        self.write('print.gcode', 'G1 X3\n', 'a')
+        self.assertIsNone( self.index.resumable(self.filename) )
+
+    def test_prune(self):
+        files = [ self.write('file{0}.gcode'.format(i), 'G1 X1\n') for i in range(3) ]
+        for i, filename in enumerate(files):
+            self.index.save(filename, self.info)
+            path = os.path.join(self.index.path, hashlib.sha1( os.path.realpath(filename) ).hexdigest() + '.json')
+            os.utime(path, (1000 + i, 1000 + i))
+
+        # Loading marks the oldest index as recently used
+        self.assertIsNotNone( self.index.load(files[0]) )
+        self.index.prune(max_files = 2)
+
+        self.assertEqual( len(self.index_files()), 2 )
+        self.assertIsNone( self.index.load(files[1]) )
+        self.assertIsNotNone( self.index.load(files[0]) )
+        self.assertIsNotNone( self.index.load(files[2]) )
+
+    def test_remove(self):
+        self.index.save(self.filename, self.info)
+        self.index.remove(self.filename)
+        self.assertIsNone( self.index.load(self.filename) )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Import standard python module
+import math
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.gcodepipeline import GLine, GCodePipeline, ArcStage, MeshStage, FlowScaleStage
+from fabtotum.utils.mesh import BedMesh
+
+#############################################
+
+class GLineTest(unittest.TestCase):
+
+    def test_spaced(self):
+        line = GLine('G1 X10 Y-2.5 F1200')
+        self.assertEqual( line.command, 'G1' )
+        self.assertEqual( line.get('X'), 10.0 )
+        self.assertEqual( line.get('Y'), -2.5 )
+        self.assertIsNone( line.get('Z') )
+        self.assertEqual( str(line), 'G1 X10 Y-2.5 F1200' )
+
+    def test_compact(self):
+        line = GLine('g1z0.3f1200')
+        self.assertEqual( line.command, 'G1' )
+        self.assertEqual( line.get('Z'), 0.3 )
+        self.assertEqual( line.get('F'), 1200.0 )
+
+    def test_exponent(self):
+        line = GLine('G1 X-1.5e-3 Y2E+2 Z.5E1 E0.1')
+        self.assertEqual( line.get('X'), -0.0015 )
+        self.assertEqual( line.get('Y'), 200.0 )
+        self.assertEqual( line.get('Z'), 5.0 )
+        self.assertEqual( line.get('E'), 0.1 )
+
+    def test_compact_extrusion(self):
+        line = GLine('G1X10E5F1200')
+        self.assertEqual( line.get('X'), 10.0 )
+        self.assertEqual( line.get('E'), 5.0 )
+        self.assertEqual( line.get('F'), 1200.0 )
+
+    def test_set(self):
+        line = GLine('G1X1Y2')
+        line.set('Y', 3)
+        line.set('E', 0.5)
+        self.assertEqual( str(line), 'G1 X1 Y3 E0.5' )
+
+    def test_empty(self):
+        line = GLine('')
+        self.assertEqual( line.command, '' )
+        self.assertEqual( line.params, [] )
+
+class ArcStageTest(unittest.TestCase):
+
+    def linearize(self, *lines):
+        pipeline = GCodePipeline([ ArcStage(0.5) ])
+        output = []
+        for code in lines:
+            output.extend( GLine(code) for code in pipeline.process(code) )
+        return output
+
+    def assert_on_arc(self, lines, center, radius, end):
+        """ Segment ends are on the circle, up to the printed precision. """
+        for line in lines:
+            self.assertEqual( line.command, 'G1' )
+            distance = math.hypot(line.get('X') - center[0], line.get('Y') - center[1])
+            self.assertAlmostEqual( distance, radius, places = 2 )
+        self.assertEqual( (lines[-1].get('X'), lines[-1].get('Y')), end )
+
+    def test_center_clockwise(self):
+        lines = self.linearize('G2 X10 Y0 I5 J0 E1 F600')
+        self.assertGreater( len(lines), 10 )
+        self.assert_on_arc(lines, (5, 0), 5, (10, 0))
+        # Clockwise from the left of the center goes over it
+        self.assertTrue( all( line.get('Y') >= 0 for line in lines ) )
+        self.assertAlmostEqual( max( line.get('Y') for line in lines ), 5, delta = 0.05 )
+        # The feedrate only on the first segment, the extrusion is spread
+        self.assertEqual( lines[0].get('F'), 600 )
+        self.assertIsNone( lines[1].get('F') )
+        self.assertEqual( lines[-1].get('E'), 1 )
+
+    def test_center_counterclockwise(self):
+        lines = self.linearize('G3 X10 Y0 I5 J0')
+        self.assert_on_arc(lines, (5, 0), 5, (10, 0))
+        self.assertTrue( all( line.get('Y') <= 0 for line in lines ) )
+
+    def test_radius(self):
+        # Same arc as the center format
+        self.assertEqual( [ str(line) for line in self.linearize('G2 X10 Y0 R5') ],
+                          [ str(line) for line in self.linearize('G2 X10 Y0 I5 J0') ] )
+
+        # Positive radius, short arc with the center on the right of the travel
+        lines = self.linearize('G2 X10 Y0 R10')
+        center = (5, -math.sqrt(75))
+        self.assert_on_arc(lines, center, 10, (10, 0))
+        self.assertAlmostEqual( max( line.get('Y') for line in lines ), 10 + center[1], delta = 0.05 )
+
+        # Negative radius, long arc
+        lines = self.linearize('G2 X10 Y0 R-10')
+        center = (5, math.sqrt(75))
+        self.assert_on_arc(lines, center, 10, (10, 0))
+        self.assertAlmostEqual( max( line.get('Y') for line in lines ), 10 + center[1], delta = 0.05 )
+
+        lines = self.linearize('G3 X10 Y0 R10')
+        self.assert_on_arc(lines, (5, math.sqrt(75)), 10, (10, 0))
+
+    def test_start_position(self):
+        lines = self.linearize('G1 X10 Y10', 'G2 X20 Y10 I5 J0')
+        self.assertEqual( str(lines[0]), 'G1 X10 Y10' )
+        self.assert_on_arc(lines[1:], (15, 10), 5, (20, 10))
+        self.assertTrue( all( line.get('Y') >= 10 for line in lines[1:] ) )
+
+    def test_relative(self):
+        lines = self.linearize('G91', 'G2 X10 Y0 I5 J0')
+        self.assertEqual( [ str(line) for line in lines ], ['G91', 'G2 X10 Y0 I5 J0'] )
+
+class MeshStageTest(unittest.TestCase):
+
+    def compensate(self, mesh, *lines):
+        pipeline = GCodePipeline([ MeshStage(mesh, fade_height = 10.0) ])
+        output = []
+        for code in lines:
+            output.extend( GLine(code) for code in pipeline.process(code) )
+        return output
+
+    def test_fade(self):
+        # Bed 0.2mm high everywhere
+        mesh = BedMesh((0, 0), (100, 100), [[0.2, 0.2], [0.2, 0.2]])
+        lines = self.compensate(mesh, 'G1 X10 Y10 Z0', 'G1 Z5', 'G1 Z7.5', 'G1 X20 Z10', 'G1 X30 Z20')
+        self.assertEqual( len(lines), 5 )
+        self.assertAlmostEqual( lines[0].get('Z'), 0.2 )
+        self.assertAlmostEqual( lines[1].get('Z'), 5.1 )
+        self.assertAlmostEqual( lines[2].get('Z'), 7.55 )
+        # No correction from the fade height up
+        self.assertEqual( str(lines[3]), 'G1 X20 Z10' )
+        self.assertEqual( str(lines[4]), 'G1 X30 Z20' )
+
+    def test_grid_split(self):
+        # Bed tilted along X, the move crosses the grid line at X50
+        mesh = BedMesh((0, 0), (50, 100), [[0.0, 0.1, 0.3], [0.0, 0.1, 0.3]])
+        lines = self.compensate(mesh, 'G1 X25 Y10 Z0 F1000', 'G1 X75 E1')
+        self.assertEqual( len(lines), 3 )
+        self.assertEqual( [ (line.get('X'), line.get('Z')) for line in lines ],
+                          [ (25, 0.05), (50, 0.1), (75, 0.2) ] )
+        self.assertEqual( [ line.get('E') for line in lines[1:] ], [0.5, 1] )
+
+class FlowScaleStageTest(unittest.TestCase):
+
+    def scale(self, factor, *lines):
+        pipeline = GCodePipeline([ FlowScaleStage(factor) ])
+        output = []
+        for code in lines:
+            output.extend( pipeline.process(code) )
+        return output
+
+    def test_absolute(self):
+        self.assertEqual( self.scale(0.5, 'G1 X1 E10', 'G1 X2 E14', 'G1 X3'),
+                          ['G1 X1 E5', 'G1 X2 E7', 'G1 X3'] )
+
+    def test_reset(self):
+        # The slicer resets E at every layer
+        self.assertEqual( self.scale(0.5, 'G1 X1 E10', 'G92 E0', 'G1 X2 E4'),
+                          ['G1 X1 E5', 'G92 E0', 'G1 X2 E2'] )
+        self.assertEqual( self.scale(2, 'G1 X1 E1', 'G92', 'G1 X2 E1'),
+                          ['G1 X1 E2', 'G92', 'G1 X2 E2'] )
+
+    def test_set_position(self):
+        self.assertEqual( self.scale(0.5, 'G92 E3', 'G1 X1 E5', 'G92 X0', 'G1 X2 E7'),
+                          ['G92 E3', 'G1 X1 E4', 'G92 X0', 'G1 X2 E5'] )
+
+    def test_relative(self):
+        self.assertEqual( self.scale(0.5, 'M83', 'G1 X1 E2', 'G92 E0', 'G1 X2 E-1'),
+                          ['M83', 'G1 X1 E1', 'G92 E0', 'G1 X2 E-0.5'] )
+
+if __name__ == '__main__':
+    unittest.main()
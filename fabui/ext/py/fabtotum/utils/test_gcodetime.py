@@ -0,0 +1,215 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# Import standard python module
+import os
+import math
+import shutil
+import tempfile
+import unittest
+
+# Import external modules
+
+# Import internal modules
+import fabtotum.utils.gcodefile as gcodefile
+import fabtotum.utils.gcodetime as gcodetime
+from fabtotum.utils.gcodetime import MotionConfig, TimeEstimate, PrintTimeEstimator, PyPlanner, Planner
+
+#############################################
+
+# Expected values below are computed by hand for these limits
+CONFIG = MotionConfig(max_feedrate = (500.0, 500.0, 5.0, 25.0),
+                      max_acceleration = (1000.0, 1000.0, 100.0, 10000.0),
+                      acceleration = 1000.0, retract_acceleration = 1000.0,
+                      jerk = (20.0, 0.4, 5.0))
+
+# Exit speed of the last move
+STOP = gcodetime.MINIMUM_PLANNER_SPEED
+
+PLANNERS = [PyPlanner] if Planner is PyPlanner else [PyPlanner, Planner]
+
+def trapezoid(d, a, vn, v0, v1):
+    """ Time of a move of length **d** from speed **v0** to **v1** cruising at **vn**. """
+    a = float(a)
+    d_acc = (vn*vn - v0*v0) / (2*a)
+    d_dec = (vn*vn - v1*v1) / (2*a)
+    return (vn - v0) / a + (d - d_acc - d_dec) / vn + (vn - v1) / a
+
+def triangle(d, a, v0, v1):
+    """ Time of a move of length **d** too short to reach the nominal speed. """
+    a = float(a)
+    vp = math.sqrt( (2*a*d + v0*v0 + v1*v1) / 2 )
+    return (vp - v0) / a + (vp - v1) / a
+
+class PlannerTest(unittest.TestCase):
+
+    def estimate(self, lines, planner):
+        estimator = PrintTimeEstimator(CONFIG, planner)
+        for line in lines:
+            estimator.process_line(line)
+        return estimator.finish(), estimator.moves
+
+    def check(self, lines, expected, moves = None):
+        for planner in PLANNERS:
+            estimate, count = self.estimate(lines, planner)
+            self.assertAlmostEqual(estimate.total, expected, places = 9, msg = planner.__name__)
+            if moves is not None:
+                self.assertEqual(count, moves, planner.__name__)
+
+    def test_trapezoid(self):
+        # Accelerates from rest to 100mm/s, cruises and stops
+        self.check(['G1 X100 F6000'], 1.0999500125, 1)
+        self.check(['G1 X100 F6000'], trapezoid(100, 1000, 100, 0, STOP))
+
+    def test_triangle(self):
+        # 5mm are needed to reach 100mm/s
+        self.check(['G1 X2 F6000'], triangle(2, 1000, 0, STOP))
+
+    def test_collinear_junction(self):
+        # No speed change at the junction, same as a single move
+        self.check(['G1 X50 F6000', 'G1 X100'], 1.0999500125, 2)
+
+    def test_corner_junction(self):
+        # The XY jerk limits the corner speed
+        junction = 100 * 20.0 / math.hypot(100, 100)
+        expected = trapezoid(100, 1000, 100, 0, junction) + trapezoid(100, 1000, 100, junction, STOP)
+        self.check(['G1 X100 F6000', 'G1 Y100'], expected)
+
+    def test_reversal_junction(self):
+        expected = trapezoid(100, 1000, 100, 0, 10) + trapezoid(100, 1000, 100, 10, STOP)
+        self.check(['G1 X100 F6000', 'G1 X0'], expected)
+
+    def test_synchronize(self):
+        # The buffer is emptied, the corner is not blended
+        expected = trapezoid(100, 1000, 100, 0, STOP) * 2
+        self.check(['G1 X100 F6000', 'M400', 'G1 Y100'], expected)
+
+    def test_axis_limits(self):
+        # Z feedrate is limited to 5mm/s and acceleration to 100mm/s^2
+        self.check(['G1 Z10 F6000'], trapezoid(10, 100, 5, 0, STOP))
+
+    def test_relative(self):
+        self.check(['G91', 'G1 X50 F6000', 'G1 X50', 'G90', 'G1 X100'], 1.0999500125, 2)
+        self.check(['G92 X50', 'G1 X100 F6000', 'G92 X0', 'G1 X50'],
+                   trapezoid(50, 1000, 100, 0, 100) + trapezoid(50, 1000, 100, 100, STOP))
+
+    def test_extruder_only(self):
+        # E feedrate is limited to 25mm/s
+        self.check(['G1 E10 F6000'], trapezoid(10, 1000, 25, 0, STOP))
+        self.check(['M83', 'G1 E10 F6000', 'G1 E-10'],
+                   trapezoid(10, 1000, 25, 0, 2.5) + trapezoid(10, 1000, 25, 2.5, STOP))
+
+    def test_dwell(self):
+        move = trapezoid(100, 1000, 100, 0, STOP)
+        self.check(['G1 X100 F6000', 'G4 P500', 'G4 S2', 'G4'], move + 2.5)
+
+    def test_ignored(self):
+        self.check(['', '   ', 'M104 S210', 'G1 F6000', 'G1 X100 Q Y', 'G1 Xa'], 1.0999500125, 1)
+
+    def test_full_circle(self):
+        # Split in 62 segments of the same length
+        chord = 2 * 10 * math.sin(math.pi / 62)
+        expected = trapezoid(62 * chord, 1000, 10, 0, STOP)
+        self.check(['G2 X0 Y0 I10 J0 F600'], expected, 62)
+
+    def test_arc_forms(self):
+        quarter = trapezoid(15 * 2 * 10 * math.sin(math.pi / 60), 1000, 10, 0, STOP)
+        self.check(['G2 X10 Y10 I10 J0 F600'], quarter, 15)
+        self.check(['G2 X10 Y10 R10 F600'], quarter, 15)
+        self.check(['G3 X10 Y10 R10 F600'], quarter, 15)
+        # A negative radius selects the long arc
+        self.check(['G2 X10 Y10 R-10 F600'],
+                   trapezoid(47 * 2 * 10 * math.sin(3 * math.pi / 4 / 47), 1000, 10, 0, STOP), 47)
+        # Without a center it is a straight move
+        self.check(['G2 X10 F600'], trapezoid(10, 1000, 10, 0, STOP), 1)
+
+    def test_planners(self):
+        if Planner is PyPlanner:
+            self.skipTest('Compiled planner not available')
+        lines = ['G28', 'G1 X10 Y10 Z0.2 F9000', 'G1 X20.5 Y-3 E1.25 F1800', 'G2 X30 Y10 I5 J5 E2',
+                 'G3 X0 Y0 R-20 E3 F1.2e3', 'G91', 'G1 Z0.5 E-1', 'G90', 'G92 E0', 'M83',
+                 'G1 E-2 F2400', 'G1 E2', 'M82', 'G4 P150', 'G1\tX5.  Y.5', 'G1 X1 Y2 Fx', 'G0 X0 Y0']
+        data = ''.join( line + ';\n' if i % 3 else line + '\r\n' for i, line in enumerate(lines * 300) )
+        layers = lambda line: len(line) if line.startswith('G3') else None
+
+        results = []
+        for planner in [PyPlanner, Planner]:
+            p = planner(CONFIG)
+            # Blocks of complete lines, the last one without a newline
+            end = data.index('\n', len(data) / 2) + 1
+            p.process_block(data[:end], 0, layers)
+            p.process_block(data[end:-1], end, layers)
+            results.append( p.finish() + (p.moves,) )
+        self.assertEqual(results[0], results[1])
+
+class TimeEstimateTest(unittest.TestCase):
+
+    def test_estimate(self):
+        estimate = TimeEstimate(10.0, [(0, 0.0), (100, 4.0), (200, 6.0)], [(0, 0, 0.0), (1, 100, 4.0)], 300)
+        self.assertEqual(estimate.elapsed_at(0), 0.0)
+        self.assertEqual(estimate.elapsed_at(50), 2.0)
+        self.assertEqual(estimate.elapsed_at(150), 5.0)
+        self.assertEqual(estimate.elapsed_at(250), 8.0)
+        self.assertEqual(estimate.elapsed_at(300), 10.0)
+        self.assertEqual(estimate.remaining(150), 5.0)
+        self.assertEqual(estimate.remaining(300), 0.0)
+        self.assertEqual(estimate.layer_times(), [(0, 4.0), (1, 6.0)])
+
+class ProcessFileTest(unittest.TestCase):
+
+    def setUp(self):
+        # Not running on a Raspberry Pi, always do a full scan
+        self.rpi_version = gcodefile.rpi_version
+        gcodefile.rpi_version = lambda: 'Raspberry Pi 3 Model B'
+        self.read_block_size = gcodetime.READ_BLOCK_SIZE
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        gcodefile.rpi_version = self.rpi_version
+        gcodetime.READ_BLOCK_SIZE = self.read_block_size
+        shutil.rmtree(self.directory)
+
+    def test_layers(self):
+        content = (';Generated with Cura_SteamEngine 2.3\n'
+                   ';LAYER:0\nG1 X100 F6000 ; first\n'
+                   ';LAYER:1\nG1 X0\n'
+                   'M104 S0')
+        filename = os.path.join(self.directory, 'file.gcode')
+        with open(filename, 'wb') as f:
+            f.write(content)
+        first = trapezoid(100, 1000, 100, 0, 10)
+        total = first + trapezoid(100, 1000, 100, 10, STOP)
+        layer1 = content.index(';LAYER:1\n') + len(';LAYER:1\n')
+
+        # Small blocks so that lines cross the block ends
+        for block_size in [7, 1024]:
+            gcodetime.READ_BLOCK_SIZE = block_size
+            for planner in PLANNERS:
+                estimate = PrintTimeEstimator(CONFIG, planner).process_file(filename)
+                self.assertEqual(estimate.size, len(content))
+                self.assertAlmostEqual(estimate.total, total, places = 9)
+                self.assertEqual([ (layer, offset) for layer, offset, start in estimate.layers ],
+                                 [ ('0', content.index('G1')), ('1', layer1) ])
+                self.assertAlmostEqual(estimate.layers[1][2], first, places = 9)
+                self.assertAlmostEqual(estimate.elapsed_at(layer1), first, places = 9)
+                self.assertEqual(estimate.remaining(len(content)), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
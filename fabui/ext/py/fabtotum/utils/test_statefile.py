@@ -0,0 +1,119 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Import standard python module
+import os
+import stat
+import shutil
+import tempfile
+import unittest
+
+# Import external modules
+
+# Import internal modules
+from fabtotum.utils.singleton import Singleton
+from fabtotum.utils.statefile import StateFileWriter
+
+#############################################
+
+class StateFileWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        # Stats are by real path
+        self.directory = os.path.realpath(tempfile.mkdtemp())
+        self.filename = os.path.join(self.directory, 'task_monitor.json')
+        # Fresh writer for every test, without the sync timer
+        Singleton._instances.pop(StateFileWriter, None)
+        self.writer = StateFileWriter(fsync_delay = None)
+
+    def tearDown(self):
+        Singleton._instances.pop(StateFileWriter, None)
+        shutil.rmtree(self.directory)
+
+    def read(self, filename = None):
+        with open(filename or self.filename, 'rb') as f:
+            return f.read()
+
+    def test_atomic_replace(self):
+        self.assertTrue( self.writer.write(self.filename, '{"a": 1}') )
+
+        # A reader of the old file is not affected by the next write
+        with open(self.filename, 'rb') as reader:
+            inode = os.fstat(reader.fileno()).st_ino
+            self.assertTrue( self.writer.write(self.filename, '{"a": 2, "b": 3}') )
+            self.assertEqual( reader.read(), '{"a": 1}' )
+
+        self.assertNotEqual( os.stat(self.filename).st_ino, inode )
+        self.assertEqual( self.read(), '{"a": 2, "b": 3}' )
+        # No temporary file left behind
+        self.assertEqual( os.listdir(self.directory), ['task_monitor.json'] )
+
+    def test_keep_mode(self):
+        with open(self.filename, 'wb') as f:
+            f.write('old')
+        os.chmod(self.filename, 0o640)
+
+        self.writer.write(self.filename, 'new')
+        self.assertEqual( stat.S_IMODE(os.stat(self.filename).st_mode), 0o640 )
+
+    def test_symlink(self):
+        target = os.path.join(self.directory, 'target.json')
+        link = os.path.join(self.directory, 'link.json')
+        os.symlink(target, link)
+
+        self.writer.write(link, 'data')
+        self.assertTrue( os.path.islink(link) )
+        self.assertEqual( self.read(target), 'data' )
+
+    def test_skip_unchanged(self):
+        self.assertTrue( self.writer.write(self.filename, 'same') )
+        self.assertFalse( self.writer.write(self.filename, 'same') )
+        self.assertFalse( self.writer.write(self.filename, u'same') )
+
+        counters = self.writer.stats()[self.filename]
+        self.assertEqual( counters['writes'], 1 )
+        self.assertEqual( counters['skipped'], 2 )
+        self.assertEqual( counters['bytes'], 4 )
+
+    def test_rewrite_external_change(self):
+        self.writer.write(self.filename, 'same')
+        # Changed by someone else
+        with open(self.filename, 'wb') as f:
+            f.write('other content')
+        self.assertTrue( self.writer.write(self.filename, 'same') )
+        self.assertEqual( self.read(), 'same' )
+
+        os.remove(self.filename)
+        self.assertTrue( self.writer.write(self.filename, 'same') )
+        self.assertEqual( self.read(), 'same' )
+
+    def test_unicode(self):
+        self.writer.write(self.filename, u'temp \xb0C')
+        self.assertEqual( self.read(), 'temp \xc2\xb0C' )
+
+    def test_flush(self):
+        self.writer.write(self.filename, 'data')
+        self.writer.flush()
+        self.writer.flush()
+        self.assertEqual( self.writer.stats()[self.filename]['fsyncs'], 1 )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -95,7 +95,11 @@ class ExposeCommands:
         """
         Send GCode and receive it's reply.
         """
-        return self.gcs.send(code, block=block, timeout=timeout, async=async)
+        reply = self.gcs.send(code, block=block, timeout=timeout, async=async)
+        if block:
+            return reply
+        # Command handles can not be passed to remote clients
+        return None
     
     def reload_config(self):
         self.config.reload()
@@ -29,8 +29,8 @@ import gettext
 from fabtotum.database import Database, timestamp2datetime
 from fabtotum.database.file import File
 from fabtotum.fabui.config import ConfigService
-
-from printrun.gcoder import GCode
+from fabtotum.utils.gcodeanalyzer import GCodeAnalyzer
+from fabtotum.utils.gcodecache import GCodeCache
 
 # Set up message catalog access
 tr = gettext.translation('gcode_analyzer', 'locale', fallback=True)
@@ -50,23 +50,21 @@ def main():
     f['attributes'] = 'Processing';
     f.write()
     
-    # Analyze the gcode file
-    gcode = GCode(open(f['full_path'], "rU"))
+    # Analyze the gcode file in a single pass, memory use does not depend on the file size
+    analyzer = GCodeAnalyzer()
+    analyzer.process_file(f['full_path'])
     
-    result = {
-        "dimensions" : {
-            "x" : str(gcode.width),
-            "y" : str(gcode.depth),
-            "z" : str(gcode.height)
-        },
-        "number_of_layers" : str(gcode.layers_count),
-        "filament": str(gcode.filament_length),
-        "estimated_time": str(gcode.estimate_duration()[1])
-    }
+    result = analyzer.attributes()
     
     # Write newly calculated attributes back to file
     f['attributes'] = json.dumps(result)
     f.write()       
     
+    # Compile the streaming cache, files are still printed from the source without it
+    try:
+        GCodeCache.compile(f['full_path'])
+    except Exception:
+        GCodeCache.remove(f['full_path'])
+    
 if __name__ == "__main__":
     main()
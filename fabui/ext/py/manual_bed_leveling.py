@@ -35,6 +35,7 @@ from fabtotum.fabui.gpusher import GCodePusher
 import fabtotum.fabui.macros.general as general_macros
 import fabtotum.fabui.macros.printing as print_macros
 from fabtotum.totumduino.format import parseG30
+from fabtotum.utils.mesh import BedMesh
 
 ################################################################################
 
@@ -102,6 +103,65 @@ class ManualBedLeveling(GCodePusher):
             
         return None
 
+    def probe_grid(self, grid, num_probes, probe_height):
+        """
+        Probe the bed on a regular grid covering the area of the screw
+        probe points, row by row in a serpentine path.
+        
+        :param grid: Number of points along X and Y
+        :param num_probes: Number of probings averaged for each point
+        :param probe_height: Z used to move between the points
+        :returns: Probed points in bed coordinates or ``None`` if a probe failed
+        """
+        nx, ny = grid
+        x0 = min( p[0] for p in self.PROBE_POINTS )
+        x1 = max( p[0] for p in self.PROBE_POINTS )
+        y0 = min( p[1] for p in self.PROBE_POINTS )
+        y1 = max( p[1] for p in self.PROBE_POINTS )
+        
+        points = []
+        for j in range(ny):
+            y = y0 + (y1 - y0) * j / float(ny - 1)
+            columns = range(nx) if j % 2 == 0 else reversed(range(nx))
+            for i in columns:
+                x = x0 + (x1 - x0) * i / float(nx - 1)
+                self.trace( _("Measuring mesh point {0} of {1}").format( len(points)+1, nx*ny ) )
+                
+                z = 0.0
+                for k in range(num_probes):
+                    new_point = self.probe(x - self.CARRIAGE_POSITION[0], y - self.CARRIAGE_POSITION[1], timeout = 20)
+                    self.send("G0 Z{0} F5000".format(probe_height))
+                    self.send("M400")
+                    if not new_point:
+                        self.trace( _("Probe failed") )
+                        return None
+                    z += new_point[2]
+                
+                points.append( [x, y, z / num_probes] )
+        
+        return np.array(points)
+
+    def save_bed_mesh(self, probed_points):
+        """
+        Store the probed grid as bed mesh for the print compensation. The
+        screws only fix the tilt of the bed so the best fitting plane is
+        removed and the mesh keeps the residual warp.
+        
+        :param probed_points: Points probed by `probe_grid`
+        """
+        x = probed_points[:,0] - self.CARRIAGE_POSITION[0]
+        y = probed_points[:,1] - self.CARRIAGE_POSITION[1]
+        z = probed_points[:,2]
+        A = np.column_stack([x, y, np.ones(len(z))])
+        plane = np.linalg.lstsq(A, z)[0]
+        residual = z - A.dot(plane)
+        
+        try:
+            mesh = BedMesh.from_points( zip(x.tolist(), y.tolist(), residual.tolist()) )
+            mesh.save()
+        except (ValueError, IOError, OSError) as e:
+            print "Bed mesh not saved:", e
+
     def fitplane(self, XYZ):
         [npts,rows] = XYZ.shape
 
@@ -137,8 +197,9 @@ class ManualBedLeveling(GCodePusher):
     #~ def trace(self, msg):
         #~ print msg
 
-    def run(self, task_id, num_probes, skip_homing):
+    def run(self, task_id, num_probes, skip_homing, mesh_grid = None):
         """
+        :param mesh_grid: Number of points along X and Y of the bed mesh grid, ``None`` to keep the stored mesh
         """
         
         if(num_probes > self.MAX_NUM_PROBES):
@@ -200,6 +261,11 @@ class ManualBedLeveling(GCodePusher):
             #if(error == False):    
             probed_points[p,2] /= probes
         
+        # The four screw points only give the tilt, the warp needs a grid
+        mesh_points = None
+        if mesh_grid and probe_errors == 0:
+            mesh_points = self.probe_grid(mesh_grid, num_probes, probe_height)
+        
         # Retract probe
         self.send("M402")
         self.send("G0 X5 Y5 Z{0} F10000".format(probe_height))
@@ -213,6 +279,11 @@ class ManualBedLeveling(GCodePusher):
         if(probe_errors == 0) :
             print probed_points
             
+            if mesh_points is not None:
+                self.save_bed_mesh(mesh_points)
+            elif mesh_grid:
+                self.trace( _("Bed mesh not saved") )
+            
             # Math
             Fit = self.fitplane(probed_points)
             coeff = Fit[0:3]
@@ -266,6 +337,7 @@ def main():
     parser.add_argument("-T", "--task-id",                          help="Task ID.",default=0)
     parser.add_argument("-n", "--num_probes",                       help="Number of probings per screw.",     default=1, type=int)
     parser.add_argument("-s", "--skip_homing", action='store_true', help="Skip homing." )
+    parser.add_argument("-g", "--mesh-grid",                        help="Probe a NxM grid and store it as bed mesh for print.py --mesh, e.g. 5x5.", default='' )
     parser.add_argument("--lang",                                   help="Output language",                   default='en_US.UTF-8' )
 	
     # GET ARGUMENTS
@@ -279,13 +351,20 @@ def main():
     skip_homing     = args.skip_homing
     lang			= args.lang
     
+    mesh_grid       = None
+    if args.mesh_grid:
+        match = re.match(r'^(\d+)x(\d+)$', args.mesh_grid)
+        if not match or int(match.group(1)) < 2 or int(match.group(2)) < 2:
+            parser.error("mesh grid must be NxM with N, M >= 2")
+        mesh_grid = ( int(match.group(1)), int(match.group(2)) )
+    
     print "num_probes: ", num_probes
 
     app = ManualBedLeveling(log_trace, monitor_file, config=config, lang=lang)
 
     app_thread = Thread( 
             target = app.run, 
-            args=( [task_id, num_probes, skip_homing] ) 
+            args=( [task_id, num_probes, skip_homing, mesh_grid] ) 
             )
     app_thread.start()
 
@@ -47,12 +47,13 @@ class PrintApplication(GCodePusher):
     
     def __init__(self, log_trace, monitor_file, standalone = False, 
                     autolevel = False, finalize = True,
-                    lang = 'en_US.UTF-8', send_email=False):
+                    lang = 'en_US.UTF-8', send_email=False, mesh = False):
         super(PrintApplication, self).__init__(log_trace, monitor_file, 
                 use_stdout=standalone, lang=lang, send_email=send_email)
                 
         self.standalone = standalone
         self.autolevel = autolevel
+        self.mesh = mesh
         self.finalize = finalize
         self.ext_target = 0.0
         self.bed_target = 0.0
@@ -176,7 +177,9 @@ class PrintApplication(GCodePusher):
             
             #~ self.exec_macro("start_print")
         
-        self.send_file(gcode_file)
+        # Compensate the bed warp with the mesh stored by manual bed leveling
+        pipeline = {'mesh' : True} if self.mesh else None
+        self.send_file(gcode_file, pipeline=pipeline)
         self.trace( _("Print initialized.") )
 
 def main():
@@ -188,6 +191,7 @@ def main():
     parser.add_argument("-T", "--task-id",     help="Task ID.",      default=0)
     parser.add_argument("-F", "--file-name",   help="File name.",    required=True)
     parser.add_argument("--autolevel",  action='store_true',  help="Auto bed leveling. Valid only when --standalone is used.", default=False)
+    parser.add_argument("--mesh",       action='store_true',  help="Compensate the bed height with the bed mesh stored by manual_bed_leveling.py --mesh-grid.", default=False)
     parser.add_argument("--lang",              help="Output language", default='en_US.UTF-8' )
     parser.add_argument("--email",             help="Send an email on task finish", action='store_true', default=False)
     parser.add_argument("--shutdown",          help="Shutdown on task finish", action='store_true', default=False )
@@ -199,6 +203,7 @@ def main():
     gcode_file      = args.file_name     # GCODE FILE
     task_id         = args.task_id
     autolevel       = args.autolevel
+    mesh            = args.mesh
     lang            = args.lang
     send_email      = bool(args.email)
     
@@ -210,7 +215,7 @@ def main():
     monitor_file    = config.get('general', 'task_monitor') # TASK MONITOR FILE (write stats & task info, es: temperatures, speed, etc
     log_trace       = config.get('general', 'trace')        # TASK TRACE FILE 
     
-    app = PrintApplication(log_trace, monitor_file, standalone, autolevel, lang=lang, send_email=send_email)
+    app = PrintApplication(log_trace, monitor_file, standalone, autolevel, lang=lang, send_email=send_email, mesh=mesh)
 
     app.run(task_id, gcode_file)
     app.loop()
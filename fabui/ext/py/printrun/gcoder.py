@@ -56,15 +56,6 @@ class PyLightLine(object):
     def __getattr__(self, name):
         return None
 
-try:
-    import gcoder_line
-    Line = gcoder_line.GLine
-    LightLine = gcoder_line.GLightLine
-except Exception, e:
-    logging.warning("Memory-efficient GCoder implementation unavailable: %s" % e)
-    Line = PyLine
-    LightLine = PyLightLine
-
 def find_specific_code(line, code):
     exp = specific_exp % code
     bits = [bit for bit in re.findall(exp, line.raw) if bit]
@@ -77,7 +68,7 @@ def S(line):
 def P(line):
     return find_specific_code(line, "P")
 
-def split(line):
+def py_split(line):
     split_raw = gcode_exp.findall(line.raw.lower())
     if split_raw and split_raw[0][0] == "n":
         del split_raw[0]
@@ -91,7 +82,7 @@ def split(line):
     line.is_move = line.command in move_gcodes
     return split_raw
 
-def parse_coordinates(line, split_raw, imperial = False, force = False):
+def py_parse_coordinates(line, split_raw, imperial = False, force = False):
     # Not a G-line, we don't want to parse its arguments
     if not force and line.command[0] != "G":
         return
@@ -101,6 +92,21 @@ def parse_coordinates(line, split_raw, imperial = False, force = False):
         if code not in gcode_parsed_nonargs and bit[1]:
             setattr(line, code, unit_factor * float(bit[1]))
 
+# Use the compiled line classes and parser if available (built from speedups/),
+# older builds of gcoder_line only provide the line classes
+try:
+    import gcoder_line
+    Line = gcoder_line.GLine
+    LightLine = gcoder_line.GLightLine
+    split = getattr(gcoder_line, 'split', py_split)
+    parse_coordinates = getattr(gcoder_line, 'parse_coordinates', py_parse_coordinates)
+except Exception, e:
+    logging.warning("Memory-efficient GCoder implementation unavailable: %s" % e)
+    Line = PyLine
+    LightLine = PyLightLine
+    split = py_split
+    parse_coordinates = py_parse_coordinates
+
 class Layer(list):
 
     __slots__ = ("duration", "z")
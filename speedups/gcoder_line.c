@@ -1,16 +1,20 @@
-/* Generated by Cython 0.23.4 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03020000)
-    #error Cython requires Python 2.6+ or Python 3.2+.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_23_4"
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
 #include <stddef.h>
 #ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
 #endif
 #if !defined(WIN32) && !defined(MS_WINDOWS)
   #ifndef __stdcall
@@ -29,6 +33,12 @@
 #ifndef DL_EXPORT
   #define DL_EXPORT(t) t
 #endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
 #ifndef PY_LONG_LONG
   #define PY_LONG_LONG LONG_LONG
 #endif
@@ -36,18 +46,329 @@
   #define Py_HUGE_VAL HUGE_VAL
 #endif
 #ifdef PYPY_VERSION
-#define CYTHON_COMPILING_IN_PYPY 1
-#define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
 #else
-#define CYTHON_COMPILING_IN_PYPY 0
-#define CYTHON_COMPILING_IN_CPYTHON 1
+   #include <stdint.h>
 #endif
-#if !defined(CYTHON_USE_PYLONG_INTERNALS) && CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x02070000
-#define CYTHON_USE_PYLONG_INTERNALS 1
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
 #endif
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-#define Py_OptimizeFlag 0
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
 #endif
+
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -57,10 +378,79 @@
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -73,23 +463,137 @@
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
   #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
   #define __Pyx_PyUnicode_READY(op)       (0)
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
   #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
   #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
   #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
 #endif
 #if CYTHON_COMPILING_IN_PYPY
   #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
@@ -102,19 +606,31 @@
 #if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
   #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
 #endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
 #else
   #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
 #endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define PyBaseString_Type            PyUnicode_Type
   #define PyStringObject               PyUnicodeObject
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
 #endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
@@ -126,7 +642,18 @@
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define PyIntObject                  PyLongObject
   #define PyInt_Type                   PyLong_Type
@@ -155,56 +682,38 @@
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
-#if PY_VERSION_HEX >= 0x030500B1
-#define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
-#define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
-#elif CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
-typedef struct {
-    unaryfunc am_await;
-    unaryfunc am_aiter;
-    unaryfunc am_anext;
-} __Pyx_PyAsyncMethodsStruct;
-#define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
-#else
-#define __Pyx_PyType_AsAsync(obj) NULL
-#endif
-#ifndef CYTHON_RESTRICT
-  #if defined(__GNUC__)
-    #define CYTHON_RESTRICT __restrict__
-  #elif defined(_MSC_VER) && _MSC_VER >= 1400
-    #define CYTHON_RESTRICT __restrict
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_RESTRICT restrict
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
   #else
-    #define CYTHON_RESTRICT
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
   #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
 #endif
-#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
-
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -216,16 +725,17 @@ static CYTHON_INLINE float __PYX_NAN() {
   return value;
 }
 #endif
-
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
 #else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#define __Pyx_truncl truncl
 #endif
 
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
     #define __PYX_EXTERN_C extern "C"
@@ -236,42 +746,24 @@ static CYTHON_INLINE float __PYX_NAN() {
 
 #define __PYX_HAVE__gcoder_line
 #define __PYX_HAVE_API__gcoder_line
-#include "string.h"
-#include "stdlib.h"
-#include "stdint.h"
+/* Early includes */
+#include <string.h>
+#include <stdlib.h>
+#include <stdint.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
 
-#ifdef PYREX_WITHOUT_ASSERTIONS
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
 #define CYTHON_WITHOUT_ASSERTIONS
 #endif
 
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-#ifndef CYTHON_NCP_UNUSED
-# if CYTHON_COMPILING_IN_CPYTHON
-#  define CYTHON_NCP_UNUSED
-# else
-#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
-# endif
-#endif
-typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
                 const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
@@ -287,6 +779,9 @@ typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
     (sizeof(type) == sizeof(Py_ssize_t) &&\
           (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
                                v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
 #if defined (__cplusplus) && __cplusplus >= 201103L
     #include <cstdlib>
     #define __Pyx_sst_abs(value) std::abs(value)
@@ -294,8 +789,8 @@ typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
     #define __Pyx_sst_abs(value) abs(value)
 #elif SIZEOF_LONG >= SIZEOF_SIZE_T
     #define __Pyx_sst_abs(value) labs(value)
-#elif defined (_MSC_VER) && defined (_M_X64)
-    #define __Pyx_sst_abs(value) _abs64(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
 #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
     #define __Pyx_sst_abs(value) llabs(value)
 #elif defined (__GNUC__)
@@ -303,8 +798,8 @@ typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
 #else
     #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
 #endif
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject*);
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
 #define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
 #define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
 #define __Pyx_PyBytes_FromString        PyBytes_FromString
@@ -317,39 +812,53 @@ static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
     #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
     #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
 #endif
-#define __Pyx_PyObject_AsSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
 #define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
 #define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
 #define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
 #define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
 #define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
-#if PY_MAJOR_VERSION < 3
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
-{
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
     const Py_UNICODE *u_end = u;
     while (*u_end++) ;
     return (size_t)(u_end - u - 1);
 }
-#else
-#define __Pyx_Py_UNICODE_strlen Py_UNICODE_strlen
-#endif
 #define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
 #define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
 #define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
 #define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
 #define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False))
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
 #define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
 #endif
 #define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
 #if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
 static int __Pyx_sys_getdefaultencoding_not_ascii;
 static int __Pyx_init_sys_getdefaultencoding_params(void) {
@@ -413,7 +922,7 @@ static int __Pyx_init_sys_getdefaultencoding_params(void) {
     if (!default_encoding) goto bad;
     default_encoding_c = PyBytes_AsString(default_encoding);
     if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
     if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
     strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
     Py_DECREF(default_encoding);
@@ -434,12 +943,15 @@ bad:
   #define likely(x)   (x)
   #define unlikely(x) (x)
 #endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
 
-static PyObject *__pyx_m;
+static PyObject *__pyx_m = NULL;
 static PyObject *__pyx_d;
 static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
 static PyObject *__pyx_empty_tuple;
 static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
 static int __pyx_lineno;
 static int __pyx_clineno = 0;
 static const char * __pyx_cfilenm= __FILE__;
@@ -447,6 +959,7 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
+  "stringsource",
   "gcoder_line.pyx",
 };
 
@@ -454,7 +967,7 @@ static const char *__pyx_f[] = {
 struct __pyx_obj_11gcoder_line_GLine;
 struct __pyx_obj_11gcoder_line_GLightLine;
 
-/* "gcoder_line.pyx":28
+/* "gcoder_line.pyx":30
  *     return array
  * 
  * cdef enum BitPos:             # <<<<<<<<<<<<<<
@@ -463,7 +976,7 @@ struct __pyx_obj_11gcoder_line_GLightLine;
  */
 enum __pyx_t_11gcoder_line_BitPos {
 
-  /* "gcoder_line.pyx":46
+  /* "gcoder_line.pyx":48
  *     pos_current_z =         1 << 15
  *     pos_current_tool =      1 << 16
  *     pos_gcview_end_vertex = 1 << 17             # <<<<<<<<<<<<<<
@@ -490,7 +1003,7 @@ enum __pyx_t_11gcoder_line_BitPos {
   __pyx_e_11gcoder_line_pos_gcview_end_vertex = (1 << 17)
 };
 
-/* "gcoder_line.pyx":58
+/* "gcoder_line.pyx":60
  *     return status & ~pos
  * 
  * cdef class GLine:             # <<<<<<<<<<<<<<
@@ -516,7 +1029,7 @@ struct __pyx_obj_11gcoder_line_GLine {
 };
 
 
-/* "gcoder_line.pyx":212
+/* "gcoder_line.pyx":214
  *             self._status = set_has_var(self._status, pos_command)
  * 
  * cdef class GLightLine:             # <<<<<<<<<<<<<<
@@ -532,6 +1045,7 @@ struct __pyx_obj_11gcoder_line_GLightLine {
 
 
 /* --- Runtime support code (head) --- */
+/* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
   #define CYTHON_REFNANNY 0
 #endif
@@ -594,81 +1108,391 @@ struct __pyx_obj_11gcoder_line_GLightLine {
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* IncludeStringH.proto */
 #include <string.h>
 
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
 #else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace)\
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
     (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
 #endif
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
 
+/* WriteUnraisableException.proto */
 static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* RaiseArgTupleInvalid.proto */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
 
+/* RaiseDoubleKeywords.proto */
 static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
+/* ParseKeywords.proto */
 static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o,n,NULL)
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_setattro))
-        return tp->tp_setattro(obj, attr_name, value);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_setattr))
-        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
-#endif
-    return PyObject_SetAttr(obj, attr_name, value);
-}
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
 #else
 #define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
 #define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
 #endif
 
-typedef struct {
-    int code_line;
-    PyCodeObject* code_object;
-} __Pyx_CodeObjectCacheEntry;
-struct __Pyx_CodeObjectCache {
-    int count;
-    int max_count;
-    __Pyx_CodeObjectCacheEntry* entries;
-};
-static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
-static PyCodeObject *__pyx_find_code_object(int code_line);
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
-
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_LshiftObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_LshiftObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceLshift(op1, op2) : PyNumber_Lshift(op1, op2))
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* StrEquals.proto */
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyString_Equals __Pyx_PyUnicode_Equals
+#else
+#define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
+#endif
+
+/* DelItemInt.proto */
+#define __Pyx_DelItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_DelItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_DelItem_Generic(o, to_py_func(i))))
+static int __Pyx_DelItem_Generic(PyObject *o, PyObject *j);
+static CYTHON_INLINE int __Pyx_DelItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                               int is_list, int wraparound);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* pyobject_as_double.proto */
+static double __Pyx__PyObject_AsDouble(PyObject* obj);
+#if CYTHON_COMPILING_IN_PYPY
+#define __Pyx_PyObject_AsDouble(obj)\
+(likely(PyFloat_CheckExact(obj)) ? PyFloat_AS_DOUBLE(obj) :\
+ likely(PyInt_CheckExact(obj)) ?\
+ PyFloat_AsDouble(obj) : __Pyx__PyObject_AsDouble(obj))
+#else
+#define __Pyx_PyObject_AsDouble(obj)\
+((likely(PyFloat_CheckExact(obj))) ?\
+ PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
+#endif
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
 
+/* CIntFromPy.proto */
 static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value);
 
+/* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
+/* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
 
+/* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 
@@ -685,20 +1509,132 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *); /*proto*/
 static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_has_var(uint32_t, uint32_t); /*proto*/
 static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_set_has_var(uint32_t, uint32_t); /*proto*/
 static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_unset_has_var(uint32_t, uint32_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_11gcoder_line_is_digit(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_11gcoder_line_is_parsed_code(char); /*proto*/
 #define __Pyx_MODULE_NAME "gcoder_line"
+extern int __pyx_module_is_main_gcoder_line;
 int __pyx_module_is_main_gcoder_line = 0;
 
 /* Implementation of 'gcoder_line' */
-static char __pyx_k_raw[] = "raw";
-static char __pyx_k_line[] = "line";
-static char __pyx_k_main[] = "__main__";
-static char __pyx_k_test[] = "__test__";
-static char __pyx_k_slots[] = "__slots__";
+static PyObject *__pyx_builtin_TypeError;
+static const char __pyx_k_G[] = "G";
+static const char __pyx_k_c[] = "c";
+static const char __pyx_k_e[] = "e";
+static const char __pyx_k_f[] = "f";
+static const char __pyx_k_g[] = "g";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_j[] = "j";
+static const char __pyx_k_m[] = "m";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_s[] = "s";
+static const char __pyx_k_t[] = "t";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_y[] = "y";
+static const char __pyx_k_z[] = "z";
+static const char __pyx_k_G0[] = "G0";
+static const char __pyx_k_G1[] = "G1";
+static const char __pyx_k_G2[] = "G2";
+static const char __pyx_k_G3[] = "G3";
+static const char __pyx_k__5[] = "";
+static const char __pyx_k_bit[] = "bit";
+static const char __pyx_k_raw[] = "raw";
+static const char __pyx_k_code[] = "code";
+static const char __pyx_k_line[] = "line";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_GLine[] = "GLine";
+static const char __pyx_k_force[] = "force";
+static const char __pyx_k_gline[] = "gline";
+static const char __pyx_k_lower[] = "lower";
+static const char __pyx_k_slots[] = "__slots__";
+static const char __pyx_k_split[] = "split";
+static const char __pyx_k_start[] = "start";
+static const char __pyx_k_upper[] = "upper";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_command[] = "command";
+static const char __pyx_k_is_move[] = "is_move";
+static const char __pyx_k_logging[] = "logging";
+static const char __pyx_k_warning[] = "warning";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_imperial[] = "imperial";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_split_raw[] = "split_raw";
+static const char __pyx_k_GLightLine[] = "GLightLine";
+static const char __pyx_k_gcoder_line[] = "gcoder_line";
+static const char __pyx_k_move_gcodes[] = "move_gcodes";
+static const char __pyx_k_unit_factor[] = "unit_factor";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_parsed_nonargs[] = "parsed_nonargs";
+static const char __pyx_k_gcoder_line_pyx[] = "gcoder_line.pyx";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_parse_coordinates[] = "parse_coordinates";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static const char __pyx_k_raw_G_Code_line_s_could_not_be_p[] = "raw G-Code line \"%s\" could not be parsed";
+static PyObject *__pyx_n_s_G;
+static PyObject *__pyx_n_s_G0;
+static PyObject *__pyx_n_s_G1;
+static PyObject *__pyx_n_s_G2;
+static PyObject *__pyx_n_s_G3;
+static PyObject *__pyx_n_s_GLightLine;
+static PyObject *__pyx_n_s_GLine;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_kp_s__5;
+static PyObject *__pyx_n_s_bit;
+static PyObject *__pyx_n_s_c;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_code;
+static PyObject *__pyx_n_s_command;
+static PyObject *__pyx_n_s_e;
+static PyObject *__pyx_n_s_f;
+static PyObject *__pyx_n_s_force;
+static PyObject *__pyx_n_s_g;
+static PyObject *__pyx_n_s_gcoder_line;
+static PyObject *__pyx_kp_s_gcoder_line_pyx;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_gline;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_imperial;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_is_move;
+static PyObject *__pyx_n_s_j;
 static PyObject *__pyx_n_s_line;
+static PyObject *__pyx_n_s_logging;
+static PyObject *__pyx_n_s_lower;
+static PyObject *__pyx_n_s_m;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_move_gcodes;
+static PyObject *__pyx_n_s_n;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_s_parse_coordinates;
+static PyObject *__pyx_n_s_parsed_nonargs;
 static PyObject *__pyx_n_s_raw;
+static PyObject *__pyx_kp_s_raw_G_Code_line_s_could_not_be_p;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_s;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_slots;
+static PyObject *__pyx_n_s_split;
+static PyObject *__pyx_n_s_split_raw;
+static PyObject *__pyx_n_s_start;
+static PyObject *__pyx_n_s_t;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_unit_factor;
+static PyObject *__pyx_n_s_upper;
+static PyObject *__pyx_n_s_value;
+static PyObject *__pyx_n_s_warning;
+static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_n_s_y;
+static PyObject *__pyx_n_s_z;
 static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self); /* proto */
 static int __pyx_pf_11gcoder_line_5GLine_2__init__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self, PyObject *__pyx_v_line); /* proto */
 static void __pyx_pf_11gcoder_line_5GLine_4__dealloc__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self); /* proto */
@@ -738,6 +1674,8 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_3raw___get__(struct __pyx_obj_11g
 static int __pyx_pf_11gcoder_line_5GLine_3raw_2__set__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_11gcoder_line_5GLine_7command___get__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self); /* proto */
 static int __pyx_pf_11gcoder_line_5GLine_7command_2__set__(struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_5GLine_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_5GLine_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self); /* proto */
 static int __pyx_pf_11gcoder_line_10GLightLine_2__init__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self, PyObject *__pyx_v_line); /* proto */
 static void __pyx_pf_11gcoder_line_10GLightLine_4__dealloc__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self); /* proto */
@@ -747,13 +1685,27 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7command___get__(struct __p
 static int __pyx_pf_11gcoder_line_10GLightLine_7command_2__set__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7is_move___get__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self); /* proto */
 static int __pyx_pf_11gcoder_line_10GLightLine_7is_move_2__set__(struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_10GLightLine_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_10GLightLine_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_split(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line); /* proto */
+static PyObject *__pyx_pf_11gcoder_line_2parse_coordinates(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line, PyObject *__pyx_v_split_raw, PyObject *__pyx_v_imperial, PyObject *__pyx_v_force); /* proto */
 static PyObject *__pyx_tp_new_11gcoder_line_GLine(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_11gcoder_line_GLightLine(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_24;
-
-/* "gcoder_line.pyx":20
- * from libc.string cimport strlen, strncpy
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_codeobj__10;
+/* Late includes */
+
+/* "gcoder_line.pyx":22
+ * import logging
  * 
  * cdef char* copy_string(object value):             # <<<<<<<<<<<<<<
  *     cdef char* orig = value
@@ -775,17 +1727,17 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *__pyx_v_value) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("copy_string", 0);
 
-  /* "gcoder_line.pyx":21
+  /* "gcoder_line.pyx":23
  * 
  * cdef char* copy_string(object value):
  *     cdef char* orig = value             # <<<<<<<<<<<<<<
  *     str_len = len(orig)
  *     cdef char* array = <char *>malloc(str_len + 1)
  */
-  __pyx_t_1 = __Pyx_PyObject_AsString(__pyx_v_value); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 21; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_AsWritableString(__pyx_v_value); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(1, 23, __pyx_L1_error)
   __pyx_v_orig = __pyx_t_1;
 
-  /* "gcoder_line.pyx":22
+  /* "gcoder_line.pyx":24
  * cdef char* copy_string(object value):
  *     cdef char* orig = value
  *     str_len = len(orig)             # <<<<<<<<<<<<<<
@@ -793,45 +1745,45 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *__pyx_v_value) {
  *     strncpy(array, orig, str_len)
  */
   __pyx_t_2 = strlen(__pyx_v_orig); 
-  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_str_len = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "gcoder_line.pyx":23
+  /* "gcoder_line.pyx":25
  *     cdef char* orig = value
  *     str_len = len(orig)
  *     cdef char* array = <char *>malloc(str_len + 1)             # <<<<<<<<<<<<<<
  *     strncpy(array, orig, str_len)
  *     array[str_len] = 0;
  */
-  __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_v_str_len, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_v_str_len, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_t_3); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 23; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_t_3); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 25, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_array = ((char *)malloc(__pyx_t_2));
 
-  /* "gcoder_line.pyx":24
+  /* "gcoder_line.pyx":26
  *     str_len = len(orig)
  *     cdef char* array = <char *>malloc(str_len + 1)
  *     strncpy(array, orig, str_len)             # <<<<<<<<<<<<<<
  *     array[str_len] = 0;
  *     return array
  */
-  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_str_len); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  strncpy(__pyx_v_array, __pyx_v_orig, __pyx_t_2);
+  __pyx_t_2 = __Pyx_PyInt_As_size_t(__pyx_v_str_len); if (unlikely((__pyx_t_2 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 26, __pyx_L1_error)
+  (void)(strncpy(__pyx_v_array, __pyx_v_orig, __pyx_t_2));
 
-  /* "gcoder_line.pyx":25
+  /* "gcoder_line.pyx":27
  *     cdef char* array = <char *>malloc(str_len + 1)
  *     strncpy(array, orig, str_len)
  *     array[str_len] = 0;             # <<<<<<<<<<<<<<
  *     return array
  * 
  */
-  __pyx_t_4 = __Pyx_PyIndex_AsSsize_t(__pyx_v_str_len); if (unlikely((__pyx_t_4 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyIndex_AsSsize_t(__pyx_v_str_len); if (unlikely((__pyx_t_4 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 27, __pyx_L1_error)
   (__pyx_v_array[__pyx_t_4]) = 0;
 
-  /* "gcoder_line.pyx":26
+  /* "gcoder_line.pyx":28
  *     strncpy(array, orig, str_len)
  *     array[str_len] = 0;
  *     return array             # <<<<<<<<<<<<<<
@@ -841,8 +1793,8 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *__pyx_v_value) {
   __pyx_r = __pyx_v_array;
   goto __pyx_L0;
 
-  /* "gcoder_line.pyx":20
- * from libc.string cimport strlen, strncpy
+  /* "gcoder_line.pyx":22
+ * import logging
  * 
  * cdef char* copy_string(object value):             # <<<<<<<<<<<<<<
  *     cdef char* orig = value
@@ -852,7 +1804,7 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *__pyx_v_value) {
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("gcoder_line.copy_string", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  __Pyx_WriteUnraisable("gcoder_line.copy_string", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_str_len);
@@ -860,7 +1812,7 @@ static char *__pyx_f_11gcoder_line_copy_string(PyObject *__pyx_v_value) {
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":49
+/* "gcoder_line.pyx":51
  *     # WARNING: don't use bits 24 to 31 as we store current_tool there
  * 
  * cdef inline uint32_t has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -873,7 +1825,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_has_var(uint32_t __pyx_v_sta
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("has_var", 0);
 
-  /* "gcoder_line.pyx":50
+  /* "gcoder_line.pyx":52
  * 
  * cdef inline uint32_t has_var(uint32_t status, uint32_t pos):
  *     return status & pos             # <<<<<<<<<<<<<<
@@ -883,7 +1835,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_has_var(uint32_t __pyx_v_sta
   __pyx_r = (__pyx_v_status & __pyx_v_pos);
   goto __pyx_L0;
 
-  /* "gcoder_line.pyx":49
+  /* "gcoder_line.pyx":51
  *     # WARNING: don't use bits 24 to 31 as we store current_tool there
  * 
  * cdef inline uint32_t has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -897,7 +1849,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_has_var(uint32_t __pyx_v_sta
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":52
+/* "gcoder_line.pyx":54
  *     return status & pos
  * 
  * cdef inline uint32_t set_has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -910,7 +1862,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_set_has_var(uint32_t __pyx_v
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("set_has_var", 0);
 
-  /* "gcoder_line.pyx":53
+  /* "gcoder_line.pyx":55
  * 
  * cdef inline uint32_t set_has_var(uint32_t status, uint32_t pos):
  *     return status | pos             # <<<<<<<<<<<<<<
@@ -920,7 +1872,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_set_has_var(uint32_t __pyx_v
   __pyx_r = (__pyx_v_status | __pyx_v_pos);
   goto __pyx_L0;
 
-  /* "gcoder_line.pyx":52
+  /* "gcoder_line.pyx":54
  *     return status & pos
  * 
  * cdef inline uint32_t set_has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -934,7 +1886,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_set_has_var(uint32_t __pyx_v
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":55
+/* "gcoder_line.pyx":57
  *     return status | pos
  * 
  * cdef inline uint32_t unset_has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -947,7 +1899,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_unset_has_var(uint32_t __pyx
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("unset_has_var", 0);
 
-  /* "gcoder_line.pyx":56
+  /* "gcoder_line.pyx":58
  * 
  * cdef inline uint32_t unset_has_var(uint32_t status, uint32_t pos):
  *     return status & ~pos             # <<<<<<<<<<<<<<
@@ -957,7 +1909,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_unset_has_var(uint32_t __pyx
   __pyx_r = (__pyx_v_status & (~__pyx_v_pos));
   goto __pyx_L0;
 
-  /* "gcoder_line.pyx":55
+  /* "gcoder_line.pyx":57
  *     return status | pos
  * 
  * cdef inline uint32_t unset_has_var(uint32_t status, uint32_t pos):             # <<<<<<<<<<<<<<
@@ -971,7 +1923,7 @@ static CYTHON_INLINE uint32_t __pyx_f_11gcoder_line_unset_has_var(uint32_t __pyx
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":69
+/* "gcoder_line.pyx":71
  *     __slots__ = ()
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1000,7 +1952,7 @@ static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_lin
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "gcoder_line.pyx":70
+  /* "gcoder_line.pyx":72
  * 
  *     def __cinit__(self):
  *         self._status = 0             # <<<<<<<<<<<<<<
@@ -1009,7 +1961,7 @@ static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_lin
  */
   __pyx_v_self->_status = 0;
 
-  /* "gcoder_line.pyx":71
+  /* "gcoder_line.pyx":73
  *     def __cinit__(self):
  *         self._status = 0
  *         self._raw = NULL             # <<<<<<<<<<<<<<
@@ -1018,7 +1970,7 @@ static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_lin
  */
   __pyx_v_self->_raw = NULL;
 
-  /* "gcoder_line.pyx":72
+  /* "gcoder_line.pyx":74
  *         self._status = 0
  *         self._raw = NULL
  *         self._command = NULL             # <<<<<<<<<<<<<<
@@ -1027,7 +1979,7 @@ static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_lin
  */
   __pyx_v_self->_command = NULL;
 
-  /* "gcoder_line.pyx":69
+  /* "gcoder_line.pyx":71
  *     __slots__ = ()
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1041,7 +1993,7 @@ static int __pyx_pf_11gcoder_line_5GLine___cinit__(struct __pyx_obj_11gcoder_lin
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":74
+/* "gcoder_line.pyx":76
  *         self._command = NULL
  * 
  *     def __init__(self, line):             # <<<<<<<<<<<<<<
@@ -1067,17 +2019,18 @@ static int __pyx_pw_11gcoder_line_5GLine_3__init__(PyObject *__pyx_v_self, PyObj
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 76, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -1088,7 +2041,7 @@ static int __pyx_pw_11gcoder_line_5GLine_3__init__(PyObject *__pyx_v_self, PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 76, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gcoder_line.GLine.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1109,16 +2062,16 @@ static int __pyx_pf_11gcoder_line_5GLine_2__init__(struct __pyx_obj_11gcoder_lin
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "gcoder_line.pyx":75
+  /* "gcoder_line.pyx":77
  * 
  *     def __init__(self, line):
  *         self.raw = line             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_raw, __pyx_v_line) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_raw, __pyx_v_line) < 0) __PYX_ERR(1, 77, __pyx_L1_error)
 
-  /* "gcoder_line.pyx":74
+  /* "gcoder_line.pyx":76
  *         self._command = NULL
  * 
  *     def __init__(self, line):             # <<<<<<<<<<<<<<
@@ -1137,7 +2090,7 @@ static int __pyx_pf_11gcoder_line_5GLine_2__init__(struct __pyx_obj_11gcoder_lin
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":77
+/* "gcoder_line.pyx":79
  *         self.raw = line
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1161,7 +2114,7 @@ static void __pyx_pf_11gcoder_line_5GLine_4__dealloc__(struct __pyx_obj_11gcoder
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "gcoder_line.pyx":78
+  /* "gcoder_line.pyx":80
  * 
  *     def __dealloc__(self):
  *         if self._raw != NULL: free(self._raw)             # <<<<<<<<<<<<<<
@@ -1173,7 +2126,7 @@ static void __pyx_pf_11gcoder_line_5GLine_4__dealloc__(struct __pyx_obj_11gcoder
     free(__pyx_v_self->_raw);
   }
 
-  /* "gcoder_line.pyx":79
+  /* "gcoder_line.pyx":81
  *     def __dealloc__(self):
  *         if self._raw != NULL: free(self._raw)
  *         if self._command != NULL: free(self._command)             # <<<<<<<<<<<<<<
@@ -1185,7 +2138,7 @@ static void __pyx_pf_11gcoder_line_5GLine_4__dealloc__(struct __pyx_obj_11gcoder
     free(__pyx_v_self->_command);
   }
 
-  /* "gcoder_line.pyx":77
+  /* "gcoder_line.pyx":79
  *         self.raw = line
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -1197,7 +2150,7 @@ static void __pyx_pf_11gcoder_line_5GLine_4__dealloc__(struct __pyx_obj_11gcoder
   __Pyx_RefNannyFinishContext();
 }
 
-/* "gcoder_line.pyx":82
+/* "gcoder_line.pyx":84
  * 
  *     property x:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1228,7 +2181,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1x___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":83
+  /* "gcoder_line.pyx":85
  *     property x:
  *         def __get__(self):
  *             if has_var(self._status, pos_x): return self._x             # <<<<<<<<<<<<<<
@@ -1238,14 +2191,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1x___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_x) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_x); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 85, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":84
+  /* "gcoder_line.pyx":86
  *         def __get__(self):
  *             if has_var(self._status, pos_x): return self._x
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1254,12 +2207,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1x___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":82
+  /* "gcoder_line.pyx":84
  * 
  *     property x:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1278,7 +2230,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1x___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":85
+/* "gcoder_line.pyx":87
  *             if has_var(self._status, pos_x): return self._x
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1308,17 +2260,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1x_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":86
+  /* "gcoder_line.pyx":88
  *             else: return None
  *         def __set__(self, value):
  *             self._x = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_x)
  *     property y:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 88, __pyx_L1_error)
   __pyx_v_self->_x = __pyx_t_1;
 
-  /* "gcoder_line.pyx":87
+  /* "gcoder_line.pyx":89
  *         def __set__(self, value):
  *             self._x = value
  *             self._status = set_has_var(self._status, pos_x)             # <<<<<<<<<<<<<<
@@ -1327,7 +2279,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1x_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_x);
 
-  /* "gcoder_line.pyx":85
+  /* "gcoder_line.pyx":87
  *             if has_var(self._status, pos_x): return self._x
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1346,7 +2298,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1x_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":89
+/* "gcoder_line.pyx":91
  *             self._status = set_has_var(self._status, pos_x)
  *     property y:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1377,7 +2329,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1y___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":90
+  /* "gcoder_line.pyx":92
  *     property y:
  *         def __get__(self):
  *             if has_var(self._status, pos_y): return self._y             # <<<<<<<<<<<<<<
@@ -1387,14 +2339,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1y___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_y) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_y); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_y); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 92, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":91
+  /* "gcoder_line.pyx":93
  *         def __get__(self):
  *             if has_var(self._status, pos_y): return self._y
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1403,12 +2355,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1y___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":89
+  /* "gcoder_line.pyx":91
  *             self._status = set_has_var(self._status, pos_x)
  *     property y:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1427,7 +2378,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1y___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":92
+/* "gcoder_line.pyx":94
  *             if has_var(self._status, pos_y): return self._y
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1457,17 +2408,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1y_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":93
+  /* "gcoder_line.pyx":95
  *             else: return None
  *         def __set__(self, value):
  *             self._y = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_y)
  *     property z:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 95, __pyx_L1_error)
   __pyx_v_self->_y = __pyx_t_1;
 
-  /* "gcoder_line.pyx":94
+  /* "gcoder_line.pyx":96
  *         def __set__(self, value):
  *             self._y = value
  *             self._status = set_has_var(self._status, pos_y)             # <<<<<<<<<<<<<<
@@ -1476,7 +2427,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1y_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_y);
 
-  /* "gcoder_line.pyx":92
+  /* "gcoder_line.pyx":94
  *             if has_var(self._status, pos_y): return self._y
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1495,7 +2446,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1y_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":96
+/* "gcoder_line.pyx":98
  *             self._status = set_has_var(self._status, pos_y)
  *     property z:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1526,7 +2477,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1z___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":97
+  /* "gcoder_line.pyx":99
  *     property z:
  *         def __get__(self):
  *             if has_var(self._status, pos_z): return self._z             # <<<<<<<<<<<<<<
@@ -1536,14 +2487,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1z___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_z) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_z); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_z); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 99, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":98
+  /* "gcoder_line.pyx":100
  *         def __get__(self):
  *             if has_var(self._status, pos_z): return self._z
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1552,12 +2503,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1z___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":96
+  /* "gcoder_line.pyx":98
  *             self._status = set_has_var(self._status, pos_y)
  *     property z:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1576,7 +2526,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1z___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":99
+/* "gcoder_line.pyx":101
  *             if has_var(self._status, pos_z): return self._z
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1606,17 +2556,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1z_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":100
+  /* "gcoder_line.pyx":102
  *             else: return None
  *         def __set__(self, value):
  *             self._z = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_z)
  *     property e:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 102, __pyx_L1_error)
   __pyx_v_self->_z = __pyx_t_1;
 
-  /* "gcoder_line.pyx":101
+  /* "gcoder_line.pyx":103
  *         def __set__(self, value):
  *             self._z = value
  *             self._status = set_has_var(self._status, pos_z)             # <<<<<<<<<<<<<<
@@ -1625,7 +2575,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1z_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_z);
 
-  /* "gcoder_line.pyx":99
+  /* "gcoder_line.pyx":101
  *             if has_var(self._status, pos_z): return self._z
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1644,7 +2594,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1z_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":103
+/* "gcoder_line.pyx":105
  *             self._status = set_has_var(self._status, pos_z)
  *     property e:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1675,7 +2625,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1e___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":104
+  /* "gcoder_line.pyx":106
  *     property e:
  *         def __get__(self):
  *             if has_var(self._status, pos_e): return self._e             # <<<<<<<<<<<<<<
@@ -1685,14 +2635,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1e___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_e) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_e); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_e); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 106, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":105
+  /* "gcoder_line.pyx":107
  *         def __get__(self):
  *             if has_var(self._status, pos_e): return self._e
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1701,12 +2651,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1e___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":103
+  /* "gcoder_line.pyx":105
  *             self._status = set_has_var(self._status, pos_z)
  *     property e:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1725,7 +2674,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1e___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":106
+/* "gcoder_line.pyx":108
  *             if has_var(self._status, pos_e): return self._e
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1755,17 +2704,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1e_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":107
+  /* "gcoder_line.pyx":109
  *             else: return None
  *         def __set__(self, value):
  *             self._e = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_e)
  *     property f:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 109, __pyx_L1_error)
   __pyx_v_self->_e = __pyx_t_1;
 
-  /* "gcoder_line.pyx":108
+  /* "gcoder_line.pyx":110
  *         def __set__(self, value):
  *             self._e = value
  *             self._status = set_has_var(self._status, pos_e)             # <<<<<<<<<<<<<<
@@ -1774,7 +2723,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1e_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_e);
 
-  /* "gcoder_line.pyx":106
+  /* "gcoder_line.pyx":108
  *             if has_var(self._status, pos_e): return self._e
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1793,7 +2742,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1e_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":110
+/* "gcoder_line.pyx":112
  *             self._status = set_has_var(self._status, pos_e)
  *     property f:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1824,7 +2773,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1f___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":111
+  /* "gcoder_line.pyx":113
  *     property f:
  *         def __get__(self):
  *             if has_var(self._status, pos_f): return self._f             # <<<<<<<<<<<<<<
@@ -1834,14 +2783,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1f___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_f) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_f); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_f); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 113, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":112
+  /* "gcoder_line.pyx":114
  *         def __get__(self):
  *             if has_var(self._status, pos_f): return self._f
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1850,12 +2799,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1f___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":110
+  /* "gcoder_line.pyx":112
  *             self._status = set_has_var(self._status, pos_e)
  *     property f:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1874,7 +2822,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1f___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":113
+/* "gcoder_line.pyx":115
  *             if has_var(self._status, pos_f): return self._f
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1904,17 +2852,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1f_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":114
+  /* "gcoder_line.pyx":116
  *             else: return None
  *         def __set__(self, value):
  *             self._f = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_f)
  *     property i:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 116, __pyx_L1_error)
   __pyx_v_self->_f = __pyx_t_1;
 
-  /* "gcoder_line.pyx":115
+  /* "gcoder_line.pyx":117
  *         def __set__(self, value):
  *             self._f = value
  *             self._status = set_has_var(self._status, pos_f)             # <<<<<<<<<<<<<<
@@ -1923,7 +2871,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1f_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_f);
 
-  /* "gcoder_line.pyx":113
+  /* "gcoder_line.pyx":115
  *             if has_var(self._status, pos_f): return self._f
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -1942,7 +2890,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1f_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":117
+/* "gcoder_line.pyx":119
  *             self._status = set_has_var(self._status, pos_f)
  *     property i:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -1973,7 +2921,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1i___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":118
+  /* "gcoder_line.pyx":120
  *     property i:
  *         def __get__(self):
  *             if has_var(self._status, pos_i): return self._i             # <<<<<<<<<<<<<<
@@ -1983,14 +2931,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1i___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_i) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_i); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 120, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":119
+  /* "gcoder_line.pyx":121
  *         def __get__(self):
  *             if has_var(self._status, pos_i): return self._i
  *             else: return None             # <<<<<<<<<<<<<<
@@ -1999,12 +2947,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1i___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":117
+  /* "gcoder_line.pyx":119
  *             self._status = set_has_var(self._status, pos_f)
  *     property i:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2023,7 +2970,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1i___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":120
+/* "gcoder_line.pyx":122
  *             if has_var(self._status, pos_i): return self._i
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2053,17 +3000,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1i_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":121
+  /* "gcoder_line.pyx":123
  *             else: return None
  *         def __set__(self, value):
  *             self._i = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_i)
  *     property j:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 123, __pyx_L1_error)
   __pyx_v_self->_i = __pyx_t_1;
 
-  /* "gcoder_line.pyx":122
+  /* "gcoder_line.pyx":124
  *         def __set__(self, value):
  *             self._i = value
  *             self._status = set_has_var(self._status, pos_i)             # <<<<<<<<<<<<<<
@@ -2072,7 +3019,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1i_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_i);
 
-  /* "gcoder_line.pyx":120
+  /* "gcoder_line.pyx":122
  *             if has_var(self._status, pos_i): return self._i
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2091,7 +3038,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1i_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":124
+/* "gcoder_line.pyx":126
  *             self._status = set_has_var(self._status, pos_i)
  *     property j:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2122,7 +3069,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1j___get__(struct __pyx_obj_11gco
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":125
+  /* "gcoder_line.pyx":127
  *     property j:
  *         def __get__(self):
  *             if has_var(self._status, pos_j): return self._j             # <<<<<<<<<<<<<<
@@ -2132,14 +3079,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1j___get__(struct __pyx_obj_11gco
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_j) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_j); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 127, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":126
+  /* "gcoder_line.pyx":128
  *         def __get__(self):
  *             if has_var(self._status, pos_j): return self._j
  *             else: return None             # <<<<<<<<<<<<<<
@@ -2148,12 +3095,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1j___get__(struct __pyx_obj_11gco
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":124
+  /* "gcoder_line.pyx":126
  *             self._status = set_has_var(self._status, pos_i)
  *     property j:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2172,7 +3118,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_1j___get__(struct __pyx_obj_11gco
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":127
+/* "gcoder_line.pyx":129
  *             if has_var(self._status, pos_j): return self._j
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2202,17 +3148,17 @@ static int __pyx_pf_11gcoder_line_5GLine_1j_2__set__(struct __pyx_obj_11gcoder_l
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":128
+  /* "gcoder_line.pyx":130
  *             else: return None
  *         def __set__(self, value):
  *             self._j = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_j)
  *     property is_move:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 130, __pyx_L1_error)
   __pyx_v_self->_j = __pyx_t_1;
 
-  /* "gcoder_line.pyx":129
+  /* "gcoder_line.pyx":131
  *         def __set__(self, value):
  *             self._j = value
  *             self._status = set_has_var(self._status, pos_j)             # <<<<<<<<<<<<<<
@@ -2221,7 +3167,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1j_2__set__(struct __pyx_obj_11gcoder_l
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_j);
 
-  /* "gcoder_line.pyx":127
+  /* "gcoder_line.pyx":129
  *             if has_var(self._status, pos_j): return self._j
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2240,7 +3186,7 @@ static int __pyx_pf_11gcoder_line_5GLine_1j_2__set__(struct __pyx_obj_11gcoder_l
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":131
+/* "gcoder_line.pyx":133
  *             self._status = set_has_var(self._status, pos_j)
  *     property is_move:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2267,7 +3213,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7is_move___get__(struct __pyx_obj
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":132
+  /* "gcoder_line.pyx":134
  *     property is_move:
  *         def __get__(self):
  *             if has_var(self._status, pos_is_move): return True             # <<<<<<<<<<<<<<
@@ -2282,7 +3228,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7is_move___get__(struct __pyx_obj
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":133
+  /* "gcoder_line.pyx":135
  *         def __get__(self):
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False             # <<<<<<<<<<<<<<
@@ -2296,7 +3242,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7is_move___get__(struct __pyx_obj
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":131
+  /* "gcoder_line.pyx":133
  *             self._status = set_has_var(self._status, pos_j)
  *     property is_move:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2311,7 +3257,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7is_move___get__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":134
+/* "gcoder_line.pyx":136
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2341,20 +3287,20 @@ static int __pyx_pf_11gcoder_line_5GLine_7is_move_2__set__(struct __pyx_obj_11gc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":135
+  /* "gcoder_line.pyx":137
  *             else: return False
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_is_move)             # <<<<<<<<<<<<<<
  *             else: self._status = unset_has_var(self._status, pos_is_move)
  *     property relative:
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 137, __pyx_L1_error)
   if (__pyx_t_1) {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_is_move);
     goto __pyx_L3;
   }
 
-  /* "gcoder_line.pyx":136
+  /* "gcoder_line.pyx":138
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_is_move)
  *             else: self._status = unset_has_var(self._status, pos_is_move)             # <<<<<<<<<<<<<<
@@ -2366,7 +3312,7 @@ static int __pyx_pf_11gcoder_line_5GLine_7is_move_2__set__(struct __pyx_obj_11gc
   }
   __pyx_L3:;
 
-  /* "gcoder_line.pyx":134
+  /* "gcoder_line.pyx":136
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2385,7 +3331,7 @@ static int __pyx_pf_11gcoder_line_5GLine_7is_move_2__set__(struct __pyx_obj_11gc
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":138
+/* "gcoder_line.pyx":140
  *             else: self._status = unset_has_var(self._status, pos_is_move)
  *     property relative:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2412,7 +3358,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_8relative___get__(struct __pyx_ob
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":139
+  /* "gcoder_line.pyx":141
  *     property relative:
  *         def __get__(self):
  *             if has_var(self._status, pos_relative): return True             # <<<<<<<<<<<<<<
@@ -2427,7 +3373,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_8relative___get__(struct __pyx_ob
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":140
+  /* "gcoder_line.pyx":142
  *         def __get__(self):
  *             if has_var(self._status, pos_relative): return True
  *             else: return False             # <<<<<<<<<<<<<<
@@ -2441,7 +3387,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_8relative___get__(struct __pyx_ob
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":138
+  /* "gcoder_line.pyx":140
  *             else: self._status = unset_has_var(self._status, pos_is_move)
  *     property relative:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2456,7 +3402,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_8relative___get__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":141
+/* "gcoder_line.pyx":143
  *             if has_var(self._status, pos_relative): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2486,20 +3432,20 @@ static int __pyx_pf_11gcoder_line_5GLine_8relative_2__set__(struct __pyx_obj_11g
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":142
+  /* "gcoder_line.pyx":144
  *             else: return False
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_relative)             # <<<<<<<<<<<<<<
  *             else: self._status = unset_has_var(self._status, pos_relative)
  *     property relative_e:
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 144, __pyx_L1_error)
   if (__pyx_t_1) {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_relative);
     goto __pyx_L3;
   }
 
-  /* "gcoder_line.pyx":143
+  /* "gcoder_line.pyx":145
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_relative)
  *             else: self._status = unset_has_var(self._status, pos_relative)             # <<<<<<<<<<<<<<
@@ -2511,7 +3457,7 @@ static int __pyx_pf_11gcoder_line_5GLine_8relative_2__set__(struct __pyx_obj_11g
   }
   __pyx_L3:;
 
-  /* "gcoder_line.pyx":141
+  /* "gcoder_line.pyx":143
  *             if has_var(self._status, pos_relative): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2530,7 +3476,7 @@ static int __pyx_pf_11gcoder_line_5GLine_8relative_2__set__(struct __pyx_obj_11g
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":145
+/* "gcoder_line.pyx":147
  *             else: self._status = unset_has_var(self._status, pos_relative)
  *     property relative_e:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2557,7 +3503,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_10relative_e___get__(struct __pyx
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":146
+  /* "gcoder_line.pyx":148
  *     property relative_e:
  *         def __get__(self):
  *             if has_var(self._status, pos_relative_e): return True             # <<<<<<<<<<<<<<
@@ -2572,7 +3518,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_10relative_e___get__(struct __pyx
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":147
+  /* "gcoder_line.pyx":149
  *         def __get__(self):
  *             if has_var(self._status, pos_relative_e): return True
  *             else: return False             # <<<<<<<<<<<<<<
@@ -2586,7 +3532,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_10relative_e___get__(struct __pyx
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":145
+  /* "gcoder_line.pyx":147
  *             else: self._status = unset_has_var(self._status, pos_relative)
  *     property relative_e:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2601,7 +3547,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_10relative_e___get__(struct __pyx
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":148
+/* "gcoder_line.pyx":150
  *             if has_var(self._status, pos_relative_e): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2631,20 +3577,20 @@ static int __pyx_pf_11gcoder_line_5GLine_10relative_e_2__set__(struct __pyx_obj_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":149
+  /* "gcoder_line.pyx":151
  *             else: return False
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_relative_e)             # <<<<<<<<<<<<<<
  *             else: self._status = unset_has_var(self._status, pos_relative_e)
  *     property extruding:
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 151, __pyx_L1_error)
   if (__pyx_t_1) {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_relative_e);
     goto __pyx_L3;
   }
 
-  /* "gcoder_line.pyx":150
+  /* "gcoder_line.pyx":152
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_relative_e)
  *             else: self._status = unset_has_var(self._status, pos_relative_e)             # <<<<<<<<<<<<<<
@@ -2656,7 +3602,7 @@ static int __pyx_pf_11gcoder_line_5GLine_10relative_e_2__set__(struct __pyx_obj_
   }
   __pyx_L3:;
 
-  /* "gcoder_line.pyx":148
+  /* "gcoder_line.pyx":150
  *             if has_var(self._status, pos_relative_e): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2675,7 +3621,7 @@ static int __pyx_pf_11gcoder_line_5GLine_10relative_e_2__set__(struct __pyx_obj_
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":152
+/* "gcoder_line.pyx":154
  *             else: self._status = unset_has_var(self._status, pos_relative_e)
  *     property extruding:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2702,7 +3648,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9extruding___get__(struct __pyx_o
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":153
+  /* "gcoder_line.pyx":155
  *     property extruding:
  *         def __get__(self):
  *             if has_var(self._status, pos_extruding): return True             # <<<<<<<<<<<<<<
@@ -2717,7 +3663,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9extruding___get__(struct __pyx_o
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":154
+  /* "gcoder_line.pyx":156
  *         def __get__(self):
  *             if has_var(self._status, pos_extruding): return True
  *             else: return False             # <<<<<<<<<<<<<<
@@ -2731,7 +3677,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9extruding___get__(struct __pyx_o
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":152
+  /* "gcoder_line.pyx":154
  *             else: self._status = unset_has_var(self._status, pos_relative_e)
  *     property extruding:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2746,7 +3692,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9extruding___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":155
+/* "gcoder_line.pyx":157
  *             if has_var(self._status, pos_extruding): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2776,20 +3722,20 @@ static int __pyx_pf_11gcoder_line_5GLine_9extruding_2__set__(struct __pyx_obj_11
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":156
+  /* "gcoder_line.pyx":158
  *             else: return False
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_extruding)             # <<<<<<<<<<<<<<
  *             else: self._status = unset_has_var(self._status, pos_extruding)
  *     property current_x:
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 158, __pyx_L1_error)
   if (__pyx_t_1) {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_extruding);
     goto __pyx_L3;
   }
 
-  /* "gcoder_line.pyx":157
+  /* "gcoder_line.pyx":159
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_extruding)
  *             else: self._status = unset_has_var(self._status, pos_extruding)             # <<<<<<<<<<<<<<
@@ -2801,7 +3747,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9extruding_2__set__(struct __pyx_obj_11
   }
   __pyx_L3:;
 
-  /* "gcoder_line.pyx":155
+  /* "gcoder_line.pyx":157
  *             if has_var(self._status, pos_extruding): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2820,7 +3766,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9extruding_2__set__(struct __pyx_obj_11
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":159
+/* "gcoder_line.pyx":161
  *             else: self._status = unset_has_var(self._status, pos_extruding)
  *     property current_x:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2851,7 +3797,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_x___get__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":160
+  /* "gcoder_line.pyx":162
  *     property current_x:
  *         def __get__(self):
  *             if has_var(self._status, pos_current_x): return self._current_x             # <<<<<<<<<<<<<<
@@ -2861,14 +3807,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_x___get__(struct __pyx_o
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_x) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_x); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 162, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":161
+  /* "gcoder_line.pyx":163
  *         def __get__(self):
  *             if has_var(self._status, pos_current_x): return self._current_x
  *             else: return None             # <<<<<<<<<<<<<<
@@ -2877,12 +3823,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_x___get__(struct __pyx_o
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":159
+  /* "gcoder_line.pyx":161
  *             else: self._status = unset_has_var(self._status, pos_extruding)
  *     property current_x:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -2901,7 +3846,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_x___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":162
+/* "gcoder_line.pyx":164
  *             if has_var(self._status, pos_current_x): return self._current_x
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2931,17 +3876,17 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_x_2__set__(struct __pyx_obj_11
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":163
+  /* "gcoder_line.pyx":165
  *             else: return None
  *         def __set__(self, value):
  *             self._current_x = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_current_x)
  *     property current_y:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 165, __pyx_L1_error)
   __pyx_v_self->_current_x = __pyx_t_1;
 
-  /* "gcoder_line.pyx":164
+  /* "gcoder_line.pyx":166
  *         def __set__(self, value):
  *             self._current_x = value
  *             self._status = set_has_var(self._status, pos_current_x)             # <<<<<<<<<<<<<<
@@ -2950,7 +3895,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_x_2__set__(struct __pyx_obj_11
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_x);
 
-  /* "gcoder_line.pyx":162
+  /* "gcoder_line.pyx":164
  *             if has_var(self._status, pos_current_x): return self._current_x
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -2969,7 +3914,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_x_2__set__(struct __pyx_obj_11
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":166
+/* "gcoder_line.pyx":168
  *             self._status = set_has_var(self._status, pos_current_x)
  *     property current_y:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3000,7 +3945,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_y___get__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":167
+  /* "gcoder_line.pyx":169
  *     property current_y:
  *         def __get__(self):
  *             if has_var(self._status, pos_current_y): return self._current_y             # <<<<<<<<<<<<<<
@@ -3010,14 +3955,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_y___get__(struct __pyx_o
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_y) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_y); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_y); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 169, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":168
+  /* "gcoder_line.pyx":170
  *         def __get__(self):
  *             if has_var(self._status, pos_current_y): return self._current_y
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3026,12 +3971,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_y___get__(struct __pyx_o
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":166
+  /* "gcoder_line.pyx":168
  *             self._status = set_has_var(self._status, pos_current_x)
  *     property current_y:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3050,7 +3994,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_y___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":169
+/* "gcoder_line.pyx":171
  *             if has_var(self._status, pos_current_y): return self._current_y
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3080,17 +4024,17 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_y_2__set__(struct __pyx_obj_11
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":170
+  /* "gcoder_line.pyx":172
  *             else: return None
  *         def __set__(self, value):
  *             self._current_y = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_current_y)
  *     property current_z:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 172, __pyx_L1_error)
   __pyx_v_self->_current_y = __pyx_t_1;
 
-  /* "gcoder_line.pyx":171
+  /* "gcoder_line.pyx":173
  *         def __set__(self, value):
  *             self._current_y = value
  *             self._status = set_has_var(self._status, pos_current_y)             # <<<<<<<<<<<<<<
@@ -3099,7 +4043,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_y_2__set__(struct __pyx_obj_11
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_y);
 
-  /* "gcoder_line.pyx":169
+  /* "gcoder_line.pyx":171
  *             if has_var(self._status, pos_current_y): return self._current_y
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3118,7 +4062,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_y_2__set__(struct __pyx_obj_11
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":173
+/* "gcoder_line.pyx":175
  *             self._status = set_has_var(self._status, pos_current_y)
  *     property current_z:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3149,7 +4093,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_z___get__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":174
+  /* "gcoder_line.pyx":176
  *     property current_z:
  *         def __get__(self):
  *             if has_var(self._status, pos_current_z): return self._current_z             # <<<<<<<<<<<<<<
@@ -3159,14 +4103,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_z___get__(struct __pyx_o
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_z) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_z); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->_current_z); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 176, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":175
+  /* "gcoder_line.pyx":177
  *         def __get__(self):
  *             if has_var(self._status, pos_current_z): return self._current_z
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3175,12 +4119,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_z___get__(struct __pyx_o
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":173
+  /* "gcoder_line.pyx":175
  *             self._status = set_has_var(self._status, pos_current_y)
  *     property current_z:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3199,7 +4142,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_9current_z___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":176
+/* "gcoder_line.pyx":178
  *             if has_var(self._status, pos_current_z): return self._current_z
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3229,17 +4172,17 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_z_2__set__(struct __pyx_obj_11
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":177
+  /* "gcoder_line.pyx":179
  *             else: return None
  *         def __set__(self, value):
  *             self._current_z = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_current_z)
  *     property current_tool:
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_value); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 179, __pyx_L1_error)
   __pyx_v_self->_current_z = __pyx_t_1;
 
-  /* "gcoder_line.pyx":178
+  /* "gcoder_line.pyx":180
  *         def __set__(self, value):
  *             self._current_z = value
  *             self._status = set_has_var(self._status, pos_current_z)             # <<<<<<<<<<<<<<
@@ -3248,7 +4191,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_z_2__set__(struct __pyx_obj_11
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_z);
 
-  /* "gcoder_line.pyx":176
+  /* "gcoder_line.pyx":178
  *             if has_var(self._status, pos_current_z): return self._current_z
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3267,7 +4210,7 @@ static int __pyx_pf_11gcoder_line_5GLine_9current_z_2__set__(struct __pyx_obj_11
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":180
+/* "gcoder_line.pyx":182
  *             self._status = set_has_var(self._status, pos_current_z)
  *     property current_tool:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3298,7 +4241,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_12current_tool___get__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":181
+  /* "gcoder_line.pyx":183
  *     property current_tool:
  *         def __get__(self):
  *             if has_var(self._status, pos_current_tool): return self._status >> 24             # <<<<<<<<<<<<<<
@@ -3308,14 +4251,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_12current_tool___get__(struct __p
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_tool) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_self->_status >> 24)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyInt_From_long((__pyx_v_self->_status >> 24)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 183, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":182
+  /* "gcoder_line.pyx":184
  *         def __get__(self):
  *             if has_var(self._status, pos_current_tool): return self._status >> 24
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3324,12 +4267,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_12current_tool___get__(struct __p
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":180
+  /* "gcoder_line.pyx":182
  *             self._status = set_has_var(self._status, pos_current_z)
  *     property current_tool:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3348,7 +4290,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_12current_tool___get__(struct __p
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":183
+/* "gcoder_line.pyx":185
  *             if has_var(self._status, pos_current_tool): return self._status >> 24
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3381,26 +4323,26 @@ static int __pyx_pf_11gcoder_line_5GLine_12current_tool_2__set__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":184
+  /* "gcoder_line.pyx":186
  *             else: return None
  *         def __set__(self, value):
  *             self._status = (self._status & ((1 << 24) - 1)) | (value << 24)             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_current_tool)
  *     property gcview_end_vertex:
  */
-  __pyx_t_1 = __Pyx_PyInt_From_long((__pyx_v_self->_status & 0xFFFFFF)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_From_long((__pyx_v_self->_status & 0xFFFFFF)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_Lshift(__pyx_v_value, __pyx_int_24); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_LshiftObjC(__pyx_v_value, __pyx_int_24, 24, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Or(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyNumber_Or(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = __Pyx_PyInt_As_uint32_t(__pyx_t_3); if (unlikely((__pyx_t_4 == (uint32_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_As_uint32_t(__pyx_t_3); if (unlikely((__pyx_t_4 == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(1, 186, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_self->_status = __pyx_t_4;
 
-  /* "gcoder_line.pyx":185
+  /* "gcoder_line.pyx":187
  *         def __set__(self, value):
  *             self._status = (self._status & ((1 << 24) - 1)) | (value << 24)
  *             self._status = set_has_var(self._status, pos_current_tool)             # <<<<<<<<<<<<<<
@@ -3409,7 +4351,7 @@ static int __pyx_pf_11gcoder_line_5GLine_12current_tool_2__set__(struct __pyx_ob
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_current_tool);
 
-  /* "gcoder_line.pyx":183
+  /* "gcoder_line.pyx":185
  *             if has_var(self._status, pos_current_tool): return self._status >> 24
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3431,7 +4373,7 @@ static int __pyx_pf_11gcoder_line_5GLine_12current_tool_2__set__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":187
+/* "gcoder_line.pyx":189
  *             self._status = set_has_var(self._status, pos_current_tool)
  *     property gcview_end_vertex:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3462,7 +4404,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex___get__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":188
+  /* "gcoder_line.pyx":190
  *     property gcview_end_vertex:
  *         def __get__(self):
  *             if has_var(self._status, pos_gcview_end_vertex): return self._gcview_end_vertex             # <<<<<<<<<<<<<<
@@ -3472,14 +4414,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex___get__(struc
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_gcview_end_vertex) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyInt_From_uint32_t(__pyx_v_self->_gcview_end_vertex); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyInt_From_uint32_t(__pyx_v_self->_gcview_end_vertex); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 190, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":189
+  /* "gcoder_line.pyx":191
  *         def __get__(self):
  *             if has_var(self._status, pos_gcview_end_vertex): return self._gcview_end_vertex
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3488,12 +4430,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex___get__(struc
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":187
+  /* "gcoder_line.pyx":189
  *             self._status = set_has_var(self._status, pos_current_tool)
  *     property gcview_end_vertex:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3512,7 +4453,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex___get__(struc
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":190
+/* "gcoder_line.pyx":192
  *             if has_var(self._status, pos_gcview_end_vertex): return self._gcview_end_vertex
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3542,17 +4483,17 @@ static int __pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex_2__set__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":191
+  /* "gcoder_line.pyx":193
  *             else: return None
  *         def __set__(self, value):
  *             self._gcview_end_vertex = value             # <<<<<<<<<<<<<<
  *             self._status = set_has_var(self._status, pos_gcview_end_vertex)
  *     property raw:
  */
-  __pyx_t_1 = __Pyx_PyInt_As_uint32_t(__pyx_v_value); if (unlikely((__pyx_t_1 == (uint32_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyInt_As_uint32_t(__pyx_v_value); if (unlikely((__pyx_t_1 == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(1, 193, __pyx_L1_error)
   __pyx_v_self->_gcview_end_vertex = __pyx_t_1;
 
-  /* "gcoder_line.pyx":192
+  /* "gcoder_line.pyx":194
  *         def __set__(self, value):
  *             self._gcview_end_vertex = value
  *             self._status = set_has_var(self._status, pos_gcview_end_vertex)             # <<<<<<<<<<<<<<
@@ -3561,7 +4502,7 @@ static int __pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex_2__set__(struct __p
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_gcview_end_vertex);
 
-  /* "gcoder_line.pyx":190
+  /* "gcoder_line.pyx":192
  *             if has_var(self._status, pos_gcview_end_vertex): return self._gcview_end_vertex
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3580,7 +4521,7 @@ static int __pyx_pf_11gcoder_line_5GLine_17gcview_end_vertex_2__set__(struct __p
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":194
+/* "gcoder_line.pyx":196
  *             self._status = set_has_var(self._status, pos_gcview_end_vertex)
  *     property raw:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3611,7 +4552,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_3raw___get__(struct __pyx_obj_11g
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":195
+  /* "gcoder_line.pyx":197
  *     property raw:
  *         def __get__(self):
  *             if has_var(self._status, pos_raw): return self._raw             # <<<<<<<<<<<<<<
@@ -3621,14 +4562,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_3raw___get__(struct __pyx_obj_11g
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_raw) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_raw); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_raw); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 197, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":196
+  /* "gcoder_line.pyx":198
  *         def __get__(self):
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3637,12 +4578,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_3raw___get__(struct __pyx_obj_11g
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":194
+  /* "gcoder_line.pyx":196
  *             self._status = set_has_var(self._status, pos_gcview_end_vertex)
  *     property raw:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3661,7 +4601,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_3raw___get__(struct __pyx_obj_11g
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":197
+/* "gcoder_line.pyx":199
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3687,7 +4627,7 @@ static int __pyx_pf_11gcoder_line_5GLine_3raw_2__set__(struct __pyx_obj_11gcoder
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":200
+  /* "gcoder_line.pyx":202
  *             # WARNING: memory leak could happen here, as we don't do the following :
  *             # if self._raw != NULL: free(self._raw)
  *             self._raw = copy_string(value)             # <<<<<<<<<<<<<<
@@ -3696,7 +4636,7 @@ static int __pyx_pf_11gcoder_line_5GLine_3raw_2__set__(struct __pyx_obj_11gcoder
  */
   __pyx_v_self->_raw = __pyx_f_11gcoder_line_copy_string(__pyx_v_value);
 
-  /* "gcoder_line.pyx":201
+  /* "gcoder_line.pyx":203
  *             # if self._raw != NULL: free(self._raw)
  *             self._raw = copy_string(value)
  *             self._status = set_has_var(self._status, pos_raw)             # <<<<<<<<<<<<<<
@@ -3705,7 +4645,7 @@ static int __pyx_pf_11gcoder_line_5GLine_3raw_2__set__(struct __pyx_obj_11gcoder
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_raw);
 
-  /* "gcoder_line.pyx":197
+  /* "gcoder_line.pyx":199
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3719,7 +4659,7 @@ static int __pyx_pf_11gcoder_line_5GLine_3raw_2__set__(struct __pyx_obj_11gcoder
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":203
+/* "gcoder_line.pyx":205
  *             self._status = set_has_var(self._status, pos_raw)
  *     property command:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3750,7 +4690,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7command___get__(struct __pyx_obj
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":204
+  /* "gcoder_line.pyx":206
  *     property command:
  *         def __get__(self):
  *             if has_var(self._status, pos_command): return self._command             # <<<<<<<<<<<<<<
@@ -3760,14 +4700,14 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7command___get__(struct __pyx_obj
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_command) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_command); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_command); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 206, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":205
+  /* "gcoder_line.pyx":207
  *         def __get__(self):
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None             # <<<<<<<<<<<<<<
@@ -3776,12 +4716,11 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7command___get__(struct __pyx_obj
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":203
+  /* "gcoder_line.pyx":205
  *             self._status = set_has_var(self._status, pos_raw)
  *     property command:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -3800,7 +4739,7 @@ static PyObject *__pyx_pf_11gcoder_line_5GLine_7command___get__(struct __pyx_obj
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":206
+/* "gcoder_line.pyx":208
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3826,7 +4765,7 @@ static int __pyx_pf_11gcoder_line_5GLine_7command_2__set__(struct __pyx_obj_11gc
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":209
+  /* "gcoder_line.pyx":211
  *             # WARNING: memory leak could happen here, as we don't do the following :
  *             # if self._command != NULL: free(self._command)
  *             self._command = copy_string(value)             # <<<<<<<<<<<<<<
@@ -3835,7 +4774,7 @@ static int __pyx_pf_11gcoder_line_5GLine_7command_2__set__(struct __pyx_obj_11gc
  */
   __pyx_v_self->_command = __pyx_f_11gcoder_line_copy_string(__pyx_v_value);
 
-  /* "gcoder_line.pyx":210
+  /* "gcoder_line.pyx":212
  *             # if self._command != NULL: free(self._command)
  *             self._command = copy_string(value)
  *             self._status = set_has_var(self._status, pos_command)             # <<<<<<<<<<<<<<
@@ -3844,7 +4783,7 @@ static int __pyx_pf_11gcoder_line_5GLine_7command_2__set__(struct __pyx_obj_11gc
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_command);
 
-  /* "gcoder_line.pyx":206
+  /* "gcoder_line.pyx":208
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -3858,7 +4797,120 @@ static int __pyx_pf_11gcoder_line_5GLine_7command_2__set__(struct __pyx_obj_11gc
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":220
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_5GLine_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_11gcoder_line_5GLine_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_11gcoder_line_5GLine_6__reduce_cython__(((struct __pyx_obj_11gcoder_line_GLine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11gcoder_line_5GLine_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gcoder_line.GLine.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_5GLine_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_11gcoder_line_5GLine_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_11gcoder_line_5GLine_8__setstate_cython__(((struct __pyx_obj_11gcoder_line_GLine *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11gcoder_line_5GLine_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gcoder_line.GLine.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcoder_line.pyx":222
  *     __slots__ = ()
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -3887,7 +4939,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcod
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "gcoder_line.pyx":221
+  /* "gcoder_line.pyx":223
  * 
  *     def __cinit__(self):
  *         self._status = 0             # <<<<<<<<<<<<<<
@@ -3896,7 +4948,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcod
  */
   __pyx_v_self->_status = 0;
 
-  /* "gcoder_line.pyx":222
+  /* "gcoder_line.pyx":224
  *     def __cinit__(self):
  *         self._status = 0
  *         self._raw = NULL             # <<<<<<<<<<<<<<
@@ -3905,7 +4957,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcod
  */
   __pyx_v_self->_raw = NULL;
 
-  /* "gcoder_line.pyx":223
+  /* "gcoder_line.pyx":225
  *         self._status = 0
  *         self._raw = NULL
  *         self._command = NULL             # <<<<<<<<<<<<<<
@@ -3914,7 +4966,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcod
  */
   __pyx_v_self->_command = NULL;
 
-  /* "gcoder_line.pyx":220
+  /* "gcoder_line.pyx":222
  *     __slots__ = ()
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -3928,7 +4980,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine___cinit__(struct __pyx_obj_11gcod
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":225
+/* "gcoder_line.pyx":227
  *         self._command = NULL
  * 
  *     def __init__(self, line):             # <<<<<<<<<<<<<<
@@ -3954,17 +5006,18 @@ static int __pyx_pw_11gcoder_line_10GLightLine_3__init__(PyObject *__pyx_v_self,
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(1, 227, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -3975,7 +5028,7 @@ static int __pyx_pw_11gcoder_line_10GLightLine_3__init__(PyObject *__pyx_v_self,
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 227, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("gcoder_line.GLightLine.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3996,16 +5049,16 @@ static int __pyx_pf_11gcoder_line_10GLightLine_2__init__(struct __pyx_obj_11gcod
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "gcoder_line.pyx":226
+  /* "gcoder_line.pyx":228
  * 
  *     def __init__(self, line):
  *         self.raw = line             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_raw, __pyx_v_line) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_raw, __pyx_v_line) < 0) __PYX_ERR(1, 228, __pyx_L1_error)
 
-  /* "gcoder_line.pyx":225
+  /* "gcoder_line.pyx":227
  *         self._command = NULL
  * 
  *     def __init__(self, line):             # <<<<<<<<<<<<<<
@@ -4024,7 +5077,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_2__init__(struct __pyx_obj_11gcod
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":228
+/* "gcoder_line.pyx":230
  *         self.raw = line
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -4048,7 +5101,7 @@ static void __pyx_pf_11gcoder_line_10GLightLine_4__dealloc__(struct __pyx_obj_11
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "gcoder_line.pyx":229
+  /* "gcoder_line.pyx":231
  * 
  *     def __dealloc__(self):
  *         if self._raw != NULL: free(self._raw)             # <<<<<<<<<<<<<<
@@ -4060,7 +5113,7 @@ static void __pyx_pf_11gcoder_line_10GLightLine_4__dealloc__(struct __pyx_obj_11
     free(__pyx_v_self->_raw);
   }
 
-  /* "gcoder_line.pyx":230
+  /* "gcoder_line.pyx":232
  *     def __dealloc__(self):
  *         if self._raw != NULL: free(self._raw)
  *         if self._command != NULL: free(self._command)             # <<<<<<<<<<<<<<
@@ -4072,7 +5125,7 @@ static void __pyx_pf_11gcoder_line_10GLightLine_4__dealloc__(struct __pyx_obj_11
     free(__pyx_v_self->_command);
   }
 
-  /* "gcoder_line.pyx":228
+  /* "gcoder_line.pyx":230
  *         self.raw = line
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -4084,7 +5137,7 @@ static void __pyx_pf_11gcoder_line_10GLightLine_4__dealloc__(struct __pyx_obj_11
   __Pyx_RefNannyFinishContext();
 }
 
-/* "gcoder_line.pyx":233
+/* "gcoder_line.pyx":235
  * 
  *     property raw:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4115,7 +5168,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_3raw___get__(struct __pyx_o
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":234
+  /* "gcoder_line.pyx":236
  *     property raw:
  *         def __get__(self):
  *             if has_var(self._status, pos_raw): return self._raw             # <<<<<<<<<<<<<<
@@ -4125,14 +5178,14 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_3raw___get__(struct __pyx_o
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_raw) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_raw); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_raw); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 236, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":235
+  /* "gcoder_line.pyx":237
  *         def __get__(self):
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None             # <<<<<<<<<<<<<<
@@ -4141,12 +5194,11 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_3raw___get__(struct __pyx_o
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":233
+  /* "gcoder_line.pyx":235
  * 
  *     property raw:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4165,7 +5217,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_3raw___get__(struct __pyx_o
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":236
+/* "gcoder_line.pyx":238
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4191,7 +5243,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_3raw_2__set__(struct __pyx_obj_11
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":239
+  /* "gcoder_line.pyx":241
  *             # WARNING: memory leak could happen here, as we don't do the following :
  *             # if self._raw != NULL: free(self._raw)
  *             self._raw = copy_string(value)             # <<<<<<<<<<<<<<
@@ -4200,7 +5252,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_3raw_2__set__(struct __pyx_obj_11
  */
   __pyx_v_self->_raw = __pyx_f_11gcoder_line_copy_string(__pyx_v_value);
 
-  /* "gcoder_line.pyx":240
+  /* "gcoder_line.pyx":242
  *             # if self._raw != NULL: free(self._raw)
  *             self._raw = copy_string(value)
  *             self._status = set_has_var(self._status, pos_raw)             # <<<<<<<<<<<<<<
@@ -4209,7 +5261,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_3raw_2__set__(struct __pyx_obj_11
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_raw);
 
-  /* "gcoder_line.pyx":236
+  /* "gcoder_line.pyx":238
  *             if has_var(self._status, pos_raw): return self._raw
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4223,7 +5275,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_3raw_2__set__(struct __pyx_obj_11
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":242
+/* "gcoder_line.pyx":244
  *             self._status = set_has_var(self._status, pos_raw)
  *     property command:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4254,7 +5306,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7command___get__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":243
+  /* "gcoder_line.pyx":245
  *     property command:
  *         def __get__(self):
  *             if has_var(self._status, pos_command): return self._command             # <<<<<<<<<<<<<<
@@ -4264,14 +5316,14 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7command___get__(struct __p
   __pyx_t_1 = (__pyx_f_11gcoder_line_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_command) != 0);
   if (__pyx_t_1) {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_command); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_self->_command); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 245, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":244
+  /* "gcoder_line.pyx":246
  *         def __get__(self):
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None             # <<<<<<<<<<<<<<
@@ -4280,12 +5332,11 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7command___get__(struct __p
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(Py_None);
-    __pyx_r = Py_None;
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":242
+  /* "gcoder_line.pyx":244
  *             self._status = set_has_var(self._status, pos_raw)
  *     property command:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4304,7 +5355,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7command___get__(struct __p
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":245
+/* "gcoder_line.pyx":247
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4330,7 +5381,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7command_2__set__(struct __pyx_ob
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":248
+  /* "gcoder_line.pyx":250
  *             # WARNING: memory leak could happen here, as we don't do the following :
  *             # if self._command != NULL: free(self._command)
  *             self._command = copy_string(value)             # <<<<<<<<<<<<<<
@@ -4339,7 +5390,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7command_2__set__(struct __pyx_ob
  */
   __pyx_v_self->_command = __pyx_f_11gcoder_line_copy_string(__pyx_v_value);
 
-  /* "gcoder_line.pyx":249
+  /* "gcoder_line.pyx":251
  *             # if self._command != NULL: free(self._command)
  *             self._command = copy_string(value)
  *             self._status = set_has_var(self._status, pos_command)             # <<<<<<<<<<<<<<
@@ -4348,7 +5399,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7command_2__set__(struct __pyx_ob
  */
   __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_command);
 
-  /* "gcoder_line.pyx":245
+  /* "gcoder_line.pyx":247
  *             if has_var(self._status, pos_command): return self._command
  *             else: return None
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4362,7 +5413,7 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7command_2__set__(struct __pyx_ob
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":251
+/* "gcoder_line.pyx":253
  *             self._status = set_has_var(self._status, pos_command)
  *     property is_move:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4389,7 +5440,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7is_move___get__(struct __p
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "gcoder_line.pyx":252
+  /* "gcoder_line.pyx":254
  *     property is_move:
  *         def __get__(self):
  *             if has_var(self._status, pos_is_move): return True             # <<<<<<<<<<<<<<
@@ -4404,7 +5455,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7is_move___get__(struct __p
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":253
+  /* "gcoder_line.pyx":255
  *         def __get__(self):
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False             # <<<<<<<<<<<<<<
@@ -4418,7 +5469,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7is_move___get__(struct __p
     goto __pyx_L0;
   }
 
-  /* "gcoder_line.pyx":251
+  /* "gcoder_line.pyx":253
  *             self._status = set_has_var(self._status, pos_command)
  *     property is_move:
  *         def __get__(self):             # <<<<<<<<<<<<<<
@@ -4433,7 +5484,7 @@ static PyObject *__pyx_pf_11gcoder_line_10GLightLine_7is_move___get__(struct __p
   return __pyx_r;
 }
 
-/* "gcoder_line.pyx":254
+/* "gcoder_line.pyx":256
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4463,29 +5514,32 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7is_move_2__set__(struct __pyx_ob
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
 
-  /* "gcoder_line.pyx":255
+  /* "gcoder_line.pyx":257
  *             else: return False
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_is_move)             # <<<<<<<<<<<<<<
  *             else: self._status = unset_has_var(self._status, pos_is_move)
+ * 
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 257, __pyx_L1_error)
   if (__pyx_t_1) {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_is_move);
     goto __pyx_L3;
   }
 
-  /* "gcoder_line.pyx":256
+  /* "gcoder_line.pyx":258
  *         def __set__(self, value):
  *             if value: self._status = set_has_var(self._status, pos_is_move)
  *             else: self._status = unset_has_var(self._status, pos_is_move)             # <<<<<<<<<<<<<<
+ * 
+ * # Compiled versions of printrun.gcoder split and parse_coordinates, they
  */
   /*else*/ {
     __pyx_v_self->_status = __pyx_f_11gcoder_line_unset_has_var(__pyx_v_self->_status, __pyx_e_11gcoder_line_pos_is_move);
   }
   __pyx_L3:;
 
-  /* "gcoder_line.pyx":254
+  /* "gcoder_line.pyx":256
  *             if has_var(self._status, pos_is_move): return True
  *             else: return False
  *         def __set__(self, value):             # <<<<<<<<<<<<<<
@@ -4504,759 +5558,3564 @@ static int __pyx_pf_11gcoder_line_10GLightLine_7is_move_2__set__(struct __pyx_ob
   return __pyx_r;
 }
 
-static PyObject *__pyx_tp_new_11gcoder_line_GLine(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  if (unlikely(__pyx_pw_11gcoder_line_5GLine_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
 
-static void __pyx_tp_dealloc_11gcoder_line_GLine(PyObject *o) {
-  #if PY_VERSION_HEX >= 0x030400a1
-  if (unlikely(Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pw_11gcoder_line_5GLine_5__dealloc__(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  (*Py_TYPE(o)->tp_free)(o);
-}
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_10GLightLine_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_11gcoder_line_10GLightLine_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_11gcoder_line_10GLightLine_6__reduce_cython__(((struct __pyx_obj_11gcoder_line_GLightLine *)__pyx_v_self));
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_x(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1x_1__get__(o);
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_setprop_11gcoder_line_5GLine_x(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1x_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+static PyObject *__pyx_pf_11gcoder_line_10GLightLine_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_y(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1y_1__get__(o);
-}
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 2, __pyx_L1_error)
 
-static int __pyx_setprop_11gcoder_line_5GLine_y(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1y_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_z(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1z_1__get__(o);
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gcoder_line.GLightLine.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_setprop_11gcoder_line_5GLine_z(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1z_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_e(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1e_1__get__(o);
-}
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_10GLightLine_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_11gcoder_line_10GLightLine_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_11gcoder_line_10GLightLine_8__setstate_cython__(((struct __pyx_obj_11gcoder_line_GLightLine *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
-static int __pyx_setprop_11gcoder_line_5GLine_e(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1e_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_f(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1f_1__get__(o);
-}
+static PyObject *__pyx_pf_11gcoder_line_10GLightLine_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11gcoder_line_GLightLine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
-static int __pyx_setprop_11gcoder_line_5GLine_f(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1f_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(0, 4, __pyx_L1_error)
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_i(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1i_1__get__(o);
-}
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_i(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1i_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("gcoder_line.GLightLine.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_j(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_1j_1__get__(o);
-}
+/* "gcoder_line.pyx":266
+ * move_gcodes = ["G0", "G1", "G2", "G3"]
+ * 
+ * cdef inline bint is_digit(char c):             # <<<<<<<<<<<<<<
+ *     return c >= b'0' and c <= b'9'
+ * 
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_j(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_1j_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+static CYTHON_INLINE int __pyx_f_11gcoder_line_is_digit(char __pyx_v_c) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("is_digit", 0);
+
+  /* "gcoder_line.pyx":267
+ * 
+ * cdef inline bint is_digit(char c):
+ *     return c >= b'0' and c <= b'9'             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_parsed_code(char c):
+ */
+  __pyx_t_2 = ((__pyx_v_c >= '0') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
   }
-}
+  __pyx_t_2 = ((__pyx_v_c <= '9') != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_is_move(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_7is_move_1__get__(o);
-}
+  /* "gcoder_line.pyx":266
+ * move_gcodes = ["G0", "G1", "G2", "G3"]
+ * 
+ * cdef inline bint is_digit(char c):             # <<<<<<<<<<<<<<
+ *     return c >= b'0' and c <= b'9'
+ * 
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_is_move(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_7is_move_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_relative(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_8relative_1__get__(o);
-}
+/* "gcoder_line.pyx":269
+ *     return c >= b'0' and c <= b'9'
+ * 
+ * cdef inline bint is_parsed_code(char c):             # <<<<<<<<<<<<<<
+ *     return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_relative(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_8relative_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+static CYTHON_INLINE int __pyx_f_11gcoder_line_is_parsed_code(char __pyx_v_c) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("is_parsed_code", 0);
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_relative_e(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_10relative_e_1__get__(o);
-}
+  /* "gcoder_line.pyx":270
+ * 
+ * cdef inline bint is_parsed_code(char c):
+ *     return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or             # <<<<<<<<<<<<<<
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ */
+  switch (__pyx_v_c) {
+    case 'x':
+    case 'y':
+    case 'z':
+    case 'e':
+    case 'f':
+    case 'i':
+
+    /* "gcoder_line.pyx":271
+ * cdef inline bint is_parsed_code(char c):
+ *     return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')             # <<<<<<<<<<<<<<
+ * 
+ * def split(line):
+ */
+    case 'j':
+    case 'g':
+    case 't':
+    case 'm':
+    case 'n':
 
-static int __pyx_setprop_11gcoder_line_5GLine_relative_e(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_10relative_e_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+    /* "gcoder_line.pyx":270
+ * 
+ * cdef inline bint is_parsed_code(char c):
+ *     return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or             # <<<<<<<<<<<<<<
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ */
+    __pyx_t_1 = 1;
+    break;
+    default:
+    __pyx_t_1 = 0;
+    break;
   }
-}
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_extruding(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_9extruding_1__get__(o);
-}
+  /* "gcoder_line.pyx":269
+ *     return c >= b'0' and c <= b'9'
+ * 
+ * cdef inline bint is_parsed_code(char c):             # <<<<<<<<<<<<<<
+ *     return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_extruding(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_9extruding_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_x(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_9current_x_1__get__(o);
-}
+/* "gcoder_line.pyx":273
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ * def split(line):             # <<<<<<<<<<<<<<
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw
+ */
 
-static int __pyx_setprop_11gcoder_line_5GLine_current_x(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_9current_x_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_1split(PyObject *__pyx_self, PyObject *__pyx_v_line); /*proto*/
+static PyMethodDef __pyx_mdef_11gcoder_line_1split = {"split", (PyCFunction)__pyx_pw_11gcoder_line_1split, METH_O, 0};
+static PyObject *__pyx_pw_11gcoder_line_1split(PyObject *__pyx_self, PyObject *__pyx_v_line) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("split (wrapper)", 0);
+  __pyx_r = __pyx_pf_11gcoder_line_split(__pyx_self, ((PyObject *)__pyx_v_line));
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_y(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_9current_y_1__get__(o);
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_setprop_11gcoder_line_5GLine_current_y(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_9current_y_3__set__(o, v);
+static PyObject *__pyx_pf_11gcoder_line_split(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line) {
+  PyObject *__pyx_v_raw = 0;
+  char *__pyx_v_s;
+  Py_ssize_t __pyx_v_n;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_start;
+  char __pyx_v_c;
+  PyObject *__pyx_v_split_raw = 0;
+  PyObject *__pyx_v_command = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  char *__pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("split", 0);
+
+  /* "gcoder_line.pyx":274
+ * 
+ * def split(line):
+ *     cdef bytes raw = line.raw.lower()             # <<<<<<<<<<<<<<
+ *     cdef char* s = raw
+ *     cdef Py_ssize_t n = len(raw)
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_raw); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_lower); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
   }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 274, __pyx_L1_error)
+  __pyx_v_raw = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":275
+ * def split(line):
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t n = len(raw)
+ *     cdef Py_ssize_t i = 0, j, start
+ */
+  if (unlikely(__pyx_v_raw == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(1, 275, __pyx_L1_error)
   }
-}
+  __pyx_t_4 = __Pyx_PyBytes_AsWritableString(__pyx_v_raw); if (unlikely((!__pyx_t_4) && PyErr_Occurred())) __PYX_ERR(1, 275, __pyx_L1_error)
+  __pyx_v_s = __pyx_t_4;
+
+  /* "gcoder_line.pyx":276
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw
+ *     cdef Py_ssize_t n = len(raw)             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = 0, j, start
+ *     cdef char c
+ */
+  if (unlikely(__pyx_v_raw == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 276, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyBytes_GET_SIZE(__pyx_v_raw); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 276, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_5;
+
+  /* "gcoder_line.pyx":277
+ *     cdef char* s = raw
+ *     cdef Py_ssize_t n = len(raw)
+ *     cdef Py_ssize_t i = 0, j, start             # <<<<<<<<<<<<<<
+ *     cdef char c
+ *     cdef list split_raw = []
+ */
+  __pyx_v_i = 0;
+
+  /* "gcoder_line.pyx":279
+ *     cdef Py_ssize_t i = 0, j, start
+ *     cdef char c
+ *     cdef list split_raw = []             # <<<<<<<<<<<<<<
+ * 
+ *     while i < n:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_split_raw = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_z(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_9current_z_1__get__(o);
-}
+  /* "gcoder_line.pyx":281
+ *     cdef list split_raw = []
+ * 
+ *     while i < n:             # <<<<<<<<<<<<<<
+ *         c = s[i]
+ *         if c == b'(':
+ */
+  while (1) {
+    __pyx_t_6 = ((__pyx_v_i < __pyx_v_n) != 0);
+    if (!__pyx_t_6) break;
 
-static int __pyx_setprop_11gcoder_line_5GLine_current_z(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_9current_z_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+    /* "gcoder_line.pyx":282
+ * 
+ *     while i < n:
+ *         c = s[i]             # <<<<<<<<<<<<<<
+ *         if c == b'(':
+ *             # Comment in parenthesis, without nested parenthesis
+ */
+    __pyx_v_c = (__pyx_v_s[__pyx_v_i]);
+
+    /* "gcoder_line.pyx":283
+ *     while i < n:
+ *         c = s[i]
+ *         if c == b'(':             # <<<<<<<<<<<<<<
+ *             # Comment in parenthesis, without nested parenthesis
+ *             j = i + 1
+ */
+    __pyx_t_6 = ((__pyx_v_c == '(') != 0);
+    if (__pyx_t_6) {
+
+      /* "gcoder_line.pyx":285
+ *         if c == b'(':
+ *             # Comment in parenthesis, without nested parenthesis
+ *             j = i + 1             # <<<<<<<<<<<<<<
+ *             while j < n and s[j] != b'(' and s[j] != b')':
+ *                 j += 1
+ */
+      __pyx_v_j = (__pyx_v_i + 1);
+
+      /* "gcoder_line.pyx":286
+ *             # Comment in parenthesis, without nested parenthesis
+ *             j = i + 1
+ *             while j < n and s[j] != b'(' and s[j] != b')':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             if j < n and s[j] == b')':
+ */
+      while (1) {
+        __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L8_bool_binop_done;
+        }
+        __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) != '(') != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L8_bool_binop_done;
+        }
+        __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) != ')') != 0);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_L8_bool_binop_done:;
+        if (!__pyx_t_6) break;
+
+        /* "gcoder_line.pyx":287
+ *             j = i + 1
+ *             while j < n and s[j] != b'(' and s[j] != b')':
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             if j < n and s[j] == b')':
+ *                 split_raw.append(('', ''))
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_tool(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_12current_tool_1__get__(o);
-}
+      /* "gcoder_line.pyx":288
+ *             while j < n and s[j] != b'(' and s[j] != b')':
+ *                 j += 1
+ *             if j < n and s[j] == b')':             # <<<<<<<<<<<<<<
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ */
+      __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_6 = __pyx_t_7;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) == ')') != 0);
+      __pyx_t_6 = __pyx_t_7;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_6) {
+
+        /* "gcoder_line.pyx":289
+ *                 j += 1
+ *             if j < n and s[j] == b')':
+ *                 split_raw.append(('', ''))             # <<<<<<<<<<<<<<
+ *                 i = j + 1
+ *                 continue
+ */
+        __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_split_raw, __pyx_tuple__6); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(1, 289, __pyx_L1_error)
+
+        /* "gcoder_line.pyx":290
+ *             if j < n and s[j] == b')':
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1             # <<<<<<<<<<<<<<
+ *                 continue
+ *         elif c == b';':
+ */
+        __pyx_v_i = (__pyx_v_j + 1);
+
+        /* "gcoder_line.pyx":291
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ *                 continue             # <<<<<<<<<<<<<<
+ *         elif c == b';':
+ *             # Comment up to the end of the line
+ */
+        goto __pyx_L3_continue;
+
+        /* "gcoder_line.pyx":288
+ *             while j < n and s[j] != b'(' and s[j] != b')':
+ *                 j += 1
+ *             if j < n and s[j] == b')':             # <<<<<<<<<<<<<<
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ */
+      }
 
-static int __pyx_setprop_11gcoder_line_5GLine_current_tool(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_12current_tool_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+      /* "gcoder_line.pyx":283
+ *     while i < n:
+ *         c = s[i]
+ *         if c == b'(':             # <<<<<<<<<<<<<<
+ *             # Comment in parenthesis, without nested parenthesis
+ *             j = i + 1
+ */
+      goto __pyx_L5;
+    }
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_gcview_end_vertex(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_17gcview_end_vertex_1__get__(o);
-}
+    /* "gcoder_line.pyx":292
+ *                 i = j + 1
+ *                 continue
+ *         elif c == b';':             # <<<<<<<<<<<<<<
+ *             # Comment up to the end of the line
+ *             j = i + 1
+ */
+    __pyx_t_6 = ((__pyx_v_c == ';') != 0);
+    if (__pyx_t_6) {
+
+      /* "gcoder_line.pyx":294
+ *         elif c == b';':
+ *             # Comment up to the end of the line
+ *             j = i + 1             # <<<<<<<<<<<<<<
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1
+ */
+      __pyx_v_j = (__pyx_v_i + 1);
+
+      /* "gcoder_line.pyx":295
+ *             # Comment up to the end of the line
+ *             j = i + 1
+ *             while j < n and s[j] != b'\n':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             split_raw.append(('', ''))
+ */
+      while (1) {
+        __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L16_bool_binop_done;
+        }
+        __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) != '\n') != 0);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_L16_bool_binop_done:;
+        if (!__pyx_t_6) break;
+
+        /* "gcoder_line.pyx":296
+ *             j = i + 1
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             split_raw.append(('', ''))
+ *             i = j
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
 
-static int __pyx_setprop_11gcoder_line_5GLine_gcview_end_vertex(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_17gcview_end_vertex_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+      /* "gcoder_line.pyx":297
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1
+ *             split_raw.append(('', ''))             # <<<<<<<<<<<<<<
+ *             i = j
+ *             continue
+ */
+      __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_split_raw, __pyx_tuple__6); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(1, 297, __pyx_L1_error)
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_raw(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_3raw_1__get__(o);
-}
+      /* "gcoder_line.pyx":298
+ *                 j += 1
+ *             split_raw.append(('', ''))
+ *             i = j             # <<<<<<<<<<<<<<
+ *             continue
+ *         elif c == b'/' or c == b'*':
+ */
+      __pyx_v_i = __pyx_v_j;
 
-static int __pyx_setprop_11gcoder_line_5GLine_raw(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_3raw_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+      /* "gcoder_line.pyx":299
+ *             split_raw.append(('', ''))
+ *             i = j
+ *             continue             # <<<<<<<<<<<<<<
+ *         elif c == b'/' or c == b'*':
+ *             # Block delete or checksum, up to a newline
+ */
+      goto __pyx_L3_continue;
 
-static PyObject *__pyx_getprop_11gcoder_line_5GLine_command(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_5GLine_7command_1__get__(o);
-}
+      /* "gcoder_line.pyx":292
+ *                 i = j + 1
+ *                 continue
+ *         elif c == b';':             # <<<<<<<<<<<<<<
+ *             # Comment up to the end of the line
+ *             j = i + 1
+ */
+    }
 
-static int __pyx_setprop_11gcoder_line_5GLine_command(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_5GLine_7command_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
-  }
-}
+    /* "gcoder_line.pyx":300
+ *             i = j
+ *             continue
+ *         elif c == b'/' or c == b'*':             # <<<<<<<<<<<<<<
+ *             # Block delete or checksum, up to a newline
+ *             j = i + 1
+ */
+    switch (__pyx_v_c) {
+      case '/':
+      case '*':
+      __pyx_t_6 = 1;
+      break;
+      default:
+      __pyx_t_6 = 0;
+      break;
+    }
+    if (__pyx_t_6) {
+
+      /* "gcoder_line.pyx":302
+ *         elif c == b'/' or c == b'*':
+ *             # Block delete or checksum, up to a newline
+ *             j = i + 1             # <<<<<<<<<<<<<<
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1
+ */
+      __pyx_v_j = (__pyx_v_i + 1);
+
+      /* "gcoder_line.pyx":303
+ *             # Block delete or checksum, up to a newline
+ *             j = i + 1
+ *             while j < n and s[j] != b'\n':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             if j < n:
+ */
+      while (1) {
+        __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L20_bool_binop_done;
+        }
+        __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) != '\n') != 0);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_L20_bool_binop_done:;
+        if (!__pyx_t_6) break;
+
+        /* "gcoder_line.pyx":304
+ *             j = i + 1
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             if j < n:
+ *                 split_raw.append(('', ''))
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
 
-static PyMethodDef __pyx_methods_11gcoder_line_GLine[] = {
-  {0, 0, 0, 0}
-};
+      /* "gcoder_line.pyx":305
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1
+ *             if j < n:             # <<<<<<<<<<<<<<
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ */
+      __pyx_t_6 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_6) {
+
+        /* "gcoder_line.pyx":306
+ *                 j += 1
+ *             if j < n:
+ *                 split_raw.append(('', ''))             # <<<<<<<<<<<<<<
+ *                 i = j + 1
+ *                 continue
+ */
+        __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_split_raw, __pyx_tuple__6); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(1, 306, __pyx_L1_error)
+
+        /* "gcoder_line.pyx":307
+ *             if j < n:
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1             # <<<<<<<<<<<<<<
+ *                 continue
+ *         elif is_parsed_code(c):
+ */
+        __pyx_v_i = (__pyx_v_j + 1);
+
+        /* "gcoder_line.pyx":308
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ *                 continue             # <<<<<<<<<<<<<<
+ *         elif is_parsed_code(c):
+ *             # Code followed by an optional number
+ */
+        goto __pyx_L3_continue;
+
+        /* "gcoder_line.pyx":305
+ *             while j < n and s[j] != b'\n':
+ *                 j += 1
+ *             if j < n:             # <<<<<<<<<<<<<<
+ *                 split_raw.append(('', ''))
+ *                 i = j + 1
+ */
+      }
 
-static struct PyGetSetDef __pyx_getsets_11gcoder_line_GLine[] = {
-  {(char *)"x", __pyx_getprop_11gcoder_line_5GLine_x, __pyx_setprop_11gcoder_line_5GLine_x, 0, 0},
-  {(char *)"y", __pyx_getprop_11gcoder_line_5GLine_y, __pyx_setprop_11gcoder_line_5GLine_y, 0, 0},
-  {(char *)"z", __pyx_getprop_11gcoder_line_5GLine_z, __pyx_setprop_11gcoder_line_5GLine_z, 0, 0},
-  {(char *)"e", __pyx_getprop_11gcoder_line_5GLine_e, __pyx_setprop_11gcoder_line_5GLine_e, 0, 0},
-  {(char *)"f", __pyx_getprop_11gcoder_line_5GLine_f, __pyx_setprop_11gcoder_line_5GLine_f, 0, 0},
-  {(char *)"i", __pyx_getprop_11gcoder_line_5GLine_i, __pyx_setprop_11gcoder_line_5GLine_i, 0, 0},
-  {(char *)"j", __pyx_getprop_11gcoder_line_5GLine_j, __pyx_setprop_11gcoder_line_5GLine_j, 0, 0},
-  {(char *)"is_move", __pyx_getprop_11gcoder_line_5GLine_is_move, __pyx_setprop_11gcoder_line_5GLine_is_move, 0, 0},
-  {(char *)"relative", __pyx_getprop_11gcoder_line_5GLine_relative, __pyx_setprop_11gcoder_line_5GLine_relative, 0, 0},
-  {(char *)"relative_e", __pyx_getprop_11gcoder_line_5GLine_relative_e, __pyx_setprop_11gcoder_line_5GLine_relative_e, 0, 0},
-  {(char *)"extruding", __pyx_getprop_11gcoder_line_5GLine_extruding, __pyx_setprop_11gcoder_line_5GLine_extruding, 0, 0},
-  {(char *)"current_x", __pyx_getprop_11gcoder_line_5GLine_current_x, __pyx_setprop_11gcoder_line_5GLine_current_x, 0, 0},
-  {(char *)"current_y", __pyx_getprop_11gcoder_line_5GLine_current_y, __pyx_setprop_11gcoder_line_5GLine_current_y, 0, 0},
-  {(char *)"current_z", __pyx_getprop_11gcoder_line_5GLine_current_z, __pyx_setprop_11gcoder_line_5GLine_current_z, 0, 0},
-  {(char *)"current_tool", __pyx_getprop_11gcoder_line_5GLine_current_tool, __pyx_setprop_11gcoder_line_5GLine_current_tool, 0, 0},
-  {(char *)"gcview_end_vertex", __pyx_getprop_11gcoder_line_5GLine_gcview_end_vertex, __pyx_setprop_11gcoder_line_5GLine_gcview_end_vertex, 0, 0},
-  {(char *)"raw", __pyx_getprop_11gcoder_line_5GLine_raw, __pyx_setprop_11gcoder_line_5GLine_raw, 0, 0},
-  {(char *)"command", __pyx_getprop_11gcoder_line_5GLine_command, __pyx_setprop_11gcoder_line_5GLine_command, 0, 0},
-  {0, 0, 0, 0, 0}
-};
+      /* "gcoder_line.pyx":300
+ *             i = j
+ *             continue
+ *         elif c == b'/' or c == b'*':             # <<<<<<<<<<<<<<
+ *             # Block delete or checksum, up to a newline
+ *             j = i + 1
+ */
+      goto __pyx_L5;
+    }
 
-static PyTypeObject __pyx_type_11gcoder_line_GLine = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "gcoder_line.GLine", /*tp_name*/
-  sizeof(struct __pyx_obj_11gcoder_line_GLine), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11gcoder_line_GLine, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_11gcoder_line_GLine, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_11gcoder_line_GLine, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pw_11gcoder_line_5GLine_3__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_11gcoder_line_GLine, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-};
+    /* "gcoder_line.pyx":309
+ *                 i = j + 1
+ *                 continue
+ *         elif is_parsed_code(c):             # <<<<<<<<<<<<<<
+ *             # Code followed by an optional number
+ *             j = i + 1
+ */
+    __pyx_t_6 = (__pyx_f_11gcoder_line_is_parsed_code(__pyx_v_c) != 0);
+    if (__pyx_t_6) {
+
+      /* "gcoder_line.pyx":311
+ *         elif is_parsed_code(c):
+ *             # Code followed by an optional number
+ *             j = i + 1             # <<<<<<<<<<<<<<
+ *             start = j
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):
+ */
+      __pyx_v_j = (__pyx_v_i + 1);
+
+      /* "gcoder_line.pyx":312
+ *             # Code followed by an optional number
+ *             j = i + 1
+ *             start = j             # <<<<<<<<<<<<<<
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):
+ *                 j += 1
+ */
+      __pyx_v_start = __pyx_v_j;
+
+      /* "gcoder_line.pyx":313
+ *             j = i + 1
+ *             start = j
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ */
+      __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_6 = __pyx_t_7;
+        goto __pyx_L24_bool_binop_done;
+      }
+      __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) == '-') != 0);
+      if (!__pyx_t_7) {
+      } else {
+        __pyx_t_6 = __pyx_t_7;
+        goto __pyx_L24_bool_binop_done;
+      }
+      __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) == '+') != 0);
+      __pyx_t_6 = __pyx_t_7;
+      __pyx_L24_bool_binop_done:;
+      if (__pyx_t_6) {
+
+        /* "gcoder_line.pyx":314
+ *             start = j
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+
+        /* "gcoder_line.pyx":313
+ *             j = i + 1
+ *             start = j
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ */
+      }
 
-static PyObject *__pyx_tp_new_11gcoder_line_GLightLine(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  if (unlikely(__pyx_pw_11gcoder_line_10GLightLine_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) {
-    Py_DECREF(o); o = 0;
+      /* "gcoder_line.pyx":315
+ *             if j < n and (s[j] == b'-' or s[j] == b'+'):
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             if j < n and s[j] == b'.':
+ */
+      while (1) {
+        __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L29_bool_binop_done;
+        }
+        __pyx_t_7 = (__pyx_f_11gcoder_line_is_digit((__pyx_v_s[__pyx_v_j])) != 0);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_L29_bool_binop_done:;
+        if (!__pyx_t_6) break;
+
+        /* "gcoder_line.pyx":316
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             if j < n and s[j] == b'.':
+ *                 j += 1
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+
+      /* "gcoder_line.pyx":317
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1
+ *             if j < n and s[j] == b'.':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ */
+      __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_6 = __pyx_t_7;
+        goto __pyx_L32_bool_binop_done;
+      }
+      __pyx_t_7 = (((__pyx_v_s[__pyx_v_j]) == '.') != 0);
+      __pyx_t_6 = __pyx_t_7;
+      __pyx_L32_bool_binop_done:;
+      if (__pyx_t_6) {
+
+        /* "gcoder_line.pyx":318
+ *                 j += 1
+ *             if j < n and s[j] == b'.':
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+
+        /* "gcoder_line.pyx":317
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1
+ *             if j < n and s[j] == b'.':             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ */
+      }
+
+      /* "gcoder_line.pyx":319
+ *             if j < n and s[j] == b'.':
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):             # <<<<<<<<<<<<<<
+ *                 j += 1
+ *             split_raw.append((raw[i:i+1], raw[start:j]))
+ */
+      while (1) {
+        __pyx_t_7 = ((__pyx_v_j < __pyx_v_n) != 0);
+        if (__pyx_t_7) {
+        } else {
+          __pyx_t_6 = __pyx_t_7;
+          goto __pyx_L36_bool_binop_done;
+        }
+        __pyx_t_7 = (__pyx_f_11gcoder_line_is_digit((__pyx_v_s[__pyx_v_j])) != 0);
+        __pyx_t_6 = __pyx_t_7;
+        __pyx_L36_bool_binop_done:;
+        if (!__pyx_t_6) break;
+
+        /* "gcoder_line.pyx":320
+ *                 j += 1
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1             # <<<<<<<<<<<<<<
+ *             split_raw.append((raw[i:i+1], raw[start:j]))
+ *             i = j
+ */
+        __pyx_v_j = (__pyx_v_j + 1);
+      }
+
+      /* "gcoder_line.pyx":321
+ *             while j < n and is_digit(s[j]):
+ *                 j += 1
+ *             split_raw.append((raw[i:i+1], raw[start:j]))             # <<<<<<<<<<<<<<
+ *             i = j
+ *             continue
+ */
+      if (unlikely(__pyx_v_raw == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(1, 321, __pyx_L1_error)
+      }
+      __pyx_t_1 = PySequence_GetSlice(__pyx_v_raw, __pyx_v_i, (__pyx_v_i + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 321, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__pyx_v_raw == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(1, 321, __pyx_L1_error)
+      }
+      __pyx_t_3 = PySequence_GetSlice(__pyx_v_raw, __pyx_v_start, __pyx_v_j); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 321, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 321, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+      __pyx_t_1 = 0;
+      __pyx_t_3 = 0;
+      __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_split_raw, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(1, 321, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "gcoder_line.pyx":322
+ *                 j += 1
+ *             split_raw.append((raw[i:i+1], raw[start:j]))
+ *             i = j             # <<<<<<<<<<<<<<
+ *             continue
+ *         i += 1
+ */
+      __pyx_v_i = __pyx_v_j;
+
+      /* "gcoder_line.pyx":323
+ *             split_raw.append((raw[i:i+1], raw[start:j]))
+ *             i = j
+ *             continue             # <<<<<<<<<<<<<<
+ *         i += 1
+ * 
+ */
+      goto __pyx_L3_continue;
+
+      /* "gcoder_line.pyx":309
+ *                 i = j + 1
+ *                 continue
+ *         elif is_parsed_code(c):             # <<<<<<<<<<<<<<
+ *             # Code followed by an optional number
+ *             j = i + 1
+ */
+    }
+    __pyx_L5:;
+
+    /* "gcoder_line.pyx":324
+ *             i = j
+ *             continue
+ *         i += 1             # <<<<<<<<<<<<<<
+ * 
+ *     if split_raw and split_raw[0][0] == "n":
+ */
+    __pyx_v_i = (__pyx_v_i + 1);
+    __pyx_L3_continue:;
   }
-  return o;
-}
 
-static void __pyx_tp_dealloc_11gcoder_line_GLightLine(PyObject *o) {
-  #if PY_VERSION_HEX >= 0x030400a1
-  if (unlikely(Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  /* "gcoder_line.pyx":326
+ *         i += 1
+ * 
+ *     if split_raw and split_raw[0][0] == "n":             # <<<<<<<<<<<<<<
+ *         del split_raw[0]
+ *     if not split_raw:
+ */
+  __pyx_t_7 = (PyList_GET_SIZE(__pyx_v_split_raw) != 0);
+  if (__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L39_bool_binop_done;
   }
-  #endif
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pw_11gcoder_line_10GLightLine_5__dealloc__(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
+  __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_split_raw, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 326, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 326, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_7 = (__Pyx_PyString_Equals(__pyx_t_3, __pyx_n_s_n, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(1, 326, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L39_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "gcoder_line.pyx":327
+ * 
+ *     if split_raw and split_raw[0][0] == "n":
+ *         del split_raw[0]             # <<<<<<<<<<<<<<
+ *     if not split_raw:
+ *         line.command = line.raw
+ */
+    if (unlikely(__Pyx_DelItemInt(__pyx_v_split_raw, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1) < 0)) __PYX_ERR(1, 327, __pyx_L1_error)
+
+    /* "gcoder_line.pyx":326
+ *         i += 1
+ * 
+ *     if split_raw and split_raw[0][0] == "n":             # <<<<<<<<<<<<<<
+ *         del split_raw[0]
+ *     if not split_raw:
+ */
   }
-  (*Py_TYPE(o)->tp_free)(o);
-}
 
-static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_raw(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_10GLightLine_3raw_1__get__(o);
-}
+  /* "gcoder_line.pyx":328
+ *     if split_raw and split_raw[0][0] == "n":
+ *         del split_raw[0]
+ *     if not split_raw:             # <<<<<<<<<<<<<<
+ *         line.command = line.raw
+ *         line.is_move = False
+ */
+  __pyx_t_6 = (PyList_GET_SIZE(__pyx_v_split_raw) != 0);
+  __pyx_t_7 = ((!__pyx_t_6) != 0);
+  if (__pyx_t_7) {
+
+    /* "gcoder_line.pyx":329
+ *         del split_raw[0]
+ *     if not split_raw:
+ *         line.command = line.raw             # <<<<<<<<<<<<<<
+ *         line.is_move = False
+ *         logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_raw); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 329, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_line, __pyx_n_s_command, __pyx_t_3) < 0) __PYX_ERR(1, 329, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "gcoder_line.pyx":330
+ *     if not split_raw:
+ *         line.command = line.raw
+ *         line.is_move = False             # <<<<<<<<<<<<<<
+ *         logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)
+ *         return [line.raw]
+ */
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_line, __pyx_n_s_is_move, Py_False) < 0) __PYX_ERR(1, 330, __pyx_L1_error)
+
+    /* "gcoder_line.pyx":331
+ *         line.command = line.raw
+ *         line.is_move = False
+ *         logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)             # <<<<<<<<<<<<<<
+ *         return [line.raw]
+ *     command = split_raw[0]
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logging); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_warning); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_raw); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_9 = __Pyx_PyString_FormatSafe(__pyx_kp_s_raw_G_Code_line_s_could_not_be_p, __pyx_t_2); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_2, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_9);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 331, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "gcoder_line.pyx":332
+ *         line.is_move = False
+ *         logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)
+ *         return [line.raw]             # <<<<<<<<<<<<<<
+ *     command = split_raw[0]
+ *     line.command = command[0].upper() + command[1]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_raw); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 332, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 332, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
 
-static int __pyx_setprop_11gcoder_line_10GLightLine_raw(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_10GLightLine_3raw_3__set__(o, v);
+    /* "gcoder_line.pyx":328
+ *     if split_raw and split_raw[0][0] == "n":
+ *         del split_raw[0]
+ *     if not split_raw:             # <<<<<<<<<<<<<<
+ *         line.command = line.raw
+ *         line.is_move = False
+ */
   }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+
+  /* "gcoder_line.pyx":333
+ *         logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)
+ *         return [line.raw]
+ *     command = split_raw[0]             # <<<<<<<<<<<<<<
+ *     line.command = command[0].upper() + command[1]
+ *     line.is_move = line.command in move_gcodes
+ */
+  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_split_raw, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 333, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_command = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":334
+ *         return [line.raw]
+ *     command = split_raw[0]
+ *     line.command = command[0].upper() + command[1]             # <<<<<<<<<<<<<<
+ *     line.is_move = line.command in move_gcodes
+ *     return split_raw
+ */
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_command, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_upper); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+    }
   }
-}
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_GetItemInt(__pyx_v_command, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_t_9); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_line, __pyx_n_s_command, __pyx_t_3) < 0) __PYX_ERR(1, 334, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_command(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_10GLightLine_7command_1__get__(o);
+  /* "gcoder_line.pyx":335
+ *     command = split_raw[0]
+ *     line.command = command[0].upper() + command[1]
+ *     line.is_move = line.command in move_gcodes             # <<<<<<<<<<<<<<
+ *     return split_raw
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_command); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_move_gcodes); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_7 = (__Pyx_PySequence_ContainsTF(__pyx_t_3, __pyx_t_9, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(1, 335, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyBool_FromLong(__pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_line, __pyx_n_s_is_move, __pyx_t_9) < 0) __PYX_ERR(1, 335, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "gcoder_line.pyx":336
+ *     line.command = command[0].upper() + command[1]
+ *     line.is_move = line.command in move_gcodes
+ *     return split_raw             # <<<<<<<<<<<<<<
+ * 
+ * def parse_coordinates(line, split_raw, imperial = False, force = False):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_split_raw);
+  __pyx_r = __pyx_v_split_raw;
+  goto __pyx_L0;
+
+  /* "gcoder_line.pyx":273
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ * def split(line):             # <<<<<<<<<<<<<<
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("gcoder_line.split", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_raw);
+  __Pyx_XDECREF(__pyx_v_split_raw);
+  __Pyx_XDECREF(__pyx_v_command);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_setprop_11gcoder_line_10GLightLine_command(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_10GLightLine_7command_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+/* "gcoder_line.pyx":338
+ *     return split_raw
+ * 
+ * def parse_coordinates(line, split_raw, imperial = False, force = False):             # <<<<<<<<<<<<<<
+ *     cdef GLine gline
+ *     cdef float value
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11gcoder_line_3parse_coordinates(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_11gcoder_line_3parse_coordinates = {"parse_coordinates", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_11gcoder_line_3parse_coordinates, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_11gcoder_line_3parse_coordinates(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_line = 0;
+  PyObject *__pyx_v_split_raw = 0;
+  PyObject *__pyx_v_imperial = 0;
+  PyObject *__pyx_v_force = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("parse_coordinates (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_line,&__pyx_n_s_split_raw,&__pyx_n_s_imperial,&__pyx_n_s_force,0};
+    PyObject* values[4] = {0,0,0,0};
+    values[2] = ((PyObject *)Py_False);
+    values[3] = ((PyObject *)Py_False);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_split_raw)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("parse_coordinates", 0, 2, 4, 1); __PYX_ERR(1, 338, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_imperial);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_force);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "parse_coordinates") < 0)) __PYX_ERR(1, 338, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_line = values[0];
+    __pyx_v_split_raw = values[1];
+    __pyx_v_imperial = values[2];
+    __pyx_v_force = values[3];
   }
-}
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("parse_coordinates", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 338, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("gcoder_line.parse_coordinates", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11gcoder_line_2parse_coordinates(__pyx_self, __pyx_v_line, __pyx_v_split_raw, __pyx_v_imperial, __pyx_v_force);
 
-static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_is_move(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11gcoder_line_10GLightLine_7is_move_1__get__(o);
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static int __pyx_setprop_11gcoder_line_10GLightLine_is_move(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11gcoder_line_10GLightLine_7is_move_3__set__(o, v);
-  }
-  else {
-    PyErr_SetString(PyExc_NotImplementedError, "__del__");
-    return -1;
+static PyObject *__pyx_pf_11gcoder_line_2parse_coordinates(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_line, PyObject *__pyx_v_split_raw, PyObject *__pyx_v_imperial, PyObject *__pyx_v_force) {
+  struct __pyx_obj_11gcoder_line_GLine *__pyx_v_gline = 0;
+  float __pyx_v_value;
+  double __pyx_v_unit_factor;
+  PyObject *__pyx_v_bit = NULL;
+  PyObject *__pyx_v_code = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  double __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("parse_coordinates", 0);
+
+  /* "gcoder_line.pyx":342
+ *     cdef float value
+ *     # Not a G-line, we don't want to parse its arguments
+ *     if not force and line.command[0] != "G":             # <<<<<<<<<<<<<<
+ *         return
+ *     unit_factor = 25.4 if imperial else 1
+ */
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_force); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 342, __pyx_L1_error)
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
   }
-}
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_command); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_t_5, __pyx_n_s_G, Py_NE)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 342, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-static PyMethodDef __pyx_methods_11gcoder_line_GLightLine[] = {
-  {0, 0, 0, 0}
-};
+    /* "gcoder_line.pyx":343
+ *     # Not a G-line, we don't want to parse its arguments
+ *     if not force and line.command[0] != "G":
+ *         return             # <<<<<<<<<<<<<<
+ *     unit_factor = 25.4 if imperial else 1
+ *     if isinstance(line, GLine):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-static struct PyGetSetDef __pyx_getsets_11gcoder_line_GLightLine[] = {
-  {(char *)"raw", __pyx_getprop_11gcoder_line_10GLightLine_raw, __pyx_setprop_11gcoder_line_10GLightLine_raw, 0, 0},
-  {(char *)"command", __pyx_getprop_11gcoder_line_10GLightLine_command, __pyx_setprop_11gcoder_line_10GLightLine_command, 0, 0},
-  {(char *)"is_move", __pyx_getprop_11gcoder_line_10GLightLine_is_move, __pyx_setprop_11gcoder_line_10GLightLine_is_move, 0, 0},
-  {0, 0, 0, 0, 0}
-};
+    /* "gcoder_line.pyx":342
+ *     cdef float value
+ *     # Not a G-line, we don't want to parse its arguments
+ *     if not force and line.command[0] != "G":             # <<<<<<<<<<<<<<
+ *         return
+ *     unit_factor = 25.4 if imperial else 1
+ */
+  }
 
-static PyTypeObject __pyx_type_11gcoder_line_GLightLine = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "gcoder_line.GLightLine", /*tp_name*/
-  sizeof(struct __pyx_obj_11gcoder_line_GLightLine), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11gcoder_line_GLightLine, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_11gcoder_line_GLightLine, /*tp_methods*/
-  0, /*tp_members*/
-  __pyx_getsets_11gcoder_line_GLightLine, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pw_11gcoder_line_10GLightLine_3__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_11gcoder_line_GLightLine, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-};
+  /* "gcoder_line.pyx":344
+ *     if not force and line.command[0] != "G":
+ *         return
+ *     unit_factor = 25.4 if imperial else 1             # <<<<<<<<<<<<<<
+ *     if isinstance(line, GLine):
+ *         gline = <GLine>line
+ */
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_imperial); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 344, __pyx_L1_error)
+  if (__pyx_t_1) {
+    __pyx_t_6 = 25.4;
+  } else {
+    __pyx_t_6 = 1.0;
+  }
+  __pyx_v_unit_factor = __pyx_t_6;
+
+  /* "gcoder_line.pyx":345
+ *         return
+ *     unit_factor = 25.4 if imperial else 1
+ *     if isinstance(line, GLine):             # <<<<<<<<<<<<<<
+ *         gline = <GLine>line
+ *         for bit in split_raw:
+ */
+  __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_line, __pyx_ptype_11gcoder_line_GLine); 
+  __pyx_t_3 = (__pyx_t_1 != 0);
+  if (__pyx_t_3) {
+
+    /* "gcoder_line.pyx":346
+ *     unit_factor = 25.4 if imperial else 1
+ *     if isinstance(line, GLine):
+ *         gline = <GLine>line             # <<<<<<<<<<<<<<
+ *         for bit in split_raw:
+ *             code = bit[0]
+ */
+    __pyx_t_5 = __pyx_v_line;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_v_gline = ((struct __pyx_obj_11gcoder_line_GLine *)__pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "gcoder_line.pyx":347
+ *     if isinstance(line, GLine):
+ *         gline = <GLine>line
+ *         for bit in split_raw:             # <<<<<<<<<<<<<<
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
+ */
+    if (likely(PyList_CheckExact(__pyx_v_split_raw)) || PyTuple_CheckExact(__pyx_v_split_raw)) {
+      __pyx_t_5 = __pyx_v_split_raw; __Pyx_INCREF(__pyx_t_5); __pyx_t_7 = 0;
+      __pyx_t_8 = NULL;
+    } else {
+      __pyx_t_7 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_split_raw); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_8 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 347, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_8)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 347, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 347, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        } else {
+          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 347, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 347, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        }
+      } else {
+        __pyx_t_4 = __pyx_t_8(__pyx_t_5);
+        if (unlikely(!__pyx_t_4)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(1, 347, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_bit, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "gcoder_line.pyx":348
+ *         gline = <GLine>line
+ *         for bit in split_raw:
+ *             code = bit[0]             # <<<<<<<<<<<<<<
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 value = unit_factor * float(bit[1])
+ */
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 348, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_XDECREF_SET(__pyx_v_code, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "gcoder_line.pyx":349
+ *         for bit in split_raw:
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:             # <<<<<<<<<<<<<<
+ *                 value = unit_factor * float(bit[1])
+ *                 if code == 'x':
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_parsed_nonargs); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 349, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = (__Pyx_PySequence_ContainsTF(__pyx_v_code, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 349, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_2 = (__pyx_t_1 != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_3 = __pyx_t_2;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 349, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 349, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_3 = __pyx_t_2;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "gcoder_line.pyx":350
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 value = unit_factor * float(bit[1])             # <<<<<<<<<<<<<<
+ *                 if code == 'x':
+ *                     gline._x = value
+ */
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 350, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_6 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_6 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(1, 350, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_v_value = (__pyx_v_unit_factor * __pyx_t_6);
+
+        /* "gcoder_line.pyx":351
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 value = unit_factor * float(bit[1])
+ *                 if code == 'x':             # <<<<<<<<<<<<<<
+ *                     gline._x = value
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_x, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 351, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":352
+ *                 value = unit_factor * float(bit[1])
+ *                 if code == 'x':
+ *                     gline._x = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ *                 elif code == 'y':
+ */
+          __pyx_v_gline->_x = __pyx_v_value;
+
+          /* "gcoder_line.pyx":353
+ *                 if code == 'x':
+ *                     gline._x = value
+ *                     gline._status = set_has_var(gline._status, pos_x)             # <<<<<<<<<<<<<<
+ *                 elif code == 'y':
+ *                     gline._y = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_x);
+
+          /* "gcoder_line.pyx":351
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 value = unit_factor * float(bit[1])
+ *                 if code == 'x':             # <<<<<<<<<<<<<<
+ *                     gline._x = value
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ */
+          goto __pyx_L12;
+        }
 
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
+        /* "gcoder_line.pyx":354
+ *                     gline._x = value
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ *                 elif code == 'y':             # <<<<<<<<<<<<<<
+ *                     gline._y = value
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_y, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 354, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":355
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ *                 elif code == 'y':
+ *                     gline._y = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ *                 elif code == 'z':
+ */
+          __pyx_v_gline->_y = __pyx_v_value;
+
+          /* "gcoder_line.pyx":356
+ *                 elif code == 'y':
+ *                     gline._y = value
+ *                     gline._status = set_has_var(gline._status, pos_y)             # <<<<<<<<<<<<<<
+ *                 elif code == 'z':
+ *                     gline._z = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_y);
+
+          /* "gcoder_line.pyx":354
+ *                     gline._x = value
+ *                     gline._status = set_has_var(gline._status, pos_x)
+ *                 elif code == 'y':             # <<<<<<<<<<<<<<
+ *                     gline._y = value
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ */
+          goto __pyx_L12;
+        }
 
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-  #if PY_VERSION_HEX < 0x03020000
-    { PyObject_HEAD_INIT(NULL) NULL, 0, NULL },
-  #else
-    PyModuleDef_HEAD_INIT,
-  #endif
-    "gcoder_line",
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
+        /* "gcoder_line.pyx":357
+ *                     gline._y = value
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ *                 elif code == 'z':             # <<<<<<<<<<<<<<
+ *                     gline._z = value
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_z, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 357, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":358
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ *                 elif code == 'z':
+ *                     gline._z = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ *                 elif code == 'e':
+ */
+          __pyx_v_gline->_z = __pyx_v_value;
+
+          /* "gcoder_line.pyx":359
+ *                 elif code == 'z':
+ *                     gline._z = value
+ *                     gline._status = set_has_var(gline._status, pos_z)             # <<<<<<<<<<<<<<
+ *                 elif code == 'e':
+ *                     gline._e = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_z);
+
+          /* "gcoder_line.pyx":357
+ *                     gline._y = value
+ *                     gline._status = set_has_var(gline._status, pos_y)
+ *                 elif code == 'z':             # <<<<<<<<<<<<<<
+ *                     gline._z = value
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ */
+          goto __pyx_L12;
+        }
 
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_n_s_line, __pyx_k_line, sizeof(__pyx_k_line), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_raw, __pyx_k_raw, sizeof(__pyx_k_raw), 0, 0, 1, 1},
-  {&__pyx_n_s_slots, __pyx_k_slots, sizeof(__pyx_k_slots), 0, 0, 1, 1},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  return 0;
-}
+        /* "gcoder_line.pyx":360
+ *                     gline._z = value
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ *                 elif code == 'e':             # <<<<<<<<<<<<<<
+ *                     gline._e = value
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_e, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 360, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":361
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ *                 elif code == 'e':
+ *                     gline._e = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ *                 elif code == 'f':
+ */
+          __pyx_v_gline->_e = __pyx_v_value;
+
+          /* "gcoder_line.pyx":362
+ *                 elif code == 'e':
+ *                     gline._e = value
+ *                     gline._status = set_has_var(gline._status, pos_e)             # <<<<<<<<<<<<<<
+ *                 elif code == 'f':
+ *                     gline._f = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_e);
+
+          /* "gcoder_line.pyx":360
+ *                     gline._z = value
+ *                     gline._status = set_has_var(gline._status, pos_z)
+ *                 elif code == 'e':             # <<<<<<<<<<<<<<
+ *                     gline._e = value
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ */
+          goto __pyx_L12;
+        }
 
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+        /* "gcoder_line.pyx":363
+ *                     gline._e = value
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ *                 elif code == 'f':             # <<<<<<<<<<<<<<
+ *                     gline._f = value
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_f, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 363, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":364
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ *                 elif code == 'f':
+ *                     gline._f = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ *                 elif code == 'i':
+ */
+          __pyx_v_gline->_f = __pyx_v_value;
+
+          /* "gcoder_line.pyx":365
+ *                 elif code == 'f':
+ *                     gline._f = value
+ *                     gline._status = set_has_var(gline._status, pos_f)             # <<<<<<<<<<<<<<
+ *                 elif code == 'i':
+ *                     gline._i = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_f);
+
+          /* "gcoder_line.pyx":363
+ *                     gline._e = value
+ *                     gline._status = set_has_var(gline._status, pos_e)
+ *                 elif code == 'f':             # <<<<<<<<<<<<<<
+ *                     gline._f = value
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ */
+          goto __pyx_L12;
+        }
 
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_24 = PyInt_FromLong(24); if (unlikely(!__pyx_int_24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
+        /* "gcoder_line.pyx":366
+ *                     gline._f = value
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ *                 elif code == 'i':             # <<<<<<<<<<<<<<
+ *                     gline._i = value
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_i, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 366, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":367
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ *                 elif code == 'i':
+ *                     gline._i = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ *                 elif code == 'j':
+ */
+          __pyx_v_gline->_i = __pyx_v_value;
+
+          /* "gcoder_line.pyx":368
+ *                 elif code == 'i':
+ *                     gline._i = value
+ *                     gline._status = set_has_var(gline._status, pos_i)             # <<<<<<<<<<<<<<
+ *                 elif code == 'j':
+ *                     gline._j = value
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_i);
+
+          /* "gcoder_line.pyx":366
+ *                     gline._f = value
+ *                     gline._status = set_has_var(gline._status, pos_f)
+ *                 elif code == 'i':             # <<<<<<<<<<<<<<
+ *                     gline._i = value
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ */
+          goto __pyx_L12;
+        }
 
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initgcoder_line(void); /*proto*/
-PyMODINIT_FUNC initgcoder_line(void)
-#else
-PyMODINIT_FUNC PyInit_gcoder_line(void); /*proto*/
-PyMODINIT_FUNC PyInit_gcoder_line(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_gcoder_line(void)", 0);
-  if (__Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("gcoder_line", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (unlikely(!__pyx_m)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if CYTHON_COMPILING_IN_PYPY
-  Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  if (__pyx_module_is_main_gcoder_line) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (!PyDict_GetItemString(modules, "gcoder_line")) {
-      if (unlikely(PyDict_SetItemString(modules, "gcoder_line", __pyx_m) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        /* "gcoder_line.pyx":369
+ *                     gline._i = value
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ *                 elif code == 'j':             # <<<<<<<<<<<<<<
+ *                     gline._j = value
+ *                     gline._status = set_has_var(gline._status, pos_j)
+ */
+        __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_code, __pyx_n_s_j, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(1, 369, __pyx_L1_error)
+        if (__pyx_t_3) {
+
+          /* "gcoder_line.pyx":370
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ *                 elif code == 'j':
+ *                     gline._j = value             # <<<<<<<<<<<<<<
+ *                     gline._status = set_has_var(gline._status, pos_j)
+ *                 else:
+ */
+          __pyx_v_gline->_j = __pyx_v_value;
+
+          /* "gcoder_line.pyx":371
+ *                 elif code == 'j':
+ *                     gline._j = value
+ *                     gline._status = set_has_var(gline._status, pos_j)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     setattr(line, code, value)
+ */
+          __pyx_v_gline->_status = __pyx_f_11gcoder_line_set_has_var(__pyx_v_gline->_status, __pyx_e_11gcoder_line_pos_j);
+
+          /* "gcoder_line.pyx":369
+ *                     gline._i = value
+ *                     gline._status = set_has_var(gline._status, pos_i)
+ *                 elif code == 'j':             # <<<<<<<<<<<<<<
+ *                     gline._j = value
+ *                     gline._status = set_has_var(gline._status, pos_j)
+ */
+          goto __pyx_L12;
+        }
+
+        /* "gcoder_line.pyx":373
+ *                     gline._status = set_has_var(gline._status, pos_j)
+ *                 else:
+ *                     setattr(line, code, value)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for bit in split_raw:
+ */
+        /*else*/ {
+          __pyx_t_4 = PyFloat_FromDouble(__pyx_v_value); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 373, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_9 = PyObject_SetAttr(__pyx_v_line, __pyx_v_code, __pyx_t_4); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(1, 373, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        }
+        __pyx_L12:;
+
+        /* "gcoder_line.pyx":349
+ *         for bit in split_raw:
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:             # <<<<<<<<<<<<<<
+ *                 value = unit_factor * float(bit[1])
+ *                 if code == 'x':
+ */
+      }
+
+      /* "gcoder_line.pyx":347
+ *     if isinstance(line, GLine):
+ *         gline = <GLine>line
+ *         for bit in split_raw:             # <<<<<<<<<<<<<<
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
+ */
     }
-  }
-  #endif
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_11gcoder_line_GLine) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_type_11gcoder_line_GLine.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "GLine", (PyObject *)&__pyx_type_11gcoder_line_GLine) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_11gcoder_line_GLine = &__pyx_type_11gcoder_line_GLine;
-  if (PyType_Ready(&__pyx_type_11gcoder_line_GLightLine) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_type_11gcoder_line_GLightLine.tp_print = 0;
-  if (PyObject_SetAttrString(__pyx_m, "GLightLine", (PyObject *)&__pyx_type_11gcoder_line_GLightLine) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_11gcoder_line_GLightLine = &__pyx_type_11gcoder_line_GLightLine;
-  /*--- Type import code ---*/
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "gcoder_line.pyx":67
- *     cdef uint32_t _status
- * 
- *     __slots__ = ()             # <<<<<<<<<<<<<<
- * 
- *     def __cinit__(self):
+    /* "gcoder_line.pyx":345
+ *         return
+ *     unit_factor = 25.4 if imperial else 1
+ *     if isinstance(line, GLine):             # <<<<<<<<<<<<<<
+ *         gline = <GLine>line
+ *         for bit in split_raw:
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_11gcoder_line_GLine->tp_dict, __pyx_n_s_slots, __pyx_empty_tuple) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyType_Modified(__pyx_ptype_11gcoder_line_GLine);
+    goto __pyx_L6;
+  }
 
-  /* "gcoder_line.pyx":218
- *     cdef uint8_t _status
- * 
- *     __slots__ = ()             # <<<<<<<<<<<<<<
- * 
- *     def __cinit__(self):
+  /* "gcoder_line.pyx":375
+ *                     setattr(line, code, value)
+ *     else:
+ *         for bit in split_raw:             # <<<<<<<<<<<<<<
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_11gcoder_line_GLightLine->tp_dict, __pyx_n_s_slots, __pyx_empty_tuple) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyType_Modified(__pyx_ptype_11gcoder_line_GLightLine);
+  /*else*/ {
+    if (likely(PyList_CheckExact(__pyx_v_split_raw)) || PyTuple_CheckExact(__pyx_v_split_raw)) {
+      __pyx_t_5 = __pyx_v_split_raw; __Pyx_INCREF(__pyx_t_5); __pyx_t_7 = 0;
+      __pyx_t_8 = NULL;
+    } else {
+      __pyx_t_7 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_split_raw); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 375, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_8 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 375, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_8)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 375, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 375, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        } else {
+          if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_7); __Pyx_INCREF(__pyx_t_4); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(1, 375, __pyx_L1_error)
+          #else
+          __pyx_t_4 = PySequence_ITEM(__pyx_t_5, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 375, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          #endif
+        }
+      } else {
+        __pyx_t_4 = __pyx_t_8(__pyx_t_5);
+        if (unlikely(!__pyx_t_4)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(1, 375, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_4);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_bit, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "gcoder_line.pyx":376
+ *     else:
+ *         for bit in split_raw:
+ *             code = bit[0]             # <<<<<<<<<<<<<<
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 setattr(line, code, unit_factor * float(bit[1]))
+ */
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 376, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_XDECREF_SET(__pyx_v_code, __pyx_t_4);
+      __pyx_t_4 = 0;
+
+      /* "gcoder_line.pyx":377
+ *         for bit in split_raw:
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:             # <<<<<<<<<<<<<<
+ *                 setattr(line, code, unit_factor * float(bit[1]))
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_parsed_nonargs); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 377, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_v_code, __pyx_t_4, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 377, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_1 = (__pyx_t_2 != 0);
+      if (__pyx_t_1) {
+      } else {
+        __pyx_t_3 = __pyx_t_1;
+        goto __pyx_L16_bool_binop_done;
+      }
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 377, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(1, 377, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_3 = __pyx_t_1;
+      __pyx_L16_bool_binop_done:;
+      if (__pyx_t_3) {
+
+        /* "gcoder_line.pyx":378
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
+ *                 setattr(line, code, unit_factor * float(bit[1]))             # <<<<<<<<<<<<<<
+ */
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_bit, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 378, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_6 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_6 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(1, 378, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = PyFloat_FromDouble((__pyx_v_unit_factor * __pyx_t_6)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 378, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_9 = PyObject_SetAttr(__pyx_v_line, __pyx_v_code, __pyx_t_4); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(1, 378, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "gcoder_line.pyx":377
+ *         for bit in split_raw:
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:             # <<<<<<<<<<<<<<
+ *                 setattr(line, code, unit_factor * float(bit[1]))
+ */
+      }
 
-  /* "gcoder_line.pyx":1
- * # This file is copied from GCoder.             # <<<<<<<<<<<<<<
- * #
- * # GCoder is free software: you can redistribute it and/or modify
+      /* "gcoder_line.pyx":375
+ *                     setattr(line, code, value)
+ *     else:
+ *         for bit in split_raw:             # <<<<<<<<<<<<<<
+ *             code = bit[0]
+ *             if code not in parsed_nonargs and bit[1]:
  */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_L6:;
 
-  /*--- Wrapped vars code ---*/
+  /* "gcoder_line.pyx":338
+ *     return split_raw
+ * 
+ * def parse_coordinates(line, split_raw, imperial = False, force = False):             # <<<<<<<<<<<<<<
+ *     cdef GLine gline
+ *     cdef float value
+ */
 
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init gcoder_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("gcoder_line.parse_coordinates", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_gline);
+  __Pyx_XDECREF(__pyx_v_bit);
+  __Pyx_XDECREF(__pyx_v_code);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_tp_new_11gcoder_line_GLine(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  if (unlikely(__pyx_pw_11gcoder_line_5GLine_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_11gcoder_line_GLine(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_11gcoder_line_5GLine_5__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_x(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1x_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_x(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1x_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_y(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1y_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_y(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1y_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_z(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1z_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_z(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1z_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_e(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1e_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_e(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1e_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_f(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1f_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_f(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1f_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_i(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1i_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_i(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1i_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_j(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_1j_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_j(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_1j_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_is_move(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_7is_move_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_is_move(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_7is_move_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_relative(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_8relative_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_relative(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_8relative_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_relative_e(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_10relative_e_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_relative_e(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_10relative_e_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_extruding(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_9extruding_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_extruding(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_9extruding_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_x(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_9current_x_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_current_x(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_9current_x_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_y(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_9current_y_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_current_y(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_9current_y_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_z(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_9current_z_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_current_z(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_9current_z_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_current_tool(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_12current_tool_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_current_tool(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_12current_tool_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_gcview_end_vertex(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_17gcview_end_vertex_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_gcview_end_vertex(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_17gcview_end_vertex_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_raw(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_3raw_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_raw(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_3raw_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_5GLine_command(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_5GLine_7command_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_5GLine_command(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_5GLine_7command_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyMethodDef __pyx_methods_11gcoder_line_GLine[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_11gcoder_line_5GLine_7__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_11gcoder_line_5GLine_9__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_11gcoder_line_GLine[] = {
+  {(char *)"x", __pyx_getprop_11gcoder_line_5GLine_x, __pyx_setprop_11gcoder_line_5GLine_x, (char *)0, 0},
+  {(char *)"y", __pyx_getprop_11gcoder_line_5GLine_y, __pyx_setprop_11gcoder_line_5GLine_y, (char *)0, 0},
+  {(char *)"z", __pyx_getprop_11gcoder_line_5GLine_z, __pyx_setprop_11gcoder_line_5GLine_z, (char *)0, 0},
+  {(char *)"e", __pyx_getprop_11gcoder_line_5GLine_e, __pyx_setprop_11gcoder_line_5GLine_e, (char *)0, 0},
+  {(char *)"f", __pyx_getprop_11gcoder_line_5GLine_f, __pyx_setprop_11gcoder_line_5GLine_f, (char *)0, 0},
+  {(char *)"i", __pyx_getprop_11gcoder_line_5GLine_i, __pyx_setprop_11gcoder_line_5GLine_i, (char *)0, 0},
+  {(char *)"j", __pyx_getprop_11gcoder_line_5GLine_j, __pyx_setprop_11gcoder_line_5GLine_j, (char *)0, 0},
+  {(char *)"is_move", __pyx_getprop_11gcoder_line_5GLine_is_move, __pyx_setprop_11gcoder_line_5GLine_is_move, (char *)0, 0},
+  {(char *)"relative", __pyx_getprop_11gcoder_line_5GLine_relative, __pyx_setprop_11gcoder_line_5GLine_relative, (char *)0, 0},
+  {(char *)"relative_e", __pyx_getprop_11gcoder_line_5GLine_relative_e, __pyx_setprop_11gcoder_line_5GLine_relative_e, (char *)0, 0},
+  {(char *)"extruding", __pyx_getprop_11gcoder_line_5GLine_extruding, __pyx_setprop_11gcoder_line_5GLine_extruding, (char *)0, 0},
+  {(char *)"current_x", __pyx_getprop_11gcoder_line_5GLine_current_x, __pyx_setprop_11gcoder_line_5GLine_current_x, (char *)0, 0},
+  {(char *)"current_y", __pyx_getprop_11gcoder_line_5GLine_current_y, __pyx_setprop_11gcoder_line_5GLine_current_y, (char *)0, 0},
+  {(char *)"current_z", __pyx_getprop_11gcoder_line_5GLine_current_z, __pyx_setprop_11gcoder_line_5GLine_current_z, (char *)0, 0},
+  {(char *)"current_tool", __pyx_getprop_11gcoder_line_5GLine_current_tool, __pyx_setprop_11gcoder_line_5GLine_current_tool, (char *)0, 0},
+  {(char *)"gcview_end_vertex", __pyx_getprop_11gcoder_line_5GLine_gcview_end_vertex, __pyx_setprop_11gcoder_line_5GLine_gcview_end_vertex, (char *)0, 0},
+  {(char *)"raw", __pyx_getprop_11gcoder_line_5GLine_raw, __pyx_setprop_11gcoder_line_5GLine_raw, (char *)0, 0},
+  {(char *)"command", __pyx_getprop_11gcoder_line_5GLine_command, __pyx_setprop_11gcoder_line_5GLine_command, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_11gcoder_line_GLine = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "gcoder_line.GLine", /*tp_name*/
+  sizeof(struct __pyx_obj_11gcoder_line_GLine), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_11gcoder_line_GLine, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  0, /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11gcoder_line_GLine, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_11gcoder_line_GLine, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_11gcoder_line_5GLine_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_11gcoder_line_GLine, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyObject *__pyx_tp_new_11gcoder_line_GLightLine(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  if (unlikely(__pyx_pw_11gcoder_line_10GLightLine_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_11gcoder_line_GLightLine(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_11gcoder_line_10GLightLine_5__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_raw(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_10GLightLine_3raw_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_10GLightLine_raw(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_10GLightLine_3raw_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_command(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_10GLightLine_7command_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_10GLightLine_command(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_10GLightLine_7command_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11gcoder_line_10GLightLine_is_move(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11gcoder_line_10GLightLine_7is_move_1__get__(o);
+}
+
+static int __pyx_setprop_11gcoder_line_10GLightLine_is_move(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11gcoder_line_10GLightLine_7is_move_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyMethodDef __pyx_methods_11gcoder_line_GLightLine[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_11gcoder_line_10GLightLine_7__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_11gcoder_line_10GLightLine_9__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_11gcoder_line_GLightLine[] = {
+  {(char *)"raw", __pyx_getprop_11gcoder_line_10GLightLine_raw, __pyx_setprop_11gcoder_line_10GLightLine_raw, (char *)0, 0},
+  {(char *)"command", __pyx_getprop_11gcoder_line_10GLightLine_command, __pyx_setprop_11gcoder_line_10GLightLine_command, (char *)0, 0},
+  {(char *)"is_move", __pyx_getprop_11gcoder_line_10GLightLine_is_move, __pyx_setprop_11gcoder_line_10GLightLine_is_move, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_11gcoder_line_GLightLine = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "gcoder_line.GLightLine", /*tp_name*/
+  sizeof(struct __pyx_obj_11gcoder_line_GLightLine), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_11gcoder_line_GLightLine, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  0, /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11gcoder_line_GLightLine, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_11gcoder_line_GLightLine, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_11gcoder_line_10GLightLine_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_11gcoder_line_GLightLine, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_gcoder_line(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_gcoder_line},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "gcoder_line",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_G, __pyx_k_G, sizeof(__pyx_k_G), 0, 0, 1, 1},
+  {&__pyx_n_s_G0, __pyx_k_G0, sizeof(__pyx_k_G0), 0, 0, 1, 1},
+  {&__pyx_n_s_G1, __pyx_k_G1, sizeof(__pyx_k_G1), 0, 0, 1, 1},
+  {&__pyx_n_s_G2, __pyx_k_G2, sizeof(__pyx_k_G2), 0, 0, 1, 1},
+  {&__pyx_n_s_G3, __pyx_k_G3, sizeof(__pyx_k_G3), 0, 0, 1, 1},
+  {&__pyx_n_s_GLightLine, __pyx_k_GLightLine, sizeof(__pyx_k_GLightLine), 0, 0, 1, 1},
+  {&__pyx_n_s_GLine, __pyx_k_GLine, sizeof(__pyx_k_GLine), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_kp_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 0},
+  {&__pyx_n_s_bit, __pyx_k_bit, sizeof(__pyx_k_bit), 0, 0, 1, 1},
+  {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
+  {&__pyx_n_s_command, __pyx_k_command, sizeof(__pyx_k_command), 0, 0, 1, 1},
+  {&__pyx_n_s_e, __pyx_k_e, sizeof(__pyx_k_e), 0, 0, 1, 1},
+  {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
+  {&__pyx_n_s_force, __pyx_k_force, sizeof(__pyx_k_force), 0, 0, 1, 1},
+  {&__pyx_n_s_g, __pyx_k_g, sizeof(__pyx_k_g), 0, 0, 1, 1},
+  {&__pyx_n_s_gcoder_line, __pyx_k_gcoder_line, sizeof(__pyx_k_gcoder_line), 0, 0, 1, 1},
+  {&__pyx_kp_s_gcoder_line_pyx, __pyx_k_gcoder_line_pyx, sizeof(__pyx_k_gcoder_line_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_gline, __pyx_k_gline, sizeof(__pyx_k_gline), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_imperial, __pyx_k_imperial, sizeof(__pyx_k_imperial), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_is_move, __pyx_k_is_move, sizeof(__pyx_k_is_move), 0, 0, 1, 1},
+  {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_line, __pyx_k_line, sizeof(__pyx_k_line), 0, 0, 1, 1},
+  {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
+  {&__pyx_n_s_lower, __pyx_k_lower, sizeof(__pyx_k_lower), 0, 0, 1, 1},
+  {&__pyx_n_s_m, __pyx_k_m, sizeof(__pyx_k_m), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_move_gcodes, __pyx_k_move_gcodes, sizeof(__pyx_k_move_gcodes), 0, 0, 1, 1},
+  {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_parse_coordinates, __pyx_k_parse_coordinates, sizeof(__pyx_k_parse_coordinates), 0, 0, 1, 1},
+  {&__pyx_n_s_parsed_nonargs, __pyx_k_parsed_nonargs, sizeof(__pyx_k_parsed_nonargs), 0, 0, 1, 1},
+  {&__pyx_n_s_raw, __pyx_k_raw, sizeof(__pyx_k_raw), 0, 0, 1, 1},
+  {&__pyx_kp_s_raw_G_Code_line_s_could_not_be_p, __pyx_k_raw_G_Code_line_s_could_not_be_p, sizeof(__pyx_k_raw_G_Code_line_s_could_not_be_p), 0, 0, 1, 0},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_slots, __pyx_k_slots, sizeof(__pyx_k_slots), 0, 0, 1, 1},
+  {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
+  {&__pyx_n_s_split_raw, __pyx_k_split_raw, sizeof(__pyx_k_split_raw), 0, 0, 1, 1},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
+  {&__pyx_n_s_t, __pyx_k_t, sizeof(__pyx_k_t), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_unit_factor, __pyx_k_unit_factor, sizeof(__pyx_k_unit_factor), 0, 0, 1, 1},
+  {&__pyx_n_s_upper, __pyx_k_upper, sizeof(__pyx_k_upper), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {&__pyx_n_s_warning, __pyx_k_warning, sizeof(__pyx_k_warning), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+  {&__pyx_n_s_z, __pyx_k_z, sizeof(__pyx_k_z), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "gcoder_line.pyx":289
+ *                 j += 1
+ *             if j < n and s[j] == b')':
+ *                 split_raw.append(('', ''))             # <<<<<<<<<<<<<<
+ *                 i = j + 1
+ *                 continue
+ */
+  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_kp_s__5, __pyx_kp_s__5); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "gcoder_line.pyx":273
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ * def split(line):             # <<<<<<<<<<<<<<
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw
+ */
+  __pyx_tuple__7 = PyTuple_Pack(10, __pyx_n_s_line, __pyx_n_s_raw, __pyx_n_s_s, __pyx_n_s_n, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_start, __pyx_n_s_c, __pyx_n_s_split_raw, __pyx_n_s_command); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gcoder_line_pyx, __pyx_n_s_split, 273, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(1, 273, __pyx_L1_error)
+
+  /* "gcoder_line.pyx":338
+ *     return split_raw
+ * 
+ * def parse_coordinates(line, split_raw, imperial = False, force = False):             # <<<<<<<<<<<<<<
+ *     cdef GLine gline
+ *     cdef float value
+ */
+  __pyx_tuple__9 = PyTuple_Pack(9, __pyx_n_s_line, __pyx_n_s_split_raw, __pyx_n_s_imperial, __pyx_n_s_force, __pyx_n_s_gline, __pyx_n_s_value, __pyx_n_s_unit_factor, __pyx_n_s_bit, __pyx_n_s_code); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(4, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_gcoder_line_pyx, __pyx_n_s_parse_coordinates, 338, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(1, 338, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_int_24 = PyInt_FromLong(24); if (unlikely(!__pyx_int_24)) __PYX_ERR(1, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  if (PyType_Ready(&__pyx_type_11gcoder_line_GLine) < 0) __PYX_ERR(1, 60, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_11gcoder_line_GLine.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_11gcoder_line_GLine.tp_dictoffset && __pyx_type_11gcoder_line_GLine.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_11gcoder_line_GLine.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_GLine, (PyObject *)&__pyx_type_11gcoder_line_GLine) < 0) __PYX_ERR(1, 60, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_11gcoder_line_GLine) < 0) __PYX_ERR(1, 60, __pyx_L1_error)
+  __pyx_ptype_11gcoder_line_GLine = &__pyx_type_11gcoder_line_GLine;
+  if (PyType_Ready(&__pyx_type_11gcoder_line_GLightLine) < 0) __PYX_ERR(1, 214, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_11gcoder_line_GLightLine.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_11gcoder_line_GLightLine.tp_dictoffset && __pyx_type_11gcoder_line_GLightLine.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_11gcoder_line_GLightLine.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_GLightLine, (PyObject *)&__pyx_type_11gcoder_line_GLightLine) < 0) __PYX_ERR(1, 214, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_11gcoder_line_GLightLine) < 0) __PYX_ERR(1, 214, __pyx_L1_error)
+  __pyx_ptype_11gcoder_line_GLightLine = &__pyx_type_11gcoder_line_GLightLine;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initgcoder_line(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initgcoder_line(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_gcoder_line(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_gcoder_line(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_gcoder_line(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'gcoder_line' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_gcoder_line(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(1, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("gcoder_line", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(1, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(1, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(1, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_gcoder_line) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(1, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "gcoder_line")) {
+      if (unlikely(PyDict_SetItemString(modules, "gcoder_line", __pyx_m) < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  #endif
+
+  /* "gcoder_line.pyx":20
+ * from libc.string cimport strlen, strncpy
+ * 
+ * import logging             # <<<<<<<<<<<<<<
+ * 
+ * cdef char* copy_string(object value):
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_logging, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logging, __pyx_t_1) < 0) __PYX_ERR(1, 20, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":69
+ *     cdef uint32_t _status
+ * 
+ *     __slots__ = ()             # <<<<<<<<<<<<<<
+ * 
+ *     def __cinit__(self):
+ */
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_11gcoder_line_GLine->tp_dict, __pyx_n_s_slots, __pyx_empty_tuple) < 0) __PYX_ERR(1, 69, __pyx_L1_error)
+  PyType_Modified(__pyx_ptype_11gcoder_line_GLine);
+
+  /* "gcoder_line.pyx":220
+ *     cdef uint8_t _status
+ * 
+ *     __slots__ = ()             # <<<<<<<<<<<<<<
+ * 
+ *     def __cinit__(self):
+ */
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_11gcoder_line_GLightLine->tp_dict, __pyx_n_s_slots, __pyx_empty_tuple) < 0) __PYX_ERR(1, 220, __pyx_L1_error)
+  PyType_Modified(__pyx_ptype_11gcoder_line_GLightLine);
+
+  /* "gcoder_line.pyx":263
+ * # return the same results as the regular expression based ones.
+ * 
+ * parsed_nonargs = ["g", "t", "m", "n"]             # <<<<<<<<<<<<<<
+ * move_gcodes = ["G0", "G1", "G2", "G3"]
+ * 
+ */
+  __pyx_t_1 = PyList_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_g);
+  __Pyx_GIVEREF(__pyx_n_s_g);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_g);
+  __Pyx_INCREF(__pyx_n_s_t);
+  __Pyx_GIVEREF(__pyx_n_s_t);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_t);
+  __Pyx_INCREF(__pyx_n_s_m);
+  __Pyx_GIVEREF(__pyx_n_s_m);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_m);
+  __Pyx_INCREF(__pyx_n_s_n);
+  __Pyx_GIVEREF(__pyx_n_s_n);
+  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_n);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_parsed_nonargs, __pyx_t_1) < 0) __PYX_ERR(1, 263, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":264
+ * 
+ * parsed_nonargs = ["g", "t", "m", "n"]
+ * move_gcodes = ["G0", "G1", "G2", "G3"]             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_digit(char c):
+ */
+  __pyx_t_1 = PyList_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_G0);
+  __Pyx_GIVEREF(__pyx_n_s_G0);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_G0);
+  __Pyx_INCREF(__pyx_n_s_G1);
+  __Pyx_GIVEREF(__pyx_n_s_G1);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_G1);
+  __Pyx_INCREF(__pyx_n_s_G2);
+  __Pyx_GIVEREF(__pyx_n_s_G2);
+  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_G2);
+  __Pyx_INCREF(__pyx_n_s_G3);
+  __Pyx_GIVEREF(__pyx_n_s_G3);
+  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_n_s_G3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_move_gcodes, __pyx_t_1) < 0) __PYX_ERR(1, 264, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":273
+ *             c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+ * 
+ * def split(line):             # <<<<<<<<<<<<<<
+ *     cdef bytes raw = line.raw.lower()
+ *     cdef char* s = raw
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_11gcoder_line_1split, NULL, __pyx_n_s_gcoder_line); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 273, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_split, __pyx_t_1) < 0) __PYX_ERR(1, 273, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":338
+ *     return split_raw
+ * 
+ * def parse_coordinates(line, split_raw, imperial = False, force = False):             # <<<<<<<<<<<<<<
+ *     cdef GLine gline
+ *     cdef float value
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_11gcoder_line_3parse_coordinates, NULL, __pyx_n_s_gcoder_line); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_parse_coordinates, __pyx_t_1) < 0) __PYX_ERR(1, 338, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcoder_line.pyx":1
+ * # This file is copied from GCoder.             # <<<<<<<<<<<<<<
+ * #
+ * # GCoder is free software: you can redistribute it and/or modify
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init gcoder_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init gcoder_line");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
     }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init gcoder_line");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
 }
 
-/* --- Runtime support code --- */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
 #endif
-
-#if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+    return PyObject_SetAttr(obj, attr_name, value);
+}
 #endif
 
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_LshiftObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
     #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_CheckExact(op1))) {
         const long b = intval;
-        long x;
         long a = PyInt_AS_LONG(op1);
-            x = (long)((unsigned long)a + b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            if (likely(b < (long) (sizeof(long)*8) && a == (a << b) >> b) || !a) {
+                return PyInt_FromLong(a << b);
+            }
     }
     #endif
-    #if CYTHON_USE_PYLONG_INTERNALS && PY_MAJOR_VERSION >= 3
+    #if CYTHON_USE_PYLONG_INTERNALS
     if (likely(PyLong_CheckExact(op1))) {
         const long b = intval;
         long a, x;
+#ifdef HAVE_LONG_LONG
         const PY_LONG_LONG llb = intval;
         PY_LONG_LONG lla, llx;
+#endif
         const digit* digits = ((PyLongObject*)op1)->ob_digit;
         const Py_ssize_t size = Py_SIZE(op1);
         if (likely(__Pyx_sst_abs(size) <= 1)) {
@@ -5268,318 +9127,1206 @@ static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED
                     if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
                         a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
                         lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
+                    CYTHON_FALLTHROUGH;
                 case 2:
                     if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
                         a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
                         lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
+                    CYTHON_FALLTHROUGH;
                 case -3:
                     if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
                         a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
                         lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
+                    CYTHON_FALLTHROUGH;
                 case 3:
                     if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
                         a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
                         lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
+                    CYTHON_FALLTHROUGH;
                 case -4:
                     if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
                         a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
                         lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
+                    CYTHON_FALLTHROUGH;
                 case 4:
                     if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
                         a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
                         break;
+#ifdef HAVE_LONG_LONG
                     } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
                         lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
                         goto long_long;
+#endif
                     }
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_lshift(op1, op2);
+            }
+        }
+                x = a << b;
+#ifdef HAVE_LONG_LONG
+                if (unlikely(!(b < (long) (sizeof(long)*8) && a == x >> b)) && a) {
+                    lla = a;
+                    goto long_long;
+                }
+#else
+                if (likely(b < (long) (sizeof(long)*8) && a == x >> b) || !a)
+#endif
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla << llb;
+                if (likely(lla == llx >> llb))
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    return (inplace ? PyNumber_InPlaceLshift : PyNumber_Lshift)(op1, op2);
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
             }
         }
-                x = a + b;
-            return PyLong_FromLong(x);
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
     }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
     #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
 #endif
+}
 
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+/* DelItemInt */
+static int __Pyx_DelItem_Generic(PyObject *o, PyObject *j) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_DelItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_DelItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                               CYTHON_UNUSED int is_list, CYTHON_NCP_UNUSED int wraparound) {
+#if !CYTHON_USE_TYPE_SLOTS
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_DelItem(o, i);
+    }
 #else
-    PyErr_Restore(type, value, tb);
+    PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+    if (likely(m && m->sq_ass_item)) {
+        if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+            Py_ssize_t l = m->sq_length(o);
+            if (likely(l >= 0)) {
+                i += l;
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    return -1;
+                PyErr_Clear();
+            }
+        }
+        return m->sq_ass_item(o, i, (PyObject *)NULL);
+    }
 #endif
+    return __Pyx_DelItem_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
 }
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
 #if CYTHON_COMPILING_IN_CPYTHON
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
 #else
-    PyErr_Fetch(type, value, tb);
+        dictptr = _PyObject_GetDictPtr(obj);
 #endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
 }
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
 
-static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
 #endif
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
     }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
     }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
 #endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
 }
 
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* pyobject_as_double */
+static double __Pyx__PyObject_AsDouble(PyObject* obj) {
+    PyObject* float_value;
+#if !CYTHON_USE_TYPE_SLOTS
+    float_value = PyNumber_Float(obj);  if ((0)) goto bad;
+#else
+    PyNumberMethods *nb = Py_TYPE(obj)->tp_as_number;
+    if (likely(nb) && likely(nb->nb_float)) {
+        float_value = nb->nb_float(obj);
+        if (likely(float_value) && unlikely(!PyFloat_Check(float_value))) {
+            PyErr_Format(PyExc_TypeError,
+                "__float__ returned non-float (type %.200s)",
+                Py_TYPE(float_value)->tp_name);
+            Py_DECREF(float_value);
+            goto bad;
+        }
+    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
+#if PY_MAJOR_VERSION >= 3
+        float_value = PyFloat_FromString(obj);
+#else
+        float_value = PyFloat_FromString(obj, 0);
+#endif
     } else {
-        num_expected = num_max;
-        more_or_less = "at most";
+        PyObject* args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        PyTuple_SET_ITEM(args, 0, obj);
+        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
+        PyTuple_SET_ITEM(args, 0, 0);
+        Py_DECREF(args);
     }
-    if (exact) {
-        more_or_less = "exactly";
+#endif
+    if (likely(float_value)) {
+        double value = PyFloat_AS_DOUBLE(float_value);
+        Py_DECREF(float_value);
+        return value;
     }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
+bad:
+    return (double)-1;
 }
 
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-#if CYTHON_COMPILING_IN_PYPY
-    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
-        goto invalid_keyword;
-    return 1;
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
 #else
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
-        #endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    return 0;
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
 #endif
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
     #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
     #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
     return 0;
 }
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
 
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
 }
 
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
         }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
             }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
                 }
-                name++;
             }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
                 }
             }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
         }
     }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
+bad:
     #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
+    Py_XDECREF(py_import);
     #endif
-bad:
-    return -1;
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
 }
+#endif
 
+/* CodeObjectCache */
 static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
@@ -5643,7 +10390,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -5659,36 +10406,44 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     Py_INCREF(code_object);
 }
 
+/* AddTraceback */
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -5707,38 +10462,58 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename) {
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
-    py_code = __pyx_find_code_object(c_line ? c_line : py_line);
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
-        __pyx_insert_code_object(c_line ? c_line : py_line, py_code);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        __pyx_d,      /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
     );
     if (!py_frame) goto bad;
-    py_frame->f_lineno = py_line;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
     PyTraceBack_Here(py_frame);
 bad:
     Py_XDECREF(py_code);
     Py_XDECREF(py_frame);
 }
 
+/* CIntFromPyVerify */
 #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
@@ -5760,8 +10535,16 @@ bad:
         return (target_type) value;\
     }
 
+/* CIntFromPy */
 static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -5812,7 +10595,7 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -5827,15 +10610,17 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
 #endif
             if (sizeof(size_t) <= sizeof(unsigned long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
                 case  0: return (size_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, -(sdigit) digits[0])
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
                 case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
                 case -2:
                     if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
@@ -5895,8 +10680,10 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
 #endif
             if (sizeof(size_t) <= sizeof(long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
         }
         {
@@ -5905,7 +10692,7 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
             size_t val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
                 PyObject *tmp = v;
@@ -5928,7 +10715,7 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
         }
     } else {
         size_t val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
         if (!tmp) return (size_t) -1;
         val = __Pyx_PyInt_As_size_t(tmp);
         Py_DECREF(tmp);
@@ -5944,34 +10731,16 @@ raise_neg_overflow:
     return (size_t) -1;
 }
 
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
-}
-
+/* CIntFromPy */
 static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6022,7 +10791,7 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6037,15 +10806,17 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
 #endif
             if (sizeof(uint32_t) <= sizeof(unsigned long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(uint32_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(uint32_t) <= sizeof(unsigned PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(uint32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
                 case  0: return (uint32_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(uint32_t, sdigit, -(sdigit) digits[0])
+                case -1: __PYX_VERIFY_RETURN_INT(uint32_t, sdigit, (sdigit) (-(sdigit)digits[0]))
                 case  1: __PYX_VERIFY_RETURN_INT(uint32_t,  digit, +digits[0])
                 case -2:
                     if (8 * sizeof(uint32_t) - 1 > 1 * PyLong_SHIFT) {
@@ -6105,8 +10876,10 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
 #endif
             if (sizeof(uint32_t) <= sizeof(long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(uint32_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(uint32_t) <= sizeof(PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(uint32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
         }
         {
@@ -6115,7 +10888,7 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
             uint32_t val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
                 PyObject *tmp = v;
@@ -6138,7 +10911,7 @@ static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
         }
     } else {
         uint32_t val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
         if (!tmp) return (uint32_t) -1;
         val = __Pyx_PyInt_As_uint32_t(tmp);
         Py_DECREF(tmp);
@@ -6154,22 +10927,72 @@ raise_neg_overflow:
     return (uint32_t) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(uint32_t) < sizeof(long)) {
             return PyInt_FromLong((long) value);
         } else if (sizeof(uint32_t) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
         } else if (sizeof(uint32_t) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
         }
     } else {
         if (sizeof(uint32_t) <= sizeof(long)) {
             return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
         } else if (sizeof(uint32_t) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
         }
     }
     {
@@ -6180,8 +11003,16 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value) {
     }
 }
 
+/* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6232,7 +11063,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6247,15 +11078,17 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
 #endif
             if (sizeof(long) <= sizeof(unsigned long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
                 case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, -(sdigit) digits[0])
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
                 case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
                 case -2:
                     if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
@@ -6315,8 +11148,10 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
 #endif
             if (sizeof(long) <= sizeof(long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
         }
         {
@@ -6325,7 +11160,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
             long val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
                 PyObject *tmp = v;
@@ -6348,7 +11183,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
         }
     } else {
         long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
         if (!tmp) return (long) -1;
         val = __Pyx_PyInt_As_long(tmp);
         Py_DECREF(tmp);
@@ -6364,8 +11199,16 @@ raise_neg_overflow:
     return (long) -1;
 }
 
+/* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6416,7 +11259,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6431,15 +11274,17 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #endif
             if (sizeof(int) <= sizeof(unsigned long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
                 case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
                 case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
                 case -2:
                     if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
@@ -6499,8 +11344,10 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #endif
             if (sizeof(int) <= sizeof(long)) {
                 __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
             } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
                 __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
             }
         }
         {
@@ -6509,7 +11356,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
             int val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
                 PyObject *tmp = v;
@@ -6532,7 +11379,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
         }
     } else {
         int val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
         if (!tmp) return (int) -1;
         val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
@@ -6548,12 +11395,135 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -6563,6 +11533,7 @@ static int __Pyx_check_binary_version(void) {
     return 0;
 }
 
+/* InitStrings */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
@@ -6588,6 +11559,8 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
         #endif
         if (!*t->p)
             return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
         ++t;
     }
     return 0;
@@ -6596,50 +11569,57 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
 static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
     return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
 }
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject* o) {
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
     Py_ssize_t ignore;
     return __Pyx_PyObject_AsStringAndSize(o, &ignore);
 }
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if CYTHON_COMPILING_IN_CPYTHON && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-    if (
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-            __Pyx_sys_getdefaultencoding_not_ascii &&
-#endif
-            PyUnicode_Check(o)) {
-#if PY_VERSION_HEX < 0x03030000
-        char* defenc_c;
-        PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
-        if (!defenc) return NULL;
-        defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
 #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        {
-            char* end = defenc_c + PyBytes_GET_SIZE(defenc);
-            char* c;
-            for (c = defenc_c; c < end; c++) {
-                if ((unsigned char) (*c) >= 128) {
-                    PyUnicode_AsASCIIString(o);
-                    return NULL;
-                }
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
             }
         }
+    }
 #endif
-        *length = PyBytes_GET_SIZE(defenc);
-        return defenc_c;
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
 #else
-        if (__Pyx_PyUnicode_READY(o) == -1) return NULL;
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
 #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        if (PyUnicode_IS_ASCII(o)) {
-            *length = PyUnicode_GET_LENGTH(o);
-            return PyUnicode_AsUTF8(o);
-        } else {
-            PyUnicode_AsASCIIString(o);
-            return NULL;
-        }
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
 #else
-        return PyUnicode_AsUTF8AndSize(o, length);
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
 #endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
 #endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
     } else
 #endif
 #if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
@@ -6663,43 +11643,74 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
    else return PyObject_IsTrue(x);
 }
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
   PyNumberMethods *m;
+#endif
   const char *name = NULL;
   PyObject *res = NULL;
 #if PY_MAJOR_VERSION < 3
-  if (PyInt_Check(x) || PyLong_Check(x))
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
 #else
-  if (PyLong_Check(x))
+  if (likely(PyLong_Check(x)))
 #endif
     return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
   m = Py_TYPE(x)->tp_as_number;
-#if PY_MAJOR_VERSION < 3
+  #if PY_MAJOR_VERSION < 3
   if (m && m->nb_int) {
     name = "int";
-    res = PyNumber_Int(x);
+    res = m->nb_int(x);
   }
   else if (m && m->nb_long) {
     name = "long";
-    res = PyNumber_Long(x);
+    res = m->nb_long(x);
   }
-#else
-  if (m && m->nb_int) {
+  #else
+  if (likely(m && m->nb_int)) {
     name = "int";
-    res = PyNumber_Long(x);
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
   }
 #endif
-  if (res) {
+  if (likely(res)) {
 #if PY_MAJOR_VERSION < 3
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
 #else
-    if (!PyLong_Check(res)) {
+    if (unlikely(!PyLong_CheckExact(res))) {
 #endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%.4s__ returned non-%.4s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
     }
   }
   else if (!PyErr_Occurred()) {
@@ -6716,7 +11727,7 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
     if (sizeof(Py_ssize_t) >= sizeof(long))
         return PyInt_AS_LONG(b);
     else
-        return PyInt_AsSsize_t(x);
+        return PyInt_AsSsize_t(b);
   }
 #endif
   if (likely(PyLong_CheckExact(b))) {
@@ -6770,6 +11781,26 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
     return PyInt_FromSize_t(ival);
 }
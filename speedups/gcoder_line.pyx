@@ -17,6 +17,8 @@ from libc.stdlib cimport malloc, free
 from libc.stdint cimport uint8_t, uint32_t
 from libc.string cimport strlen, strncpy
 
+import logging
+
 cdef char* copy_string(object value):
     cdef char* orig = value
     str_len = len(orig)
@@ -254,3 +256,123 @@ cdef class GLightLine:
         def __set__(self, value):
             if value: self._status = set_has_var(self._status, pos_is_move)
             else: self._status = unset_has_var(self._status, pos_is_move)
+
+# Compiled versions of printrun.gcoder split and parse_coordinates, they
+# return the same results as the regular expression based ones.
+
+parsed_nonargs = ["g", "t", "m", "n"]
+move_gcodes = ["G0", "G1", "G2", "G3"]
+
+cdef inline bint is_digit(char c):
+    return c >= b'0' and c <= b'9'
+
+cdef inline bint is_parsed_code(char c):
+    return (c == b'x' or c == b'y' or c == b'z' or c == b'e' or c == b'f' or
+            c == b'i' or c == b'j' or c == b'g' or c == b't' or c == b'm' or c == b'n')
+
+def split(line):
+    cdef bytes raw = line.raw.lower()
+    cdef char* s = raw
+    cdef Py_ssize_t n = len(raw)
+    cdef Py_ssize_t i = 0, j, start
+    cdef char c
+    cdef list split_raw = []
+
+    while i < n:
+        c = s[i]
+        if c == b'(':
+            # Comment in parenthesis, without nested parenthesis
+            j = i + 1
+            while j < n and s[j] != b'(' and s[j] != b')':
+                j += 1
+            if j < n and s[j] == b')':
+                split_raw.append(('', ''))
+                i = j + 1
+                continue
+        elif c == b';':
+            # Comment up to the end of the line
+            j = i + 1
+            while j < n and s[j] != b'\n':
+                j += 1
+            split_raw.append(('', ''))
+            i = j
+            continue
+        elif c == b'/' or c == b'*':
+            # Block delete or checksum, up to a newline
+            j = i + 1
+            while j < n and s[j] != b'\n':
+                j += 1
+            if j < n:
+                split_raw.append(('', ''))
+                i = j + 1
+                continue
+        elif is_parsed_code(c):
+            # Code followed by an optional number
+            j = i + 1
+            start = j
+            if j < n and (s[j] == b'-' or s[j] == b'+'):
+                j += 1
+            while j < n and is_digit(s[j]):
+                j += 1
+            if j < n and s[j] == b'.':
+                j += 1
+            while j < n and is_digit(s[j]):
+                j += 1
+            split_raw.append((raw[i:i+1], raw[start:j]))
+            i = j
+            continue
+        i += 1
+
+    if split_raw and split_raw[0][0] == "n":
+        del split_raw[0]
+    if not split_raw:
+        line.command = line.raw
+        line.is_move = False
+        logging.warning("raw G-Code line \"%s\" could not be parsed" % line.raw)
+        return [line.raw]
+    command = split_raw[0]
+    line.command = command[0].upper() + command[1]
+    line.is_move = line.command in move_gcodes
+    return split_raw
+
+def parse_coordinates(line, split_raw, imperial = False, force = False):
+    cdef GLine gline
+    cdef float value
+    # Not a G-line, we don't want to parse its arguments
+    if not force and line.command[0] != "G":
+        return
+    unit_factor = 25.4 if imperial else 1
+    if isinstance(line, GLine):
+        gline = <GLine>line
+        for bit in split_raw:
+            code = bit[0]
+            if code not in parsed_nonargs and bit[1]:
+                value = unit_factor * float(bit[1])
+                if code == 'x':
+                    gline._x = value
+                    gline._status = set_has_var(gline._status, pos_x)
+                elif code == 'y':
+                    gline._y = value
+                    gline._status = set_has_var(gline._status, pos_y)
+                elif code == 'z':
+                    gline._z = value
+                    gline._status = set_has_var(gline._status, pos_z)
+                elif code == 'e':
+                    gline._e = value
+                    gline._status = set_has_var(gline._status, pos_e)
+                elif code == 'f':
+                    gline._f = value
+                    gline._status = set_has_var(gline._status, pos_f)
+                elif code == 'i':
+                    gline._i = value
+                    gline._status = set_has_var(gline._status, pos_i)
+                elif code == 'j':
+                    gline._j = value
+                    gline._status = set_has_var(gline._status, pos_j)
+                else:
+                    setattr(line, code, value)
+    else:
+        for bit in split_raw:
+            code = bit[0]
+            if code not in parsed_nonargs and bit[1]:
+                setattr(line, code, unit_factor * float(bit[1]))
@@ -0,0 +1,139 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Check that the compiled gcoder_line parser gives the same results as the
+# pure python one and compare their speed:
+#
+#   python setup.py build_ext --inplace
+#   python gcoder_parity.py file.gcode [file.gcode ...]
+
+# Import standard python module
+import os
+import sys
+import time
+import argparse
+
+# Import external modules
+
+# Import internal modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fabui', 'ext', 'py'))
+from printrun import gcoder
+
+#############################################
+
+# Lines covering the corner cases of the gcode regular expression
+SAMPLE_LINES = [
+    'G1 X10 Y20.5 Z.3 E-1.25 F1800',
+    'g1 x1 y2',
+    'N10 G1 X1 Y2*33',
+    'N11 M104 S210 ; set temperature',
+    'G1 X(comment)5 Y(a(b)c)6',
+    'G1 X-.5 Y+3. Z- E. F',
+    'G2 X10 Y10 I5 J-5',
+    'G28 X0 Y0',
+    'G92 E0',
+    'T1',
+    'M82',
+    '; only a comment',
+    '(only a comment)',
+    '/block delete\nG1 X1',
+    'S100',
+    'M117 Printing x1 y2'
+]
+
+ATTRIBUTES = ('command', 'is_move', 'x', 'y', 'z', 'e', 'f', 'i', 'j')
+
+def parse(line_class, split, parse_coordinates, raw):
+    line = line_class(raw)
+    try:
+        split_raw = split(line)
+        parse_coordinates(line, split_raw)
+    except (ValueError, IndexError) as e:
+        return type(e).__name__, None
+    return split_raw, tuple( getattr(line, name) for name in ATTRIBUTES )
+
+def check_lines(lines):
+    """
+    Compare the parser outputs line by line.
+
+    :returns: List of the lines with different results
+    """
+    gline = gcoder.gcoder_line.GLine
+    mismatches = []
+    for raw in lines:
+        raw = raw.strip()
+        if not raw:
+            continue
+        compiled = parse(gline, gcoder.gcoder_line.split, gcoder.gcoder_line.parse_coordinates, raw)
+        python = parse(gline, gcoder.py_split, gcoder.py_parse_coordinates, raw)
+        # Split results do not depend on the line class
+        pyline = parse(gcoder.PyLine, gcoder.py_split, gcoder.py_parse_coordinates, raw)
+        if compiled != python or compiled[0] != pyline[0]:
+            mismatches.append( (raw, compiled, python) )
+    return mismatches
+
+def analyze(filename, split, parse_coordinates):
+    gcoder.split = split
+    gcoder.parse_coordinates = parse_coordinates
+    t = time.time()
+    gcode = gcoder.GCode(open(filename, "rU"))
+    duration = time.time() - t
+    result = (gcode.width, gcode.depth, gcode.height, gcode.layers_count,
+              gcode.filament_length, gcode.estimate_duration()[1])
+    return result, duration
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the compiled and python gcoder parsers.')
+    parser.add_argument('files', nargs='*', help='GCode files')
+    args = parser.parse_args()
+
+    if gcoder.split is gcoder.py_split:
+        print "Compiled gcoder_line parser is not available, build it with 'python setup.py build_ext --inplace'"
+        return 1
+
+    failed = False
+    compiled = (gcoder.split, gcoder.parse_coordinates)
+    python = (gcoder.py_split, gcoder.py_parse_coordinates)
+
+    mismatches = check_lines(SAMPLE_LINES)
+    print "Sample lines: {0} mismatches".format(len(mismatches))
+
+    for filename in args.files:
+        with open(filename, 'r') as f:
+            mismatches += check_lines(f)
+
+        result_c, duration_c = analyze(filename, *compiled)
+        result_py, duration_py = analyze(filename, *python)
+        print "{0}: python {1:.2f}s, compiled {2:.2f}s, x{3:.1f}, result {4}".format(
+                filename, duration_py, duration_c, duration_py / duration_c,
+                'identical' if result_c == result_py else 'DIFFERENT')
+        failed |= result_c != result_py
+
+    for raw, result_c, result_py in mismatches[:20]:
+        print "Mismatch: {0!r}\n  compiled: {1}\n  python:   {2}".format(raw, result_c, result_py)
+
+    return 1 if failed or mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
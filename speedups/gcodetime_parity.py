@@ -0,0 +1,77 @@
+#!/bin/env python
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+__authors__ = "Daniel Kesler"
+__license__ = "GPL - https://opensource.org/licenses/GPL-3.0"
+__version__ = "1.0"
+
+# Check that the compiled print time planner gives the same estimates as
+# the pure python one and compare their speed:
+#
+#   python setup.py build_ext --inplace
+#   python gcodetime_parity.py file.gcode [file.gcode ...]
+
+# Import standard python module
+import os
+import sys
+import time
+import argparse
+
+# Import external modules
+
+# Import internal modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fabui', 'ext', 'py'))
+from fabtotum.utils import gcodetime
+from fabtotum.utils.gcodefile import GCodeFile
+
+#############################################
+
+def estimate(filename, gfile, planner):
+    t = time.time()
+    estimator = gcodetime.PrintTimeEstimator(planner = planner)
+    result = estimator.process_file(filename, gfile)
+    duration = time.time() - t
+    return (result.total, result.checkpoints, result.layers, estimator.moves), duration
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the compiled and python print time planners.')
+    parser.add_argument('files', nargs='+', help='GCode files')
+    args = parser.parse_args()
+
+    if gcodetime.Planner is gcodetime.PyPlanner:
+        print "Compiled gcodetime_planner is not available, build it with 'python setup.py build_ext --inplace'"
+        return 1
+
+    failed = False
+    for filename in args.files:
+        gfile = GCodeFile(filename)
+        result_c, duration_c = estimate(filename, gfile, gcodetime.Planner)
+        result_py, duration_py = estimate(filename, gfile, gcodetime.PyPlanner)
+        print "{0}: {1} moves, python {2:.2f}s, compiled {3:.2f}s, x{4:.1f}, result {5}".format(
+                filename, result_c[3], duration_py, duration_c, duration_py / duration_c,
+                'identical' if result_c == result_py else 'DIFFERENT')
+        if result_c != result_py:
+            print "  total: compiled {0!r}, python {1!r}".format(result_c[0], result_py[0])
+            failed = True
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
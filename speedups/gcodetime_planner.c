@@ -0,0 +1,13713 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [], 
+        "name": "fabtotum.speedups.gcodetime_planner", 
+        "sources": [
+            "gcodetime_planner.pyx"
+        ]
+    }, 
+    "module_name": "fabtotum.speedups.gcodetime_planner"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__fabtotum__speedups__gcodetime_planner
+#define __PYX_HAVE_API__fabtotum__speedups__gcodetime_planner
+/* Early includes */
+#include <math.h>
+#include <string.h>
+#include <stdio.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "gcodetime_planner.pyx",
+  "stringsource",
+  "type.pxd",
+};
+
+/*--- Type declarations ---*/
+struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner;
+
+/* "gcodetime_planner.pyx":73
+ *     return -1
+ * 
+ * cdef class Planner:             # <<<<<<<<<<<<<<
+ *     """
+ *     Simulation of the look-ahead planner of the firmware, see
+ */
+struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_vtab;
+  double max_feedrate[4];
+  double max_acceleration[4];
+  double acceleration;
+  double retract_acceleration;
+  double xy_jerk;
+  double z_jerk;
+  double e_jerk;
+  double min_feedrate;
+  double min_travel_feedrate;
+  double position[4];
+  int relative;
+  int relative_e;
+  double feedrate;
+  int has_previous;
+  double previous_speed[4];
+  double previous_nominal;
+  int count;
+  double lengths[0x1010];
+  double accelerations[0x1010];
+  double nominals[0x1010];
+  double max_entries[0x1010];
+  PY_LONG_LONG offsets[0x1010];
+  double entries[(0x1010 + 1)];
+  double stop[0x1010];
+  double entry;
+  double elapsed;
+  PY_LONG_LONG moves;
+  PyObject *layer_marks;
+  Py_ssize_t mark_index;
+  PY_LONG_LONG next_mark;
+  PyObject *layers;
+  PyObject *checkpoints;
+};
+
+
+
+struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner {
+  int (*add_move)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, double, double, double, double, PY_LONG_LONG);
+  int (*add_arc)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, double, double, double *, double, double, double, int, int, PY_LONG_LONG);
+  int (*plan)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, int, int);
+  int (*pop_mark)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *);
+  int (*process)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, char const *, Py_ssize_t, PY_LONG_LONG);
+};
+static struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_vtabptr_8fabtotum_8speedups_17gcodetime_planner_Planner;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* SliceTupleAndList.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+#else
+#define __Pyx_PyList_GetSlice(seq, start, stop)   PySequence_GetSlice(seq, start, stop)
+#define __Pyx_PyTuple_GetSlice(seq, start, stop)  PySequence_GetSlice(seq, start, stop)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_move(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, double __pyx_v_dx, double __pyx_v_dy, double __pyx_v_dz, double __pyx_v_de, PY_LONG_LONG __pyx_v_offset); /* proto*/
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_arc(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, double __pyx_v_x, double __pyx_v_y, double *__pyx_v_delta, double __pyx_v_i, double __pyx_v_j, double __pyx_v_r, int __pyx_v_has_r, int __pyx_v_clockwise, PY_LONG_LONG __pyx_v_offset); /* proto*/
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_plan(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, int __pyx_v_count, int __pyx_v_final); /* proto*/
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_pop_mark(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto*/
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_process(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, char const *__pyx_v_line, Py_ssize_t __pyx_v_length, PY_LONG_LONG __pyx_v_offset); /* proto*/
+
+/* Module declarations from 'libc.math' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'cpython.exc' */
+
+/* Module declarations from 'fabtotum.speedups.gcodetime_planner' */
+static PyTypeObject *__pyx_ptype_8fabtotum_8speedups_17gcodetime_planner_Planner = 0;
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space(char); /*proto*/
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(char const *, Py_ssize_t, char const *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_parse_value(char const *, Py_ssize_t, double *); /*proto*/
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_axis_index(char); /*proto*/
+static PyObject *__pyx_f_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner__set_state(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__Pyx_carray_to_py_double(double *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE PyObject *__Pyx_carray_to_tuple_double(double *, Py_ssize_t); /*proto*/
+static int __Pyx_carray_from_py_double(PyObject *, double *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE PyObject *__Pyx_carray_to_py_PY_LONG_LONG(PY_LONG_LONG *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE PyObject *__Pyx_carray_to_tuple_PY_LONG_LONG(PY_LONG_LONG *, Py_ssize_t); /*proto*/
+static int __Pyx_carray_from_py_PY_LONG_LONG(PyObject *, PY_LONG_LONG *, Py_ssize_t); /*proto*/
+#define __Pyx_MODULE_NAME "fabtotum.speedups.gcodetime_planner"
+extern int __pyx_module_is_main_fabtotum__speedups__gcodetime_planner;
+int __pyx_module_is_main_fabtotum__speedups__gcodetime_planner = 0;
+
+/* Implementation of 'fabtotum.speedups.gcodetime_planner' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_OverflowError;
+static PyObject *__pyx_builtin_enumerate;
+static PyObject *__pyx_builtin_IndexError;
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_line[] = "line";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_layer[] = "layer";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_utf_8[] = "utf-8";
+static const char __pyx_k_config[] = "config";
+static const char __pyx_k_e_jerk[] = "e_jerk";
+static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_offset[] = "offset";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_z_jerk[] = "z_jerk";
+static const char __pyx_k_Planner[] = "Planner";
+static const char __pyx_k_xy_jerk[] = "xy_jerk";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_enumerate[] = "enumerate";
+static const char __pyx_k_get_layer[] = "get_layer";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_IndexError[] = "IndexError";
+static const char __pyx_k_mark_layer[] = "mark_layer";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_synchronize[] = "synchronize";
+static const char __pyx_k_acceleration[] = "acceleration";
+static const char __pyx_k_max_feedrate[] = "max_feedrate";
+static const char __pyx_k_min_feedrate[] = "min_feedrate";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_OverflowError[] = "OverflowError";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_max_acceleration[] = "max_acceleration";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_min_travel_feedrate[] = "min_travel_feedrate";
+static const char __pyx_k_pyx_unpickle_Planner[] = "__pyx_unpickle_Planner";
+static const char __pyx_k_retract_acceleration[] = "retract_acceleration";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))";
+static const char __pyx_k_fabtotum_speedups_gcodetime_plan[] = "fabtotum.speedups.gcodetime_planner";
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_IndexError;
+static PyObject *__pyx_n_s_OverflowError;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_Planner;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_acceleration;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_config;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_e_jerk;
+static PyObject *__pyx_n_s_encode;
+static PyObject *__pyx_n_s_enumerate;
+static PyObject *__pyx_n_s_fabtotum_speedups_gcodetime_plan;
+static PyObject *__pyx_n_s_get_layer;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_layer;
+static PyObject *__pyx_n_s_line;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mark_layer;
+static PyObject *__pyx_n_s_max_acceleration;
+static PyObject *__pyx_n_s_max_feedrate;
+static PyObject *__pyx_n_s_min_feedrate;
+static PyObject *__pyx_n_s_min_travel_feedrate;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_n_s_offset;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_Planner;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_retract_acceleration;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_synchronize;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_kp_s_utf_8;
+static PyObject *__pyx_n_s_xy_jerk;
+static PyObject *__pyx_n_s_z_jerk;
+static int __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner___init__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_config); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_2synchronize(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_4mark_layer(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_layer, PY_LONG_LONG __pyx_v_offset); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_6process_line(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_line, PY_LONG_LONG __pyx_v_offset); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_8process_block(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_data, PY_LONG_LONG __pyx_v_offset, PyObject *__pyx_v_get_layer); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_10finish(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed___get__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves___get__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_12__reduce_cython__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_14__setstate_cython__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_8fabtotum_8speedups_17gcodetime_planner_Planner(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_71859306;
+static PyObject *__pyx_int_86576574;
+static PyObject *__pyx_int_175721758;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_codeobj__4;
+/* Late includes */
+
+/* "gcodetime_planner.pyx":44
+ * DEF NO_MARK = 0x7fffffffffffffff
+ * 
+ * cdef inline bint is_space(char c):             # <<<<<<<<<<<<<<
+ *     # Same characters as str.split()
+ *     return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'
+ */
+
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space(char __pyx_v_c) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("is_space", 0);
+
+  /* "gcodetime_planner.pyx":46
+ * cdef inline bint is_space(char c):
+ *     # Same characters as str.split()
+ *     return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint is_word(const char *token, Py_ssize_t length, const char *word, Py_ssize_t word_length):
+ */
+  switch (__pyx_v_c) {
+    case ' ':
+    case '\t':
+    case '\n':
+    case '\r':
+    case '\x0B':
+    case '\x0C':
+    __pyx_t_1 = 1;
+    break;
+    default:
+    __pyx_t_1 = 0;
+    break;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":44
+ * DEF NO_MARK = 0x7fffffffffffffff
+ * 
+ * cdef inline bint is_space(char c):             # <<<<<<<<<<<<<<
+ *     # Same characters as str.split()
+ *     return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":48
+ *     return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'
+ * 
+ * cdef inline bint is_word(const char *token, Py_ssize_t length, const char *word, Py_ssize_t word_length):             # <<<<<<<<<<<<<<
+ *     return length == word_length and memcmp(token, word, length) == 0
+ * 
+ */
+
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(char const *__pyx_v_token, Py_ssize_t __pyx_v_length, char const *__pyx_v_word, Py_ssize_t __pyx_v_word_length) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("is_word", 0);
+
+  /* "gcodetime_planner.pyx":49
+ * 
+ * cdef inline bint is_word(const char *token, Py_ssize_t length, const char *word, Py_ssize_t word_length):
+ *     return length == word_length and memcmp(token, word, length) == 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline bint parse_value(const char *token, Py_ssize_t length, double *value):
+ */
+  __pyx_t_2 = ((__pyx_v_length == __pyx_v_word_length) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = ((memcmp(__pyx_v_token, __pyx_v_word, __pyx_v_length) == 0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":48
+ *     return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'
+ * 
+ * cdef inline bint is_word(const char *token, Py_ssize_t length, const char *word, Py_ssize_t word_length):             # <<<<<<<<<<<<<<
+ *     return length == word_length and memcmp(token, word, length) == 0
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":51
+ *     return length == word_length and memcmp(token, word, length) == 0
+ * 
+ * cdef inline bint parse_value(const char *token, Py_ssize_t length, double *value):             # <<<<<<<<<<<<<<
+ *     """ Parse the whole **token** as a number, like float(). """
+ *     cdef char *end
+ */
+
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_parse_value(char const *__pyx_v_token, Py_ssize_t __pyx_v_length, double *__pyx_v_value) {
+  char *__pyx_v_end;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("parse_value", 0);
+
+  /* "gcodetime_planner.pyx":54
+ *     """ Parse the whole **token** as a number, like float(). """
+ *     cdef char *end
+ *     if length <= 0:             # <<<<<<<<<<<<<<
+ *         return False
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ */
+  __pyx_t_1 = ((__pyx_v_length <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":55
+ *     cdef char *end
+ *     if length <= 0:
+ *         return False             # <<<<<<<<<<<<<<
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ *     if end == token:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":54
+ *     """ Parse the whole **token** as a number, like float(). """
+ *     cdef char *end
+ *     if length <= 0:             # <<<<<<<<<<<<<<
+ *         return False
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ */
+  }
+
+  /* "gcodetime_planner.pyx":56
+ *     if length <= 0:
+ *         return False
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)             # <<<<<<<<<<<<<<
+ *     if end == token:
+ *         PyErr_Clear()
+ */
+  (__pyx_v_value[0]) = PyOS_string_to_double(__pyx_v_token, (&__pyx_v_end), NULL);
+
+  /* "gcodetime_planner.pyx":57
+ *         return False
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ *     if end == token:             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return False
+ */
+  __pyx_t_1 = ((__pyx_v_end == __pyx_v_token) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":58
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ *     if end == token:
+ *         PyErr_Clear()             # <<<<<<<<<<<<<<
+ *         return False
+ *     return end == token + length
+ */
+    PyErr_Clear();
+
+    /* "gcodetime_planner.pyx":59
+ *     if end == token:
+ *         PyErr_Clear()
+ *         return False             # <<<<<<<<<<<<<<
+ *     return end == token + length
+ * 
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":57
+ *         return False
+ *     value[0] = PyOS_string_to_double(token, &end, NULL)
+ *     if end == token:             # <<<<<<<<<<<<<<
+ *         PyErr_Clear()
+ *         return False
+ */
+  }
+
+  /* "gcodetime_planner.pyx":60
+ *         PyErr_Clear()
+ *         return False
+ *     return end == token + length             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int axis_index(char code):
+ */
+  __pyx_r = (__pyx_v_end == (__pyx_v_token + __pyx_v_length));
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":51
+ *     return length == word_length and memcmp(token, word, length) == 0
+ * 
+ * cdef inline bint parse_value(const char *token, Py_ssize_t length, double *value):             # <<<<<<<<<<<<<<
+ *     """ Parse the whole **token** as a number, like float(). """
+ *     cdef char *end
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":62
+ *     return end == token + length
+ * 
+ * cdef inline int axis_index(char code):             # <<<<<<<<<<<<<<
+ *     if code == 'X':
+ *         return 0
+ */
+
+static CYTHON_INLINE int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_axis_index(char __pyx_v_code) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("axis_index", 0);
+
+  /* "gcodetime_planner.pyx":63
+ * 
+ * cdef inline int axis_index(char code):
+ *     if code == 'X':             # <<<<<<<<<<<<<<
+ *         return 0
+ *     elif code == 'Y':
+ */
+  switch (__pyx_v_code) {
+    case 'X':
+
+    /* "gcodetime_planner.pyx":64
+ * cdef inline int axis_index(char code):
+ *     if code == 'X':
+ *         return 0             # <<<<<<<<<<<<<<
+ *     elif code == 'Y':
+ *         return 1
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":63
+ * 
+ * cdef inline int axis_index(char code):
+ *     if code == 'X':             # <<<<<<<<<<<<<<
+ *         return 0
+ *     elif code == 'Y':
+ */
+    break;
+    case 'Y':
+
+    /* "gcodetime_planner.pyx":66
+ *         return 0
+ *     elif code == 'Y':
+ *         return 1             # <<<<<<<<<<<<<<
+ *     elif code == 'Z':
+ *         return 2
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":65
+ *     if code == 'X':
+ *         return 0
+ *     elif code == 'Y':             # <<<<<<<<<<<<<<
+ *         return 1
+ *     elif code == 'Z':
+ */
+    break;
+    case 'Z':
+
+    /* "gcodetime_planner.pyx":68
+ *         return 1
+ *     elif code == 'Z':
+ *         return 2             # <<<<<<<<<<<<<<
+ *     elif code == 'E':
+ *         return 3
+ */
+    __pyx_r = 2;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":67
+ *     elif code == 'Y':
+ *         return 1
+ *     elif code == 'Z':             # <<<<<<<<<<<<<<
+ *         return 2
+ *     elif code == 'E':
+ */
+    break;
+    case 'E':
+
+    /* "gcodetime_planner.pyx":70
+ *         return 2
+ *     elif code == 'E':
+ *         return 3             # <<<<<<<<<<<<<<
+ *     return -1
+ * 
+ */
+    __pyx_r = 3;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":69
+ *     elif code == 'Z':
+ *         return 2
+ *     elif code == 'E':             # <<<<<<<<<<<<<<
+ *         return 3
+ *     return -1
+ */
+    break;
+    default: break;
+  }
+
+  /* "gcodetime_planner.pyx":71
+ *     elif code == 'E':
+ *         return 3
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * cdef class Planner:
+ */
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":62
+ *     return end == token + length
+ * 
+ * cdef inline int axis_index(char code):             # <<<<<<<<<<<<<<
+ *     if code == 'X':
+ *         return 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":115
+ *     cdef list checkpoints
+ * 
+ *     def __init__(self, config):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(4):
+ */
+
+/* Python wrapper */
+static int __pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_config = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_config,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_config)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 115, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_config = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 115, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner___init__(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self), __pyx_v_config);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner___init__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_config) {
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  double __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "gcodetime_planner.pyx":117
+ *     def __init__(self, config):
+ *         cdef int i
+ *         for i in range(4):             # <<<<<<<<<<<<<<
+ *             self.max_feedrate[i] = config.max_feedrate[i]
+ *             self.max_acceleration[i] = config.max_acceleration[i]
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 4; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "gcodetime_planner.pyx":118
+ *         cdef int i
+ *         for i in range(4):
+ *             self.max_feedrate[i] = config.max_feedrate[i]             # <<<<<<<<<<<<<<
+ *             self.max_acceleration[i] = config.max_acceleration[i]
+ *             self.position[i] = 0.0
+ */
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_max_feedrate); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 118, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    (__pyx_v_self->max_feedrate[__pyx_v_i]) = __pyx_t_4;
+
+    /* "gcodetime_planner.pyx":119
+ *         for i in range(4):
+ *             self.max_feedrate[i] = config.max_feedrate[i]
+ *             self.max_acceleration[i] = config.max_acceleration[i]             # <<<<<<<<<<<<<<
+ *             self.position[i] = 0.0
+ *         self.acceleration = config.acceleration
+ */
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_max_acceleration); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    (__pyx_v_self->max_acceleration[__pyx_v_i]) = __pyx_t_4;
+
+    /* "gcodetime_planner.pyx":120
+ *             self.max_feedrate[i] = config.max_feedrate[i]
+ *             self.max_acceleration[i] = config.max_acceleration[i]
+ *             self.position[i] = 0.0             # <<<<<<<<<<<<<<
+ *         self.acceleration = config.acceleration
+ *         self.retract_acceleration = config.retract_acceleration
+ */
+    (__pyx_v_self->position[__pyx_v_i]) = 0.0;
+  }
+
+  /* "gcodetime_planner.pyx":121
+ *             self.max_acceleration[i] = config.max_acceleration[i]
+ *             self.position[i] = 0.0
+ *         self.acceleration = config.acceleration             # <<<<<<<<<<<<<<
+ *         self.retract_acceleration = config.retract_acceleration
+ *         self.xy_jerk = config.xy_jerk
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_acceleration); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->acceleration = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":122
+ *             self.position[i] = 0.0
+ *         self.acceleration = config.acceleration
+ *         self.retract_acceleration = config.retract_acceleration             # <<<<<<<<<<<<<<
+ *         self.xy_jerk = config.xy_jerk
+ *         self.z_jerk = config.z_jerk
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_retract_acceleration); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->retract_acceleration = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":123
+ *         self.acceleration = config.acceleration
+ *         self.retract_acceleration = config.retract_acceleration
+ *         self.xy_jerk = config.xy_jerk             # <<<<<<<<<<<<<<
+ *         self.z_jerk = config.z_jerk
+ *         self.e_jerk = config.e_jerk
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_xy_jerk); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->xy_jerk = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":124
+ *         self.retract_acceleration = config.retract_acceleration
+ *         self.xy_jerk = config.xy_jerk
+ *         self.z_jerk = config.z_jerk             # <<<<<<<<<<<<<<
+ *         self.e_jerk = config.e_jerk
+ *         self.min_feedrate = config.min_feedrate
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_z_jerk); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->z_jerk = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":125
+ *         self.xy_jerk = config.xy_jerk
+ *         self.z_jerk = config.z_jerk
+ *         self.e_jerk = config.e_jerk             # <<<<<<<<<<<<<<
+ *         self.min_feedrate = config.min_feedrate
+ *         self.min_travel_feedrate = config.min_travel_feedrate
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_e_jerk); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->e_jerk = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":126
+ *         self.z_jerk = config.z_jerk
+ *         self.e_jerk = config.e_jerk
+ *         self.min_feedrate = config.min_feedrate             # <<<<<<<<<<<<<<
+ *         self.min_travel_feedrate = config.min_travel_feedrate
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_min_feedrate); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->min_feedrate = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":127
+ *         self.e_jerk = config.e_jerk
+ *         self.min_feedrate = config.min_feedrate
+ *         self.min_travel_feedrate = config.min_travel_feedrate             # <<<<<<<<<<<<<<
+ * 
+ *         self.relative = False
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_config, __pyx_n_s_min_travel_feedrate); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_4 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->min_travel_feedrate = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":129
+ *         self.min_travel_feedrate = config.min_travel_feedrate
+ * 
+ *         self.relative = False             # <<<<<<<<<<<<<<
+ *         self.relative_e = False
+ *         self.feedrate = 1500.0 / 60.0
+ */
+  __pyx_v_self->relative = 0;
+
+  /* "gcodetime_planner.pyx":130
+ * 
+ *         self.relative = False
+ *         self.relative_e = False             # <<<<<<<<<<<<<<
+ *         self.feedrate = 1500.0 / 60.0
+ *         self.has_previous = False
+ */
+  __pyx_v_self->relative_e = 0;
+
+  /* "gcodetime_planner.pyx":131
+ *         self.relative = False
+ *         self.relative_e = False
+ *         self.feedrate = 1500.0 / 60.0             # <<<<<<<<<<<<<<
+ *         self.has_previous = False
+ *         self.previous_nominal = 0.0
+ */
+  __pyx_v_self->feedrate = (1500.0 / 60.0);
+
+  /* "gcodetime_planner.pyx":132
+ *         self.relative_e = False
+ *         self.feedrate = 1500.0 / 60.0
+ *         self.has_previous = False             # <<<<<<<<<<<<<<
+ *         self.previous_nominal = 0.0
+ *         self.count = 0
+ */
+  __pyx_v_self->has_previous = 0;
+
+  /* "gcodetime_planner.pyx":133
+ *         self.feedrate = 1500.0 / 60.0
+ *         self.has_previous = False
+ *         self.previous_nominal = 0.0             # <<<<<<<<<<<<<<
+ *         self.count = 0
+ *         self.entry = 0.0
+ */
+  __pyx_v_self->previous_nominal = 0.0;
+
+  /* "gcodetime_planner.pyx":134
+ *         self.has_previous = False
+ *         self.previous_nominal = 0.0
+ *         self.count = 0             # <<<<<<<<<<<<<<
+ *         self.entry = 0.0
+ *         self.elapsed = 0.0
+ */
+  __pyx_v_self->count = 0;
+
+  /* "gcodetime_planner.pyx":135
+ *         self.previous_nominal = 0.0
+ *         self.count = 0
+ *         self.entry = 0.0             # <<<<<<<<<<<<<<
+ *         self.elapsed = 0.0
+ *         self.moves = 0
+ */
+  __pyx_v_self->entry = 0.0;
+
+  /* "gcodetime_planner.pyx":136
+ *         self.count = 0
+ *         self.entry = 0.0
+ *         self.elapsed = 0.0             # <<<<<<<<<<<<<<
+ *         self.moves = 0
+ *         self.layer_marks = []
+ */
+  __pyx_v_self->elapsed = 0.0;
+
+  /* "gcodetime_planner.pyx":137
+ *         self.entry = 0.0
+ *         self.elapsed = 0.0
+ *         self.moves = 0             # <<<<<<<<<<<<<<
+ *         self.layer_marks = []
+ *         self.mark_index = 0
+ */
+  __pyx_v_self->moves = 0;
+
+  /* "gcodetime_planner.pyx":138
+ *         self.elapsed = 0.0
+ *         self.moves = 0
+ *         self.layer_marks = []             # <<<<<<<<<<<<<<
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->layer_marks);
+  __Pyx_DECREF(__pyx_v_self->layer_marks);
+  __pyx_v_self->layer_marks = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gcodetime_planner.pyx":139
+ *         self.moves = 0
+ *         self.layer_marks = []
+ *         self.mark_index = 0             # <<<<<<<<<<<<<<
+ *         self.next_mark = NO_MARK
+ *         self.layers = []
+ */
+  __pyx_v_self->mark_index = 0;
+
+  /* "gcodetime_planner.pyx":140
+ *         self.layer_marks = []
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK             # <<<<<<<<<<<<<<
+ *         self.layers = []
+ *         self.checkpoints = [(0, 0.0)]
+ */
+  __pyx_v_self->next_mark = 0x7FFFFFFFFFFFFFFF;
+
+  /* "gcodetime_planner.pyx":141
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK
+ *         self.layers = []             # <<<<<<<<<<<<<<
+ *         self.checkpoints = [(0, 0.0)]
+ * 
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->layers);
+  __Pyx_DECREF(__pyx_v_self->layers);
+  __pyx_v_self->layers = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gcodetime_planner.pyx":142
+ *         self.next_mark = NO_MARK
+ *         self.layers = []
+ *         self.checkpoints = [(0, 0.0)]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int add_move(self, double dx, double dy, double dz, double de, long long offset) except -1:
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->checkpoints);
+  __Pyx_DECREF(__pyx_v_self->checkpoints);
+  __pyx_v_self->checkpoints = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gcodetime_planner.pyx":115
+ *     cdef list checkpoints
+ * 
+ *     def __init__(self, config):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(4):
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":144
+ *         self.checkpoints = [(0, 0.0)]
+ * 
+ *     cdef int add_move(self, double dx, double dy, double dz, double de, long long offset) except -1:             # <<<<<<<<<<<<<<
+ *         cdef double length, ax, ay, az, ae, speed, duration, t, nominal
+ *         cdef double vx, vy, vz, ve, acceleration, factor, jerk, max_entry
+ */
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_move(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, double __pyx_v_dx, double __pyx_v_dy, double __pyx_v_dz, double __pyx_v_de, PY_LONG_LONG __pyx_v_offset) {
+  double __pyx_v_length;
+  double __pyx_v_ax;
+  double __pyx_v_ay;
+  double __pyx_v_az;
+  double __pyx_v_ae;
+  double __pyx_v_speed;
+  double __pyx_v_duration;
+  double __pyx_v_t;
+  double __pyx_v_nominal;
+  double __pyx_v_vx;
+  double __pyx_v_vy;
+  double __pyx_v_vz;
+  double __pyx_v_ve;
+  double __pyx_v_acceleration;
+  double __pyx_v_factor;
+  double __pyx_v_jerk;
+  double __pyx_v_max_entry;
+  int __pyx_v_extruder_only;
+  int __pyx_v_n;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  double __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_move", 0);
+
+  /* "gcodetime_planner.pyx":150
+ *         cdef int n
+ * 
+ *         length = sqrt(dx*dx + dy*dy + dz*dz)             # <<<<<<<<<<<<<<
+ *         extruder_only = length < 0.000001
+ *         if extruder_only:
+ */
+  __pyx_v_length = sqrt((((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy)) + (__pyx_v_dz * __pyx_v_dz)));
+
+  /* "gcodetime_planner.pyx":151
+ * 
+ *         length = sqrt(dx*dx + dy*dy + dz*dz)
+ *         extruder_only = length < 0.000001             # <<<<<<<<<<<<<<
+ *         if extruder_only:
+ *             length = fabs(de)
+ */
+  __pyx_v_extruder_only = (__pyx_v_length < 0.000001);
+
+  /* "gcodetime_planner.pyx":152
+ *         length = sqrt(dx*dx + dy*dy + dz*dz)
+ *         extruder_only = length < 0.000001
+ *         if extruder_only:             # <<<<<<<<<<<<<<
+ *             length = fabs(de)
+ *             if length < 0.000001:
+ */
+  __pyx_t_1 = (__pyx_v_extruder_only != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":153
+ *         extruder_only = length < 0.000001
+ *         if extruder_only:
+ *             length = fabs(de)             # <<<<<<<<<<<<<<
+ *             if length < 0.000001:
+ *                 return 0
+ */
+    __pyx_v_length = fabs(__pyx_v_de);
+
+    /* "gcodetime_planner.pyx":154
+ *         if extruder_only:
+ *             length = fabs(de)
+ *             if length < 0.000001:             # <<<<<<<<<<<<<<
+ *                 return 0
+ *         ax = fabs(dx)
+ */
+    __pyx_t_1 = ((__pyx_v_length < 0.000001) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":155
+ *             length = fabs(de)
+ *             if length < 0.000001:
+ *                 return 0             # <<<<<<<<<<<<<<
+ *         ax = fabs(dx)
+ *         ay = fabs(dy)
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "gcodetime_planner.pyx":154
+ *         if extruder_only:
+ *             length = fabs(de)
+ *             if length < 0.000001:             # <<<<<<<<<<<<<<
+ *                 return 0
+ *         ax = fabs(dx)
+ */
+    }
+
+    /* "gcodetime_planner.pyx":152
+ *         length = sqrt(dx*dx + dy*dy + dz*dz)
+ *         extruder_only = length < 0.000001
+ *         if extruder_only:             # <<<<<<<<<<<<<<
+ *             length = fabs(de)
+ *             if length < 0.000001:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":156
+ *             if length < 0.000001:
+ *                 return 0
+ *         ax = fabs(dx)             # <<<<<<<<<<<<<<
+ *         ay = fabs(dy)
+ *         az = fabs(dz)
+ */
+  __pyx_v_ax = fabs(__pyx_v_dx);
+
+  /* "gcodetime_planner.pyx":157
+ *                 return 0
+ *         ax = fabs(dx)
+ *         ay = fabs(dy)             # <<<<<<<<<<<<<<
+ *         az = fabs(dz)
+ *         ae = fabs(de)
+ */
+  __pyx_v_ay = fabs(__pyx_v_dy);
+
+  /* "gcodetime_planner.pyx":158
+ *         ax = fabs(dx)
+ *         ay = fabs(dy)
+ *         az = fabs(dz)             # <<<<<<<<<<<<<<
+ *         ae = fabs(de)
+ * 
+ */
+  __pyx_v_az = fabs(__pyx_v_dz);
+
+  /* "gcodetime_planner.pyx":159
+ *         ay = fabs(dy)
+ *         az = fabs(dz)
+ *         ae = fabs(de)             # <<<<<<<<<<<<<<
+ * 
+ *         speed = self.feedrate
+ */
+  __pyx_v_ae = fabs(__pyx_v_de);
+
+  /* "gcodetime_planner.pyx":161
+ *         ae = fabs(de)
+ * 
+ *         speed = self.feedrate             # <<<<<<<<<<<<<<
+ *         if de == 0:
+ *             if speed < self.min_travel_feedrate:
+ */
+  __pyx_t_2 = __pyx_v_self->feedrate;
+  __pyx_v_speed = __pyx_t_2;
+
+  /* "gcodetime_planner.pyx":162
+ * 
+ *         speed = self.feedrate
+ *         if de == 0:             # <<<<<<<<<<<<<<
+ *             if speed < self.min_travel_feedrate:
+ *                 speed = self.min_travel_feedrate
+ */
+  __pyx_t_1 = ((__pyx_v_de == 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":163
+ *         speed = self.feedrate
+ *         if de == 0:
+ *             if speed < self.min_travel_feedrate:             # <<<<<<<<<<<<<<
+ *                 speed = self.min_travel_feedrate
+ *         elif speed < self.min_feedrate:
+ */
+    __pyx_t_1 = ((__pyx_v_speed < __pyx_v_self->min_travel_feedrate) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":164
+ *         if de == 0:
+ *             if speed < self.min_travel_feedrate:
+ *                 speed = self.min_travel_feedrate             # <<<<<<<<<<<<<<
+ *         elif speed < self.min_feedrate:
+ *             speed = self.min_feedrate
+ */
+      __pyx_t_2 = __pyx_v_self->min_travel_feedrate;
+      __pyx_v_speed = __pyx_t_2;
+
+      /* "gcodetime_planner.pyx":163
+ *         speed = self.feedrate
+ *         if de == 0:
+ *             if speed < self.min_travel_feedrate:             # <<<<<<<<<<<<<<
+ *                 speed = self.min_travel_feedrate
+ *         elif speed < self.min_feedrate:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":162
+ * 
+ *         speed = self.feedrate
+ *         if de == 0:             # <<<<<<<<<<<<<<
+ *             if speed < self.min_travel_feedrate:
+ *                 speed = self.min_travel_feedrate
+ */
+    goto __pyx_L5;
+  }
+
+  /* "gcodetime_planner.pyx":165
+ *             if speed < self.min_travel_feedrate:
+ *                 speed = self.min_travel_feedrate
+ *         elif speed < self.min_feedrate:             # <<<<<<<<<<<<<<
+ *             speed = self.min_feedrate
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_speed < __pyx_v_self->min_feedrate) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":166
+ *                 speed = self.min_travel_feedrate
+ *         elif speed < self.min_feedrate:
+ *             speed = self.min_feedrate             # <<<<<<<<<<<<<<
+ * 
+ *         # Per axis feedrate limit, the time of the move is set by the slowest axis
+ */
+    __pyx_t_2 = __pyx_v_self->min_feedrate;
+    __pyx_v_speed = __pyx_t_2;
+
+    /* "gcodetime_planner.pyx":165
+ *             if speed < self.min_travel_feedrate:
+ *                 speed = self.min_travel_feedrate
+ *         elif speed < self.min_feedrate:             # <<<<<<<<<<<<<<
+ *             speed = self.min_feedrate
+ * 
+ */
+  }
+  __pyx_L5:;
+
+  /* "gcodetime_planner.pyx":169
+ * 
+ *         # Per axis feedrate limit, the time of the move is set by the slowest axis
+ *         duration = length / speed             # <<<<<<<<<<<<<<
+ *         t = ax / self.max_feedrate[0]
+ *         if ay / self.max_feedrate[1] > t:
+ */
+  __pyx_v_duration = (__pyx_v_length / __pyx_v_speed);
+
+  /* "gcodetime_planner.pyx":170
+ *         # Per axis feedrate limit, the time of the move is set by the slowest axis
+ *         duration = length / speed
+ *         t = ax / self.max_feedrate[0]             # <<<<<<<<<<<<<<
+ *         if ay / self.max_feedrate[1] > t:
+ *             t = ay / self.max_feedrate[1]
+ */
+  __pyx_v_t = (__pyx_v_ax / (__pyx_v_self->max_feedrate[0]));
+
+  /* "gcodetime_planner.pyx":171
+ *         duration = length / speed
+ *         t = ax / self.max_feedrate[0]
+ *         if ay / self.max_feedrate[1] > t:             # <<<<<<<<<<<<<<
+ *             t = ay / self.max_feedrate[1]
+ *         if az / self.max_feedrate[2] > t:
+ */
+  __pyx_t_1 = (((__pyx_v_ay / (__pyx_v_self->max_feedrate[1])) > __pyx_v_t) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":172
+ *         t = ax / self.max_feedrate[0]
+ *         if ay / self.max_feedrate[1] > t:
+ *             t = ay / self.max_feedrate[1]             # <<<<<<<<<<<<<<
+ *         if az / self.max_feedrate[2] > t:
+ *             t = az / self.max_feedrate[2]
+ */
+    __pyx_v_t = (__pyx_v_ay / (__pyx_v_self->max_feedrate[1]));
+
+    /* "gcodetime_planner.pyx":171
+ *         duration = length / speed
+ *         t = ax / self.max_feedrate[0]
+ *         if ay / self.max_feedrate[1] > t:             # <<<<<<<<<<<<<<
+ *             t = ay / self.max_feedrate[1]
+ *         if az / self.max_feedrate[2] > t:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":173
+ *         if ay / self.max_feedrate[1] > t:
+ *             t = ay / self.max_feedrate[1]
+ *         if az / self.max_feedrate[2] > t:             # <<<<<<<<<<<<<<
+ *             t = az / self.max_feedrate[2]
+ *         if ae / self.max_feedrate[3] > t:
+ */
+  __pyx_t_1 = (((__pyx_v_az / (__pyx_v_self->max_feedrate[2])) > __pyx_v_t) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":174
+ *             t = ay / self.max_feedrate[1]
+ *         if az / self.max_feedrate[2] > t:
+ *             t = az / self.max_feedrate[2]             # <<<<<<<<<<<<<<
+ *         if ae / self.max_feedrate[3] > t:
+ *             t = ae / self.max_feedrate[3]
+ */
+    __pyx_v_t = (__pyx_v_az / (__pyx_v_self->max_feedrate[2]));
+
+    /* "gcodetime_planner.pyx":173
+ *         if ay / self.max_feedrate[1] > t:
+ *             t = ay / self.max_feedrate[1]
+ *         if az / self.max_feedrate[2] > t:             # <<<<<<<<<<<<<<
+ *             t = az / self.max_feedrate[2]
+ *         if ae / self.max_feedrate[3] > t:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":175
+ *         if az / self.max_feedrate[2] > t:
+ *             t = az / self.max_feedrate[2]
+ *         if ae / self.max_feedrate[3] > t:             # <<<<<<<<<<<<<<
+ *             t = ae / self.max_feedrate[3]
+ *         if t > duration:
+ */
+  __pyx_t_1 = (((__pyx_v_ae / (__pyx_v_self->max_feedrate[3])) > __pyx_v_t) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":176
+ *             t = az / self.max_feedrate[2]
+ *         if ae / self.max_feedrate[3] > t:
+ *             t = ae / self.max_feedrate[3]             # <<<<<<<<<<<<<<
+ *         if t > duration:
+ *             duration = t
+ */
+    __pyx_v_t = (__pyx_v_ae / (__pyx_v_self->max_feedrate[3]));
+
+    /* "gcodetime_planner.pyx":175
+ *         if az / self.max_feedrate[2] > t:
+ *             t = az / self.max_feedrate[2]
+ *         if ae / self.max_feedrate[3] > t:             # <<<<<<<<<<<<<<
+ *             t = ae / self.max_feedrate[3]
+ *         if t > duration:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":177
+ *         if ae / self.max_feedrate[3] > t:
+ *             t = ae / self.max_feedrate[3]
+ *         if t > duration:             # <<<<<<<<<<<<<<
+ *             duration = t
+ *         nominal = length / duration
+ */
+  __pyx_t_1 = ((__pyx_v_t > __pyx_v_duration) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":178
+ *             t = ae / self.max_feedrate[3]
+ *         if t > duration:
+ *             duration = t             # <<<<<<<<<<<<<<
+ *         nominal = length / duration
+ *         vx = dx / duration
+ */
+    __pyx_v_duration = __pyx_v_t;
+
+    /* "gcodetime_planner.pyx":177
+ *         if ae / self.max_feedrate[3] > t:
+ *             t = ae / self.max_feedrate[3]
+ *         if t > duration:             # <<<<<<<<<<<<<<
+ *             duration = t
+ *         nominal = length / duration
+ */
+  }
+
+  /* "gcodetime_planner.pyx":179
+ *         if t > duration:
+ *             duration = t
+ *         nominal = length / duration             # <<<<<<<<<<<<<<
+ *         vx = dx / duration
+ *         vy = dy / duration
+ */
+  __pyx_v_nominal = (__pyx_v_length / __pyx_v_duration);
+
+  /* "gcodetime_planner.pyx":180
+ *             duration = t
+ *         nominal = length / duration
+ *         vx = dx / duration             # <<<<<<<<<<<<<<
+ *         vy = dy / duration
+ *         vz = dz / duration
+ */
+  __pyx_v_vx = (__pyx_v_dx / __pyx_v_duration);
+
+  /* "gcodetime_planner.pyx":181
+ *         nominal = length / duration
+ *         vx = dx / duration
+ *         vy = dy / duration             # <<<<<<<<<<<<<<
+ *         vz = dz / duration
+ *         ve = de / duration
+ */
+  __pyx_v_vy = (__pyx_v_dy / __pyx_v_duration);
+
+  /* "gcodetime_planner.pyx":182
+ *         vx = dx / duration
+ *         vy = dy / duration
+ *         vz = dz / duration             # <<<<<<<<<<<<<<
+ *         ve = de / duration
+ * 
+ */
+  __pyx_v_vz = (__pyx_v_dz / __pyx_v_duration);
+
+  /* "gcodetime_planner.pyx":183
+ *         vy = dy / duration
+ *         vz = dz / duration
+ *         ve = de / duration             # <<<<<<<<<<<<<<
+ * 
+ *         # Per axis acceleration limit
+ */
+  __pyx_v_ve = (__pyx_v_de / __pyx_v_duration);
+
+  /* "gcodetime_planner.pyx":186
+ * 
+ *         # Per axis acceleration limit
+ *         acceleration = self.retract_acceleration if extruder_only else self.acceleration             # <<<<<<<<<<<<<<
+ *         if acceleration * ax > self.max_acceleration[0] * length:
+ *             acceleration = self.max_acceleration[0] * length / ax
+ */
+  if ((__pyx_v_extruder_only != 0)) {
+    __pyx_t_2 = __pyx_v_self->retract_acceleration;
+  } else {
+    __pyx_t_2 = __pyx_v_self->acceleration;
+  }
+  __pyx_v_acceleration = __pyx_t_2;
+
+  /* "gcodetime_planner.pyx":187
+ *         # Per axis acceleration limit
+ *         acceleration = self.retract_acceleration if extruder_only else self.acceleration
+ *         if acceleration * ax > self.max_acceleration[0] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[0] * length / ax
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ */
+  __pyx_t_1 = (((__pyx_v_acceleration * __pyx_v_ax) > ((__pyx_v_self->max_acceleration[0]) * __pyx_v_length)) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":188
+ *         acceleration = self.retract_acceleration if extruder_only else self.acceleration
+ *         if acceleration * ax > self.max_acceleration[0] * length:
+ *             acceleration = self.max_acceleration[0] * length / ax             # <<<<<<<<<<<<<<
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ *             acceleration = self.max_acceleration[1] * length / ay
+ */
+    __pyx_v_acceleration = (((__pyx_v_self->max_acceleration[0]) * __pyx_v_length) / __pyx_v_ax);
+
+    /* "gcodetime_planner.pyx":187
+ *         # Per axis acceleration limit
+ *         acceleration = self.retract_acceleration if extruder_only else self.acceleration
+ *         if acceleration * ax > self.max_acceleration[0] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[0] * length / ax
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":189
+ *         if acceleration * ax > self.max_acceleration[0] * length:
+ *             acceleration = self.max_acceleration[0] * length / ax
+ *         if acceleration * ay > self.max_acceleration[1] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[1] * length / ay
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ */
+  __pyx_t_1 = (((__pyx_v_acceleration * __pyx_v_ay) > ((__pyx_v_self->max_acceleration[1]) * __pyx_v_length)) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":190
+ *             acceleration = self.max_acceleration[0] * length / ax
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ *             acceleration = self.max_acceleration[1] * length / ay             # <<<<<<<<<<<<<<
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ *             acceleration = self.max_acceleration[2] * length / az
+ */
+    __pyx_v_acceleration = (((__pyx_v_self->max_acceleration[1]) * __pyx_v_length) / __pyx_v_ay);
+
+    /* "gcodetime_planner.pyx":189
+ *         if acceleration * ax > self.max_acceleration[0] * length:
+ *             acceleration = self.max_acceleration[0] * length / ax
+ *         if acceleration * ay > self.max_acceleration[1] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[1] * length / ay
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":191
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ *             acceleration = self.max_acceleration[1] * length / ay
+ *         if acceleration * az > self.max_acceleration[2] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[2] * length / az
+ *         if acceleration * ae > self.max_acceleration[3] * length:
+ */
+  __pyx_t_1 = (((__pyx_v_acceleration * __pyx_v_az) > ((__pyx_v_self->max_acceleration[2]) * __pyx_v_length)) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":192
+ *             acceleration = self.max_acceleration[1] * length / ay
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ *             acceleration = self.max_acceleration[2] * length / az             # <<<<<<<<<<<<<<
+ *         if acceleration * ae > self.max_acceleration[3] * length:
+ *             acceleration = self.max_acceleration[3] * length / ae
+ */
+    __pyx_v_acceleration = (((__pyx_v_self->max_acceleration[2]) * __pyx_v_length) / __pyx_v_az);
+
+    /* "gcodetime_planner.pyx":191
+ *         if acceleration * ay > self.max_acceleration[1] * length:
+ *             acceleration = self.max_acceleration[1] * length / ay
+ *         if acceleration * az > self.max_acceleration[2] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[2] * length / az
+ *         if acceleration * ae > self.max_acceleration[3] * length:
+ */
+  }
+
+  /* "gcodetime_planner.pyx":193
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ *             acceleration = self.max_acceleration[2] * length / az
+ *         if acceleration * ae > self.max_acceleration[3] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[3] * length / ae
+ * 
+ */
+  __pyx_t_1 = (((__pyx_v_acceleration * __pyx_v_ae) > ((__pyx_v_self->max_acceleration[3]) * __pyx_v_length)) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":194
+ *             acceleration = self.max_acceleration[2] * length / az
+ *         if acceleration * ae > self.max_acceleration[3] * length:
+ *             acceleration = self.max_acceleration[3] * length / ae             # <<<<<<<<<<<<<<
+ * 
+ *         # Junction speed limited by the jerk settings
+ */
+    __pyx_v_acceleration = (((__pyx_v_self->max_acceleration[3]) * __pyx_v_length) / __pyx_v_ae);
+
+    /* "gcodetime_planner.pyx":193
+ *         if acceleration * az > self.max_acceleration[2] * length:
+ *             acceleration = self.max_acceleration[2] * length / az
+ *         if acceleration * ae > self.max_acceleration[3] * length:             # <<<<<<<<<<<<<<
+ *             acceleration = self.max_acceleration[3] * length / ae
+ * 
+ */
+  }
+
+  /* "gcodetime_planner.pyx":197
+ * 
+ *         # Junction speed limited by the jerk settings
+ *         if self.has_previous and self.previous_nominal > 0.0001:             # <<<<<<<<<<<<<<
+ *             factor = 1.0
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ */
+  __pyx_t_3 = (__pyx_v_self->has_previous != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L16_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_self->previous_nominal > 0.0001) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L16_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":198
+ *         # Junction speed limited by the jerk settings
+ *         if self.has_previous and self.previous_nominal > 0.0001:
+ *             factor = 1.0             # <<<<<<<<<<<<<<
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ *             if jerk > self.xy_jerk:
+ */
+    __pyx_v_factor = 1.0;
+
+    /* "gcodetime_planner.pyx":199
+ *         if self.has_previous and self.previous_nominal > 0.0001:
+ *             factor = 1.0
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])             # <<<<<<<<<<<<<<
+ *             if jerk > self.xy_jerk:
+ *                 factor = self.xy_jerk / jerk
+ */
+    __pyx_v_jerk = hypot((__pyx_v_vx - (__pyx_v_self->previous_speed[0])), (__pyx_v_vy - (__pyx_v_self->previous_speed[1])));
+
+    /* "gcodetime_planner.pyx":200
+ *             factor = 1.0
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ *             if jerk > self.xy_jerk:             # <<<<<<<<<<<<<<
+ *                 factor = self.xy_jerk / jerk
+ *             jerk = fabs(vz - self.previous_speed[2])
+ */
+    __pyx_t_1 = ((__pyx_v_jerk > __pyx_v_self->xy_jerk) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":201
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ *             if jerk > self.xy_jerk:
+ *                 factor = self.xy_jerk / jerk             # <<<<<<<<<<<<<<
+ *             jerk = fabs(vz - self.previous_speed[2])
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:
+ */
+      __pyx_v_factor = (__pyx_v_self->xy_jerk / __pyx_v_jerk);
+
+      /* "gcodetime_planner.pyx":200
+ *             factor = 1.0
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ *             if jerk > self.xy_jerk:             # <<<<<<<<<<<<<<
+ *                 factor = self.xy_jerk / jerk
+ *             jerk = fabs(vz - self.previous_speed[2])
+ */
+    }
+
+    /* "gcodetime_planner.pyx":202
+ *             if jerk > self.xy_jerk:
+ *                 factor = self.xy_jerk / jerk
+ *             jerk = fabs(vz - self.previous_speed[2])             # <<<<<<<<<<<<<<
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:
+ *                 factor = self.z_jerk / jerk
+ */
+    __pyx_v_jerk = fabs((__pyx_v_vz - (__pyx_v_self->previous_speed[2])));
+
+    /* "gcodetime_planner.pyx":203
+ *                 factor = self.xy_jerk / jerk
+ *             jerk = fabs(vz - self.previous_speed[2])
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:             # <<<<<<<<<<<<<<
+ *                 factor = self.z_jerk / jerk
+ *             jerk = fabs(ve - self.previous_speed[3])
+ */
+    __pyx_t_3 = ((__pyx_v_jerk > __pyx_v_self->z_jerk) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L20_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_self->z_jerk / __pyx_v_jerk) < __pyx_v_factor) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L20_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":204
+ *             jerk = fabs(vz - self.previous_speed[2])
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:
+ *                 factor = self.z_jerk / jerk             # <<<<<<<<<<<<<<
+ *             jerk = fabs(ve - self.previous_speed[3])
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:
+ */
+      __pyx_v_factor = (__pyx_v_self->z_jerk / __pyx_v_jerk);
+
+      /* "gcodetime_planner.pyx":203
+ *                 factor = self.xy_jerk / jerk
+ *             jerk = fabs(vz - self.previous_speed[2])
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:             # <<<<<<<<<<<<<<
+ *                 factor = self.z_jerk / jerk
+ *             jerk = fabs(ve - self.previous_speed[3])
+ */
+    }
+
+    /* "gcodetime_planner.pyx":205
+ *             if jerk > self.z_jerk and self.z_jerk / jerk < factor:
+ *                 factor = self.z_jerk / jerk
+ *             jerk = fabs(ve - self.previous_speed[3])             # <<<<<<<<<<<<<<
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:
+ *                 factor = self.e_jerk / jerk
+ */
+    __pyx_v_jerk = fabs((__pyx_v_ve - (__pyx_v_self->previous_speed[3])));
+
+    /* "gcodetime_planner.pyx":206
+ *                 factor = self.z_jerk / jerk
+ *             jerk = fabs(ve - self.previous_speed[3])
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:             # <<<<<<<<<<<<<<
+ *                 factor = self.e_jerk / jerk
+ *             max_entry = self.previous_nominal
+ */
+    __pyx_t_3 = ((__pyx_v_jerk > __pyx_v_self->e_jerk) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L23_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_self->e_jerk / __pyx_v_jerk) < __pyx_v_factor) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L23_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":207
+ *             jerk = fabs(ve - self.previous_speed[3])
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:
+ *                 factor = self.e_jerk / jerk             # <<<<<<<<<<<<<<
+ *             max_entry = self.previous_nominal
+ *             if nominal * factor < max_entry:
+ */
+      __pyx_v_factor = (__pyx_v_self->e_jerk / __pyx_v_jerk);
+
+      /* "gcodetime_planner.pyx":206
+ *                 factor = self.z_jerk / jerk
+ *             jerk = fabs(ve - self.previous_speed[3])
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:             # <<<<<<<<<<<<<<
+ *                 factor = self.e_jerk / jerk
+ *             max_entry = self.previous_nominal
+ */
+    }
+
+    /* "gcodetime_planner.pyx":208
+ *             if jerk > self.e_jerk and self.e_jerk / jerk < factor:
+ *                 factor = self.e_jerk / jerk
+ *             max_entry = self.previous_nominal             # <<<<<<<<<<<<<<
+ *             if nominal * factor < max_entry:
+ *                 max_entry = nominal * factor
+ */
+    __pyx_t_2 = __pyx_v_self->previous_nominal;
+    __pyx_v_max_entry = __pyx_t_2;
+
+    /* "gcodetime_planner.pyx":209
+ *                 factor = self.e_jerk / jerk
+ *             max_entry = self.previous_nominal
+ *             if nominal * factor < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = nominal * factor
+ *         else:
+ */
+    __pyx_t_1 = (((__pyx_v_nominal * __pyx_v_factor) < __pyx_v_max_entry) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":210
+ *             max_entry = self.previous_nominal
+ *             if nominal * factor < max_entry:
+ *                 max_entry = nominal * factor             # <<<<<<<<<<<<<<
+ *         else:
+ *             # Safe speed to start from a full stop
+ */
+      __pyx_v_max_entry = (__pyx_v_nominal * __pyx_v_factor);
+
+      /* "gcodetime_planner.pyx":209
+ *                 factor = self.e_jerk / jerk
+ *             max_entry = self.previous_nominal
+ *             if nominal * factor < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = nominal * factor
+ *         else:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":197
+ * 
+ *         # Junction speed limited by the jerk settings
+ *         if self.has_previous and self.previous_nominal > 0.0001:             # <<<<<<<<<<<<<<
+ *             factor = 1.0
+ *             jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+ */
+    goto __pyx_L15;
+  }
+
+  /* "gcodetime_planner.pyx":213
+ *         else:
+ *             # Safe speed to start from a full stop
+ *             max_entry = self.xy_jerk / 2             # <<<<<<<<<<<<<<
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:
+ *                 max_entry = self.z_jerk / 2
+ */
+  /*else*/ {
+    __pyx_v_max_entry = (__pyx_v_self->xy_jerk / 2.0);
+
+    /* "gcodetime_planner.pyx":214
+ *             # Safe speed to start from a full stop
+ *             max_entry = self.xy_jerk / 2
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = self.z_jerk / 2
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ */
+    __pyx_t_3 = ((fabs(__pyx_v_vz) > (__pyx_v_self->z_jerk / 2.0)) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L27_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_self->z_jerk / 2.0) < __pyx_v_max_entry) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L27_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":215
+ *             max_entry = self.xy_jerk / 2
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:
+ *                 max_entry = self.z_jerk / 2             # <<<<<<<<<<<<<<
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ *                 max_entry = self.e_jerk / 2
+ */
+      __pyx_v_max_entry = (__pyx_v_self->z_jerk / 2.0);
+
+      /* "gcodetime_planner.pyx":214
+ *             # Safe speed to start from a full stop
+ *             max_entry = self.xy_jerk / 2
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = self.z_jerk / 2
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":216
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:
+ *                 max_entry = self.z_jerk / 2
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = self.e_jerk / 2
+ *             if nominal < max_entry:
+ */
+    __pyx_t_3 = ((fabs(__pyx_v_ve) > (__pyx_v_self->e_jerk / 2.0)) != 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L30_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_self->e_jerk / 2.0) < __pyx_v_max_entry) != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L30_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":217
+ *                 max_entry = self.z_jerk / 2
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ *                 max_entry = self.e_jerk / 2             # <<<<<<<<<<<<<<
+ *             if nominal < max_entry:
+ *                 max_entry = nominal
+ */
+      __pyx_v_max_entry = (__pyx_v_self->e_jerk / 2.0);
+
+      /* "gcodetime_planner.pyx":216
+ *             if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:
+ *                 max_entry = self.z_jerk / 2
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = self.e_jerk / 2
+ *             if nominal < max_entry:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":218
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ *                 max_entry = self.e_jerk / 2
+ *             if nominal < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = nominal
+ * 
+ */
+    __pyx_t_1 = ((__pyx_v_nominal < __pyx_v_max_entry) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":219
+ *                 max_entry = self.e_jerk / 2
+ *             if nominal < max_entry:
+ *                 max_entry = nominal             # <<<<<<<<<<<<<<
+ * 
+ *         self.has_previous = True
+ */
+      __pyx_v_max_entry = __pyx_v_nominal;
+
+      /* "gcodetime_planner.pyx":218
+ *             if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+ *                 max_entry = self.e_jerk / 2
+ *             if nominal < max_entry:             # <<<<<<<<<<<<<<
+ *                 max_entry = nominal
+ * 
+ */
+    }
+  }
+  __pyx_L15:;
+
+  /* "gcodetime_planner.pyx":221
+ *                 max_entry = nominal
+ * 
+ *         self.has_previous = True             # <<<<<<<<<<<<<<
+ *         self.previous_speed[0] = vx
+ *         self.previous_speed[1] = vy
+ */
+  __pyx_v_self->has_previous = 1;
+
+  /* "gcodetime_planner.pyx":222
+ * 
+ *         self.has_previous = True
+ *         self.previous_speed[0] = vx             # <<<<<<<<<<<<<<
+ *         self.previous_speed[1] = vy
+ *         self.previous_speed[2] = vz
+ */
+  (__pyx_v_self->previous_speed[0]) = __pyx_v_vx;
+
+  /* "gcodetime_planner.pyx":223
+ *         self.has_previous = True
+ *         self.previous_speed[0] = vx
+ *         self.previous_speed[1] = vy             # <<<<<<<<<<<<<<
+ *         self.previous_speed[2] = vz
+ *         self.previous_speed[3] = ve
+ */
+  (__pyx_v_self->previous_speed[1]) = __pyx_v_vy;
+
+  /* "gcodetime_planner.pyx":224
+ *         self.previous_speed[0] = vx
+ *         self.previous_speed[1] = vy
+ *         self.previous_speed[2] = vz             # <<<<<<<<<<<<<<
+ *         self.previous_speed[3] = ve
+ *         self.previous_nominal = nominal
+ */
+  (__pyx_v_self->previous_speed[2]) = __pyx_v_vz;
+
+  /* "gcodetime_planner.pyx":225
+ *         self.previous_speed[1] = vy
+ *         self.previous_speed[2] = vz
+ *         self.previous_speed[3] = ve             # <<<<<<<<<<<<<<
+ *         self.previous_nominal = nominal
+ * 
+ */
+  (__pyx_v_self->previous_speed[3]) = __pyx_v_ve;
+
+  /* "gcodetime_planner.pyx":226
+ *         self.previous_speed[2] = vz
+ *         self.previous_speed[3] = ve
+ *         self.previous_nominal = nominal             # <<<<<<<<<<<<<<
+ * 
+ *         n = self.count
+ */
+  __pyx_v_self->previous_nominal = __pyx_v_nominal;
+
+  /* "gcodetime_planner.pyx":228
+ *         self.previous_nominal = nominal
+ * 
+ *         n = self.count             # <<<<<<<<<<<<<<
+ *         self.lengths[n] = length
+ *         self.accelerations[n] = acceleration
+ */
+  __pyx_t_4 = __pyx_v_self->count;
+  __pyx_v_n = __pyx_t_4;
+
+  /* "gcodetime_planner.pyx":229
+ * 
+ *         n = self.count
+ *         self.lengths[n] = length             # <<<<<<<<<<<<<<
+ *         self.accelerations[n] = acceleration
+ *         self.nominals[n] = nominal
+ */
+  (__pyx_v_self->lengths[__pyx_v_n]) = __pyx_v_length;
+
+  /* "gcodetime_planner.pyx":230
+ *         n = self.count
+ *         self.lengths[n] = length
+ *         self.accelerations[n] = acceleration             # <<<<<<<<<<<<<<
+ *         self.nominals[n] = nominal
+ *         self.max_entries[n] = max_entry
+ */
+  (__pyx_v_self->accelerations[__pyx_v_n]) = __pyx_v_acceleration;
+
+  /* "gcodetime_planner.pyx":231
+ *         self.lengths[n] = length
+ *         self.accelerations[n] = acceleration
+ *         self.nominals[n] = nominal             # <<<<<<<<<<<<<<
+ *         self.max_entries[n] = max_entry
+ *         self.offsets[n] = offset
+ */
+  (__pyx_v_self->nominals[__pyx_v_n]) = __pyx_v_nominal;
+
+  /* "gcodetime_planner.pyx":232
+ *         self.accelerations[n] = acceleration
+ *         self.nominals[n] = nominal
+ *         self.max_entries[n] = max_entry             # <<<<<<<<<<<<<<
+ *         self.offsets[n] = offset
+ *         self.count = n + 1
+ */
+  (__pyx_v_self->max_entries[__pyx_v_n]) = __pyx_v_max_entry;
+
+  /* "gcodetime_planner.pyx":233
+ *         self.nominals[n] = nominal
+ *         self.max_entries[n] = max_entry
+ *         self.offsets[n] = offset             # <<<<<<<<<<<<<<
+ *         self.count = n + 1
+ *         self.moves += 1
+ */
+  (__pyx_v_self->offsets[__pyx_v_n]) = __pyx_v_offset;
+
+  /* "gcodetime_planner.pyx":234
+ *         self.max_entries[n] = max_entry
+ *         self.offsets[n] = offset
+ *         self.count = n + 1             # <<<<<<<<<<<<<<
+ *         self.moves += 1
+ * 
+ */
+  __pyx_v_self->count = (__pyx_v_n + 1);
+
+  /* "gcodetime_planner.pyx":235
+ *         self.offsets[n] = offset
+ *         self.count = n + 1
+ *         self.moves += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if self.count >= CAPACITY:
+ */
+  __pyx_v_self->moves = (__pyx_v_self->moves + 1);
+
+  /* "gcodetime_planner.pyx":237
+ *         self.moves += 1
+ * 
+ *         if self.count >= CAPACITY:             # <<<<<<<<<<<<<<
+ *             self.plan(PLAN_CHUNK_SIZE, False)
+ *         return 0
+ */
+  __pyx_t_1 = ((__pyx_v_self->count >= 0x1010) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":238
+ * 
+ *         if self.count >= CAPACITY:
+ *             self.plan(PLAN_CHUNK_SIZE, False)             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_t_4 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->plan(__pyx_v_self, 0x1000, 0); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 238, __pyx_L1_error)
+
+    /* "gcodetime_planner.pyx":237
+ *         self.moves += 1
+ * 
+ *         if self.count >= CAPACITY:             # <<<<<<<<<<<<<<
+ *             self.plan(PLAN_CHUNK_SIZE, False)
+ *         return 0
+ */
+  }
+
+  /* "gcodetime_planner.pyx":239
+ *         if self.count >= CAPACITY:
+ *             self.plan(PLAN_CHUNK_SIZE, False)
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int add_arc(self, double x, double y, double *delta, double i, double j,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":144
+ *         self.checkpoints = [(0, 0.0)]
+ * 
+ *     cdef int add_move(self, double dx, double dy, double dz, double de, long long offset) except -1:             # <<<<<<<<<<<<<<
+ *         cdef double length, ax, ay, az, ae, speed, duration, t, nominal
+ *         cdef double vx, vy, vz, ve, acceleration, factor, jerk, max_entry
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.add_move", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":241
+ *         return 0
+ * 
+ *     cdef int add_arc(self, double x, double y, double *delta, double i, double j,             # <<<<<<<<<<<<<<
+ *                      double r, bint has_r, bint clockwise, long long offset) except -1:
+ *         cdef double dx = delta[0], dy = delta[1], dz = delta[2], de = delta[3]
+ */
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_arc(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, double __pyx_v_x, double __pyx_v_y, double *__pyx_v_delta, double __pyx_v_i, double __pyx_v_j, double __pyx_v_r, int __pyx_v_has_r, int __pyx_v_clockwise, PY_LONG_LONG __pyx_v_offset) {
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  double __pyx_v_dz;
+  double __pyx_v_de;
+  double __pyx_v_chord;
+  double __pyx_v_h;
+  double __pyx_v_cx;
+  double __pyx_v_cy;
+  double __pyx_v_radius;
+  double __pyx_v_start_angle;
+  double __pyx_v_travel;
+  double __pyx_v_angle;
+  double __pyx_v_last_x;
+  double __pyx_v_last_y;
+  double __pyx_v_sx;
+  double __pyx_v_sy;
+  long __pyx_v_segments;
+  long __pyx_v_k;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  long __pyx_t_3;
+  long __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("add_arc", 0);
+
+  /* "gcodetime_planner.pyx":243
+ *     cdef int add_arc(self, double x, double y, double *delta, double i, double j,
+ *                      double r, bint has_r, bint clockwise, long long offset) except -1:
+ *         cdef double dx = delta[0], dy = delta[1], dz = delta[2], de = delta[3]             # <<<<<<<<<<<<<<
+ *         cdef double chord, h, cx, cy, radius, start_angle, travel, angle
+ *         cdef double last_x, last_y, sx, sy
+ */
+  __pyx_v_dx = (__pyx_v_delta[0]);
+  __pyx_v_dy = (__pyx_v_delta[1]);
+  __pyx_v_dz = (__pyx_v_delta[2]);
+  __pyx_v_de = (__pyx_v_delta[3]);
+
+  /* "gcodetime_planner.pyx":248
+ *         cdef long segments, k
+ * 
+ *         if has_r:             # <<<<<<<<<<<<<<
+ *             chord = hypot(dx, dy)
+ *             if chord == 0:
+ */
+  __pyx_t_1 = (__pyx_v_has_r != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":249
+ * 
+ *         if has_r:
+ *             chord = hypot(dx, dy)             # <<<<<<<<<<<<<<
+ *             if chord == 0:
+ *                 return self.add_move(dx, dy, dz, de, offset)
+ */
+    __pyx_v_chord = hypot(__pyx_v_dx, __pyx_v_dy);
+
+    /* "gcodetime_planner.pyx":250
+ *         if has_r:
+ *             chord = hypot(dx, dy)
+ *             if chord == 0:             # <<<<<<<<<<<<<<
+ *                 return self.add_move(dx, dy, dz, de, offset)
+ *             # A negative radius selects the long arc
+ */
+    __pyx_t_1 = ((__pyx_v_chord == 0.0) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":251
+ *             chord = hypot(dx, dy)
+ *             if chord == 0:
+ *                 return self.add_move(dx, dy, dz, de, offset)             # <<<<<<<<<<<<<<
+ *             # A negative radius selects the long arc
+ *             h = r*r - chord*chord/4
+ */
+      __pyx_t_2 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->add_move(__pyx_v_self, __pyx_v_dx, __pyx_v_dy, __pyx_v_dz, __pyx_v_de, __pyx_v_offset); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 251, __pyx_L1_error)
+      __pyx_r = __pyx_t_2;
+      goto __pyx_L0;
+
+      /* "gcodetime_planner.pyx":250
+ *         if has_r:
+ *             chord = hypot(dx, dy)
+ *             if chord == 0:             # <<<<<<<<<<<<<<
+ *                 return self.add_move(dx, dy, dz, de, offset)
+ *             # A negative radius selects the long arc
+ */
+    }
+
+    /* "gcodetime_planner.pyx":253
+ *                 return self.add_move(dx, dy, dz, de, offset)
+ *             # A negative radius selects the long arc
+ *             h = r*r - chord*chord/4             # <<<<<<<<<<<<<<
+ *             if h < 0.0:
+ *                 h = 0.0
+ */
+    __pyx_v_h = ((__pyx_v_r * __pyx_v_r) - ((__pyx_v_chord * __pyx_v_chord) / 4.0));
+
+    /* "gcodetime_planner.pyx":254
+ *             # A negative radius selects the long arc
+ *             h = r*r - chord*chord/4
+ *             if h < 0.0:             # <<<<<<<<<<<<<<
+ *                 h = 0.0
+ *             h = sqrt(h) / chord
+ */
+    __pyx_t_1 = ((__pyx_v_h < 0.0) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":255
+ *             h = r*r - chord*chord/4
+ *             if h < 0.0:
+ *                 h = 0.0             # <<<<<<<<<<<<<<
+ *             h = sqrt(h) / chord
+ *             if (not clockwise) != (r < 0):
+ */
+      __pyx_v_h = 0.0;
+
+      /* "gcodetime_planner.pyx":254
+ *             # A negative radius selects the long arc
+ *             h = r*r - chord*chord/4
+ *             if h < 0.0:             # <<<<<<<<<<<<<<
+ *                 h = 0.0
+ *             h = sqrt(h) / chord
+ */
+    }
+
+    /* "gcodetime_planner.pyx":256
+ *             if h < 0.0:
+ *                 h = 0.0
+ *             h = sqrt(h) / chord             # <<<<<<<<<<<<<<
+ *             if (not clockwise) != (r < 0):
+ *                 h = -h
+ */
+    __pyx_v_h = (sqrt(__pyx_v_h) / __pyx_v_chord);
+
+    /* "gcodetime_planner.pyx":257
+ *                 h = 0.0
+ *             h = sqrt(h) / chord
+ *             if (not clockwise) != (r < 0):             # <<<<<<<<<<<<<<
+ *                 h = -h
+ *             cx = x + dx/2 + h*dy
+ */
+    __pyx_t_1 = (((!(__pyx_v_clockwise != 0)) != (__pyx_v_r < 0.0)) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":258
+ *             h = sqrt(h) / chord
+ *             if (not clockwise) != (r < 0):
+ *                 h = -h             # <<<<<<<<<<<<<<
+ *             cx = x + dx/2 + h*dy
+ *             cy = y + dy/2 - h*dx
+ */
+      __pyx_v_h = (-__pyx_v_h);
+
+      /* "gcodetime_planner.pyx":257
+ *                 h = 0.0
+ *             h = sqrt(h) / chord
+ *             if (not clockwise) != (r < 0):             # <<<<<<<<<<<<<<
+ *                 h = -h
+ *             cx = x + dx/2 + h*dy
+ */
+    }
+
+    /* "gcodetime_planner.pyx":259
+ *             if (not clockwise) != (r < 0):
+ *                 h = -h
+ *             cx = x + dx/2 + h*dy             # <<<<<<<<<<<<<<
+ *             cy = y + dy/2 - h*dx
+ *         else:
+ */
+    __pyx_v_cx = ((__pyx_v_x + (__pyx_v_dx / 2.0)) + (__pyx_v_h * __pyx_v_dy));
+
+    /* "gcodetime_planner.pyx":260
+ *                 h = -h
+ *             cx = x + dx/2 + h*dy
+ *             cy = y + dy/2 - h*dx             # <<<<<<<<<<<<<<
+ *         else:
+ *             cx = x + i
+ */
+    __pyx_v_cy = ((__pyx_v_y + (__pyx_v_dy / 2.0)) - (__pyx_v_h * __pyx_v_dx));
+
+    /* "gcodetime_planner.pyx":248
+ *         cdef long segments, k
+ * 
+ *         if has_r:             # <<<<<<<<<<<<<<
+ *             chord = hypot(dx, dy)
+ *             if chord == 0:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "gcodetime_planner.pyx":262
+ *             cy = y + dy/2 - h*dx
+ *         else:
+ *             cx = x + i             # <<<<<<<<<<<<<<
+ *             cy = y + j
+ * 
+ */
+  /*else*/ {
+    __pyx_v_cx = (__pyx_v_x + __pyx_v_i);
+
+    /* "gcodetime_planner.pyx":263
+ *         else:
+ *             cx = x + i
+ *             cy = y + j             # <<<<<<<<<<<<<<
+ * 
+ *         radius = hypot(x - cx, y - cy)
+ */
+    __pyx_v_cy = (__pyx_v_y + __pyx_v_j);
+  }
+  __pyx_L3:;
+
+  /* "gcodetime_planner.pyx":265
+ *             cy = y + j
+ * 
+ *         radius = hypot(x - cx, y - cy)             # <<<<<<<<<<<<<<
+ *         start_angle = atan2(y - cy, x - cx)
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ */
+  __pyx_v_radius = hypot((__pyx_v_x - __pyx_v_cx), (__pyx_v_y - __pyx_v_cy));
+
+  /* "gcodetime_planner.pyx":266
+ * 
+ *         radius = hypot(x - cx, y - cy)
+ *         start_angle = atan2(y - cy, x - cx)             # <<<<<<<<<<<<<<
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ *         if clockwise:
+ */
+  __pyx_v_start_angle = atan2((__pyx_v_y - __pyx_v_cy), (__pyx_v_x - __pyx_v_cx));
+
+  /* "gcodetime_planner.pyx":267
+ *         radius = hypot(x - cx, y - cy)
+ *         start_angle = atan2(y - cy, x - cx)
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle             # <<<<<<<<<<<<<<
+ *         if clockwise:
+ *             if travel >= 0:
+ */
+  __pyx_v_travel = (atan2(((__pyx_v_y + __pyx_v_dy) - __pyx_v_cy), ((__pyx_v_x + __pyx_v_dx) - __pyx_v_cx)) - __pyx_v_start_angle);
+
+  /* "gcodetime_planner.pyx":268
+ *         start_angle = atan2(y - cy, x - cx)
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ *         if clockwise:             # <<<<<<<<<<<<<<
+ *             if travel >= 0:
+ *                 travel -= 2*M_PI
+ */
+  __pyx_t_1 = (__pyx_v_clockwise != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":269
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ *         if clockwise:
+ *             if travel >= 0:             # <<<<<<<<<<<<<<
+ *                 travel -= 2*M_PI
+ *         elif travel <= 0:
+ */
+    __pyx_t_1 = ((__pyx_v_travel >= 0.0) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":270
+ *         if clockwise:
+ *             if travel >= 0:
+ *                 travel -= 2*M_PI             # <<<<<<<<<<<<<<
+ *         elif travel <= 0:
+ *             travel += 2*M_PI
+ */
+      __pyx_v_travel = (__pyx_v_travel - (2.0 * M_PI));
+
+      /* "gcodetime_planner.pyx":269
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ *         if clockwise:
+ *             if travel >= 0:             # <<<<<<<<<<<<<<
+ *                 travel -= 2*M_PI
+ *         elif travel <= 0:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":268
+ *         start_angle = atan2(y - cy, x - cx)
+ *         travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+ *         if clockwise:             # <<<<<<<<<<<<<<
+ *             if travel >= 0:
+ *                 travel -= 2*M_PI
+ */
+    goto __pyx_L7;
+  }
+
+  /* "gcodetime_planner.pyx":271
+ *             if travel >= 0:
+ *                 travel -= 2*M_PI
+ *         elif travel <= 0:             # <<<<<<<<<<<<<<
+ *             travel += 2*M_PI
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_travel <= 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":272
+ *                 travel -= 2*M_PI
+ *         elif travel <= 0:
+ *             travel += 2*M_PI             # <<<<<<<<<<<<<<
+ * 
+ *         # Helix length for the number of segments, like the firmware
+ */
+    __pyx_v_travel = (__pyx_v_travel + (2.0 * M_PI));
+
+    /* "gcodetime_planner.pyx":271
+ *             if travel >= 0:
+ *                 travel -= 2*M_PI
+ *         elif travel <= 0:             # <<<<<<<<<<<<<<
+ *             travel += 2*M_PI
+ * 
+ */
+  }
+  __pyx_L7:;
+
+  /* "gcodetime_planner.pyx":275
+ * 
+ *         # Helix length for the number of segments, like the firmware
+ *         segments = <long>(hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT)             # <<<<<<<<<<<<<<
+ *         if segments < 1:
+ *             segments = 1
+ */
+  __pyx_v_segments = ((long)(hypot((__pyx_v_travel * __pyx_v_radius), __pyx_v_dz) / 1.0));
+
+  /* "gcodetime_planner.pyx":276
+ *         # Helix length for the number of segments, like the firmware
+ *         segments = <long>(hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT)
+ *         if segments < 1:             # <<<<<<<<<<<<<<
+ *             segments = 1
+ *         last_x = x
+ */
+  __pyx_t_1 = ((__pyx_v_segments < 1) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":277
+ *         segments = <long>(hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT)
+ *         if segments < 1:
+ *             segments = 1             # <<<<<<<<<<<<<<
+ *         last_x = x
+ *         last_y = y
+ */
+    __pyx_v_segments = 1;
+
+    /* "gcodetime_planner.pyx":276
+ *         # Helix length for the number of segments, like the firmware
+ *         segments = <long>(hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT)
+ *         if segments < 1:             # <<<<<<<<<<<<<<
+ *             segments = 1
+ *         last_x = x
+ */
+  }
+
+  /* "gcodetime_planner.pyx":278
+ *         if segments < 1:
+ *             segments = 1
+ *         last_x = x             # <<<<<<<<<<<<<<
+ *         last_y = y
+ *         for k in range(1, segments + 1):
+ */
+  __pyx_v_last_x = __pyx_v_x;
+
+  /* "gcodetime_planner.pyx":279
+ *             segments = 1
+ *         last_x = x
+ *         last_y = y             # <<<<<<<<<<<<<<
+ *         for k in range(1, segments + 1):
+ *             if k == segments:
+ */
+  __pyx_v_last_y = __pyx_v_y;
+
+  /* "gcodetime_planner.pyx":280
+ *         last_x = x
+ *         last_y = y
+ *         for k in range(1, segments + 1):             # <<<<<<<<<<<<<<
+ *             if k == segments:
+ *                 sx = x + dx
+ */
+  __pyx_t_3 = (__pyx_v_segments + 1);
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 1; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_k = __pyx_t_5;
+
+    /* "gcodetime_planner.pyx":281
+ *         last_y = y
+ *         for k in range(1, segments + 1):
+ *             if k == segments:             # <<<<<<<<<<<<<<
+ *                 sx = x + dx
+ *                 sy = y + dy
+ */
+    __pyx_t_1 = ((__pyx_v_k == __pyx_v_segments) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":282
+ *         for k in range(1, segments + 1):
+ *             if k == segments:
+ *                 sx = x + dx             # <<<<<<<<<<<<<<
+ *                 sy = y + dy
+ *             else:
+ */
+      __pyx_v_sx = (__pyx_v_x + __pyx_v_dx);
+
+      /* "gcodetime_planner.pyx":283
+ *             if k == segments:
+ *                 sx = x + dx
+ *                 sy = y + dy             # <<<<<<<<<<<<<<
+ *             else:
+ *                 angle = start_angle + travel * k / segments
+ */
+      __pyx_v_sy = (__pyx_v_y + __pyx_v_dy);
+
+      /* "gcodetime_planner.pyx":281
+ *         last_y = y
+ *         for k in range(1, segments + 1):
+ *             if k == segments:             # <<<<<<<<<<<<<<
+ *                 sx = x + dx
+ *                 sy = y + dy
+ */
+      goto __pyx_L12;
+    }
+
+    /* "gcodetime_planner.pyx":285
+ *                 sy = y + dy
+ *             else:
+ *                 angle = start_angle + travel * k / segments             # <<<<<<<<<<<<<<
+ *                 sx = cx + radius * cos(angle)
+ *                 sy = cy + radius * sin(angle)
+ */
+    /*else*/ {
+      __pyx_v_angle = (__pyx_v_start_angle + ((__pyx_v_travel * __pyx_v_k) / __pyx_v_segments));
+
+      /* "gcodetime_planner.pyx":286
+ *             else:
+ *                 angle = start_angle + travel * k / segments
+ *                 sx = cx + radius * cos(angle)             # <<<<<<<<<<<<<<
+ *                 sy = cy + radius * sin(angle)
+ *             self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+ */
+      __pyx_v_sx = (__pyx_v_cx + (__pyx_v_radius * cos(__pyx_v_angle)));
+
+      /* "gcodetime_planner.pyx":287
+ *                 angle = start_angle + travel * k / segments
+ *                 sx = cx + radius * cos(angle)
+ *                 sy = cy + radius * sin(angle)             # <<<<<<<<<<<<<<
+ *             self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+ *             last_x = sx
+ */
+      __pyx_v_sy = (__pyx_v_cy + (__pyx_v_radius * sin(__pyx_v_angle)));
+    }
+    __pyx_L12:;
+
+    /* "gcodetime_planner.pyx":288
+ *                 sx = cx + radius * cos(angle)
+ *                 sy = cy + radius * sin(angle)
+ *             self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)             # <<<<<<<<<<<<<<
+ *             last_x = sx
+ *             last_y = sy
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->add_move(__pyx_v_self, (__pyx_v_sx - __pyx_v_last_x), (__pyx_v_sy - __pyx_v_last_y), (__pyx_v_dz / __pyx_v_segments), (__pyx_v_de / __pyx_v_segments), __pyx_v_offset); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 288, __pyx_L1_error)
+
+    /* "gcodetime_planner.pyx":289
+ *                 sy = cy + radius * sin(angle)
+ *             self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+ *             last_x = sx             # <<<<<<<<<<<<<<
+ *             last_y = sy
+ *         return 0
+ */
+    __pyx_v_last_x = __pyx_v_sx;
+
+    /* "gcodetime_planner.pyx":290
+ *             self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+ *             last_x = sx
+ *             last_y = sy             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_v_last_y = __pyx_v_sy;
+  }
+
+  /* "gcodetime_planner.pyx":291
+ *             last_x = sx
+ *             last_y = sy
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int plan(self, int count, bint final) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":241
+ *         return 0
+ * 
+ *     cdef int add_arc(self, double x, double y, double *delta, double i, double j,             # <<<<<<<<<<<<<<
+ *                      double r, bint has_r, bint clockwise, long long offset) except -1:
+ *         cdef double dx = delta[0], dy = delta[1], dz = delta[2], de = delta[3]
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.add_arc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":293
+ *         return 0
+ * 
+ *     cdef int plan(self, int count, bint final) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan the pending moves and account the time of the first **count** ones.
+ */
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_plan(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, int __pyx_v_count, int __pyx_v_final) {
+  int __pyx_v_n;
+  int __pyx_v_i;
+  int __pyx_v_rest;
+  double __pyx_v_stop_sum;
+  double __pyx_v_next_sq;
+  double __pyx_v_v_sq;
+  double __pyx_v_max_entry;
+  double __pyx_v_elapsed;
+  double __pyx_v_a;
+  double __pyx_v_d;
+  double __pyx_v_vn;
+  double __pyx_v_v0;
+  double __pyx_v_v1;
+  double __pyx_v_d_acc;
+  double __pyx_v_d_dec;
+  double __pyx_v_vp;
+  PY_LONG_LONG __pyx_v_base;
+  double *__pyx_v_entries;
+  double *__pyx_v_stop;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  double *__pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  double __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("plan", 0);
+
+  /* "gcodetime_planner.pyx":297
+ *         Plan the pending moves and account the time of the first **count** ones.
+ *         """
+ *         cdef int n = self.count             # <<<<<<<<<<<<<<
+ *         cdef int i, rest
+ *         cdef double stop_sum, next_sq, v_sq, max_entry, elapsed
+ */
+  __pyx_t_1 = __pyx_v_self->count;
+  __pyx_v_n = __pyx_t_1;
+
+  /* "gcodetime_planner.pyx":302
+ *         cdef double a, d, vn, v0, v1, d_acc, d_dec, vp
+ *         cdef long long base
+ *         cdef double *entries = self.entries             # <<<<<<<<<<<<<<
+ *         cdef double *stop = self.stop
+ *         if n == 0:
+ */
+  __pyx_t_2 = __pyx_v_self->entries;
+  __pyx_v_entries = __pyx_t_2;
+
+  /* "gcodetime_planner.pyx":303
+ *         cdef long long base
+ *         cdef double *entries = self.entries
+ *         cdef double *stop = self.stop             # <<<<<<<<<<<<<<
+ *         if n == 0:
+ *             return 0
+ */
+  __pyx_t_2 = __pyx_v_self->stop;
+  __pyx_v_stop = __pyx_t_2;
+
+  /* "gcodetime_planner.pyx":304
+ *         cdef double *entries = self.entries
+ *         cdef double *stop = self.stop
+ *         if n == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_3 = ((__pyx_v_n == 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "gcodetime_planner.pyx":305
+ *         cdef double *stop = self.stop
+ *         if n == 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         # Reverse pass, the last move in the buffer has to stop. Without
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":304
+ *         cdef double *entries = self.entries
+ *         cdef double *stop = self.stop
+ *         if n == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  }
+
+  /* "gcodetime_planner.pyx":310
+ *         # the final flush entry speeds are also limited to what allows a stop
+ *         # within the planner buffer.
+ *         for i in range(n):             # <<<<<<<<<<<<<<
+ *             stop[i] = 2 * self.accelerations[i] * self.lengths[i]
+ *         stop_sum = 0.0
+ */
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_4 = __pyx_t_1;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "gcodetime_planner.pyx":311
+ *         # within the planner buffer.
+ *         for i in range(n):
+ *             stop[i] = 2 * self.accelerations[i] * self.lengths[i]             # <<<<<<<<<<<<<<
+ *         stop_sum = 0.0
+ *         next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ */
+    (__pyx_v_stop[__pyx_v_i]) = ((2.0 * (__pyx_v_self->accelerations[__pyx_v_i])) * (__pyx_v_self->lengths[__pyx_v_i]));
+  }
+
+  /* "gcodetime_planner.pyx":312
+ *         for i in range(n):
+ *             stop[i] = 2 * self.accelerations[i] * self.lengths[i]
+ *         stop_sum = 0.0             # <<<<<<<<<<<<<<
+ *         next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ *         for i in range(n - 1, -1, -1):
+ */
+  __pyx_v_stop_sum = 0.0;
+
+  /* "gcodetime_planner.pyx":313
+ *             stop[i] = 2 * self.accelerations[i] * self.lengths[i]
+ *         stop_sum = 0.0
+ *         next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED             # <<<<<<<<<<<<<<
+ *         for i in range(n - 1, -1, -1):
+ *             stop_sum += stop[i]
+ */
+  __pyx_v_next_sq = (0.05 * 0.05);
+
+  /* "gcodetime_planner.pyx":314
+ *         stop_sum = 0.0
+ *         next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ *         for i in range(n - 1, -1, -1):             # <<<<<<<<<<<<<<
+ *             stop_sum += stop[i]
+ *             if i + PLANNER_BUFFER_SIZE < n:
+ */
+  for (__pyx_t_1 = (__pyx_v_n - 1); __pyx_t_1 > -1; __pyx_t_1-=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "gcodetime_planner.pyx":315
+ *         next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ *         for i in range(n - 1, -1, -1):
+ *             stop_sum += stop[i]             # <<<<<<<<<<<<<<
+ *             if i + PLANNER_BUFFER_SIZE < n:
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ */
+    __pyx_v_stop_sum = (__pyx_v_stop_sum + (__pyx_v_stop[__pyx_v_i]));
+
+    /* "gcodetime_planner.pyx":316
+ *         for i in range(n - 1, -1, -1):
+ *             stop_sum += stop[i]
+ *             if i + PLANNER_BUFFER_SIZE < n:             # <<<<<<<<<<<<<<
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ *             v_sq = next_sq + stop[i]
+ */
+    __pyx_t_3 = (((__pyx_v_i + 16) < __pyx_v_n) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":317
+ *             stop_sum += stop[i]
+ *             if i + PLANNER_BUFFER_SIZE < n:
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]             # <<<<<<<<<<<<<<
+ *             v_sq = next_sq + stop[i]
+ *             if not final and v_sq > stop_sum:
+ */
+      __pyx_v_stop_sum = (__pyx_v_stop_sum - (__pyx_v_stop[(__pyx_v_i + 16)]));
+
+      /* "gcodetime_planner.pyx":316
+ *         for i in range(n - 1, -1, -1):
+ *             stop_sum += stop[i]
+ *             if i + PLANNER_BUFFER_SIZE < n:             # <<<<<<<<<<<<<<
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ *             v_sq = next_sq + stop[i]
+ */
+    }
+
+    /* "gcodetime_planner.pyx":318
+ *             if i + PLANNER_BUFFER_SIZE < n:
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ *             v_sq = next_sq + stop[i]             # <<<<<<<<<<<<<<
+ *             if not final and v_sq > stop_sum:
+ *                 v_sq = stop_sum
+ */
+    __pyx_v_v_sq = (__pyx_v_next_sq + (__pyx_v_stop[__pyx_v_i]));
+
+    /* "gcodetime_planner.pyx":319
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ *             v_sq = next_sq + stop[i]
+ *             if not final and v_sq > stop_sum:             # <<<<<<<<<<<<<<
+ *                 v_sq = stop_sum
+ *             max_entry = self.max_entries[i]
+ */
+    __pyx_t_6 = ((!(__pyx_v_final != 0)) != 0);
+    if (__pyx_t_6) {
+    } else {
+      __pyx_t_3 = __pyx_t_6;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_6 = ((__pyx_v_v_sq > __pyx_v_stop_sum) != 0);
+    __pyx_t_3 = __pyx_t_6;
+    __pyx_L10_bool_binop_done:;
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":320
+ *             v_sq = next_sq + stop[i]
+ *             if not final and v_sq > stop_sum:
+ *                 v_sq = stop_sum             # <<<<<<<<<<<<<<
+ *             max_entry = self.max_entries[i]
+ *             if v_sq > max_entry * max_entry:
+ */
+      __pyx_v_v_sq = __pyx_v_stop_sum;
+
+      /* "gcodetime_planner.pyx":319
+ *                 stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+ *             v_sq = next_sq + stop[i]
+ *             if not final and v_sq > stop_sum:             # <<<<<<<<<<<<<<
+ *                 v_sq = stop_sum
+ *             max_entry = self.max_entries[i]
+ */
+    }
+
+    /* "gcodetime_planner.pyx":321
+ *             if not final and v_sq > stop_sum:
+ *                 v_sq = stop_sum
+ *             max_entry = self.max_entries[i]             # <<<<<<<<<<<<<<
+ *             if v_sq > max_entry * max_entry:
+ *                 v_sq = max_entry * max_entry
+ */
+    __pyx_v_max_entry = (__pyx_v_self->max_entries[__pyx_v_i]);
+
+    /* "gcodetime_planner.pyx":322
+ *                 v_sq = stop_sum
+ *             max_entry = self.max_entries[i]
+ *             if v_sq > max_entry * max_entry:             # <<<<<<<<<<<<<<
+ *                 v_sq = max_entry * max_entry
+ *             entries[i] = v_sq
+ */
+    __pyx_t_3 = ((__pyx_v_v_sq > (__pyx_v_max_entry * __pyx_v_max_entry)) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":323
+ *             max_entry = self.max_entries[i]
+ *             if v_sq > max_entry * max_entry:
+ *                 v_sq = max_entry * max_entry             # <<<<<<<<<<<<<<
+ *             entries[i] = v_sq
+ *             next_sq = v_sq
+ */
+      __pyx_v_v_sq = (__pyx_v_max_entry * __pyx_v_max_entry);
+
+      /* "gcodetime_planner.pyx":322
+ *                 v_sq = stop_sum
+ *             max_entry = self.max_entries[i]
+ *             if v_sq > max_entry * max_entry:             # <<<<<<<<<<<<<<
+ *                 v_sq = max_entry * max_entry
+ *             entries[i] = v_sq
+ */
+    }
+
+    /* "gcodetime_planner.pyx":324
+ *             if v_sq > max_entry * max_entry:
+ *                 v_sq = max_entry * max_entry
+ *             entries[i] = v_sq             # <<<<<<<<<<<<<<
+ *             next_sq = v_sq
+ * 
+ */
+    (__pyx_v_entries[__pyx_v_i]) = __pyx_v_v_sq;
+
+    /* "gcodetime_planner.pyx":325
+ *                 v_sq = max_entry * max_entry
+ *             entries[i] = v_sq
+ *             next_sq = v_sq             # <<<<<<<<<<<<<<
+ * 
+ *         # Forward pass, the first entry speed was fixed by the previous round
+ */
+    __pyx_v_next_sq = __pyx_v_v_sq;
+  }
+
+  /* "gcodetime_planner.pyx":328
+ * 
+ *         # Forward pass, the first entry speed was fixed by the previous round
+ *         if self.entry * self.entry < entries[0]:             # <<<<<<<<<<<<<<
+ *             entries[0] = self.entry * self.entry
+ *         for i in range(1, n):
+ */
+  __pyx_t_3 = (((__pyx_v_self->entry * __pyx_v_self->entry) < (__pyx_v_entries[0])) != 0);
+  if (__pyx_t_3) {
+
+    /* "gcodetime_planner.pyx":329
+ *         # Forward pass, the first entry speed was fixed by the previous round
+ *         if self.entry * self.entry < entries[0]:
+ *             entries[0] = self.entry * self.entry             # <<<<<<<<<<<<<<
+ *         for i in range(1, n):
+ *             v_sq = entries[i-1] + stop[i-1]
+ */
+    (__pyx_v_entries[0]) = (__pyx_v_self->entry * __pyx_v_self->entry);
+
+    /* "gcodetime_planner.pyx":328
+ * 
+ *         # Forward pass, the first entry speed was fixed by the previous round
+ *         if self.entry * self.entry < entries[0]:             # <<<<<<<<<<<<<<
+ *             entries[0] = self.entry * self.entry
+ *         for i in range(1, n):
+ */
+  }
+
+  /* "gcodetime_planner.pyx":330
+ *         if self.entry * self.entry < entries[0]:
+ *             entries[0] = self.entry * self.entry
+ *         for i in range(1, n):             # <<<<<<<<<<<<<<
+ *             v_sq = entries[i-1] + stop[i-1]
+ *             if entries[i] > v_sq:
+ */
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_4 = __pyx_t_1;
+  for (__pyx_t_5 = 1; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "gcodetime_planner.pyx":331
+ *             entries[0] = self.entry * self.entry
+ *         for i in range(1, n):
+ *             v_sq = entries[i-1] + stop[i-1]             # <<<<<<<<<<<<<<
+ *             if entries[i] > v_sq:
+ *                 entries[i] = v_sq
+ */
+    __pyx_v_v_sq = ((__pyx_v_entries[(__pyx_v_i - 1)]) + (__pyx_v_stop[(__pyx_v_i - 1)]));
+
+    /* "gcodetime_planner.pyx":332
+ *         for i in range(1, n):
+ *             v_sq = entries[i-1] + stop[i-1]
+ *             if entries[i] > v_sq:             # <<<<<<<<<<<<<<
+ *                 entries[i] = v_sq
+ *         entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ */
+    __pyx_t_3 = (((__pyx_v_entries[__pyx_v_i]) > __pyx_v_v_sq) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":333
+ *             v_sq = entries[i-1] + stop[i-1]
+ *             if entries[i] > v_sq:
+ *                 entries[i] = v_sq             # <<<<<<<<<<<<<<
+ *         entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ * 
+ */
+      (__pyx_v_entries[__pyx_v_i]) = __pyx_v_v_sq;
+
+      /* "gcodetime_planner.pyx":332
+ *         for i in range(1, n):
+ *             v_sq = entries[i-1] + stop[i-1]
+ *             if entries[i] > v_sq:             # <<<<<<<<<<<<<<
+ *                 entries[i] = v_sq
+ *         entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+ */
+    }
+  }
+
+  /* "gcodetime_planner.pyx":334
+ *             if entries[i] > v_sq:
+ *                 entries[i] = v_sq
+ *         entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED             # <<<<<<<<<<<<<<
+ * 
+ *         # Trapezoid time of each move
+ */
+  (__pyx_v_entries[__pyx_v_n]) = (0.05 * 0.05);
+
+  /* "gcodetime_planner.pyx":337
+ * 
+ *         # Trapezoid time of each move
+ *         elapsed = self.elapsed             # <<<<<<<<<<<<<<
+ *         base = self.moves - n
+ *         if count > n:
+ */
+  __pyx_t_7 = __pyx_v_self->elapsed;
+  __pyx_v_elapsed = __pyx_t_7;
+
+  /* "gcodetime_planner.pyx":338
+ *         # Trapezoid time of each move
+ *         elapsed = self.elapsed
+ *         base = self.moves - n             # <<<<<<<<<<<<<<
+ *         if count > n:
+ *             count = n
+ */
+  __pyx_v_base = (__pyx_v_self->moves - __pyx_v_n);
+
+  /* "gcodetime_planner.pyx":339
+ *         elapsed = self.elapsed
+ *         base = self.moves - n
+ *         if count > n:             # <<<<<<<<<<<<<<
+ *             count = n
+ *         for i in range(count):
+ */
+  __pyx_t_3 = ((__pyx_v_count > __pyx_v_n) != 0);
+  if (__pyx_t_3) {
+
+    /* "gcodetime_planner.pyx":340
+ *         base = self.moves - n
+ *         if count > n:
+ *             count = n             # <<<<<<<<<<<<<<
+ *         for i in range(count):
+ *             while self.next_mark <= base + i:
+ */
+    __pyx_v_count = __pyx_v_n;
+
+    /* "gcodetime_planner.pyx":339
+ *         elapsed = self.elapsed
+ *         base = self.moves - n
+ *         if count > n:             # <<<<<<<<<<<<<<
+ *             count = n
+ *         for i in range(count):
+ */
+  }
+
+  /* "gcodetime_planner.pyx":341
+ *         if count > n:
+ *             count = n
+ *         for i in range(count):             # <<<<<<<<<<<<<<
+ *             while self.next_mark <= base + i:
+ *                 self.elapsed = elapsed
+ */
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_4 = __pyx_t_1;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "gcodetime_planner.pyx":342
+ *             count = n
+ *         for i in range(count):
+ *             while self.next_mark <= base + i:             # <<<<<<<<<<<<<<
+ *                 self.elapsed = elapsed
+ *                 self.pop_mark()
+ */
+    while (1) {
+      __pyx_t_3 = ((__pyx_v_self->next_mark <= (__pyx_v_base + __pyx_v_i)) != 0);
+      if (!__pyx_t_3) break;
+
+      /* "gcodetime_planner.pyx":343
+ *         for i in range(count):
+ *             while self.next_mark <= base + i:
+ *                 self.elapsed = elapsed             # <<<<<<<<<<<<<<
+ *                 self.pop_mark()
+ * 
+ */
+      __pyx_v_self->elapsed = __pyx_v_elapsed;
+
+      /* "gcodetime_planner.pyx":344
+ *             while self.next_mark <= base + i:
+ *                 self.elapsed = elapsed
+ *                 self.pop_mark()             # <<<<<<<<<<<<<<
+ * 
+ *             a = self.accelerations[i]
+ */
+      __pyx_t_8 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->pop_mark(__pyx_v_self); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 344, __pyx_L1_error)
+    }
+
+    /* "gcodetime_planner.pyx":346
+ *                 self.pop_mark()
+ * 
+ *             a = self.accelerations[i]             # <<<<<<<<<<<<<<
+ *             d = self.lengths[i]
+ *             vn = self.nominals[i]
+ */
+    __pyx_v_a = (__pyx_v_self->accelerations[__pyx_v_i]);
+
+    /* "gcodetime_planner.pyx":347
+ * 
+ *             a = self.accelerations[i]
+ *             d = self.lengths[i]             # <<<<<<<<<<<<<<
+ *             vn = self.nominals[i]
+ *             v0 = sqrt(entries[i])
+ */
+    __pyx_v_d = (__pyx_v_self->lengths[__pyx_v_i]);
+
+    /* "gcodetime_planner.pyx":348
+ *             a = self.accelerations[i]
+ *             d = self.lengths[i]
+ *             vn = self.nominals[i]             # <<<<<<<<<<<<<<
+ *             v0 = sqrt(entries[i])
+ *             v1 = sqrt(entries[i+1])
+ */
+    __pyx_v_vn = (__pyx_v_self->nominals[__pyx_v_i]);
+
+    /* "gcodetime_planner.pyx":349
+ *             d = self.lengths[i]
+ *             vn = self.nominals[i]
+ *             v0 = sqrt(entries[i])             # <<<<<<<<<<<<<<
+ *             v1 = sqrt(entries[i+1])
+ *             if v0 > vn:
+ */
+    __pyx_v_v0 = sqrt((__pyx_v_entries[__pyx_v_i]));
+
+    /* "gcodetime_planner.pyx":350
+ *             vn = self.nominals[i]
+ *             v0 = sqrt(entries[i])
+ *             v1 = sqrt(entries[i+1])             # <<<<<<<<<<<<<<
+ *             if v0 > vn:
+ *                 v0 = vn
+ */
+    __pyx_v_v1 = sqrt((__pyx_v_entries[(__pyx_v_i + 1)]));
+
+    /* "gcodetime_planner.pyx":351
+ *             v0 = sqrt(entries[i])
+ *             v1 = sqrt(entries[i+1])
+ *             if v0 > vn:             # <<<<<<<<<<<<<<
+ *                 v0 = vn
+ *             if v1 > vn:
+ */
+    __pyx_t_3 = ((__pyx_v_v0 > __pyx_v_vn) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":352
+ *             v1 = sqrt(entries[i+1])
+ *             if v0 > vn:
+ *                 v0 = vn             # <<<<<<<<<<<<<<
+ *             if v1 > vn:
+ *                 v1 = vn
+ */
+      __pyx_v_v0 = __pyx_v_vn;
+
+      /* "gcodetime_planner.pyx":351
+ *             v0 = sqrt(entries[i])
+ *             v1 = sqrt(entries[i+1])
+ *             if v0 > vn:             # <<<<<<<<<<<<<<
+ *                 v0 = vn
+ *             if v1 > vn:
+ */
+    }
+
+    /* "gcodetime_planner.pyx":353
+ *             if v0 > vn:
+ *                 v0 = vn
+ *             if v1 > vn:             # <<<<<<<<<<<<<<
+ *                 v1 = vn
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ */
+    __pyx_t_3 = ((__pyx_v_v1 > __pyx_v_vn) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":354
+ *                 v0 = vn
+ *             if v1 > vn:
+ *                 v1 = vn             # <<<<<<<<<<<<<<
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ *             d_dec = (vn*vn - v1*v1) / (2*a)
+ */
+      __pyx_v_v1 = __pyx_v_vn;
+
+      /* "gcodetime_planner.pyx":353
+ *             if v0 > vn:
+ *                 v0 = vn
+ *             if v1 > vn:             # <<<<<<<<<<<<<<
+ *                 v1 = vn
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ */
+    }
+
+    /* "gcodetime_planner.pyx":355
+ *             if v1 > vn:
+ *                 v1 = vn
+ *             d_acc = (vn*vn - v0*v0) / (2*a)             # <<<<<<<<<<<<<<
+ *             d_dec = (vn*vn - v1*v1) / (2*a)
+ *             if d_acc + d_dec <= d:
+ */
+    __pyx_v_d_acc = (((__pyx_v_vn * __pyx_v_vn) - (__pyx_v_v0 * __pyx_v_v0)) / (2.0 * __pyx_v_a));
+
+    /* "gcodetime_planner.pyx":356
+ *                 v1 = vn
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ *             d_dec = (vn*vn - v1*v1) / (2*a)             # <<<<<<<<<<<<<<
+ *             if d_acc + d_dec <= d:
+ *                 elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn
+ */
+    __pyx_v_d_dec = (((__pyx_v_vn * __pyx_v_vn) - (__pyx_v_v1 * __pyx_v_v1)) / (2.0 * __pyx_v_a));
+
+    /* "gcodetime_planner.pyx":357
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ *             d_dec = (vn*vn - v1*v1) / (2*a)
+ *             if d_acc + d_dec <= d:             # <<<<<<<<<<<<<<
+ *                 elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn
+ *             else:
+ */
+    __pyx_t_3 = (((__pyx_v_d_acc + __pyx_v_d_dec) <= __pyx_v_d) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":358
+ *             d_dec = (vn*vn - v1*v1) / (2*a)
+ *             if d_acc + d_dec <= d:
+ *                 elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # Never reaches the nominal speed
+ */
+      __pyx_v_elapsed = (__pyx_v_elapsed + ((((__pyx_v_vn - __pyx_v_v0) / __pyx_v_a) + ((__pyx_v_vn - __pyx_v_v1) / __pyx_v_a)) + (((__pyx_v_d - __pyx_v_d_acc) - __pyx_v_d_dec) / __pyx_v_vn)));
+
+      /* "gcodetime_planner.pyx":357
+ *             d_acc = (vn*vn - v0*v0) / (2*a)
+ *             d_dec = (vn*vn - v1*v1) / (2*a)
+ *             if d_acc + d_dec <= d:             # <<<<<<<<<<<<<<
+ *                 elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn
+ *             else:
+ */
+      goto __pyx_L24;
+    }
+
+    /* "gcodetime_planner.pyx":361
+ *             else:
+ *                 # Never reaches the nominal speed
+ *                 vp = (2*a*d + v0*v0 + v1*v1) / 2             # <<<<<<<<<<<<<<
+ *                 if v1*v1 > vp:
+ *                     vp = v1*v1
+ */
+    /*else*/ {
+      __pyx_v_vp = (((((2.0 * __pyx_v_a) * __pyx_v_d) + (__pyx_v_v0 * __pyx_v_v0)) + (__pyx_v_v1 * __pyx_v_v1)) / 2.0);
+
+      /* "gcodetime_planner.pyx":362
+ *                 # Never reaches the nominal speed
+ *                 vp = (2*a*d + v0*v0 + v1*v1) / 2
+ *                 if v1*v1 > vp:             # <<<<<<<<<<<<<<
+ *                     vp = v1*v1
+ *                 if v0*v0 > vp:
+ */
+      __pyx_t_3 = (((__pyx_v_v1 * __pyx_v_v1) > __pyx_v_vp) != 0);
+      if (__pyx_t_3) {
+
+        /* "gcodetime_planner.pyx":363
+ *                 vp = (2*a*d + v0*v0 + v1*v1) / 2
+ *                 if v1*v1 > vp:
+ *                     vp = v1*v1             # <<<<<<<<<<<<<<
+ *                 if v0*v0 > vp:
+ *                     vp = v0*v0
+ */
+        __pyx_v_vp = (__pyx_v_v1 * __pyx_v_v1);
+
+        /* "gcodetime_planner.pyx":362
+ *                 # Never reaches the nominal speed
+ *                 vp = (2*a*d + v0*v0 + v1*v1) / 2
+ *                 if v1*v1 > vp:             # <<<<<<<<<<<<<<
+ *                     vp = v1*v1
+ *                 if v0*v0 > vp:
+ */
+      }
+
+      /* "gcodetime_planner.pyx":364
+ *                 if v1*v1 > vp:
+ *                     vp = v1*v1
+ *                 if v0*v0 > vp:             # <<<<<<<<<<<<<<
+ *                     vp = v0*v0
+ *                 vp = sqrt(vp)
+ */
+      __pyx_t_3 = (((__pyx_v_v0 * __pyx_v_v0) > __pyx_v_vp) != 0);
+      if (__pyx_t_3) {
+
+        /* "gcodetime_planner.pyx":365
+ *                     vp = v1*v1
+ *                 if v0*v0 > vp:
+ *                     vp = v0*v0             # <<<<<<<<<<<<<<
+ *                 vp = sqrt(vp)
+ *                 elapsed += (vp - v0) / a + (vp - v1) / a
+ */
+        __pyx_v_vp = (__pyx_v_v0 * __pyx_v_v0);
+
+        /* "gcodetime_planner.pyx":364
+ *                 if v1*v1 > vp:
+ *                     vp = v1*v1
+ *                 if v0*v0 > vp:             # <<<<<<<<<<<<<<
+ *                     vp = v0*v0
+ *                 vp = sqrt(vp)
+ */
+      }
+
+      /* "gcodetime_planner.pyx":366
+ *                 if v0*v0 > vp:
+ *                     vp = v0*v0
+ *                 vp = sqrt(vp)             # <<<<<<<<<<<<<<
+ *                 elapsed += (vp - v0) / a + (vp - v1) / a
+ * 
+ */
+      __pyx_v_vp = sqrt(__pyx_v_vp);
+
+      /* "gcodetime_planner.pyx":367
+ *                     vp = v0*v0
+ *                 vp = sqrt(vp)
+ *                 elapsed += (vp - v0) / a + (vp - v1) / a             # <<<<<<<<<<<<<<
+ * 
+ *             if (base + i + 1) % CHECKPOINT_BLOCKS == 0:
+ */
+      __pyx_v_elapsed = (__pyx_v_elapsed + (((__pyx_v_vp - __pyx_v_v0) / __pyx_v_a) + ((__pyx_v_vp - __pyx_v_v1) / __pyx_v_a)));
+    }
+    __pyx_L24:;
+
+    /* "gcodetime_planner.pyx":369
+ *                 elapsed += (vp - v0) / a + (vp - v1) / a
+ * 
+ *             if (base + i + 1) % CHECKPOINT_BLOCKS == 0:             # <<<<<<<<<<<<<<
+ *                 self.checkpoints.append( (self.offsets[i], elapsed) )
+ * 
+ */
+    __pyx_t_3 = (((((__pyx_v_base + __pyx_v_i) + 1) % 0x3E8) == 0) != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":370
+ * 
+ *             if (base + i + 1) % CHECKPOINT_BLOCKS == 0:
+ *                 self.checkpoints.append( (self.offsets[i], elapsed) )             # <<<<<<<<<<<<<<
+ * 
+ *         self.elapsed = elapsed
+ */
+      if (unlikely(__pyx_v_self->checkpoints == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+        __PYX_ERR(0, 370, __pyx_L1_error)
+      }
+      __pyx_t_9 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_self->offsets[__pyx_v_i])); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_10 = PyFloat_FromDouble(__pyx_v_elapsed); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_9);
+      __Pyx_GIVEREF(__pyx_t_10);
+      PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_10);
+      __pyx_t_9 = 0;
+      __pyx_t_10 = 0;
+      __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_self->checkpoints, __pyx_t_11); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+      /* "gcodetime_planner.pyx":369
+ *                 elapsed += (vp - v0) / a + (vp - v1) / a
+ * 
+ *             if (base + i + 1) % CHECKPOINT_BLOCKS == 0:             # <<<<<<<<<<<<<<
+ *                 self.checkpoints.append( (self.offsets[i], elapsed) )
+ * 
+ */
+    }
+  }
+
+  /* "gcodetime_planner.pyx":372
+ *                 self.checkpoints.append( (self.offsets[i], elapsed) )
+ * 
+ *         self.elapsed = elapsed             # <<<<<<<<<<<<<<
+ *         self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+ *         rest = n - count
+ */
+  __pyx_v_self->elapsed = __pyx_v_elapsed;
+
+  /* "gcodetime_planner.pyx":373
+ * 
+ *         self.elapsed = elapsed
+ *         self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED             # <<<<<<<<<<<<<<
+ *         rest = n - count
+ *         if rest:
+ */
+  if (((__pyx_v_count < __pyx_v_n) != 0)) {
+    __pyx_t_7 = sqrt((__pyx_v_entries[__pyx_v_count]));
+  } else {
+    __pyx_t_7 = 0.05;
+  }
+  __pyx_v_self->entry = __pyx_t_7;
+
+  /* "gcodetime_planner.pyx":374
+ *         self.elapsed = elapsed
+ *         self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+ *         rest = n - count             # <<<<<<<<<<<<<<
+ *         if rest:
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+ */
+  __pyx_v_rest = (__pyx_v_n - __pyx_v_count);
+
+  /* "gcodetime_planner.pyx":375
+ *         self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+ *         rest = n - count
+ *         if rest:             # <<<<<<<<<<<<<<
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+ */
+  __pyx_t_3 = (__pyx_v_rest != 0);
+  if (__pyx_t_3) {
+
+    /* "gcodetime_planner.pyx":376
+ *         rest = n - count
+ *         if rest:
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))             # <<<<<<<<<<<<<<
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+ *             memmove(self.nominals, self.nominals + count, rest * sizeof(double))
+ */
+    (void)(memmove(__pyx_v_self->lengths, (__pyx_v_self->lengths + __pyx_v_count), (__pyx_v_rest * (sizeof(double)))));
+
+    /* "gcodetime_planner.pyx":377
+ *         if rest:
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))             # <<<<<<<<<<<<<<
+ *             memmove(self.nominals, self.nominals + count, rest * sizeof(double))
+ *             memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))
+ */
+    (void)(memmove(__pyx_v_self->accelerations, (__pyx_v_self->accelerations + __pyx_v_count), (__pyx_v_rest * (sizeof(double)))));
+
+    /* "gcodetime_planner.pyx":378
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+ *             memmove(self.nominals, self.nominals + count, rest * sizeof(double))             # <<<<<<<<<<<<<<
+ *             memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))
+ *             memmove(self.offsets, self.offsets + count, rest * sizeof(long long))
+ */
+    (void)(memmove(__pyx_v_self->nominals, (__pyx_v_self->nominals + __pyx_v_count), (__pyx_v_rest * (sizeof(double)))));
+
+    /* "gcodetime_planner.pyx":379
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+ *             memmove(self.nominals, self.nominals + count, rest * sizeof(double))
+ *             memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))             # <<<<<<<<<<<<<<
+ *             memmove(self.offsets, self.offsets + count, rest * sizeof(long long))
+ *         self.count = rest
+ */
+    (void)(memmove(__pyx_v_self->max_entries, (__pyx_v_self->max_entries + __pyx_v_count), (__pyx_v_rest * (sizeof(double)))));
+
+    /* "gcodetime_planner.pyx":380
+ *             memmove(self.nominals, self.nominals + count, rest * sizeof(double))
+ *             memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))
+ *             memmove(self.offsets, self.offsets + count, rest * sizeof(long long))             # <<<<<<<<<<<<<<
+ *         self.count = rest
+ *         return 0
+ */
+    (void)(memmove(__pyx_v_self->offsets, (__pyx_v_self->offsets + __pyx_v_count), (__pyx_v_rest * (sizeof(PY_LONG_LONG)))));
+
+    /* "gcodetime_planner.pyx":375
+ *         self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+ *         rest = n - count
+ *         if rest:             # <<<<<<<<<<<<<<
+ *             memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+ *             memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+ */
+  }
+
+  /* "gcodetime_planner.pyx":381
+ *             memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))
+ *             memmove(self.offsets, self.offsets + count, rest * sizeof(long long))
+ *         self.count = rest             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->count = __pyx_v_rest;
+
+  /* "gcodetime_planner.pyx":382
+ *             memmove(self.offsets, self.offsets + count, rest * sizeof(long long))
+ *         self.count = rest
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int pop_mark(self) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":293
+ *         return 0
+ * 
+ *     cdef int plan(self, int count, bint final) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan the pending moves and account the time of the first **count** ones.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.plan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":384
+ *         return 0
+ * 
+ *     cdef int pop_mark(self) except -1:             # <<<<<<<<<<<<<<
+ *         """ Record the first pending layer start at the current elapsed time. """
+ *         index, layer, offset = self.layer_marks[self.mark_index]
+ */
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_pop_mark(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *__pyx_v_index = NULL;
+  PyObject *__pyx_v_layer = NULL;
+  PyObject *__pyx_v_offset = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  PY_LONG_LONG __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pop_mark", 0);
+
+  /* "gcodetime_planner.pyx":386
+ *     cdef int pop_mark(self) except -1:
+ *         """ Record the first pending layer start at the current elapsed time. """
+ *         index, layer, offset = self.layer_marks[self.mark_index]             # <<<<<<<<<<<<<<
+ *         self.layers.append( (layer, offset, self.elapsed) )
+ *         self.checkpoints.append( (offset, self.elapsed) )
+ */
+  if (unlikely(__pyx_v_self->layer_marks == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 386, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyList_GET_ITEM(__pyx_v_self->layer_marks, __pyx_v_self->mark_index);
+  __Pyx_INCREF(__pyx_t_1);
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 386, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_4);
+    #else
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_6 = Py_TYPE(__pyx_t_5)->tp_iternext;
+    index = 0; __pyx_t_2 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 1; __pyx_t_3 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    index = 2; __pyx_t_4 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_4)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_6(__pyx_t_5), 3) < 0) __PYX_ERR(0, 386, __pyx_L1_error)
+    __pyx_t_6 = NULL;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 386, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_v_index = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_layer = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_offset = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "gcodetime_planner.pyx":387
+ *         """ Record the first pending layer start at the current elapsed time. """
+ *         index, layer, offset = self.layer_marks[self.mark_index]
+ *         self.layers.append( (layer, offset, self.elapsed) )             # <<<<<<<<<<<<<<
+ *         self.checkpoints.append( (offset, self.elapsed) )
+ *         self.mark_index += 1
+ */
+  if (unlikely(__pyx_v_self->layers == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 387, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_layer);
+  __Pyx_GIVEREF(__pyx_v_layer);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_layer);
+  __Pyx_INCREF(__pyx_v_offset);
+  __Pyx_GIVEREF(__pyx_v_offset);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_offset);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_self->layers, __pyx_t_4); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "gcodetime_planner.pyx":388
+ *         index, layer, offset = self.layer_marks[self.mark_index]
+ *         self.layers.append( (layer, offset, self.elapsed) )
+ *         self.checkpoints.append( (offset, self.elapsed) )             # <<<<<<<<<<<<<<
+ *         self.mark_index += 1
+ *         if self.mark_index < len(self.layer_marks):
+ */
+  if (unlikely(__pyx_v_self->checkpoints == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 388, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 388, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_offset);
+  __Pyx_GIVEREF(__pyx_v_offset);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_offset);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_self->checkpoints, __pyx_t_1); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 388, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcodetime_planner.pyx":389
+ *         self.layers.append( (layer, offset, self.elapsed) )
+ *         self.checkpoints.append( (offset, self.elapsed) )
+ *         self.mark_index += 1             # <<<<<<<<<<<<<<
+ *         if self.mark_index < len(self.layer_marks):
+ *             self.next_mark = self.layer_marks[self.mark_index][0]
+ */
+  __pyx_v_self->mark_index = (__pyx_v_self->mark_index + 1);
+
+  /* "gcodetime_planner.pyx":390
+ *         self.checkpoints.append( (offset, self.elapsed) )
+ *         self.mark_index += 1
+ *         if self.mark_index < len(self.layer_marks):             # <<<<<<<<<<<<<<
+ *             self.next_mark = self.layer_marks[self.mark_index][0]
+ *         else:
+ */
+  __pyx_t_1 = __pyx_v_self->layer_marks;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 390, __pyx_L1_error)
+  }
+  __pyx_t_8 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-1))) __PYX_ERR(0, 390, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_9 = ((__pyx_v_self->mark_index < __pyx_t_8) != 0);
+  if (__pyx_t_9) {
+
+    /* "gcodetime_planner.pyx":391
+ *         self.mark_index += 1
+ *         if self.mark_index < len(self.layer_marks):
+ *             self.next_mark = self.layer_marks[self.mark_index][0]             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.layer_marks = []
+ */
+    if (unlikely(__pyx_v_self->layer_marks == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 391, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_GetItemInt(PyList_GET_ITEM(__pyx_v_self->layer_marks, __pyx_v_self->mark_index), 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 391, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_10 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_10 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 391, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_self->next_mark = __pyx_t_10;
+
+    /* "gcodetime_planner.pyx":390
+ *         self.checkpoints.append( (offset, self.elapsed) )
+ *         self.mark_index += 1
+ *         if self.mark_index < len(self.layer_marks):             # <<<<<<<<<<<<<<
+ *             self.next_mark = self.layer_marks[self.mark_index][0]
+ *         else:
+ */
+    goto __pyx_L5;
+  }
+
+  /* "gcodetime_planner.pyx":393
+ *             self.next_mark = self.layer_marks[self.mark_index][0]
+ *         else:
+ *             self.layer_marks = []             # <<<<<<<<<<<<<<
+ *             self.mark_index = 0
+ *             self.next_mark = NO_MARK
+ */
+  /*else*/ {
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_v_self->layer_marks);
+    __Pyx_DECREF(__pyx_v_self->layer_marks);
+    __pyx_v_self->layer_marks = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "gcodetime_planner.pyx":394
+ *         else:
+ *             self.layer_marks = []
+ *             self.mark_index = 0             # <<<<<<<<<<<<<<
+ *             self.next_mark = NO_MARK
+ *         return 0
+ */
+    __pyx_v_self->mark_index = 0;
+
+    /* "gcodetime_planner.pyx":395
+ *             self.layer_marks = []
+ *             self.mark_index = 0
+ *             self.next_mark = NO_MARK             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+    __pyx_v_self->next_mark = 0x7FFFFFFFFFFFFFFF;
+  }
+  __pyx_L5:;
+
+  /* "gcodetime_planner.pyx":396
+ *             self.mark_index = 0
+ *             self.next_mark = NO_MARK
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def synchronize(self):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":384
+ *         return 0
+ * 
+ *     cdef int pop_mark(self) except -1:             # <<<<<<<<<<<<<<
+ *         """ Record the first pending layer start at the current elapsed time. """
+ *         index, layer, offset = self.layer_marks[self.mark_index]
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.pop_mark", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_index);
+  __Pyx_XDECREF(__pyx_v_layer);
+  __Pyx_XDECREF(__pyx_v_offset);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":398
+ *         return 0
+ * 
+ *     def synchronize(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan all the pending moves, like the firmware does when it waits for
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_3synchronize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_2synchronize[] = "\n        Plan all the pending moves, like the firmware does when it waits for\n        the planner buffer to be empty.\n        ";
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_3synchronize(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("synchronize (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_2synchronize(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_2synchronize(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("synchronize", 0);
+
+  /* "gcodetime_planner.pyx":403
+ *         the planner buffer to be empty.
+ *         """
+ *         self.plan(self.count, True)             # <<<<<<<<<<<<<<
+ *         self.entry = 0.0
+ *         self.has_previous = False
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->plan(__pyx_v_self, __pyx_v_self->count, 1); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 403, __pyx_L1_error)
+
+  /* "gcodetime_planner.pyx":404
+ *         """
+ *         self.plan(self.count, True)
+ *         self.entry = 0.0             # <<<<<<<<<<<<<<
+ *         self.has_previous = False
+ *         self.previous_nominal = 0.0
+ */
+  __pyx_v_self->entry = 0.0;
+
+  /* "gcodetime_planner.pyx":405
+ *         self.plan(self.count, True)
+ *         self.entry = 0.0
+ *         self.has_previous = False             # <<<<<<<<<<<<<<
+ *         self.previous_nominal = 0.0
+ * 
+ */
+  __pyx_v_self->has_previous = 0;
+
+  /* "gcodetime_planner.pyx":406
+ *         self.entry = 0.0
+ *         self.has_previous = False
+ *         self.previous_nominal = 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     def mark_layer(self, layer, long long offset):
+ */
+  __pyx_v_self->previous_nominal = 0.0;
+
+  /* "gcodetime_planner.pyx":398
+ *         return 0
+ * 
+ *     def synchronize(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan all the pending moves, like the firmware does when it waits for
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.synchronize", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":408
+ *         self.previous_nominal = 0.0
+ * 
+ *     def mark_layer(self, layer, long long offset):             # <<<<<<<<<<<<<<
+ *         """ Record the start of **layer** before the next move. """
+ *         if not self.layer_marks:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5mark_layer(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_4mark_layer[] = " Record the start of **layer** before the next move. ";
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5mark_layer(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_layer = 0;
+  PY_LONG_LONG __pyx_v_offset;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("mark_layer (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_layer,&__pyx_n_s_offset,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_layer)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("mark_layer", 1, 2, 2, 1); __PYX_ERR(0, 408, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "mark_layer") < 0)) __PYX_ERR(0, 408, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_layer = values[0];
+    __pyx_v_offset = __Pyx_PyInt_As_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_offset == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 408, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("mark_layer", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 408, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.mark_layer", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_4mark_layer(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self), __pyx_v_layer, __pyx_v_offset);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_4mark_layer(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_layer, PY_LONG_LONG __pyx_v_offset) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PY_LONG_LONG __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("mark_layer", 0);
+
+  /* "gcodetime_planner.pyx":410
+ *     def mark_layer(self, layer, long long offset):
+ *         """ Record the start of **layer** before the next move. """
+ *         if not self.layer_marks:             # <<<<<<<<<<<<<<
+ *             self.next_mark = self.moves
+ *         self.layer_marks.append( (self.moves, layer, offset) )
+ */
+  __pyx_t_1 = (__pyx_v_self->layer_marks != Py_None)&&(PyList_GET_SIZE(__pyx_v_self->layer_marks) != 0);
+  __pyx_t_2 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_2) {
+
+    /* "gcodetime_planner.pyx":411
+ *         """ Record the start of **layer** before the next move. """
+ *         if not self.layer_marks:
+ *             self.next_mark = self.moves             # <<<<<<<<<<<<<<
+ *         self.layer_marks.append( (self.moves, layer, offset) )
+ * 
+ */
+    __pyx_t_3 = __pyx_v_self->moves;
+    __pyx_v_self->next_mark = __pyx_t_3;
+
+    /* "gcodetime_planner.pyx":410
+ *     def mark_layer(self, layer, long long offset):
+ *         """ Record the start of **layer** before the next move. """
+ *         if not self.layer_marks:             # <<<<<<<<<<<<<<
+ *             self.next_mark = self.moves
+ *         self.layer_marks.append( (self.moves, layer, offset) )
+ */
+  }
+
+  /* "gcodetime_planner.pyx":412
+ *         if not self.layer_marks:
+ *             self.next_mark = self.moves
+ *         self.layer_marks.append( (self.moves, layer, offset) )             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int process(self, const char *line, Py_ssize_t length, long long offset) except -1:
+ */
+  if (unlikely(__pyx_v_self->layer_marks == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 412, __pyx_L1_error)
+  }
+  __pyx_t_4 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->moves); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_offset); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_v_layer);
+  __Pyx_GIVEREF(__pyx_v_layer);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_layer);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5);
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_self->layer_marks, __pyx_t_6); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "gcodetime_planner.pyx":408
+ *         self.previous_nominal = 0.0
+ * 
+ *     def mark_layer(self, layer, long long offset):             # <<<<<<<<<<<<<<
+ *         """ Record the start of **layer** before the next move. """
+ *         if not self.layer_marks:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.mark_layer", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":414
+ *         self.layer_marks.append( (self.moves, layer, offset) )
+ * 
+ *     cdef int process(self, const char *line, Py_ssize_t length, long long offset) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Process a gcode line without comments.
+ */
+
+static int __pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_process(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, char const *__pyx_v_line, Py_ssize_t __pyx_v_length, PY_LONG_LONG __pyx_v_offset) {
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_start;
+  Py_ssize_t __pyx_v_size;
+  char const *__pyx_v_command;
+  Py_ssize_t __pyx_v_command_length;
+  char const *__pyx_v_token;
+  double __pyx_v_value;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_i;
+  double __pyx_v_j;
+  double __pyx_v_r;
+  double __pyx_v_delta[4];
+  int __pyx_v_has_r;
+  int __pyx_v_arc;
+  int __pyx_v_axis;
+  char __pyx_v_code;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("process", 0);
+
+  /* "gcodetime_planner.pyx":418
+ *         Process a gcode line without comments.
+ *         """
+ *         cdef Py_ssize_t pos = 0, start, size             # <<<<<<<<<<<<<<
+ *         cdef const char *command
+ *         cdef Py_ssize_t command_length
+ */
+  __pyx_v_pos = 0;
+
+  /* "gcodetime_planner.pyx":422
+ *         cdef Py_ssize_t command_length
+ *         cdef const char *token
+ *         cdef double value, x, y, i = 0.0, j = 0.0, r = 0.0             # <<<<<<<<<<<<<<
+ *         cdef double delta[4]
+ *         cdef bint has_r = False, arc
+ */
+  __pyx_v_i = 0.0;
+  __pyx_v_j = 0.0;
+  __pyx_v_r = 0.0;
+
+  /* "gcodetime_planner.pyx":424
+ *         cdef double value, x, y, i = 0.0, j = 0.0, r = 0.0
+ *         cdef double delta[4]
+ *         cdef bint has_r = False, arc             # <<<<<<<<<<<<<<
+ *         cdef int axis
+ *         cdef char code
+ */
+  __pyx_v_has_r = 0;
+
+  /* "gcodetime_planner.pyx":428
+ *         cdef char code
+ * 
+ *         while pos < length and is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *             pos += 1
+ *         if pos == length:
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_pos < __pyx_v_length) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "gcodetime_planner.pyx":429
+ * 
+ *         while pos < length and is_space(line[pos]):
+ *             pos += 1             # <<<<<<<<<<<<<<
+ *         if pos == length:
+ *             return 0
+ */
+    __pyx_v_pos = (__pyx_v_pos + 1);
+  }
+
+  /* "gcodetime_planner.pyx":430
+ *         while pos < length and is_space(line[pos]):
+ *             pos += 1
+ *         if pos == length:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         start = pos
+ */
+  __pyx_t_1 = ((__pyx_v_pos == __pyx_v_length) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":431
+ *             pos += 1
+ *         if pos == length:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         start = pos
+ *         while pos < length and not is_space(line[pos]):
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "gcodetime_planner.pyx":430
+ *         while pos < length and is_space(line[pos]):
+ *             pos += 1
+ *         if pos == length:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         start = pos
+ */
+  }
+
+  /* "gcodetime_planner.pyx":432
+ *         if pos == length:
+ *             return 0
+ *         start = pos             # <<<<<<<<<<<<<<
+ *         while pos < length and not is_space(line[pos]):
+ *             pos += 1
+ */
+  __pyx_v_start = __pyx_v_pos;
+
+  /* "gcodetime_planner.pyx":433
+ *             return 0
+ *         start = pos
+ *         while pos < length and not is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *             pos += 1
+ *         command = line + start
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_pos < __pyx_v_length) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_2 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0)) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L10_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "gcodetime_planner.pyx":434
+ *         start = pos
+ *         while pos < length and not is_space(line[pos]):
+ *             pos += 1             # <<<<<<<<<<<<<<
+ *         command = line + start
+ *         command_length = pos - start
+ */
+    __pyx_v_pos = (__pyx_v_pos + 1);
+  }
+
+  /* "gcodetime_planner.pyx":435
+ *         while pos < length and not is_space(line[pos]):
+ *             pos += 1
+ *         command = line + start             # <<<<<<<<<<<<<<
+ *         command_length = pos - start
+ * 
+ */
+  __pyx_v_command = (__pyx_v_line + __pyx_v_start);
+
+  /* "gcodetime_planner.pyx":436
+ *             pos += 1
+ *         command = line + start
+ *         command_length = pos - start             # <<<<<<<<<<<<<<
+ * 
+ *         if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':
+ */
+  __pyx_v_command_length = (__pyx_v_pos - __pyx_v_start);
+
+  /* "gcodetime_planner.pyx":438
+ *         command_length = pos - start
+ * 
+ *         if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':             # <<<<<<<<<<<<<<
+ *             arc = command[1] == '2' or command[1] == '3'
+ *             x = self.position[0]
+ */
+  __pyx_t_2 = ((__pyx_v_command_length == 2) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_command[0]) == 'G') != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L13_bool_binop_done;
+  }
+  __pyx_t_2 = ('0' <= (__pyx_v_command[1]));
+  if (__pyx_t_2) {
+    __pyx_t_2 = ((__pyx_v_command[1]) <= '3');
+  }
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L13_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":439
+ * 
+ *         if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':
+ *             arc = command[1] == '2' or command[1] == '3'             # <<<<<<<<<<<<<<
+ *             x = self.position[0]
+ *             y = self.position[1]
+ */
+    __pyx_t_3 = (((__pyx_v_command[1]) == '2') != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L16_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_command[1]) == '3') != 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L16_bool_binop_done:;
+    __pyx_v_arc = __pyx_t_1;
+
+    /* "gcodetime_planner.pyx":440
+ *         if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':
+ *             arc = command[1] == '2' or command[1] == '3'
+ *             x = self.position[0]             # <<<<<<<<<<<<<<
+ *             y = self.position[1]
+ *             delta[0] = delta[1] = delta[2] = delta[3] = 0.0
+ */
+    __pyx_v_x = (__pyx_v_self->position[0]);
+
+    /* "gcodetime_planner.pyx":441
+ *             arc = command[1] == '2' or command[1] == '3'
+ *             x = self.position[0]
+ *             y = self.position[1]             # <<<<<<<<<<<<<<
+ *             delta[0] = delta[1] = delta[2] = delta[3] = 0.0
+ *             while True:
+ */
+    __pyx_v_y = (__pyx_v_self->position[1]);
+
+    /* "gcodetime_planner.pyx":442
+ *             x = self.position[0]
+ *             y = self.position[1]
+ *             delta[0] = delta[1] = delta[2] = delta[3] = 0.0             # <<<<<<<<<<<<<<
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):
+ */
+    (__pyx_v_delta[0]) = 0.0;
+    (__pyx_v_delta[1]) = 0.0;
+    (__pyx_v_delta[2]) = 0.0;
+    (__pyx_v_delta[3]) = 0.0;
+
+    /* "gcodetime_planner.pyx":443
+ *             y = self.position[1]
+ *             delta[0] = delta[1] = delta[2] = delta[3] = 0.0
+ *             while True:             # <<<<<<<<<<<<<<
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ */
+    while (1) {
+
+      /* "gcodetime_planner.pyx":444
+ *             delta[0] = delta[1] = delta[2] = delta[3] = 0.0
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                     pos += 1
+ *                 if pos == length:
+ */
+      while (1) {
+        __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+        if (__pyx_t_3) {
+        } else {
+          __pyx_t_1 = __pyx_t_3;
+          goto __pyx_L22_bool_binop_done;
+        }
+        __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0);
+        __pyx_t_1 = __pyx_t_3;
+        __pyx_L22_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "gcodetime_planner.pyx":445
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1             # <<<<<<<<<<<<<<
+ *                 if pos == length:
+ *                     break
+ */
+        __pyx_v_pos = (__pyx_v_pos + 1);
+      }
+
+      /* "gcodetime_planner.pyx":446
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ *                 if pos == length:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 start = pos
+ */
+      __pyx_t_1 = ((__pyx_v_pos == __pyx_v_length) != 0);
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":447
+ *                     pos += 1
+ *                 if pos == length:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):
+ */
+        goto __pyx_L19_break;
+
+        /* "gcodetime_planner.pyx":446
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ *                 if pos == length:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 start = pos
+ */
+      }
+
+      /* "gcodetime_planner.pyx":448
+ *                 if pos == length:
+ *                     break
+ *                 start = pos             # <<<<<<<<<<<<<<
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1
+ */
+      __pyx_v_start = __pyx_v_pos;
+
+      /* "gcodetime_planner.pyx":449
+ *                     break
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                     pos += 1
+ *                 token = line + start
+ */
+      while (1) {
+        __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+        if (__pyx_t_3) {
+        } else {
+          __pyx_t_1 = __pyx_t_3;
+          goto __pyx_L27_bool_binop_done;
+        }
+        __pyx_t_3 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0)) != 0);
+        __pyx_t_1 = __pyx_t_3;
+        __pyx_L27_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "gcodetime_planner.pyx":450
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1             # <<<<<<<<<<<<<<
+ *                 token = line + start
+ *                 size = pos - start
+ */
+        __pyx_v_pos = (__pyx_v_pos + 1);
+      }
+
+      /* "gcodetime_planner.pyx":451
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1
+ *                 token = line + start             # <<<<<<<<<<<<<<
+ *                 size = pos - start
+ *                 if not parse_value(token + 1, size - 1, &value):
+ */
+      __pyx_v_token = (__pyx_v_line + __pyx_v_start);
+
+      /* "gcodetime_planner.pyx":452
+ *                     pos += 1
+ *                 token = line + start
+ *                 size = pos - start             # <<<<<<<<<<<<<<
+ *                 if not parse_value(token + 1, size - 1, &value):
+ *                     continue
+ */
+      __pyx_v_size = (__pyx_v_pos - __pyx_v_start);
+
+      /* "gcodetime_planner.pyx":453
+ *                 token = line + start
+ *                 size = pos - start
+ *                 if not parse_value(token + 1, size - 1, &value):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 code = token[0]
+ */
+      __pyx_t_1 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_parse_value((__pyx_v_token + 1), (__pyx_v_size - 1), (&__pyx_v_value)) != 0)) != 0);
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":454
+ *                 size = pos - start
+ *                 if not parse_value(token + 1, size - 1, &value):
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 code = token[0]
+ *                 if code == 'F':
+ */
+        goto __pyx_L18_continue;
+
+        /* "gcodetime_planner.pyx":453
+ *                 token = line + start
+ *                 size = pos - start
+ *                 if not parse_value(token + 1, size - 1, &value):             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 code = token[0]
+ */
+      }
+
+      /* "gcodetime_planner.pyx":455
+ *                 if not parse_value(token + 1, size - 1, &value):
+ *                     continue
+ *                 code = token[0]             # <<<<<<<<<<<<<<
+ *                 if code == 'F':
+ *                     if value > 0:
+ */
+      __pyx_v_code = (__pyx_v_token[0]);
+
+      /* "gcodetime_planner.pyx":456
+ *                     continue
+ *                 code = token[0]
+ *                 if code == 'F':             # <<<<<<<<<<<<<<
+ *                     if value > 0:
+ *                         self.feedrate = value / 60.0
+ */
+      __pyx_t_1 = ((__pyx_v_code == 'F') != 0);
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":457
+ *                 code = token[0]
+ *                 if code == 'F':
+ *                     if value > 0:             # <<<<<<<<<<<<<<
+ *                         self.feedrate = value / 60.0
+ *                     continue
+ */
+        __pyx_t_1 = ((__pyx_v_value > 0.0) != 0);
+        if (__pyx_t_1) {
+
+          /* "gcodetime_planner.pyx":458
+ *                 if code == 'F':
+ *                     if value > 0:
+ *                         self.feedrate = value / 60.0             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 axis = axis_index(code)
+ */
+          __pyx_v_self->feedrate = (__pyx_v_value / 60.0);
+
+          /* "gcodetime_planner.pyx":457
+ *                 code = token[0]
+ *                 if code == 'F':
+ *                     if value > 0:             # <<<<<<<<<<<<<<
+ *                         self.feedrate = value / 60.0
+ *                     continue
+ */
+        }
+
+        /* "gcodetime_planner.pyx":459
+ *                     if value > 0:
+ *                         self.feedrate = value / 60.0
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 axis = axis_index(code)
+ *                 if axis < 0:
+ */
+        goto __pyx_L18_continue;
+
+        /* "gcodetime_planner.pyx":456
+ *                     continue
+ *                 code = token[0]
+ *                 if code == 'F':             # <<<<<<<<<<<<<<
+ *                     if value > 0:
+ *                         self.feedrate = value / 60.0
+ */
+      }
+
+      /* "gcodetime_planner.pyx":460
+ *                         self.feedrate = value / 60.0
+ *                     continue
+ *                 axis = axis_index(code)             # <<<<<<<<<<<<<<
+ *                 if axis < 0:
+ *                     if code == 'I':
+ */
+      __pyx_v_axis = __pyx_f_8fabtotum_8speedups_17gcodetime_planner_axis_index(__pyx_v_code);
+
+      /* "gcodetime_planner.pyx":461
+ *                     continue
+ *                 axis = axis_index(code)
+ *                 if axis < 0:             # <<<<<<<<<<<<<<
+ *                     if code == 'I':
+ *                         i = value
+ */
+      __pyx_t_1 = ((__pyx_v_axis < 0) != 0);
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":462
+ *                 axis = axis_index(code)
+ *                 if axis < 0:
+ *                     if code == 'I':             # <<<<<<<<<<<<<<
+ *                         i = value
+ *                     elif code == 'J':
+ */
+        switch (__pyx_v_code) {
+          case 'I':
+
+          /* "gcodetime_planner.pyx":463
+ *                 if axis < 0:
+ *                     if code == 'I':
+ *                         i = value             # <<<<<<<<<<<<<<
+ *                     elif code == 'J':
+ *                         j = value
+ */
+          __pyx_v_i = __pyx_v_value;
+
+          /* "gcodetime_planner.pyx":462
+ *                 axis = axis_index(code)
+ *                 if axis < 0:
+ *                     if code == 'I':             # <<<<<<<<<<<<<<
+ *                         i = value
+ *                     elif code == 'J':
+ */
+          break;
+          case 'J':
+
+          /* "gcodetime_planner.pyx":465
+ *                         i = value
+ *                     elif code == 'J':
+ *                         j = value             # <<<<<<<<<<<<<<
+ *                     elif code == 'R':
+ *                         r = value
+ */
+          __pyx_v_j = __pyx_v_value;
+
+          /* "gcodetime_planner.pyx":464
+ *                     if code == 'I':
+ *                         i = value
+ *                     elif code == 'J':             # <<<<<<<<<<<<<<
+ *                         j = value
+ *                     elif code == 'R':
+ */
+          break;
+          case 'R':
+
+          /* "gcodetime_planner.pyx":467
+ *                         j = value
+ *                     elif code == 'R':
+ *                         r = value             # <<<<<<<<<<<<<<
+ *                         has_r = True
+ *                     continue
+ */
+          __pyx_v_r = __pyx_v_value;
+
+          /* "gcodetime_planner.pyx":468
+ *                     elif code == 'R':
+ *                         r = value
+ *                         has_r = True             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if self.relative or (axis == 3 and self.relative_e):
+ */
+          __pyx_v_has_r = 1;
+
+          /* "gcodetime_planner.pyx":466
+ *                     elif code == 'J':
+ *                         j = value
+ *                     elif code == 'R':             # <<<<<<<<<<<<<<
+ *                         r = value
+ *                         has_r = True
+ */
+          break;
+          default: break;
+        }
+
+        /* "gcodetime_planner.pyx":469
+ *                         r = value
+ *                         has_r = True
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 if self.relative or (axis == 3 and self.relative_e):
+ *                     delta[axis] = value
+ */
+        goto __pyx_L18_continue;
+
+        /* "gcodetime_planner.pyx":461
+ *                     continue
+ *                 axis = axis_index(code)
+ *                 if axis < 0:             # <<<<<<<<<<<<<<
+ *                     if code == 'I':
+ *                         i = value
+ */
+      }
+
+      /* "gcodetime_planner.pyx":470
+ *                         has_r = True
+ *                     continue
+ *                 if self.relative or (axis == 3 and self.relative_e):             # <<<<<<<<<<<<<<
+ *                     delta[axis] = value
+ *                     self.position[axis] += value
+ */
+      __pyx_t_3 = (__pyx_v_self->relative != 0);
+      if (!__pyx_t_3) {
+      } else {
+        __pyx_t_1 = __pyx_t_3;
+        goto __pyx_L34_bool_binop_done;
+      }
+      __pyx_t_3 = ((__pyx_v_axis == 3) != 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_1 = __pyx_t_3;
+        goto __pyx_L34_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_v_self->relative_e != 0);
+      __pyx_t_1 = __pyx_t_3;
+      __pyx_L34_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":471
+ *                     continue
+ *                 if self.relative or (axis == 3 and self.relative_e):
+ *                     delta[axis] = value             # <<<<<<<<<<<<<<
+ *                     self.position[axis] += value
+ *                 else:
+ */
+        (__pyx_v_delta[__pyx_v_axis]) = __pyx_v_value;
+
+        /* "gcodetime_planner.pyx":472
+ *                 if self.relative or (axis == 3 and self.relative_e):
+ *                     delta[axis] = value
+ *                     self.position[axis] += value             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     delta[axis] = value - self.position[axis]
+ */
+        __pyx_t_4 = __pyx_v_axis;
+        (__pyx_v_self->position[__pyx_t_4]) = ((__pyx_v_self->position[__pyx_t_4]) + __pyx_v_value);
+
+        /* "gcodetime_planner.pyx":470
+ *                         has_r = True
+ *                     continue
+ *                 if self.relative or (axis == 3 and self.relative_e):             # <<<<<<<<<<<<<<
+ *                     delta[axis] = value
+ *                     self.position[axis] += value
+ */
+        goto __pyx_L33;
+      }
+
+      /* "gcodetime_planner.pyx":474
+ *                     self.position[axis] += value
+ *                 else:
+ *                     delta[axis] = value - self.position[axis]             # <<<<<<<<<<<<<<
+ *                     self.position[axis] = value
+ *             if arc:
+ */
+      /*else*/ {
+        (__pyx_v_delta[__pyx_v_axis]) = (__pyx_v_value - (__pyx_v_self->position[__pyx_v_axis]));
+
+        /* "gcodetime_planner.pyx":475
+ *                 else:
+ *                     delta[axis] = value - self.position[axis]
+ *                     self.position[axis] = value             # <<<<<<<<<<<<<<
+ *             if arc:
+ *                 self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)
+ */
+        (__pyx_v_self->position[__pyx_v_axis]) = __pyx_v_value;
+      }
+      __pyx_L33:;
+      __pyx_L18_continue:;
+    }
+    __pyx_L19_break:;
+
+    /* "gcodetime_planner.pyx":476
+ *                     delta[axis] = value - self.position[axis]
+ *                     self.position[axis] = value
+ *             if arc:             # <<<<<<<<<<<<<<
+ *                 self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)
+ *             else:
+ */
+    __pyx_t_1 = (__pyx_v_arc != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":477
+ *                     self.position[axis] = value
+ *             if arc:
+ *                 self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self.add_move(delta[0], delta[1], delta[2], delta[3], offset)
+ */
+      __pyx_t_4 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->add_arc(__pyx_v_self, __pyx_v_x, __pyx_v_y, __pyx_v_delta, __pyx_v_i, __pyx_v_j, __pyx_v_r, __pyx_v_has_r, ((__pyx_v_command[1]) == '2'), __pyx_v_offset); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 477, __pyx_L1_error)
+
+      /* "gcodetime_planner.pyx":476
+ *                     delta[axis] = value - self.position[axis]
+ *                     self.position[axis] = value
+ *             if arc:             # <<<<<<<<<<<<<<
+ *                 self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)
+ *             else:
+ */
+      goto __pyx_L37;
+    }
+
+    /* "gcodetime_planner.pyx":479
+ *                 self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)
+ *             else:
+ *                 self.add_move(delta[0], delta[1], delta[2], delta[3], offset)             # <<<<<<<<<<<<<<
+ *         elif is_word(command, command_length, 'G90', 3):
+ *             self.relative = False
+ */
+    /*else*/ {
+      __pyx_t_4 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->add_move(__pyx_v_self, (__pyx_v_delta[0]), (__pyx_v_delta[1]), (__pyx_v_delta[2]), (__pyx_v_delta[3]), __pyx_v_offset); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 479, __pyx_L1_error)
+    }
+    __pyx_L37:;
+
+    /* "gcodetime_planner.pyx":438
+ *         command_length = pos - start
+ * 
+ *         if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':             # <<<<<<<<<<<<<<
+ *             arc = command[1] == '2' or command[1] == '3'
+ *             x = self.position[0]
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":480
+ *             else:
+ *                 self.add_move(delta[0], delta[1], delta[2], delta[3], offset)
+ *         elif is_word(command, command_length, 'G90', 3):             # <<<<<<<<<<<<<<
+ *             self.relative = False
+ *         elif is_word(command, command_length, 'G91', 3):
+ */
+  __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G90"), 3) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":481
+ *                 self.add_move(delta[0], delta[1], delta[2], delta[3], offset)
+ *         elif is_word(command, command_length, 'G90', 3):
+ *             self.relative = False             # <<<<<<<<<<<<<<
+ *         elif is_word(command, command_length, 'G91', 3):
+ *             self.relative = True
+ */
+    __pyx_v_self->relative = 0;
+
+    /* "gcodetime_planner.pyx":480
+ *             else:
+ *                 self.add_move(delta[0], delta[1], delta[2], delta[3], offset)
+ *         elif is_word(command, command_length, 'G90', 3):             # <<<<<<<<<<<<<<
+ *             self.relative = False
+ *         elif is_word(command, command_length, 'G91', 3):
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":482
+ *         elif is_word(command, command_length, 'G90', 3):
+ *             self.relative = False
+ *         elif is_word(command, command_length, 'G91', 3):             # <<<<<<<<<<<<<<
+ *             self.relative = True
+ *         elif is_word(command, command_length, 'M82', 3):
+ */
+  __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G91"), 3) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":483
+ *             self.relative = False
+ *         elif is_word(command, command_length, 'G91', 3):
+ *             self.relative = True             # <<<<<<<<<<<<<<
+ *         elif is_word(command, command_length, 'M82', 3):
+ *             self.relative_e = False
+ */
+    __pyx_v_self->relative = 1;
+
+    /* "gcodetime_planner.pyx":482
+ *         elif is_word(command, command_length, 'G90', 3):
+ *             self.relative = False
+ *         elif is_word(command, command_length, 'G91', 3):             # <<<<<<<<<<<<<<
+ *             self.relative = True
+ *         elif is_word(command, command_length, 'M82', 3):
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":484
+ *         elif is_word(command, command_length, 'G91', 3):
+ *             self.relative = True
+ *         elif is_word(command, command_length, 'M82', 3):             # <<<<<<<<<<<<<<
+ *             self.relative_e = False
+ *         elif is_word(command, command_length, 'M83', 3):
+ */
+  __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M82"), 3) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":485
+ *             self.relative = True
+ *         elif is_word(command, command_length, 'M82', 3):
+ *             self.relative_e = False             # <<<<<<<<<<<<<<
+ *         elif is_word(command, command_length, 'M83', 3):
+ *             self.relative_e = True
+ */
+    __pyx_v_self->relative_e = 0;
+
+    /* "gcodetime_planner.pyx":484
+ *         elif is_word(command, command_length, 'G91', 3):
+ *             self.relative = True
+ *         elif is_word(command, command_length, 'M82', 3):             # <<<<<<<<<<<<<<
+ *             self.relative_e = False
+ *         elif is_word(command, command_length, 'M83', 3):
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":486
+ *         elif is_word(command, command_length, 'M82', 3):
+ *             self.relative_e = False
+ *         elif is_word(command, command_length, 'M83', 3):             # <<<<<<<<<<<<<<
+ *             self.relative_e = True
+ *         elif is_word(command, command_length, 'G92', 3):
+ */
+  __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M83"), 3) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":487
+ *             self.relative_e = False
+ *         elif is_word(command, command_length, 'M83', 3):
+ *             self.relative_e = True             # <<<<<<<<<<<<<<
+ *         elif is_word(command, command_length, 'G92', 3):
+ *             while True:
+ */
+    __pyx_v_self->relative_e = 1;
+
+    /* "gcodetime_planner.pyx":486
+ *         elif is_word(command, command_length, 'M82', 3):
+ *             self.relative_e = False
+ *         elif is_word(command, command_length, 'M83', 3):             # <<<<<<<<<<<<<<
+ *             self.relative_e = True
+ *         elif is_word(command, command_length, 'G92', 3):
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":488
+ *         elif is_word(command, command_length, 'M83', 3):
+ *             self.relative_e = True
+ *         elif is_word(command, command_length, 'G92', 3):             # <<<<<<<<<<<<<<
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):
+ */
+  __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G92"), 3) != 0);
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":489
+ *             self.relative_e = True
+ *         elif is_word(command, command_length, 'G92', 3):
+ *             while True:             # <<<<<<<<<<<<<<
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ */
+    while (1) {
+
+      /* "gcodetime_planner.pyx":490
+ *         elif is_word(command, command_length, 'G92', 3):
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                     pos += 1
+ *                 if pos == length:
+ */
+      while (1) {
+        __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+        if (__pyx_t_3) {
+        } else {
+          __pyx_t_1 = __pyx_t_3;
+          goto __pyx_L42_bool_binop_done;
+        }
+        __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0);
+        __pyx_t_1 = __pyx_t_3;
+        __pyx_L42_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "gcodetime_planner.pyx":491
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1             # <<<<<<<<<<<<<<
+ *                 if pos == length:
+ *                     break
+ */
+        __pyx_v_pos = (__pyx_v_pos + 1);
+      }
+
+      /* "gcodetime_planner.pyx":492
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ *                 if pos == length:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 start = pos
+ */
+      __pyx_t_1 = ((__pyx_v_pos == __pyx_v_length) != 0);
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":493
+ *                     pos += 1
+ *                 if pos == length:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):
+ */
+        goto __pyx_L39_break;
+
+        /* "gcodetime_planner.pyx":492
+ *                 while pos < length and is_space(line[pos]):
+ *                     pos += 1
+ *                 if pos == length:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 start = pos
+ */
+      }
+
+      /* "gcodetime_planner.pyx":494
+ *                 if pos == length:
+ *                     break
+ *                 start = pos             # <<<<<<<<<<<<<<
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1
+ */
+      __pyx_v_start = __pyx_v_pos;
+
+      /* "gcodetime_planner.pyx":495
+ *                     break
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                     pos += 1
+ *                 axis = axis_index(line[start])
+ */
+      while (1) {
+        __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+        if (__pyx_t_3) {
+        } else {
+          __pyx_t_1 = __pyx_t_3;
+          goto __pyx_L47_bool_binop_done;
+        }
+        __pyx_t_3 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0)) != 0);
+        __pyx_t_1 = __pyx_t_3;
+        __pyx_L47_bool_binop_done:;
+        if (!__pyx_t_1) break;
+
+        /* "gcodetime_planner.pyx":496
+ *                 start = pos
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1             # <<<<<<<<<<<<<<
+ *                 axis = axis_index(line[start])
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ */
+        __pyx_v_pos = (__pyx_v_pos + 1);
+      }
+
+      /* "gcodetime_planner.pyx":497
+ *                 while pos < length and not is_space(line[pos]):
+ *                     pos += 1
+ *                 axis = axis_index(line[start])             # <<<<<<<<<<<<<<
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ *                     self.position[axis] = value
+ */
+      __pyx_v_axis = __pyx_f_8fabtotum_8speedups_17gcodetime_planner_axis_index((__pyx_v_line[__pyx_v_start]));
+
+      /* "gcodetime_planner.pyx":498
+ *                     pos += 1
+ *                 axis = axis_index(line[start])
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):             # <<<<<<<<<<<<<<
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or
+ */
+      __pyx_t_3 = ((__pyx_v_axis >= 0) != 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_1 = __pyx_t_3;
+        goto __pyx_L50_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_parse_value(((__pyx_v_line + __pyx_v_start) + 1), ((__pyx_v_pos - __pyx_v_start) - 1), (&__pyx_v_value)) != 0);
+      __pyx_t_1 = __pyx_t_3;
+      __pyx_L50_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "gcodetime_planner.pyx":499
+ *                 axis = axis_index(line[start])
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ *                     self.position[axis] = value             # <<<<<<<<<<<<<<
+ *         elif (is_word(command, command_length, 'G4', 2) or
+ *               is_word(command, command_length, 'G28', 3) or
+ */
+        (__pyx_v_self->position[__pyx_v_axis]) = __pyx_v_value;
+
+        /* "gcodetime_planner.pyx":498
+ *                     pos += 1
+ *                 axis = axis_index(line[start])
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):             # <<<<<<<<<<<<<<
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or
+ */
+      }
+    }
+    __pyx_L39_break:;
+
+    /* "gcodetime_planner.pyx":488
+ *         elif is_word(command, command_length, 'M83', 3):
+ *             self.relative_e = True
+ *         elif is_word(command, command_length, 'G92', 3):             # <<<<<<<<<<<<<<
+ *             while True:
+ *                 while pos < length and is_space(line[pos]):
+ */
+    goto __pyx_L12;
+  }
+
+  /* "gcodetime_planner.pyx":500
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'G28', 3) or
+ *               is_word(command, command_length, 'G29', 3) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G4"), 2) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":501
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or
+ *               is_word(command, command_length, 'G28', 3) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'G29', 3) or
+ *               is_word(command, command_length, 'G30', 3) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G28"), 3) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":502
+ *         elif (is_word(command, command_length, 'G4', 2) or
+ *               is_word(command, command_length, 'G28', 3) or
+ *               is_word(command, command_length, 'G29', 3) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'G30', 3) or
+ *               is_word(command, command_length, 'M400', 4) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G29"), 3) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":503
+ *               is_word(command, command_length, 'G28', 3) or
+ *               is_word(command, command_length, 'G29', 3) or
+ *               is_word(command, command_length, 'G30', 3) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'M400', 4) or
+ *               is_word(command, command_length, 'M109', 4) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G30"), 3) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":504
+ *               is_word(command, command_length, 'G29', 3) or
+ *               is_word(command, command_length, 'G30', 3) or
+ *               is_word(command, command_length, 'M400', 4) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'M109', 4) or
+ *               is_word(command, command_length, 'M190', 4) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M400"), 4) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":505
+ *               is_word(command, command_length, 'G30', 3) or
+ *               is_word(command, command_length, 'M400', 4) or
+ *               is_word(command, command_length, 'M109', 4) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'M190', 4) or
+ *               is_word(command, command_length, 'M0', 2) or
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M109"), 4) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":506
+ *               is_word(command, command_length, 'M400', 4) or
+ *               is_word(command, command_length, 'M109', 4) or
+ *               is_word(command, command_length, 'M190', 4) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'M0', 2) or
+ *               is_word(command, command_length, 'M1', 2)):
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M190"), 4) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":507
+ *               is_word(command, command_length, 'M109', 4) or
+ *               is_word(command, command_length, 'M190', 4) or
+ *               is_word(command, command_length, 'M0', 2) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'M1', 2)):
+ *             self.synchronize()
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M0"), 2) != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L52_bool_binop_done;
+  }
+
+  /* "gcodetime_planner.pyx":508
+ *               is_word(command, command_length, 'M190', 4) or
+ *               is_word(command, command_length, 'M0', 2) or
+ *               is_word(command, command_length, 'M1', 2)):             # <<<<<<<<<<<<<<
+ *             self.synchronize()
+ *             if is_word(command, command_length, 'G4', 2):
+ */
+  __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"M1"), 2) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L52_bool_binop_done:;
+
+  /* "gcodetime_planner.pyx":500
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'G28', 3) or
+ *               is_word(command, command_length, 'G29', 3) or
+ */
+  if (__pyx_t_1) {
+
+    /* "gcodetime_planner.pyx":509
+ *               is_word(command, command_length, 'M0', 2) or
+ *               is_word(command, command_length, 'M1', 2)):
+ *             self.synchronize()             # <<<<<<<<<<<<<<
+ *             if is_word(command, command_length, 'G4', 2):
+ *                 while True:
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_synchronize); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 509, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 509, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "gcodetime_planner.pyx":510
+ *               is_word(command, command_length, 'M1', 2)):
+ *             self.synchronize()
+ *             if is_word(command, command_length, 'G4', 2):             # <<<<<<<<<<<<<<
+ *                 while True:
+ *                     while pos < length and is_space(line[pos]):
+ */
+    __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G4"), 2) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":511
+ *             self.synchronize()
+ *             if is_word(command, command_length, 'G4', 2):
+ *                 while True:             # <<<<<<<<<<<<<<
+ *                     while pos < length and is_space(line[pos]):
+ *                         pos += 1
+ */
+      while (1) {
+
+        /* "gcodetime_planner.pyx":512
+ *             if is_word(command, command_length, 'G4', 2):
+ *                 while True:
+ *                     while pos < length and is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                         pos += 1
+ *                     if pos == length:
+ */
+        while (1) {
+          __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_1 = __pyx_t_3;
+            goto __pyx_L66_bool_binop_done;
+          }
+          __pyx_t_3 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0);
+          __pyx_t_1 = __pyx_t_3;
+          __pyx_L66_bool_binop_done:;
+          if (!__pyx_t_1) break;
+
+          /* "gcodetime_planner.pyx":513
+ *                 while True:
+ *                     while pos < length and is_space(line[pos]):
+ *                         pos += 1             # <<<<<<<<<<<<<<
+ *                     if pos == length:
+ *                         break
+ */
+          __pyx_v_pos = (__pyx_v_pos + 1);
+        }
+
+        /* "gcodetime_planner.pyx":514
+ *                     while pos < length and is_space(line[pos]):
+ *                         pos += 1
+ *                     if pos == length:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     start = pos
+ */
+        __pyx_t_1 = ((__pyx_v_pos == __pyx_v_length) != 0);
+        if (__pyx_t_1) {
+
+          /* "gcodetime_planner.pyx":515
+ *                         pos += 1
+ *                     if pos == length:
+ *                         break             # <<<<<<<<<<<<<<
+ *                     start = pos
+ *                     while pos < length and not is_space(line[pos]):
+ */
+          goto __pyx_L63_break;
+
+          /* "gcodetime_planner.pyx":514
+ *                     while pos < length and is_space(line[pos]):
+ *                         pos += 1
+ *                     if pos == length:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     start = pos
+ */
+        }
+
+        /* "gcodetime_planner.pyx":516
+ *                     if pos == length:
+ *                         break
+ *                     start = pos             # <<<<<<<<<<<<<<
+ *                     while pos < length and not is_space(line[pos]):
+ *                         pos += 1
+ */
+        __pyx_v_start = __pyx_v_pos;
+
+        /* "gcodetime_planner.pyx":517
+ *                         break
+ *                     start = pos
+ *                     while pos < length and not is_space(line[pos]):             # <<<<<<<<<<<<<<
+ *                         pos += 1
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):
+ */
+        while (1) {
+          __pyx_t_3 = ((__pyx_v_pos < __pyx_v_length) != 0);
+          if (__pyx_t_3) {
+          } else {
+            __pyx_t_1 = __pyx_t_3;
+            goto __pyx_L71_bool_binop_done;
+          }
+          __pyx_t_3 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_space((__pyx_v_line[__pyx_v_pos])) != 0)) != 0);
+          __pyx_t_1 = __pyx_t_3;
+          __pyx_L71_bool_binop_done:;
+          if (!__pyx_t_1) break;
+
+          /* "gcodetime_planner.pyx":518
+ *                     start = pos
+ *                     while pos < length and not is_space(line[pos]):
+ *                         pos += 1             # <<<<<<<<<<<<<<
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):
+ *                         continue
+ */
+          __pyx_v_pos = (__pyx_v_pos + 1);
+        }
+
+        /* "gcodetime_planner.pyx":519
+ *                     while pos < length and not is_space(line[pos]):
+ *                         pos += 1
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if line[start] == 'P':
+ */
+        __pyx_t_1 = ((!(__pyx_f_8fabtotum_8speedups_17gcodetime_planner_parse_value(((__pyx_v_line + __pyx_v_start) + 1), ((__pyx_v_pos - __pyx_v_start) - 1), (&__pyx_v_value)) != 0)) != 0);
+        if (__pyx_t_1) {
+
+          /* "gcodetime_planner.pyx":520
+ *                         pos += 1
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     if line[start] == 'P':
+ *                         self.elapsed += value / 1000.0
+ */
+          goto __pyx_L62_continue;
+
+          /* "gcodetime_planner.pyx":519
+ *                     while pos < length and not is_space(line[pos]):
+ *                         pos += 1
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if line[start] == 'P':
+ */
+        }
+
+        /* "gcodetime_planner.pyx":521
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):
+ *                         continue
+ *                     if line[start] == 'P':             # <<<<<<<<<<<<<<
+ *                         self.elapsed += value / 1000.0
+ *                     elif line[start] == 'S':
+ */
+        __pyx_t_1 = (((__pyx_v_line[__pyx_v_start]) == 'P') != 0);
+        if (__pyx_t_1) {
+
+          /* "gcodetime_planner.pyx":522
+ *                         continue
+ *                     if line[start] == 'P':
+ *                         self.elapsed += value / 1000.0             # <<<<<<<<<<<<<<
+ *                     elif line[start] == 'S':
+ *                         self.elapsed += value
+ */
+          __pyx_v_self->elapsed = (__pyx_v_self->elapsed + (__pyx_v_value / 1000.0));
+
+          /* "gcodetime_planner.pyx":521
+ *                     if not parse_value(line + start + 1, pos - start - 1, &value):
+ *                         continue
+ *                     if line[start] == 'P':             # <<<<<<<<<<<<<<
+ *                         self.elapsed += value / 1000.0
+ *                     elif line[start] == 'S':
+ */
+          goto __pyx_L74;
+        }
+
+        /* "gcodetime_planner.pyx":523
+ *                     if line[start] == 'P':
+ *                         self.elapsed += value / 1000.0
+ *                     elif line[start] == 'S':             # <<<<<<<<<<<<<<
+ *                         self.elapsed += value
+ *             elif is_word(command, command_length, 'G28', 3):
+ */
+        __pyx_t_1 = (((__pyx_v_line[__pyx_v_start]) == 'S') != 0);
+        if (__pyx_t_1) {
+
+          /* "gcodetime_planner.pyx":524
+ *                         self.elapsed += value / 1000.0
+ *                     elif line[start] == 'S':
+ *                         self.elapsed += value             # <<<<<<<<<<<<<<
+ *             elif is_word(command, command_length, 'G28', 3):
+ *                 self.position[0] = self.position[1] = self.position[2] = 0.0
+ */
+          __pyx_v_self->elapsed = (__pyx_v_self->elapsed + __pyx_v_value);
+
+          /* "gcodetime_planner.pyx":523
+ *                     if line[start] == 'P':
+ *                         self.elapsed += value / 1000.0
+ *                     elif line[start] == 'S':             # <<<<<<<<<<<<<<
+ *                         self.elapsed += value
+ *             elif is_word(command, command_length, 'G28', 3):
+ */
+        }
+        __pyx_L74:;
+        __pyx_L62_continue:;
+      }
+      __pyx_L63_break:;
+
+      /* "gcodetime_planner.pyx":510
+ *               is_word(command, command_length, 'M1', 2)):
+ *             self.synchronize()
+ *             if is_word(command, command_length, 'G4', 2):             # <<<<<<<<<<<<<<
+ *                 while True:
+ *                     while pos < length and is_space(line[pos]):
+ */
+      goto __pyx_L61;
+    }
+
+    /* "gcodetime_planner.pyx":525
+ *                     elif line[start] == 'S':
+ *                         self.elapsed += value
+ *             elif is_word(command, command_length, 'G28', 3):             # <<<<<<<<<<<<<<
+ *                 self.position[0] = self.position[1] = self.position[2] = 0.0
+ *         return 0
+ */
+    __pyx_t_1 = (__pyx_f_8fabtotum_8speedups_17gcodetime_planner_is_word(__pyx_v_command, __pyx_v_command_length, ((char const *)"G28"), 3) != 0);
+    if (__pyx_t_1) {
+
+      /* "gcodetime_planner.pyx":526
+ *                         self.elapsed += value
+ *             elif is_word(command, command_length, 'G28', 3):
+ *                 self.position[0] = self.position[1] = self.position[2] = 0.0             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+      (__pyx_v_self->position[0]) = 0.0;
+      (__pyx_v_self->position[1]) = 0.0;
+      (__pyx_v_self->position[2]) = 0.0;
+
+      /* "gcodetime_planner.pyx":525
+ *                     elif line[start] == 'S':
+ *                         self.elapsed += value
+ *             elif is_word(command, command_length, 'G28', 3):             # <<<<<<<<<<<<<<
+ *                 self.position[0] = self.position[1] = self.position[2] = 0.0
+ *         return 0
+ */
+    }
+    __pyx_L61:;
+
+    /* "gcodetime_planner.pyx":500
+ *                 if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+ *                     self.position[axis] = value
+ *         elif (is_word(command, command_length, 'G4', 2) or             # <<<<<<<<<<<<<<
+ *               is_word(command, command_length, 'G28', 3) or
+ *               is_word(command, command_length, 'G29', 3) or
+ */
+  }
+  __pyx_L12:;
+
+  /* "gcodetime_planner.pyx":527
+ *             elif is_word(command, command_length, 'G28', 3):
+ *                 self.position[0] = self.position[1] = self.position[2] = 0.0
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     def process_line(self, line, long long offset = 0):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":414
+ *         self.layer_marks.append( (self.moves, layer, offset) )
+ * 
+ *     cdef int process(self, const char *line, Py_ssize_t length, long long offset) except -1:             # <<<<<<<<<<<<<<
+ *         """
+ *         Process a gcode line without comments.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.process", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":529
+ *         return 0
+ * 
+ *     def process_line(self, line, long long offset = 0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Process a gcode line without comments.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7process_line(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_6process_line[] = "\n        Process a gcode line without comments.\n\n        :param offset: Byte offset of the end of the line\n        ";
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7process_line(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_line = 0;
+  PY_LONG_LONG __pyx_v_offset;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("process_line (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_line,&__pyx_n_s_offset,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_line)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "process_line") < 0)) __PYX_ERR(0, 529, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_line = values[0];
+    if (values[1]) {
+      __pyx_v_offset = __Pyx_PyInt_As_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_offset == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 529, __pyx_L3_error)
+    } else {
+      __pyx_v_offset = ((PY_LONG_LONG)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("process_line", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 529, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.process_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_6process_line(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self), __pyx_v_line, __pyx_v_offset);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_6process_line(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_line, PY_LONG_LONG __pyx_v_offset) {
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  char const *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("process_line", 0);
+  __Pyx_INCREF(__pyx_v_line);
+
+  /* "gcodetime_planner.pyx":535
+ *         :param offset: Byte offset of the end of the line
+ *         """
+ *         if isinstance(line, unicode):             # <<<<<<<<<<<<<<
+ *             line = line.encode('utf-8')
+ *         cdef bytes data = line
+ */
+  __pyx_t_1 = PyUnicode_Check(__pyx_v_line); 
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "gcodetime_planner.pyx":536
+ *         """
+ *         if isinstance(line, unicode):
+ *             line = line.encode('utf-8')             # <<<<<<<<<<<<<<
+ *         cdef bytes data = line
+ *         self.process(data, len(data), offset)
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_s_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_s_utf_8);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_line, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "gcodetime_planner.pyx":535
+ *         :param offset: Byte offset of the end of the line
+ *         """
+ *         if isinstance(line, unicode):             # <<<<<<<<<<<<<<
+ *             line = line.encode('utf-8')
+ *         cdef bytes data = line
+ */
+  }
+
+  /* "gcodetime_planner.pyx":537
+ *         if isinstance(line, unicode):
+ *             line = line.encode('utf-8')
+ *         cdef bytes data = line             # <<<<<<<<<<<<<<
+ *         self.process(data, len(data), offset)
+ * 
+ */
+  if (!(likely(PyBytes_CheckExact(__pyx_v_line))||((__pyx_v_line) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_v_line)->tp_name), 0))) __PYX_ERR(0, 537, __pyx_L1_error)
+  __pyx_t_3 = __pyx_v_line;
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_v_data = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "gcodetime_planner.pyx":538
+ *             line = line.encode('utf-8')
+ *         cdef bytes data = line
+ *         self.process(data, len(data), offset)             # <<<<<<<<<<<<<<
+ * 
+ *     def process_block(self, bytes data, long long offset, get_layer = None):
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 538, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyBytes_AsString(__pyx_v_data); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 538, __pyx_L1_error)
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 538, __pyx_L1_error)
+  }
+  __pyx_t_7 = PyBytes_GET_SIZE(__pyx_v_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 538, __pyx_L1_error)
+  __pyx_t_8 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->process(__pyx_v_self, __pyx_t_6, __pyx_t_7, __pyx_v_offset); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 538, __pyx_L1_error)
+
+  /* "gcodetime_planner.pyx":529
+ *         return 0
+ * 
+ *     def process_line(self, line, long long offset = 0):             # <<<<<<<<<<<<<<
+ *         """
+ *         Process a gcode line without comments.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.process_line", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_line);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":540
+ *         self.process(data, len(data), offset)
+ * 
+ *     def process_block(self, bytes data, long long offset, get_layer = None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Process complete lines of a file, comments included. Only the last
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_9process_block(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_8process_block[] = "\n        Process complete lines of a file, comments included. Only the last\n        line of the file may have no newline.\n\n        :param data: File content\n        :param offset: Byte offset of **data** in the file\n        :param get_layer: Function returning the layer started by a line with a comment or ``None``\n        ";
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_9process_block(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_data = 0;
+  PY_LONG_LONG __pyx_v_offset;
+  PyObject *__pyx_v_get_layer = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("process_block (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_data,&__pyx_n_s_offset,&__pyx_n_s_get_layer,0};
+    PyObject* values[3] = {0,0,0};
+    values[2] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("process_block", 0, 2, 3, 1); __PYX_ERR(0, 540, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_get_layer);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "process_block") < 0)) __PYX_ERR(0, 540, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_data = ((PyObject*)values[0]);
+    __pyx_v_offset = __Pyx_PyInt_As_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_offset == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 540, __pyx_L3_error)
+    __pyx_v_get_layer = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("process_block", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 540, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.process_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_data), (&PyBytes_Type), 1, "data", 1))) __PYX_ERR(0, 540, __pyx_L1_error)
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_8process_block(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self), __pyx_v_data, __pyx_v_offset, __pyx_v_get_layer);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_8process_block(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v_data, PY_LONG_LONG __pyx_v_offset, PyObject *__pyx_v_get_layer) {
+  char const *__pyx_v_buffer;
+  Py_ssize_t __pyx_v_size;
+  Py_ssize_t __pyx_v_pos;
+  Py_ssize_t __pyx_v_end;
+  Py_ssize_t __pyx_v_line_end;
+  char const *__pyx_v_newline;
+  char const *__pyx_v_comment;
+  PyObject *__pyx_v_layer = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  char const *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("process_block", 0);
+
+  /* "gcodetime_planner.pyx":549
+ *         :param get_layer: Function returning the layer started by a line with a comment or ``None``
+ *         """
+ *         cdef const char *buffer = data             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = len(data)
+ *         cdef Py_ssize_t pos = 0, end, line_end
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 549, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyBytes_AsString(__pyx_v_data); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(0, 549, __pyx_L1_error)
+  __pyx_v_buffer = __pyx_t_1;
+
+  /* "gcodetime_planner.pyx":550
+ *         """
+ *         cdef const char *buffer = data
+ *         cdef Py_ssize_t size = len(data)             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t pos = 0, end, line_end
+ *         cdef const char *newline
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 550, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyBytes_GET_SIZE(__pyx_v_data); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 550, __pyx_L1_error)
+  __pyx_v_size = __pyx_t_2;
+
+  /* "gcodetime_planner.pyx":551
+ *         cdef const char *buffer = data
+ *         cdef Py_ssize_t size = len(data)
+ *         cdef Py_ssize_t pos = 0, end, line_end             # <<<<<<<<<<<<<<
+ *         cdef const char *newline
+ *         cdef const char *comment
+ */
+  __pyx_v_pos = 0;
+
+  /* "gcodetime_planner.pyx":555
+ *         cdef const char *comment
+ * 
+ *         while pos < size:             # <<<<<<<<<<<<<<
+ *             newline = <const char *>memchr(buffer + pos, '\n', size - pos)
+ *             if newline:
+ */
+  while (1) {
+    __pyx_t_3 = ((__pyx_v_pos < __pyx_v_size) != 0);
+    if (!__pyx_t_3) break;
+
+    /* "gcodetime_planner.pyx":556
+ * 
+ *         while pos < size:
+ *             newline = <const char *>memchr(buffer + pos, '\n', size - pos)             # <<<<<<<<<<<<<<
+ *             if newline:
+ *                 line_end = newline - buffer
+ */
+    __pyx_v_newline = ((char const *)memchr((__pyx_v_buffer + __pyx_v_pos), '\n', (__pyx_v_size - __pyx_v_pos)));
+
+    /* "gcodetime_planner.pyx":557
+ *         while pos < size:
+ *             newline = <const char *>memchr(buffer + pos, '\n', size - pos)
+ *             if newline:             # <<<<<<<<<<<<<<
+ *                 line_end = newline - buffer
+ *                 end = line_end + 1
+ */
+    __pyx_t_3 = (__pyx_v_newline != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":558
+ *             newline = <const char *>memchr(buffer + pos, '\n', size - pos)
+ *             if newline:
+ *                 line_end = newline - buffer             # <<<<<<<<<<<<<<
+ *                 end = line_end + 1
+ *             else:
+ */
+      __pyx_v_line_end = (__pyx_v_newline - __pyx_v_buffer);
+
+      /* "gcodetime_planner.pyx":559
+ *             if newline:
+ *                 line_end = newline - buffer
+ *                 end = line_end + 1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 line_end = end = size
+ */
+      __pyx_v_end = (__pyx_v_line_end + 1);
+
+      /* "gcodetime_planner.pyx":557
+ *         while pos < size:
+ *             newline = <const char *>memchr(buffer + pos, '\n', size - pos)
+ *             if newline:             # <<<<<<<<<<<<<<
+ *                 line_end = newline - buffer
+ *                 end = line_end + 1
+ */
+      goto __pyx_L5;
+    }
+
+    /* "gcodetime_planner.pyx":561
+ *                 end = line_end + 1
+ *             else:
+ *                 line_end = end = size             # <<<<<<<<<<<<<<
+ * 
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+ */
+    /*else*/ {
+      __pyx_v_line_end = __pyx_v_size;
+      __pyx_v_end = __pyx_v_size;
+    }
+    __pyx_L5:;
+
+    /* "gcodetime_planner.pyx":563
+ *                 line_end = end = size
+ * 
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)             # <<<<<<<<<<<<<<
+ *             if comment:
+ *                 if get_layer is not None:
+ */
+    __pyx_v_comment = ((char const *)memchr((__pyx_v_buffer + __pyx_v_pos), ';', (__pyx_v_line_end - __pyx_v_pos)));
+
+    /* "gcodetime_planner.pyx":564
+ * 
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+ *             if comment:             # <<<<<<<<<<<<<<
+ *                 if get_layer is not None:
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ */
+    __pyx_t_3 = (__pyx_v_comment != 0);
+    if (__pyx_t_3) {
+
+      /* "gcodetime_planner.pyx":565
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+ *             if comment:
+ *                 if get_layer is not None:             # <<<<<<<<<<<<<<
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ *                     if layer is not None:
+ */
+      __pyx_t_3 = (__pyx_v_get_layer != Py_None);
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "gcodetime_planner.pyx":566
+ *             if comment:
+ *                 if get_layer is not None:
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )             # <<<<<<<<<<<<<<
+ *                     if layer is not None:
+ *                         self.mark_layer(layer, offset + end)
+ */
+        __pyx_t_6 = PyBytes_FromStringAndSize((__pyx_v_buffer + __pyx_v_pos), (__pyx_v_line_end - __pyx_v_pos)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 566, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_INCREF(__pyx_v_get_layer);
+        __pyx_t_7 = __pyx_v_get_layer; __pyx_t_8 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+          __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+          if (likely(__pyx_t_8)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+            __Pyx_INCREF(__pyx_t_8);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_7, function);
+          }
+        }
+        __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 566, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_layer, __pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "gcodetime_planner.pyx":567
+ *                 if get_layer is not None:
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ *                     if layer is not None:             # <<<<<<<<<<<<<<
+ *                         self.mark_layer(layer, offset + end)
+ *                 line_end = comment - buffer
+ */
+        __pyx_t_4 = (__pyx_v_layer != Py_None);
+        __pyx_t_3 = (__pyx_t_4 != 0);
+        if (__pyx_t_3) {
+
+          /* "gcodetime_planner.pyx":568
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ *                     if layer is not None:
+ *                         self.mark_layer(layer, offset + end)             # <<<<<<<<<<<<<<
+ *                 line_end = comment - buffer
+ * 
+ */
+          __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_mark_layer); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 568, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          __pyx_t_6 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_offset + __pyx_v_end)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 568, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_8 = NULL;
+          __pyx_t_9 = 0;
+          if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_7))) {
+            __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+            if (likely(__pyx_t_8)) {
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+              __Pyx_INCREF(__pyx_t_8);
+              __Pyx_INCREF(function);
+              __Pyx_DECREF_SET(__pyx_t_7, function);
+              __pyx_t_9 = 1;
+            }
+          }
+          #if CYTHON_FAST_PYCALL
+          if (PyFunction_Check(__pyx_t_7)) {
+            PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_layer, __pyx_t_6};
+            __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 568, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          } else
+          #endif
+          #if CYTHON_FAST_PYCCALL
+          if (__Pyx_PyFastCFunction_Check(__pyx_t_7)) {
+            PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_v_layer, __pyx_t_6};
+            __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_7, __pyx_temp+1-__pyx_t_9, 2+__pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 568, __pyx_L1_error)
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          } else
+          #endif
+          {
+            __pyx_t_10 = PyTuple_New(2+__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 568, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            if (__pyx_t_8) {
+              __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
+            }
+            __Pyx_INCREF(__pyx_v_layer);
+            __Pyx_GIVEREF(__pyx_v_layer);
+            PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_9, __pyx_v_layer);
+            __Pyx_GIVEREF(__pyx_t_6);
+            PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_9, __pyx_t_6);
+            __pyx_t_6 = 0;
+            __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_10, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 568, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_5);
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          }
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+          /* "gcodetime_planner.pyx":567
+ *                 if get_layer is not None:
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ *                     if layer is not None:             # <<<<<<<<<<<<<<
+ *                         self.mark_layer(layer, offset + end)
+ *                 line_end = comment - buffer
+ */
+        }
+
+        /* "gcodetime_planner.pyx":565
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+ *             if comment:
+ *                 if get_layer is not None:             # <<<<<<<<<<<<<<
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ *                     if layer is not None:
+ */
+      }
+
+      /* "gcodetime_planner.pyx":569
+ *                     if layer is not None:
+ *                         self.mark_layer(layer, offset + end)
+ *                 line_end = comment - buffer             # <<<<<<<<<<<<<<
+ * 
+ *             self.process(buffer + pos, line_end - pos, offset + end)
+ */
+      __pyx_v_line_end = (__pyx_v_comment - __pyx_v_buffer);
+
+      /* "gcodetime_planner.pyx":564
+ * 
+ *             comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+ *             if comment:             # <<<<<<<<<<<<<<
+ *                 if get_layer is not None:
+ *                     layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+ */
+    }
+
+    /* "gcodetime_planner.pyx":571
+ *                 line_end = comment - buffer
+ * 
+ *             self.process(buffer + pos, line_end - pos, offset + end)             # <<<<<<<<<<<<<<
+ *             pos = end
+ * 
+ */
+    __pyx_t_9 = ((struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self->__pyx_vtab)->process(__pyx_v_self, (__pyx_v_buffer + __pyx_v_pos), (__pyx_v_line_end - __pyx_v_pos), (__pyx_v_offset + __pyx_v_end)); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 571, __pyx_L1_error)
+
+    /* "gcodetime_planner.pyx":572
+ * 
+ *             self.process(buffer + pos, line_end - pos, offset + end)
+ *             pos = end             # <<<<<<<<<<<<<<
+ * 
+ *     def finish(self):
+ */
+    __pyx_v_pos = __pyx_v_end;
+  }
+
+  /* "gcodetime_planner.pyx":540
+ *         self.process(data, len(data), offset)
+ * 
+ *     def process_block(self, bytes data, long long offset, get_layer = None):             # <<<<<<<<<<<<<<
+ *         """
+ *         Process complete lines of a file, comments included. Only the last
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.process_block", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_layer);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":574
+ *             pos = end
+ * 
+ *     def finish(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan the remaining moves.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_11finish(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_10finish[] = "\n        Plan the remaining moves.\n\n        :returns: Total time, checkpoints and layer starts, see `TimeEstimate`\n        :rtype: tuple\n        ";
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_11finish(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("finish (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_10finish(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_10finish(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *__pyx_v_index = NULL;
+  PyObject *__pyx_v_layer = NULL;
+  PyObject *__pyx_v_offset = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("finish", 0);
+
+  /* "gcodetime_planner.pyx":581
+ *         :rtype: tuple
+ *         """
+ *         self.synchronize()             # <<<<<<<<<<<<<<
+ *         for index, layer, offset in self.layer_marks[self.mark_index:]:
+ *             self.layers.append( (layer, offset, self.elapsed) )
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_synchronize); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 581, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 581, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcodetime_planner.pyx":582
+ *         """
+ *         self.synchronize()
+ *         for index, layer, offset in self.layer_marks[self.mark_index:]:             # <<<<<<<<<<<<<<
+ *             self.layers.append( (layer, offset, self.elapsed) )
+ *         self.layer_marks = []
+ */
+  if (unlikely(__pyx_v_self->layer_marks == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 582, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GetSlice(__pyx_v_self->layer_marks, __pyx_v_self->mark_index, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 582, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 582, __pyx_L1_error)
+    #else
+    __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 582, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    #endif
+    if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+      PyObject* sequence = __pyx_t_1;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 3)) {
+        if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 582, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 2); 
+      } else {
+        __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_6 = PyList_GET_ITEM(sequence, 2); 
+      }
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      #else
+      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 582, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 582, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 582, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_7 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 582, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_8 = Py_TYPE(__pyx_t_7)->tp_iternext;
+      index = 0; __pyx_t_3 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_3)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_3);
+      index = 1; __pyx_t_5 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_5)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_5);
+      index = 2; __pyx_t_6 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_6)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_6);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_7), 3) < 0) __PYX_ERR(0, 582, __pyx_L1_error)
+      __pyx_t_8 = NULL;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      goto __pyx_L6_unpacking_done;
+      __pyx_L5_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_8 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 582, __pyx_L1_error)
+      __pyx_L6_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_index, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_layer, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_offset, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "gcodetime_planner.pyx":583
+ *         self.synchronize()
+ *         for index, layer, offset in self.layer_marks[self.mark_index:]:
+ *             self.layers.append( (layer, offset, self.elapsed) )             # <<<<<<<<<<<<<<
+ *         self.layer_marks = []
+ *         self.mark_index = 0
+ */
+    if (unlikely(__pyx_v_self->layers == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+      __PYX_ERR(0, 583, __pyx_L1_error)
+    }
+    __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 583, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 583, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_v_layer);
+    __Pyx_GIVEREF(__pyx_v_layer);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_layer);
+    __Pyx_INCREF(__pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_v_offset);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_offset);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_1);
+    __pyx_t_1 = 0;
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_self->layers, __pyx_t_6); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 583, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "gcodetime_planner.pyx":582
+ *         """
+ *         self.synchronize()
+ *         for index, layer, offset in self.layer_marks[self.mark_index:]:             # <<<<<<<<<<<<<<
+ *             self.layers.append( (layer, offset, self.elapsed) )
+ *         self.layer_marks = []
+ */
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "gcodetime_planner.pyx":584
+ *         for index, layer, offset in self.layer_marks[self.mark_index:]:
+ *             self.layers.append( (layer, offset, self.elapsed) )
+ *         self.layer_marks = []             # <<<<<<<<<<<<<<
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 584, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->layer_marks);
+  __Pyx_DECREF(__pyx_v_self->layer_marks);
+  __pyx_v_self->layer_marks = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "gcodetime_planner.pyx":585
+ *             self.layers.append( (layer, offset, self.elapsed) )
+ *         self.layer_marks = []
+ *         self.mark_index = 0             # <<<<<<<<<<<<<<
+ *         self.next_mark = NO_MARK
+ *         return self.elapsed, self.checkpoints, self.layers
+ */
+  __pyx_v_self->mark_index = 0;
+
+  /* "gcodetime_planner.pyx":586
+ *         self.layer_marks = []
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK             # <<<<<<<<<<<<<<
+ *         return self.elapsed, self.checkpoints, self.layers
+ */
+  __pyx_v_self->next_mark = 0x7FFFFFFFFFFFFFFF;
+
+  /* "gcodetime_planner.pyx":587
+ *         self.mark_index = 0
+ *         self.next_mark = NO_MARK
+ *         return self.elapsed, self.checkpoints, self.layers             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->checkpoints);
+  __Pyx_GIVEREF(__pyx_v_self->checkpoints);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_self->checkpoints);
+  __Pyx_INCREF(__pyx_v_self->layers);
+  __Pyx_GIVEREF(__pyx_v_self->layers);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_self->layers);
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "gcodetime_planner.pyx":574
+ *             pos = end
+ * 
+ *     def finish(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         Plan the remaining moves.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.finish", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_index);
+  __Pyx_XDECREF(__pyx_v_layer);
+  __Pyx_XDECREF(__pyx_v_offset);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":106
+ * 
+ *     cdef double entry
+ *     cdef readonly double elapsed             # <<<<<<<<<<<<<<
+ *     cdef readonly long long moves
+ *     # Pending layer starts as (move index, layer, offset), next_mark is the move index of the first one
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed___get__(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed___get__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.elapsed.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "gcodetime_planner.pyx":107
+ *     cdef double entry
+ *     cdef readonly double elapsed
+ *     cdef readonly long long moves             # <<<<<<<<<<<<<<
+ *     # Pending layer starts as (move index, layer, offset), next_mark is the move index of the first one
+ *     cdef list layer_marks
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves___get__(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves___get__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->moves); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.moves.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_12__reduce_cython__(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_12__reduce_cython__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *__pyx_t_26 = NULL;
+  PyObject *__pyx_t_27 = NULL;
+  PyObject *__pyx_t_28 = NULL;
+  PyObject *__pyx_t_29 = NULL;
+  PyObject *__pyx_t_30 = NULL;
+  int __pyx_t_31;
+  int __pyx_t_32;
+  int __pyx_t_33;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.acceleration, self.accelerations, self.checkpoints, self.count, self.e_jerk, self.elapsed, self.entries, self.entry, self.feedrate, self.has_previous, self.layer_marks, self.layers, self.lengths, self.mark_index, self.max_acceleration, self.max_entries, self.max_feedrate, self.min_feedrate, self.min_travel_feedrate, self.moves, self.next_mark, self.nominals, self.offsets, self.position, self.previous_nominal, self.previous_speed, self.relative, self.relative_e, self.retract_acceleration, self.stop, self.xy_jerk, self.z_jerk)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->acceleration); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_carray_to_py_double(__pyx_v_self->accelerations, 0x1010); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_self->e_jerk); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_self->elapsed); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_carray_to_py_double(__pyx_v_self->entries, (0x1010 + 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_self->entry); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_self->feedrate); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_9 = __Pyx_PyBool_FromLong(__pyx_v_self->has_previous); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_carray_to_py_double(__pyx_v_self->lengths, 0x1010); if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = PyInt_FromSsize_t(__pyx_v_self->mark_index); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_carray_to_py_double(__pyx_v_self->max_acceleration, 4); if (unlikely(!__pyx_t_12)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_carray_to_py_double(__pyx_v_self->max_entries, 0x1010); if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = __Pyx_carray_to_py_double(__pyx_v_self->max_feedrate, 4); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_15 = PyFloat_FromDouble(__pyx_v_self->min_feedrate); if (unlikely(!__pyx_t_15)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  __pyx_t_16 = PyFloat_FromDouble(__pyx_v_self->min_travel_feedrate); if (unlikely(!__pyx_t_16)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_16);
+  __pyx_t_17 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->moves); if (unlikely(!__pyx_t_17)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __pyx_t_18 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_self->next_mark); if (unlikely(!__pyx_t_18)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_18);
+  __pyx_t_19 = __Pyx_carray_to_py_double(__pyx_v_self->nominals, 0x1010); if (unlikely(!__pyx_t_19)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_20 = __Pyx_carray_to_py_PY_LONG_LONG(__pyx_v_self->offsets, 0x1010); if (unlikely(!__pyx_t_20)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_20);
+  __pyx_t_21 = __Pyx_carray_to_py_double(__pyx_v_self->position, 4); if (unlikely(!__pyx_t_21)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_21);
+  __pyx_t_22 = PyFloat_FromDouble(__pyx_v_self->previous_nominal); if (unlikely(!__pyx_t_22)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_22);
+  __pyx_t_23 = __Pyx_carray_to_py_double(__pyx_v_self->previous_speed, 4); if (unlikely(!__pyx_t_23)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_23);
+  __pyx_t_24 = __Pyx_PyBool_FromLong(__pyx_v_self->relative); if (unlikely(!__pyx_t_24)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_24);
+  __pyx_t_25 = __Pyx_PyBool_FromLong(__pyx_v_self->relative_e); if (unlikely(!__pyx_t_25)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_25);
+  __pyx_t_26 = PyFloat_FromDouble(__pyx_v_self->retract_acceleration); if (unlikely(!__pyx_t_26)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_26);
+  __pyx_t_27 = __Pyx_carray_to_py_double(__pyx_v_self->stop, 0x1010); if (unlikely(!__pyx_t_27)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_27);
+  __pyx_t_28 = PyFloat_FromDouble(__pyx_v_self->xy_jerk); if (unlikely(!__pyx_t_28)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_28);
+  __pyx_t_29 = PyFloat_FromDouble(__pyx_v_self->z_jerk); if (unlikely(!__pyx_t_29)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_29);
+  __pyx_t_30 = PyTuple_New(32); if (unlikely(!__pyx_t_30)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_30);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_30, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_30, 1, __pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->checkpoints);
+  __Pyx_GIVEREF(__pyx_v_self->checkpoints);
+  PyTuple_SET_ITEM(__pyx_t_30, 2, __pyx_v_self->checkpoints);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_30, 3, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_30, 4, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_30, 5, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_30, 6, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_30, 7, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_30, 8, __pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_30, 9, __pyx_t_9);
+  __Pyx_INCREF(__pyx_v_self->layer_marks);
+  __Pyx_GIVEREF(__pyx_v_self->layer_marks);
+  PyTuple_SET_ITEM(__pyx_t_30, 10, __pyx_v_self->layer_marks);
+  __Pyx_INCREF(__pyx_v_self->layers);
+  __Pyx_GIVEREF(__pyx_v_self->layers);
+  PyTuple_SET_ITEM(__pyx_t_30, 11, __pyx_v_self->layers);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_30, 12, __pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyTuple_SET_ITEM(__pyx_t_30, 13, __pyx_t_11);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_30, 14, __pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_30, 15, __pyx_t_13);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyTuple_SET_ITEM(__pyx_t_30, 16, __pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_15);
+  PyTuple_SET_ITEM(__pyx_t_30, 17, __pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_16);
+  PyTuple_SET_ITEM(__pyx_t_30, 18, __pyx_t_16);
+  __Pyx_GIVEREF(__pyx_t_17);
+  PyTuple_SET_ITEM(__pyx_t_30, 19, __pyx_t_17);
+  __Pyx_GIVEREF(__pyx_t_18);
+  PyTuple_SET_ITEM(__pyx_t_30, 20, __pyx_t_18);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyTuple_SET_ITEM(__pyx_t_30, 21, __pyx_t_19);
+  __Pyx_GIVEREF(__pyx_t_20);
+  PyTuple_SET_ITEM(__pyx_t_30, 22, __pyx_t_20);
+  __Pyx_GIVEREF(__pyx_t_21);
+  PyTuple_SET_ITEM(__pyx_t_30, 23, __pyx_t_21);
+  __Pyx_GIVEREF(__pyx_t_22);
+  PyTuple_SET_ITEM(__pyx_t_30, 24, __pyx_t_22);
+  __Pyx_GIVEREF(__pyx_t_23);
+  PyTuple_SET_ITEM(__pyx_t_30, 25, __pyx_t_23);
+  __Pyx_GIVEREF(__pyx_t_24);
+  PyTuple_SET_ITEM(__pyx_t_30, 26, __pyx_t_24);
+  __Pyx_GIVEREF(__pyx_t_25);
+  PyTuple_SET_ITEM(__pyx_t_30, 27, __pyx_t_25);
+  __Pyx_GIVEREF(__pyx_t_26);
+  PyTuple_SET_ITEM(__pyx_t_30, 28, __pyx_t_26);
+  __Pyx_GIVEREF(__pyx_t_27);
+  PyTuple_SET_ITEM(__pyx_t_30, 29, __pyx_t_27);
+  __Pyx_GIVEREF(__pyx_t_28);
+  PyTuple_SET_ITEM(__pyx_t_30, 30, __pyx_t_28);
+  __Pyx_GIVEREF(__pyx_t_29);
+  PyTuple_SET_ITEM(__pyx_t_30, 31, __pyx_t_29);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_8 = 0;
+  __pyx_t_9 = 0;
+  __pyx_t_10 = 0;
+  __pyx_t_11 = 0;
+  __pyx_t_12 = 0;
+  __pyx_t_13 = 0;
+  __pyx_t_14 = 0;
+  __pyx_t_15 = 0;
+  __pyx_t_16 = 0;
+  __pyx_t_17 = 0;
+  __pyx_t_18 = 0;
+  __pyx_t_19 = 0;
+  __pyx_t_20 = 0;
+  __pyx_t_21 = 0;
+  __pyx_t_22 = 0;
+  __pyx_t_23 = 0;
+  __pyx_t_24 = 0;
+  __pyx_t_25 = 0;
+  __pyx_t_26 = 0;
+  __pyx_t_27 = 0;
+  __pyx_t_28 = 0;
+  __pyx_t_29 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_30);
+  __pyx_t_30 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.acceleration, self.accelerations, self.checkpoints, self.count, self.e_jerk, self.elapsed, self.entries, self.entry, self.feedrate, self.has_previous, self.layer_marks, self.layers, self.lengths, self.mark_index, self.max_acceleration, self.max_entries, self.max_feedrate, self.min_feedrate, self.min_travel_feedrate, self.moves, self.next_mark, self.nominals, self.offsets, self.position, self.previous_nominal, self.previous_speed, self.relative, self.relative_e, self.retract_acceleration, self.stop, self.xy_jerk, self.z_jerk)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_30 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_30)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_30);
+  __pyx_v__dict = __pyx_t_30;
+  __pyx_t_30 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.acceleration, self.accelerations, self.checkpoints, self.count, self.e_jerk, self.elapsed, self.entries, self.entry, self.feedrate, self.has_previous, self.layer_marks, self.layers, self.lengths, self.mark_index, self.max_acceleration, self.max_entries, self.max_feedrate, self.min_feedrate, self.min_travel_feedrate, self.moves, self.next_mark, self.nominals, self.offsets, self.position, self.previous_nominal, self.previous_speed, self.relative, self.relative_e, self.retract_acceleration, self.stop, self.xy_jerk, self.z_jerk)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_31 = (__pyx_v__dict != Py_None);
+  __pyx_t_32 = (__pyx_t_31 != 0);
+  if (__pyx_t_32) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_30 = PyTuple_New(1); if (unlikely(!__pyx_t_30)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_30);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_30, 0, __pyx_v__dict);
+    __pyx_t_29 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_30); if (unlikely(!__pyx_t_29)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_29);
+    __Pyx_DECREF(__pyx_t_30); __pyx_t_30 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_29));
+    __pyx_t_29 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.checkpoints is not None or self.layer_marks is not None or self.layers is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.acceleration, self.accelerations, self.checkpoints, self.count, self.e_jerk, self.elapsed, self.entries, self.entry, self.feedrate, self.has_previous, self.layer_marks, self.layers, self.lengths, self.mark_index, self.max_acceleration, self.max_entries, self.max_feedrate, self.min_feedrate, self.min_travel_feedrate, self.moves, self.next_mark, self.nominals, self.offsets, self.position, self.previous_nominal, self.previous_speed, self.relative, self.relative_e, self.retract_acceleration, self.stop, self.xy_jerk, self.z_jerk)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.checkpoints is not None or self.layer_marks is not None or self.layers is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, None), state
+ */
+  /*else*/ {
+    __pyx_t_31 = (__pyx_v_self->checkpoints != ((PyObject*)Py_None));
+    __pyx_t_33 = (__pyx_t_31 != 0);
+    if (!__pyx_t_33) {
+    } else {
+      __pyx_t_32 = __pyx_t_33;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_33 = (__pyx_v_self->layer_marks != ((PyObject*)Py_None));
+    __pyx_t_31 = (__pyx_t_33 != 0);
+    if (!__pyx_t_31) {
+    } else {
+      __pyx_t_32 = __pyx_t_31;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_31 = (__pyx_v_self->layers != ((PyObject*)Py_None));
+    __pyx_t_33 = (__pyx_t_31 != 0);
+    __pyx_t_32 = __pyx_t_33;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_32;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.checkpoints is not None or self.layer_marks is not None or self.layers is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, None), state
+ *     else:
+ */
+  __pyx_t_32 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_32) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.checkpoints is not None or self.layer_marks is not None or self.layers is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_29, __pyx_n_s_pyx_unpickle_Planner); if (unlikely(!__pyx_t_29)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_29);
+    __pyx_t_30 = PyTuple_New(3); if (unlikely(!__pyx_t_30)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_30);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_30, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_86576574);
+    __Pyx_GIVEREF(__pyx_int_86576574);
+    PyTuple_SET_ITEM(__pyx_t_30, 1, __pyx_int_86576574);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_30, 2, Py_None);
+    __pyx_t_28 = PyTuple_New(3); if (unlikely(!__pyx_t_28)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_28);
+    __Pyx_GIVEREF(__pyx_t_29);
+    PyTuple_SET_ITEM(__pyx_t_28, 0, __pyx_t_29);
+    __Pyx_GIVEREF(__pyx_t_30);
+    PyTuple_SET_ITEM(__pyx_t_28, 1, __pyx_t_30);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_28, 2, __pyx_v_state);
+    __pyx_t_29 = 0;
+    __pyx_t_30 = 0;
+    __pyx_r = __pyx_t_28;
+    __pyx_t_28 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.checkpoints is not None or self.layer_marks is not None or self.layers is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, None), state
+ *     else:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Planner__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_28, __pyx_n_s_pyx_unpickle_Planner); if (unlikely(!__pyx_t_28)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_28);
+    __pyx_t_30 = PyTuple_New(3); if (unlikely(!__pyx_t_30)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_30);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_30, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_86576574);
+    __Pyx_GIVEREF(__pyx_int_86576574);
+    PyTuple_SET_ITEM(__pyx_t_30, 1, __pyx_int_86576574);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_30, 2, __pyx_v_state);
+    __pyx_t_29 = PyTuple_New(2); if (unlikely(!__pyx_t_29)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_29);
+    __Pyx_GIVEREF(__pyx_t_28);
+    PyTuple_SET_ITEM(__pyx_t_29, 0, __pyx_t_28);
+    __Pyx_GIVEREF(__pyx_t_30);
+    PyTuple_SET_ITEM(__pyx_t_29, 1, __pyx_t_30);
+    __pyx_t_28 = 0;
+    __pyx_t_30 = 0;
+    __pyx_r = __pyx_t_29;
+    __pyx_t_29 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_XDECREF(__pyx_t_21);
+  __Pyx_XDECREF(__pyx_t_22);
+  __Pyx_XDECREF(__pyx_t_23);
+  __Pyx_XDECREF(__pyx_t_24);
+  __Pyx_XDECREF(__pyx_t_25);
+  __Pyx_XDECREF(__pyx_t_26);
+  __Pyx_XDECREF(__pyx_t_27);
+  __Pyx_XDECREF(__pyx_t_28);
+  __Pyx_XDECREF(__pyx_t_29);
+  __Pyx_XDECREF(__pyx_t_30);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Planner__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_14__setstate_cython__(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner_7Planner_14__setstate_cython__(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_Planner__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_Planner, (type(self), 0x5290dbe, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_Planner__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.Planner.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_Planner(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_1__pyx_unpickle_Planner(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_8fabtotum_8speedups_17gcodetime_planner_1__pyx_unpickle_Planner = {"__pyx_unpickle_Planner", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_1__pyx_unpickle_Planner, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_1__pyx_unpickle_Planner(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Planner (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Planner", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Planner", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_Planner") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_Planner", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.__pyx_unpickle_Planner", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Planner", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x5290dbe, 0xa794d1e, 0x4487c6a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__2, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x5290dbe, 0xa794d1e, 0x4487c6a):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ *     __pyx_result = Planner.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x5290dbe, 0xa794d1e, 0x4487c6a):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = Planner.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x5290dbe, 0xa794d1e, 0x4487c6a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ *     __pyx_result = Planner.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_8fabtotum_8speedups_17gcodetime_planner_Planner), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ *     __pyx_result = Planner.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = Planner.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner__set_state(((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ *     __pyx_result = Planner.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Planner(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.__pyx_unpickle_Planner", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_8fabtotum_8speedups_17gcodetime_planner___pyx_unpickle_Planner__set_state(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  double __pyx_t_2[0x1010];
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  double __pyx_t_5[(0x1010 + 1)];
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  double __pyx_t_8[4];
+  PY_LONG_LONG __pyx_t_9;
+  PY_LONG_LONG __pyx_t_10[0x1010];
+  int __pyx_t_11;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_Planner__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[32])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 0)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->acceleration = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 1), __pyx_t_2, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->accelerations[0]), __pyx_t_2, sizeof(__pyx_v___pyx_result->accelerations[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (!(likely(PyList_CheckExact(PyTuple_GET_ITEM(__pyx_v___pyx_state, 2)))||((PyTuple_GET_ITEM(__pyx_v___pyx_state, 2)) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(PyTuple_GET_ITEM(__pyx_v___pyx_state, 2))->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_GET_ITEM(__pyx_v___pyx_state, 2);
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v___pyx_result->checkpoints);
+  __Pyx_DECREF(__pyx_v___pyx_result->checkpoints);
+  __pyx_v___pyx_result->checkpoints = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_4 = __Pyx_PyInt_As_int(PyTuple_GET_ITEM(__pyx_v___pyx_state, 3)); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->count = __pyx_t_4;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 4)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->e_jerk = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 5)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->elapsed = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 6), __pyx_t_5, (0x1010 + 1)) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely(((0x1010 + 1)) != ((0x1010 + 1)))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)((0x1010 + 1)), (Py_ssize_t)((0x1010 + 1)));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->entries[0]), __pyx_t_5, sizeof(__pyx_v___pyx_result->entries[0]) * ((0x1010 + 1)));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 7)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->entry = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 8)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->feedrate = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_v___pyx_state, 9)); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->has_previous = __pyx_t_6;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (!(likely(PyList_CheckExact(PyTuple_GET_ITEM(__pyx_v___pyx_state, 10)))||((PyTuple_GET_ITEM(__pyx_v___pyx_state, 10)) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(PyTuple_GET_ITEM(__pyx_v___pyx_state, 10))->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_GET_ITEM(__pyx_v___pyx_state, 10);
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v___pyx_result->layer_marks);
+  __Pyx_DECREF(__pyx_v___pyx_result->layer_marks);
+  __pyx_v___pyx_result->layer_marks = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (!(likely(PyList_CheckExact(PyTuple_GET_ITEM(__pyx_v___pyx_state, 11)))||((PyTuple_GET_ITEM(__pyx_v___pyx_state, 11)) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(PyTuple_GET_ITEM(__pyx_v___pyx_state, 11))->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_GET_ITEM(__pyx_v___pyx_state, 11);
+  __Pyx_INCREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_3);
+  __Pyx_GOTREF(__pyx_v___pyx_result->layers);
+  __Pyx_DECREF(__pyx_v___pyx_result->layers);
+  __pyx_v___pyx_result->layers = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 12), __pyx_t_2, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->lengths[0]), __pyx_t_2, sizeof(__pyx_v___pyx_result->lengths[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(PyTuple_GET_ITEM(__pyx_v___pyx_state, 13)); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->mark_index = __pyx_t_7;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 14), __pyx_t_8, 4) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  memcpy(&(__pyx_v___pyx_result->max_acceleration[0]), __pyx_t_8, sizeof(__pyx_v___pyx_result->max_acceleration[0]) * (4));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 15), __pyx_t_2, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->max_entries[0]), __pyx_t_2, sizeof(__pyx_v___pyx_result->max_entries[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 16), __pyx_t_8, 4) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  memcpy(&(__pyx_v___pyx_result->max_feedrate[0]), __pyx_t_8, sizeof(__pyx_v___pyx_result->max_feedrate[0]) * (4));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 17)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->min_feedrate = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 18)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->min_travel_feedrate = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_9 = __Pyx_PyInt_As_PY_LONG_LONG(PyTuple_GET_ITEM(__pyx_v___pyx_state, 19)); if (unlikely((__pyx_t_9 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->moves = __pyx_t_9;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_9 = __Pyx_PyInt_As_PY_LONG_LONG(PyTuple_GET_ITEM(__pyx_v___pyx_state, 20)); if (unlikely((__pyx_t_9 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->next_mark = __pyx_t_9;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 21), __pyx_t_2, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->nominals[0]), __pyx_t_2, sizeof(__pyx_v___pyx_result->nominals[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_PY_LONG_LONG(PyTuple_GET_ITEM(__pyx_v___pyx_state, 22), __pyx_t_10, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->offsets[0]), __pyx_t_10, sizeof(__pyx_v___pyx_result->offsets[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 23), __pyx_t_8, 4) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  memcpy(&(__pyx_v___pyx_result->position[0]), __pyx_t_8, sizeof(__pyx_v___pyx_result->position[0]) * (4));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 24)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->previous_nominal = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 25), __pyx_t_8, 4) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  memcpy(&(__pyx_v___pyx_result->previous_speed[0]), __pyx_t_8, sizeof(__pyx_v___pyx_result->previous_speed[0]) * (4));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_v___pyx_state, 26)); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->relative = __pyx_t_6;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(PyTuple_GET_ITEM(__pyx_v___pyx_state, 27)); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->relative_e = __pyx_t_6;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 28)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->retract_acceleration = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  if (unlikely(__Pyx_carray_from_py_double(PyTuple_GET_ITEM(__pyx_v___pyx_state, 29), __pyx_t_2, 0x1010) < 0)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely((0x1010) != (0x1010))) {
+    PyErr_Format(PyExc_ValueError, "Assignment to slice of wrong length, expected %" CYTHON_FORMAT_SSIZE_T "d, got %" CYTHON_FORMAT_SSIZE_T "d", (Py_ssize_t)(0x1010), (Py_ssize_t)(0x1010));
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  memcpy(&(__pyx_v___pyx_result->stop[0]), __pyx_t_2, sizeof(__pyx_v___pyx_result->stop[0]) * (0x1010));
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 30)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->xy_jerk = __pyx_t_1;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_v___pyx_state, 31)); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->z_jerk = __pyx_t_1;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[32])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_7 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_11 = ((__pyx_t_7 > 32) != 0);
+  if (__pyx_t_11) {
+  } else {
+    __pyx_t_6 = __pyx_t_11;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_11 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_11 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_12 = (__pyx_t_11 != 0);
+  __pyx_t_6 = __pyx_t_12;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[32])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_13 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_13)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_update); if (unlikely(!__pyx_t_14)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_13 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
+      __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_14);
+      if (likely(__pyx_t_13)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
+        __Pyx_INCREF(__pyx_t_13);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_14, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_13) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_13, PyTuple_GET_ITEM(__pyx_v___pyx_state, 32)) : __Pyx_PyObject_CallOneArg(__pyx_t_14, PyTuple_GET_ITEM(__pyx_v___pyx_state, 32));
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[32])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_Planner__set_state(<Planner> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_Planner__set_state(Planner __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.acceleration = __pyx_state[0]; __pyx_result.accelerations = __pyx_state[1]; __pyx_result.checkpoints = __pyx_state[2]; __pyx_result.count = __pyx_state[3]; __pyx_result.e_jerk = __pyx_state[4]; __pyx_result.elapsed = __pyx_state[5]; __pyx_result.entries = __pyx_state[6]; __pyx_result.entry = __pyx_state[7]; __pyx_result.feedrate = __pyx_state[8]; __pyx_result.has_previous = __pyx_state[9]; __pyx_result.layer_marks = __pyx_state[10]; __pyx_result.layers = __pyx_state[11]; __pyx_result.lengths = __pyx_state[12]; __pyx_result.mark_index = __pyx_state[13]; __pyx_result.max_acceleration = __pyx_state[14]; __pyx_result.max_entries = __pyx_state[15]; __pyx_result.max_feedrate = __pyx_state[16]; __pyx_result.min_feedrate = __pyx_state[17]; __pyx_result.min_travel_feedrate = __pyx_state[18]; __pyx_result.moves = __pyx_state[19]; __pyx_result.next_mark = __pyx_state[20]; __pyx_result.nominals = __pyx_state[21]; __pyx_result.offsets = __pyx_state[22]; __pyx_result.position = __pyx_state[23]; __pyx_result.previous_nominal = __pyx_state[24]; __pyx_result.previous_speed = __pyx_state[25]; __pyx_result.relative = __pyx_state[26]; __pyx_result.relative_e = __pyx_state[27]; __pyx_result.retract_acceleration = __pyx_state[28]; __pyx_result.stop = __pyx_state[29]; __pyx_result.xy_jerk = __pyx_state[30]; __pyx_result.z_jerk = __pyx_state[31]
+ *     if len(__pyx_state) > 32 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("fabtotum.speedups.gcodetime_planner.__pyx_unpickle_Planner__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.to_py":112
+ * 
+ * @cname("__Pyx_carray_to_py_double")
+ * cdef inline list __Pyx_carray_to_py_double(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+static CYTHON_INLINE PyObject *__Pyx_carray_to_py_double(double *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  size_t __pyx_v_i;
+  PyObject *__pyx_v_value = 0;
+  PyObject *__pyx_v_l = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_to_py_double", 0);
+
+  /* "carray.to_py":115
+ *     cdef size_t i
+ *     cdef object value
+ *     l = PyList_New(length)             # <<<<<<<<<<<<<<
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ */
+  __pyx_t_1 = PyList_New(__pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_l = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "carray.to_py":116
+ *     cdef object value
+ *     l = PyList_New(length)
+ *     for i in range(<size_t>length):             # <<<<<<<<<<<<<<
+ *         value = v[i]
+ *         Py_INCREF(value)
+ */
+  __pyx_t_2 = ((size_t)__pyx_v_length);
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "carray.to_py":117
+ *     l = PyList_New(length)
+ *     for i in range(<size_t>length):
+ *         value = v[i]             # <<<<<<<<<<<<<<
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)
+ */
+    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_v[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 117, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "carray.to_py":118
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ *         Py_INCREF(value)             # <<<<<<<<<<<<<<
+ *         PyList_SET_ITEM(l, i, value)
+ *     return l
+ */
+    Py_INCREF(__pyx_v_value);
+
+    /* "carray.to_py":119
+ *         value = v[i]
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)             # <<<<<<<<<<<<<<
+ *     return l
+ * 
+ */
+    PyList_SET_ITEM(__pyx_v_l, __pyx_v_i, __pyx_v_value);
+  }
+
+  /* "carray.to_py":120
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)
+ *     return l             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_l);
+  __pyx_r = __pyx_v_l;
+  goto __pyx_L0;
+
+  /* "carray.to_py":112
+ * 
+ * @cname("__Pyx_carray_to_py_double")
+ * cdef inline list __Pyx_carray_to_py_double(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("carray.to_py.__Pyx_carray_to_py_double", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_l);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.to_py":124
+ * 
+ * @cname("__Pyx_carray_to_tuple_double")
+ * cdef inline tuple __Pyx_carray_to_tuple_double(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+static CYTHON_INLINE PyObject *__Pyx_carray_to_tuple_double(double *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  size_t __pyx_v_i;
+  PyObject *__pyx_v_value = 0;
+  PyObject *__pyx_v_t = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_to_tuple_double", 0);
+
+  /* "carray.to_py":127
+ *     cdef size_t i
+ *     cdef object value
+ *     t = PyTuple_New(length)             # <<<<<<<<<<<<<<
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ */
+  __pyx_t_1 = PyTuple_New(__pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_t = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "carray.to_py":128
+ *     cdef object value
+ *     t = PyTuple_New(length)
+ *     for i in range(<size_t>length):             # <<<<<<<<<<<<<<
+ *         value = v[i]
+ *         Py_INCREF(value)
+ */
+  __pyx_t_2 = ((size_t)__pyx_v_length);
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "carray.to_py":129
+ *     t = PyTuple_New(length)
+ *     for i in range(<size_t>length):
+ *         value = v[i]             # <<<<<<<<<<<<<<
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)
+ */
+    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_v[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 129, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "carray.to_py":130
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ *         Py_INCREF(value)             # <<<<<<<<<<<<<<
+ *         PyTuple_SET_ITEM(t, i, value)
+ *     return t
+ */
+    Py_INCREF(__pyx_v_value);
+
+    /* "carray.to_py":131
+ *         value = v[i]
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)             # <<<<<<<<<<<<<<
+ *     return t
+ */
+    PyTuple_SET_ITEM(__pyx_v_t, __pyx_v_i, __pyx_v_value);
+  }
+
+  /* "carray.to_py":132
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)
+ *     return t             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_t);
+  __pyx_r = __pyx_v_t;
+  goto __pyx_L0;
+
+  /* "carray.to_py":124
+ * 
+ * @cname("__Pyx_carray_to_tuple_double")
+ * cdef inline tuple __Pyx_carray_to_tuple_double(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("carray.to_py.__Pyx_carray_to_tuple_double", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_t);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.from_py":77
+ * 
+ * @cname("__Pyx_carray_from_py_double")
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = length
+ *     try:
+ */
+
+static int __Pyx_carray_from_py_double(PyObject *__pyx_v_o, double *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_v_item = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  double __pyx_t_11;
+  char const *__pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_from_py_double", 0);
+
+  /* "carray.from_py":78
+ * @cname("__Pyx_carray_from_py_double")
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length             # <<<<<<<<<<<<<<
+ *     try:
+ *         i = len(o)
+ */
+  __pyx_v_i = __pyx_v_length;
+
+  /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "carray.from_py":80
+ *     cdef Py_ssize_t i = length
+ *     try:
+ *         i = len(o)             # <<<<<<<<<<<<<<
+ *     except (TypeError, OverflowError):
+ *         pass
+ */
+      __pyx_t_4 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 80, __pyx_L3_error)
+      __pyx_v_i = __pyx_t_4;
+
+      /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "carray.from_py":81
+ *     try:
+ *         i = len(o)
+ *     except (TypeError, OverflowError):             # <<<<<<<<<<<<<<
+ *         pass
+ *     if i == length:
+ */
+    __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_TypeError) || __Pyx_PyErr_ExceptionMatches(__pyx_builtin_OverflowError);
+    if (__pyx_t_5) {
+      __Pyx_ErrRestore(0,0,0);
+      goto __pyx_L4_exception_handled;
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    __pyx_L8_try_end:;
+  }
+
+  /* "carray.from_py":83
+ *     except (TypeError, OverflowError):
+ *         pass
+ *     if i == length:             # <<<<<<<<<<<<<<
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ */
+  __pyx_t_6 = ((__pyx_v_i == __pyx_v_length) != 0);
+  if (__pyx_t_6) {
+
+    /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    __pyx_t_4 = 0;
+    if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
+      __pyx_t_7 = __pyx_v_o; __Pyx_INCREF(__pyx_t_7); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+    } else {
+      __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_9 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 84, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_9)) {
+        if (likely(PyList_CheckExact(__pyx_t_7))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_10 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_10); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 84, __pyx_L1_error)
+          #else
+          __pyx_t_10 = PySequence_ITEM(__pyx_t_7, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          #endif
+        } else {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_10 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_10); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 84, __pyx_L1_error)
+          #else
+          __pyx_t_10 = PySequence_ITEM(__pyx_t_7, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          #endif
+        }
+      } else {
+        __pyx_t_10 = __pyx_t_9(__pyx_t_7);
+        if (unlikely(!__pyx_t_10)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(1, 84, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_10);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_10);
+      __pyx_t_10 = 0;
+      __pyx_v_i = __pyx_t_4;
+      __pyx_t_4 = (__pyx_t_4 + 1);
+
+      /* "carray.from_py":85
+ *     if i == length:
+ *         for i, item in enumerate(o):
+ *             if i >= length:             # <<<<<<<<<<<<<<
+ *                 break
+ *             v[i] = item
+ */
+      __pyx_t_6 = ((__pyx_v_i >= __pyx_v_length) != 0);
+      if (__pyx_t_6) {
+
+        /* "carray.from_py":86
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ *                 break             # <<<<<<<<<<<<<<
+ *             v[i] = item
+ *         else:
+ */
+        goto __pyx_L11_break;
+
+        /* "carray.from_py":85
+ *     if i == length:
+ *         for i, item in enumerate(o):
+ *             if i >= length:             # <<<<<<<<<<<<<<
+ *                 break
+ *             v[i] = item
+ */
+      }
+
+      /* "carray.from_py":87
+ *             if i >= length:
+ *                 break
+ *             v[i] = item             # <<<<<<<<<<<<<<
+ *         else:
+ *             i += 1  # convert index to length
+ */
+      __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_v_item); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 87, __pyx_L1_error)
+      (__pyx_v_v[__pyx_v_i]) = __pyx_t_11;
+
+      /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    }
+    /*else*/ {
+
+      /* "carray.from_py":89
+ *             v[i] = item
+ *         else:
+ *             i += 1  # convert index to length             # <<<<<<<<<<<<<<
+ *             if i == length:
+ *                 return 0
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "carray.from_py":90
+ *         else:
+ *             i += 1  # convert index to length
+ *             if i == length:             # <<<<<<<<<<<<<<
+ *                 return 0
+ * 
+ */
+      __pyx_t_6 = ((__pyx_v_i == __pyx_v_length) != 0);
+      if (__pyx_t_6) {
+
+        /* "carray.from_py":91
+ *             i += 1  # convert index to length
+ *             if i == length:
+ *                 return 0             # <<<<<<<<<<<<<<
+ * 
+ *     PyErr_Format(
+ */
+        __pyx_r = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        goto __pyx_L0;
+
+        /* "carray.from_py":90
+ *         else:
+ *             i += 1  # convert index to length
+ *             if i == length:             # <<<<<<<<<<<<<<
+ *                 return 0
+ * 
+ */
+      }
+    }
+
+    /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    __pyx_L11_break:;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "carray.from_py":83
+ *     except (TypeError, OverflowError):
+ *         pass
+ *     if i == length:             # <<<<<<<<<<<<<<
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ */
+  }
+
+  /* "carray.from_py":96
+ *         IndexError,
+ *         ("too many values found during array assignment, expected %zd"
+ *          if i >= length else             # <<<<<<<<<<<<<<
+ *          "not enough values found during array assignment, expected %zd, got %zd"),
+ *         length, i)
+ */
+  if (((__pyx_v_i >= __pyx_v_length) != 0)) {
+    __pyx_t_12 = ((char const *)"too many values found during array assignment, expected %zd");
+  } else {
+    __pyx_t_12 = ((char const *)"not enough values found during array assignment, expected %zd, got %zd");
+  }
+
+  /* "carray.from_py":93
+ *                 return 0
+ * 
+ *     PyErr_Format(             # <<<<<<<<<<<<<<
+ *         IndexError,
+ *         ("too many values found during array assignment, expected %zd"
+ */
+  __pyx_t_7 = PyErr_Format(__pyx_builtin_IndexError, __pyx_t_12, __pyx_v_length, __pyx_v_i); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "carray.from_py":77
+ * 
+ * @cname("__Pyx_carray_from_py_double")
+ * cdef int __Pyx_carray_from_py_double(object o, base_type *v, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = length
+ *     try:
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("carray.from_py.__Pyx_carray_from_py_double", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.to_py":112
+ * 
+ * @cname("__Pyx_carray_to_py_PY_LONG_LONG")
+ * cdef inline list __Pyx_carray_to_py_PY_LONG_LONG(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+static CYTHON_INLINE PyObject *__Pyx_carray_to_py_PY_LONG_LONG(PY_LONG_LONG *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  size_t __pyx_v_i;
+  PyObject *__pyx_v_value = 0;
+  PyObject *__pyx_v_l = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_to_py_PY_LONG_LONG", 0);
+
+  /* "carray.to_py":115
+ *     cdef size_t i
+ *     cdef object value
+ *     l = PyList_New(length)             # <<<<<<<<<<<<<<
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ */
+  __pyx_t_1 = PyList_New(__pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_l = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "carray.to_py":116
+ *     cdef object value
+ *     l = PyList_New(length)
+ *     for i in range(<size_t>length):             # <<<<<<<<<<<<<<
+ *         value = v[i]
+ *         Py_INCREF(value)
+ */
+  __pyx_t_2 = ((size_t)__pyx_v_length);
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "carray.to_py":117
+ *     l = PyList_New(length)
+ *     for i in range(<size_t>length):
+ *         value = v[i]             # <<<<<<<<<<<<<<
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_v[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 117, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "carray.to_py":118
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ *         Py_INCREF(value)             # <<<<<<<<<<<<<<
+ *         PyList_SET_ITEM(l, i, value)
+ *     return l
+ */
+    Py_INCREF(__pyx_v_value);
+
+    /* "carray.to_py":119
+ *         value = v[i]
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)             # <<<<<<<<<<<<<<
+ *     return l
+ * 
+ */
+    PyList_SET_ITEM(__pyx_v_l, __pyx_v_i, __pyx_v_value);
+  }
+
+  /* "carray.to_py":120
+ *         Py_INCREF(value)
+ *         PyList_SET_ITEM(l, i, value)
+ *     return l             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_l);
+  __pyx_r = __pyx_v_l;
+  goto __pyx_L0;
+
+  /* "carray.to_py":112
+ * 
+ * @cname("__Pyx_carray_to_py_PY_LONG_LONG")
+ * cdef inline list __Pyx_carray_to_py_PY_LONG_LONG(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("carray.to_py.__Pyx_carray_to_py_PY_LONG_LONG", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_l);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.to_py":124
+ * 
+ * @cname("__Pyx_carray_to_tuple_PY_LONG_LONG")
+ * cdef inline tuple __Pyx_carray_to_tuple_PY_LONG_LONG(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+static CYTHON_INLINE PyObject *__Pyx_carray_to_tuple_PY_LONG_LONG(PY_LONG_LONG *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  size_t __pyx_v_i;
+  PyObject *__pyx_v_value = 0;
+  PyObject *__pyx_v_t = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_to_tuple_PY_LONG_LONG", 0);
+
+  /* "carray.to_py":127
+ *     cdef size_t i
+ *     cdef object value
+ *     t = PyTuple_New(length)             # <<<<<<<<<<<<<<
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ */
+  __pyx_t_1 = PyTuple_New(__pyx_v_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 127, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_t = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "carray.to_py":128
+ *     cdef object value
+ *     t = PyTuple_New(length)
+ *     for i in range(<size_t>length):             # <<<<<<<<<<<<<<
+ *         value = v[i]
+ *         Py_INCREF(value)
+ */
+  __pyx_t_2 = ((size_t)__pyx_v_length);
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "carray.to_py":129
+ *     t = PyTuple_New(length)
+ *     for i in range(<size_t>length):
+ *         value = v[i]             # <<<<<<<<<<<<<<
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG((__pyx_v_v[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 129, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_value, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "carray.to_py":130
+ *     for i in range(<size_t>length):
+ *         value = v[i]
+ *         Py_INCREF(value)             # <<<<<<<<<<<<<<
+ *         PyTuple_SET_ITEM(t, i, value)
+ *     return t
+ */
+    Py_INCREF(__pyx_v_value);
+
+    /* "carray.to_py":131
+ *         value = v[i]
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)             # <<<<<<<<<<<<<<
+ *     return t
+ */
+    PyTuple_SET_ITEM(__pyx_v_t, __pyx_v_i, __pyx_v_value);
+  }
+
+  /* "carray.to_py":132
+ *         Py_INCREF(value)
+ *         PyTuple_SET_ITEM(t, i, value)
+ *     return t             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_t);
+  __pyx_r = __pyx_v_t;
+  goto __pyx_L0;
+
+  /* "carray.to_py":124
+ * 
+ * @cname("__Pyx_carray_to_tuple_PY_LONG_LONG")
+ * cdef inline tuple __Pyx_carray_to_tuple_PY_LONG_LONG(base_type *v, Py_ssize_t length):             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef object value
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("carray.to_py.__Pyx_carray_to_tuple_PY_LONG_LONG", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XDECREF(__pyx_v_t);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "carray.from_py":77
+ * 
+ * @cname("__Pyx_carray_from_py_PY_LONG_LONG")
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = length
+ *     try:
+ */
+
+static int __Pyx_carray_from_py_PY_LONG_LONG(PyObject *__pyx_v_o, PY_LONG_LONG *__pyx_v_v, Py_ssize_t __pyx_v_length) {
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_v_item = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  PY_LONG_LONG __pyx_t_11;
+  char const *__pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_carray_from_py_PY_LONG_LONG", 0);
+
+  /* "carray.from_py":78
+ * @cname("__Pyx_carray_from_py_PY_LONG_LONG")
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length             # <<<<<<<<<<<<<<
+ *     try:
+ *         i = len(o)
+ */
+  __pyx_v_i = __pyx_v_length;
+
+  /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "carray.from_py":80
+ *     cdef Py_ssize_t i = length
+ *     try:
+ *         i = len(o)             # <<<<<<<<<<<<<<
+ *     except (TypeError, OverflowError):
+ *         pass
+ */
+      __pyx_t_4 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 80, __pyx_L3_error)
+      __pyx_v_i = __pyx_t_4;
+
+      /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "carray.from_py":81
+ *     try:
+ *         i = len(o)
+ *     except (TypeError, OverflowError):             # <<<<<<<<<<<<<<
+ *         pass
+ *     if i == length:
+ */
+    __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_TypeError) || __Pyx_PyErr_ExceptionMatches(__pyx_builtin_OverflowError);
+    if (__pyx_t_5) {
+      __Pyx_ErrRestore(0,0,0);
+      goto __pyx_L4_exception_handled;
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "carray.from_py":79
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:
+ *     cdef Py_ssize_t i = length
+ *     try:             # <<<<<<<<<<<<<<
+ *         i = len(o)
+ *     except (TypeError, OverflowError):
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L4_exception_handled:;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    __pyx_L8_try_end:;
+  }
+
+  /* "carray.from_py":83
+ *     except (TypeError, OverflowError):
+ *         pass
+ *     if i == length:             # <<<<<<<<<<<<<<
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ */
+  __pyx_t_6 = ((__pyx_v_i == __pyx_v_length) != 0);
+  if (__pyx_t_6) {
+
+    /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    __pyx_t_4 = 0;
+    if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
+      __pyx_t_7 = __pyx_v_o; __Pyx_INCREF(__pyx_t_7); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+    } else {
+      __pyx_t_8 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_9 = Py_TYPE(__pyx_t_7)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 84, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_9)) {
+        if (likely(PyList_CheckExact(__pyx_t_7))) {
+          if (__pyx_t_8 >= PyList_GET_SIZE(__pyx_t_7)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_10 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_10); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 84, __pyx_L1_error)
+          #else
+          __pyx_t_10 = PySequence_ITEM(__pyx_t_7, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          #endif
+        } else {
+          if (__pyx_t_8 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_10 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_8); __Pyx_INCREF(__pyx_t_10); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(1, 84, __pyx_L1_error)
+          #else
+          __pyx_t_10 = PySequence_ITEM(__pyx_t_7, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_10)) __PYX_ERR(1, 84, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          #endif
+        }
+      } else {
+        __pyx_t_10 = __pyx_t_9(__pyx_t_7);
+        if (unlikely(!__pyx_t_10)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(1, 84, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_10);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_10);
+      __pyx_t_10 = 0;
+      __pyx_v_i = __pyx_t_4;
+      __pyx_t_4 = (__pyx_t_4 + 1);
+
+      /* "carray.from_py":85
+ *     if i == length:
+ *         for i, item in enumerate(o):
+ *             if i >= length:             # <<<<<<<<<<<<<<
+ *                 break
+ *             v[i] = item
+ */
+      __pyx_t_6 = ((__pyx_v_i >= __pyx_v_length) != 0);
+      if (__pyx_t_6) {
+
+        /* "carray.from_py":86
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ *                 break             # <<<<<<<<<<<<<<
+ *             v[i] = item
+ *         else:
+ */
+        goto __pyx_L11_break;
+
+        /* "carray.from_py":85
+ *     if i == length:
+ *         for i, item in enumerate(o):
+ *             if i >= length:             # <<<<<<<<<<<<<<
+ *                 break
+ *             v[i] = item
+ */
+      }
+
+      /* "carray.from_py":87
+ *             if i >= length:
+ *                 break
+ *             v[i] = item             # <<<<<<<<<<<<<<
+ *         else:
+ *             i += 1  # convert index to length
+ */
+      __pyx_t_11 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_item); if (unlikely((__pyx_t_11 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(1, 87, __pyx_L1_error)
+      (__pyx_v_v[__pyx_v_i]) = __pyx_t_11;
+
+      /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    }
+    /*else*/ {
+
+      /* "carray.from_py":89
+ *             v[i] = item
+ *         else:
+ *             i += 1  # convert index to length             # <<<<<<<<<<<<<<
+ *             if i == length:
+ *                 return 0
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+
+      /* "carray.from_py":90
+ *         else:
+ *             i += 1  # convert index to length
+ *             if i == length:             # <<<<<<<<<<<<<<
+ *                 return 0
+ * 
+ */
+      __pyx_t_6 = ((__pyx_v_i == __pyx_v_length) != 0);
+      if (__pyx_t_6) {
+
+        /* "carray.from_py":91
+ *             i += 1  # convert index to length
+ *             if i == length:
+ *                 return 0             # <<<<<<<<<<<<<<
+ * 
+ *     PyErr_Format(
+ */
+        __pyx_r = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        goto __pyx_L0;
+
+        /* "carray.from_py":90
+ *         else:
+ *             i += 1  # convert index to length
+ *             if i == length:             # <<<<<<<<<<<<<<
+ *                 return 0
+ * 
+ */
+      }
+    }
+
+    /* "carray.from_py":84
+ *         pass
+ *     if i == length:
+ *         for i, item in enumerate(o):             # <<<<<<<<<<<<<<
+ *             if i >= length:
+ *                 break
+ */
+    __pyx_L11_break:;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "carray.from_py":83
+ *     except (TypeError, OverflowError):
+ *         pass
+ *     if i == length:             # <<<<<<<<<<<<<<
+ *         for i, item in enumerate(o):
+ *             if i >= length:
+ */
+  }
+
+  /* "carray.from_py":96
+ *         IndexError,
+ *         ("too many values found during array assignment, expected %zd"
+ *          if i >= length else             # <<<<<<<<<<<<<<
+ *          "not enough values found during array assignment, expected %zd, got %zd"),
+ *         length, i)
+ */
+  if (((__pyx_v_i >= __pyx_v_length) != 0)) {
+    __pyx_t_12 = ((char const *)"too many values found during array assignment, expected %zd");
+  } else {
+    __pyx_t_12 = ((char const *)"not enough values found during array assignment, expected %zd, got %zd");
+  }
+
+  /* "carray.from_py":93
+ *                 return 0
+ * 
+ *     PyErr_Format(             # <<<<<<<<<<<<<<
+ *         IndexError,
+ *         ("too many values found during array assignment, expected %zd"
+ */
+  __pyx_t_7 = PyErr_Format(__pyx_builtin_IndexError, __pyx_t_12, __pyx_v_length, __pyx_v_i); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "carray.from_py":77
+ * 
+ * @cname("__Pyx_carray_from_py_PY_LONG_LONG")
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = length
+ *     try:
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("carray.from_py.__Pyx_carray_from_py_PY_LONG_LONG", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_8fabtotum_8speedups_17gcodetime_planner_Planner __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner;
+
+static PyObject *__pyx_tp_new_8fabtotum_8speedups_17gcodetime_planner_Planner(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)o);
+  p->__pyx_vtab = __pyx_vtabptr_8fabtotum_8speedups_17gcodetime_planner_Planner;
+  p->layer_marks = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->layers = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->checkpoints = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_8fabtotum_8speedups_17gcodetime_planner_Planner(PyObject *o) {
+  struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *p = (struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->layer_marks);
+  Py_CLEAR(p->layers);
+  Py_CLEAR(p->checkpoints);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_8fabtotum_8speedups_17gcodetime_planner_Planner(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *p = (struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)o;
+  if (p->layer_marks) {
+    e = (*v)(p->layer_marks, a); if (e) return e;
+  }
+  if (p->layers) {
+    e = (*v)(p->layers, a); if (e) return e;
+  }
+  if (p->checkpoints) {
+    e = (*v)(p->checkpoints, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_8fabtotum_8speedups_17gcodetime_planner_Planner(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *p = (struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *)o;
+  tmp = ((PyObject*)p->layer_marks);
+  p->layer_marks = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->layers);
+  p->layers = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->checkpoints);
+  p->checkpoints = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_8fabtotum_8speedups_17gcodetime_planner_7Planner_elapsed(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7elapsed_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_8fabtotum_8speedups_17gcodetime_planner_7Planner_moves(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5moves_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_8fabtotum_8speedups_17gcodetime_planner_Planner[] = {
+  {"synchronize", (PyCFunction)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_3synchronize, METH_NOARGS, __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_2synchronize},
+  {"mark_layer", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_5mark_layer, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_4mark_layer},
+  {"process_line", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_7process_line, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_6process_line},
+  {"process_block", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_9process_block, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_8process_block},
+  {"finish", (PyCFunction)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_11finish, METH_NOARGS, __pyx_doc_8fabtotum_8speedups_17gcodetime_planner_7Planner_10finish},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_13__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_15__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_8fabtotum_8speedups_17gcodetime_planner_Planner[] = {
+  {(char *)"elapsed", __pyx_getprop_8fabtotum_8speedups_17gcodetime_planner_7Planner_elapsed, 0, (char *)0, 0},
+  {(char *)"moves", __pyx_getprop_8fabtotum_8speedups_17gcodetime_planner_7Planner_moves, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "fabtotum.speedups.gcodetime_planner.Planner", /*tp_name*/
+  sizeof(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "\n    Simulation of the look-ahead planner of the firmware, see\n    `fabtotum.utils.gcodetime.PyPlanner`.\n\n    :param config: Motion limits\n    :type config: MotionConfig\n    ", /*tp_doc*/
+  __pyx_tp_traverse_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_traverse*/
+  __pyx_tp_clear_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_8fabtotum_8speedups_17gcodetime_planner_7Planner_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_8fabtotum_8speedups_17gcodetime_planner_Planner, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_gcodetime_planner(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_gcodetime_planner},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "gcodetime_planner",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
+  {&__pyx_n_s_OverflowError, __pyx_k_OverflowError, sizeof(__pyx_k_OverflowError), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_Planner, __pyx_k_Planner, sizeof(__pyx_k_Planner), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_acceleration, __pyx_k_acceleration, sizeof(__pyx_k_acceleration), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_config, __pyx_k_config, sizeof(__pyx_k_config), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_e_jerk, __pyx_k_e_jerk, sizeof(__pyx_k_e_jerk), 0, 0, 1, 1},
+  {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
+  {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+  {&__pyx_n_s_fabtotum_speedups_gcodetime_plan, __pyx_k_fabtotum_speedups_gcodetime_plan, sizeof(__pyx_k_fabtotum_speedups_gcodetime_plan), 0, 0, 1, 1},
+  {&__pyx_n_s_get_layer, __pyx_k_get_layer, sizeof(__pyx_k_get_layer), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_layer, __pyx_k_layer, sizeof(__pyx_k_layer), 0, 0, 1, 1},
+  {&__pyx_n_s_line, __pyx_k_line, sizeof(__pyx_k_line), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mark_layer, __pyx_k_mark_layer, sizeof(__pyx_k_mark_layer), 0, 0, 1, 1},
+  {&__pyx_n_s_max_acceleration, __pyx_k_max_acceleration, sizeof(__pyx_k_max_acceleration), 0, 0, 1, 1},
+  {&__pyx_n_s_max_feedrate, __pyx_k_max_feedrate, sizeof(__pyx_k_max_feedrate), 0, 0, 1, 1},
+  {&__pyx_n_s_min_feedrate, __pyx_k_min_feedrate, sizeof(__pyx_k_min_feedrate), 0, 0, 1, 1},
+  {&__pyx_n_s_min_travel_feedrate, __pyx_k_min_travel_feedrate, sizeof(__pyx_k_min_travel_feedrate), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_Planner, __pyx_k_pyx_unpickle_Planner, sizeof(__pyx_k_pyx_unpickle_Planner), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_retract_acceleration, __pyx_k_retract_acceleration, sizeof(__pyx_k_retract_acceleration), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_synchronize, __pyx_k_synchronize, sizeof(__pyx_k_synchronize), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
+  {&__pyx_n_s_xy_jerk, __pyx_k_xy_jerk, sizeof(__pyx_k_xy_jerk), 0, 0, 1, 1},
+  {&__pyx_n_s_z_jerk, __pyx_k_z_jerk, sizeof(__pyx_k_z_jerk), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 81, __pyx_L1_error)
+  __pyx_builtin_OverflowError = __Pyx_GetBuiltinName(__pyx_n_s_OverflowError); if (!__pyx_builtin_OverflowError) __PYX_ERR(1, 81, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 84, __pyx_L1_error)
+  __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(1, 94, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "gcodetime_planner.pyx":142
+ *         self.next_mark = NO_MARK
+ *         self.layers = []
+ *         self.checkpoints = [(0, 0.0)]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int add_move(self, double dx, double dy, double dz, double de, long long offset) except -1:
+ */
+  __pyx_tuple_ = PyTuple_Pack(2, __pyx_int_0, __pyx_float_0_0); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x5290dbe, 0xa794d1e, 0x4487c6a):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x5290dbe, 0xa794d1e, 0x4487c6a) = (acceleration, accelerations, checkpoints, count, e_jerk, elapsed, entries, entry, feedrate, has_previous, layer_marks, layers, lengths, mark_index, max_acceleration, max_entries, max_feedrate, min_feedrate, min_travel_feedrate, moves, next_mark, nominals, offsets, position, previous_nominal, previous_speed, relative, relative_e, retract_acceleration, stop, xy_jerk, z_jerk))" % __pyx_checksum)
+ */
+  __pyx_tuple__2 = PyTuple_Pack(3, __pyx_int_86576574, __pyx_int_175721758, __pyx_int_71859306); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Planner(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__3 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Planner, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_71859306 = PyInt_FromLong(71859306L); if (unlikely(!__pyx_int_71859306)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_86576574 = PyInt_FromLong(86576574L); if (unlikely(!__pyx_int_86576574)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_175721758 = PyInt_FromLong(175721758L); if (unlikely(!__pyx_int_175721758)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_8fabtotum_8speedups_17gcodetime_planner_Planner = &__pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner;
+  __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner.add_move = (int (*)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, double, double, double, double, PY_LONG_LONG))__pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_move;
+  __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner.add_arc = (int (*)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, double, double, double *, double, double, double, int, int, PY_LONG_LONG))__pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_add_arc;
+  __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner.plan = (int (*)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, int, int))__pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_plan;
+  __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner.pop_mark = (int (*)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *))__pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_pop_mark;
+  __pyx_vtable_8fabtotum_8speedups_17gcodetime_planner_Planner.process = (int (*)(struct __pyx_obj_8fabtotum_8speedups_17gcodetime_planner_Planner *, char const *, Py_ssize_t, PY_LONG_LONG))__pyx_f_8fabtotum_8speedups_17gcodetime_planner_7Planner_process;
+  if (PyType_Ready(&__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner.tp_dictoffset && __pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner.tp_dict, __pyx_vtabptr_8fabtotum_8speedups_17gcodetime_planner_Planner) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Planner, (PyObject *)&__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_ptype_8fabtotum_8speedups_17gcodetime_planner_Planner = &__pyx_type_8fabtotum_8speedups_17gcodetime_planner_Planner;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initgcodetime_planner(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initgcodetime_planner(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_gcodetime_planner(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_gcodetime_planner(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_gcodetime_planner(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'gcodetime_planner' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_gcodetime_planner(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("gcodetime_planner", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_fabtotum__speedups__gcodetime_planner) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "fabtotum.speedups.gcodetime_planner")) {
+      if (unlikely(PyDict_SetItemString(modules, "fabtotum.speedups.gcodetime_planner", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_Planner(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8fabtotum_8speedups_17gcodetime_planner_1__pyx_unpickle_Planner, NULL, __pyx_n_s_fabtotum_speedups_gcodetime_plan); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Planner, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "gcodetime_planner.pyx":1
+ * # -*- coding: utf-8; -*-             # <<<<<<<<<<<<<<
+ * #
+ * # (c) 2017 FABtotum, http://www.fabtotum.com
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "carray.from_py":77
+ * 
+ * @cname("__Pyx_carray_from_py_PY_LONG_LONG")
+ * cdef int __Pyx_carray_from_py_PY_LONG_LONG(object o, base_type *v, Py_ssize_t length) except -1:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = length
+ *     try:
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init fabtotum.speedups.gcodetime_planner", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init fabtotum.speedups.gcodetime_planner");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* SliceTupleAndList */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_crop_slice(Py_ssize_t* _start, Py_ssize_t* _stop, Py_ssize_t* _length) {
+    Py_ssize_t start = *_start, stop = *_stop, length = *_length;
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    *_length = stop - start;
+    *_start = start;
+    *_stop = stop;
+}
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject** CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyList_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyList_New(0);
+    dest = PyList_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyListObject*)src)->ob_item + start,
+        ((PyListObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    PyObject* dest;
+    Py_ssize_t length = PyTuple_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (unlikely(length <= 0))
+        return PyTuple_New(0);
+    dest = PyTuple_New(length);
+    if (unlikely(!dest))
+        return NULL;
+    __Pyx_copy_object_array(
+        ((PyTupleObject*)src)->ob_item + start,
+        ((PyTupleObject*)dest)->ob_item,
+        length);
+    return dest;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (PY_LONG_LONG) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (PY_LONG_LONG) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (PY_LONG_LONG) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (PY_LONG_LONG) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            PY_LONG_LONG val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (PY_LONG_LONG) -1;
+        }
+    } else {
+        PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (PY_LONG_LONG) -1;
+        val = __Pyx_PyInt_As_PY_LONG_LONG(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
+        }
+    } else {
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
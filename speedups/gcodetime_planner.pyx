@@ -0,0 +1,587 @@
+# -*- coding: utf-8; -*-
+#
+# (c) 2017 FABtotum, http://www.fabtotum.com
+#
+# This file is part of FABUI.
+#
+# FABUI is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# FABUI is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with FABUI.  If not, see <http://www.gnu.org/licenses/>.
+
+# cython: boundscheck=False, wraparound=False, cdivision=True
+
+# Compiled version of fabtotum.utils.gcodetime.PyPlanner, it must give the
+# same results. Numbers are parsed with the same function as python float().
+
+from libc.math cimport sqrt, hypot, atan2, cos, sin, fabs, M_PI
+from libc.string cimport memchr, memcmp, memmove
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.exc cimport PyErr_Clear
+from cpython.object cimport PyObject
+
+cdef extern from "Python.h":
+    double PyOS_string_to_double(const char *s, char **endptr, PyObject *overflow_exception)
+
+# Same values as fabtotum.utils.gcodetime
+DEF PLANNER_BUFFER_SIZE     = 16
+DEF MINIMUM_PLANNER_SPEED   = 0.05
+DEF PLAN_CHUNK_SIZE         = 4096
+DEF CHECKPOINT_BLOCKS       = 1000
+DEF MM_PER_ARC_SEGMENT      = 1.0
+DEF CAPACITY                = PLAN_CHUNK_SIZE + PLANNER_BUFFER_SIZE
+
+DEF NO_MARK = 0x7fffffffffffffff
+
+cdef inline bint is_space(char c):
+    # Same characters as str.split()
+    return c == ' ' or c == '\t' or c == '\n' or c == '\r' or c == '\x0b' or c == '\x0c'
+
+cdef inline bint is_word(const char *token, Py_ssize_t length, const char *word, Py_ssize_t word_length):
+    return length == word_length and memcmp(token, word, length) == 0
+
+cdef inline bint parse_value(const char *token, Py_ssize_t length, double *value):
+    """ Parse the whole **token** as a number, like float(). """
+    cdef char *end
+    if length <= 0:
+        return False
+    value[0] = PyOS_string_to_double(token, &end, NULL)
+    if end == token:
+        PyErr_Clear()
+        return False
+    return end == token + length
+
+cdef inline int axis_index(char code):
+    if code == 'X':
+        return 0
+    elif code == 'Y':
+        return 1
+    elif code == 'Z':
+        return 2
+    elif code == 'E':
+        return 3
+    return -1
+
+cdef class Planner:
+    """
+    Simulation of the look-ahead planner of the firmware, see
+    `fabtotum.utils.gcodetime.PyPlanner`.
+
+    :param config: Motion limits
+    :type config: MotionConfig
+    """
+
+    cdef double max_feedrate[4]
+    cdef double max_acceleration[4]
+    cdef double acceleration, retract_acceleration
+    cdef double xy_jerk, z_jerk, e_jerk
+    cdef double min_feedrate, min_travel_feedrate
+
+    cdef double position[4]
+    cdef bint relative, relative_e
+    cdef double feedrate
+    cdef bint has_previous
+    cdef double previous_speed[4]
+    cdef double previous_nominal
+
+    # Moves not yet planned
+    cdef int count
+    cdef double lengths[CAPACITY]
+    cdef double accelerations[CAPACITY]
+    cdef double nominals[CAPACITY]
+    cdef double max_entries[CAPACITY]
+    cdef long long offsets[CAPACITY]
+    cdef double entries[CAPACITY + 1]
+    cdef double stop[CAPACITY]
+
+    cdef double entry
+    cdef readonly double elapsed
+    cdef readonly long long moves
+    # Pending layer starts as (move index, layer, offset), next_mark is the move index of the first one
+    cdef list layer_marks
+    cdef Py_ssize_t mark_index
+    cdef long long next_mark
+    cdef list layers
+    cdef list checkpoints
+
+    def __init__(self, config):
+        cdef int i
+        for i in range(4):
+            self.max_feedrate[i] = config.max_feedrate[i]
+            self.max_acceleration[i] = config.max_acceleration[i]
+            self.position[i] = 0.0
+        self.acceleration = config.acceleration
+        self.retract_acceleration = config.retract_acceleration
+        self.xy_jerk = config.xy_jerk
+        self.z_jerk = config.z_jerk
+        self.e_jerk = config.e_jerk
+        self.min_feedrate = config.min_feedrate
+        self.min_travel_feedrate = config.min_travel_feedrate
+
+        self.relative = False
+        self.relative_e = False
+        self.feedrate = 1500.0 / 60.0
+        self.has_previous = False
+        self.previous_nominal = 0.0
+        self.count = 0
+        self.entry = 0.0
+        self.elapsed = 0.0
+        self.moves = 0
+        self.layer_marks = []
+        self.mark_index = 0
+        self.next_mark = NO_MARK
+        self.layers = []
+        self.checkpoints = [(0, 0.0)]
+
+    cdef int add_move(self, double dx, double dy, double dz, double de, long long offset) except -1:
+        cdef double length, ax, ay, az, ae, speed, duration, t, nominal
+        cdef double vx, vy, vz, ve, acceleration, factor, jerk, max_entry
+        cdef bint extruder_only
+        cdef int n
+
+        length = sqrt(dx*dx + dy*dy + dz*dz)
+        extruder_only = length < 0.000001
+        if extruder_only:
+            length = fabs(de)
+            if length < 0.000001:
+                return 0
+        ax = fabs(dx)
+        ay = fabs(dy)
+        az = fabs(dz)
+        ae = fabs(de)
+
+        speed = self.feedrate
+        if de == 0:
+            if speed < self.min_travel_feedrate:
+                speed = self.min_travel_feedrate
+        elif speed < self.min_feedrate:
+            speed = self.min_feedrate
+
+        # Per axis feedrate limit, the time of the move is set by the slowest axis
+        duration = length / speed
+        t = ax / self.max_feedrate[0]
+        if ay / self.max_feedrate[1] > t:
+            t = ay / self.max_feedrate[1]
+        if az / self.max_feedrate[2] > t:
+            t = az / self.max_feedrate[2]
+        if ae / self.max_feedrate[3] > t:
+            t = ae / self.max_feedrate[3]
+        if t > duration:
+            duration = t
+        nominal = length / duration
+        vx = dx / duration
+        vy = dy / duration
+        vz = dz / duration
+        ve = de / duration
+
+        # Per axis acceleration limit
+        acceleration = self.retract_acceleration if extruder_only else self.acceleration
+        if acceleration * ax > self.max_acceleration[0] * length:
+            acceleration = self.max_acceleration[0] * length / ax
+        if acceleration * ay > self.max_acceleration[1] * length:
+            acceleration = self.max_acceleration[1] * length / ay
+        if acceleration * az > self.max_acceleration[2] * length:
+            acceleration = self.max_acceleration[2] * length / az
+        if acceleration * ae > self.max_acceleration[3] * length:
+            acceleration = self.max_acceleration[3] * length / ae
+
+        # Junction speed limited by the jerk settings
+        if self.has_previous and self.previous_nominal > 0.0001:
+            factor = 1.0
+            jerk = hypot(vx - self.previous_speed[0], vy - self.previous_speed[1])
+            if jerk > self.xy_jerk:
+                factor = self.xy_jerk / jerk
+            jerk = fabs(vz - self.previous_speed[2])
+            if jerk > self.z_jerk and self.z_jerk / jerk < factor:
+                factor = self.z_jerk / jerk
+            jerk = fabs(ve - self.previous_speed[3])
+            if jerk > self.e_jerk and self.e_jerk / jerk < factor:
+                factor = self.e_jerk / jerk
+            max_entry = self.previous_nominal
+            if nominal * factor < max_entry:
+                max_entry = nominal * factor
+        else:
+            # Safe speed to start from a full stop
+            max_entry = self.xy_jerk / 2
+            if fabs(vz) > self.z_jerk / 2 and self.z_jerk / 2 < max_entry:
+                max_entry = self.z_jerk / 2
+            if fabs(ve) > self.e_jerk / 2 and self.e_jerk / 2 < max_entry:
+                max_entry = self.e_jerk / 2
+            if nominal < max_entry:
+                max_entry = nominal
+
+        self.has_previous = True
+        self.previous_speed[0] = vx
+        self.previous_speed[1] = vy
+        self.previous_speed[2] = vz
+        self.previous_speed[3] = ve
+        self.previous_nominal = nominal
+
+        n = self.count
+        self.lengths[n] = length
+        self.accelerations[n] = acceleration
+        self.nominals[n] = nominal
+        self.max_entries[n] = max_entry
+        self.offsets[n] = offset
+        self.count = n + 1
+        self.moves += 1
+
+        if self.count >= CAPACITY:
+            self.plan(PLAN_CHUNK_SIZE, False)
+        return 0
+
+    cdef int add_arc(self, double x, double y, double *delta, double i, double j,
+                     double r, bint has_r, bint clockwise, long long offset) except -1:
+        cdef double dx = delta[0], dy = delta[1], dz = delta[2], de = delta[3]
+        cdef double chord, h, cx, cy, radius, start_angle, travel, angle
+        cdef double last_x, last_y, sx, sy
+        cdef long segments, k
+
+        if has_r:
+            chord = hypot(dx, dy)
+            if chord == 0:
+                return self.add_move(dx, dy, dz, de, offset)
+            # A negative radius selects the long arc
+            h = r*r - chord*chord/4
+            if h < 0.0:
+                h = 0.0
+            h = sqrt(h) / chord
+            if (not clockwise) != (r < 0):
+                h = -h
+            cx = x + dx/2 + h*dy
+            cy = y + dy/2 - h*dx
+        else:
+            cx = x + i
+            cy = y + j
+
+        radius = hypot(x - cx, y - cy)
+        start_angle = atan2(y - cy, x - cx)
+        travel = atan2(y + dy - cy, x + dx - cx) - start_angle
+        if clockwise:
+            if travel >= 0:
+                travel -= 2*M_PI
+        elif travel <= 0:
+            travel += 2*M_PI
+
+        # Helix length for the number of segments, like the firmware
+        segments = <long>(hypot(travel * radius, dz) / MM_PER_ARC_SEGMENT)
+        if segments < 1:
+            segments = 1
+        last_x = x
+        last_y = y
+        for k in range(1, segments + 1):
+            if k == segments:
+                sx = x + dx
+                sy = y + dy
+            else:
+                angle = start_angle + travel * k / segments
+                sx = cx + radius * cos(angle)
+                sy = cy + radius * sin(angle)
+            self.add_move(sx - last_x, sy - last_y, dz / segments, de / segments, offset)
+            last_x = sx
+            last_y = sy
+        return 0
+
+    cdef int plan(self, int count, bint final) except -1:
+        """
+        Plan the pending moves and account the time of the first **count** ones.
+        """
+        cdef int n = self.count
+        cdef int i, rest
+        cdef double stop_sum, next_sq, v_sq, max_entry, elapsed
+        cdef double a, d, vn, v0, v1, d_acc, d_dec, vp
+        cdef long long base
+        cdef double *entries = self.entries
+        cdef double *stop = self.stop
+        if n == 0:
+            return 0
+
+        # Reverse pass, the last move in the buffer has to stop. Without
+        # the final flush entry speeds are also limited to what allows a stop
+        # within the planner buffer.
+        for i in range(n):
+            stop[i] = 2 * self.accelerations[i] * self.lengths[i]
+        stop_sum = 0.0
+        next_sq = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+        for i in range(n - 1, -1, -1):
+            stop_sum += stop[i]
+            if i + PLANNER_BUFFER_SIZE < n:
+                stop_sum -= stop[i + PLANNER_BUFFER_SIZE]
+            v_sq = next_sq + stop[i]
+            if not final and v_sq > stop_sum:
+                v_sq = stop_sum
+            max_entry = self.max_entries[i]
+            if v_sq > max_entry * max_entry:
+                v_sq = max_entry * max_entry
+            entries[i] = v_sq
+            next_sq = v_sq
+
+        # Forward pass, the first entry speed was fixed by the previous round
+        if self.entry * self.entry < entries[0]:
+            entries[0] = self.entry * self.entry
+        for i in range(1, n):
+            v_sq = entries[i-1] + stop[i-1]
+            if entries[i] > v_sq:
+                entries[i] = v_sq
+        entries[n] = MINIMUM_PLANNER_SPEED * MINIMUM_PLANNER_SPEED
+
+        # Trapezoid time of each move
+        elapsed = self.elapsed
+        base = self.moves - n
+        if count > n:
+            count = n
+        for i in range(count):
+            while self.next_mark <= base + i:
+                self.elapsed = elapsed
+                self.pop_mark()
+
+            a = self.accelerations[i]
+            d = self.lengths[i]
+            vn = self.nominals[i]
+            v0 = sqrt(entries[i])
+            v1 = sqrt(entries[i+1])
+            if v0 > vn:
+                v0 = vn
+            if v1 > vn:
+                v1 = vn
+            d_acc = (vn*vn - v0*v0) / (2*a)
+            d_dec = (vn*vn - v1*v1) / (2*a)
+            if d_acc + d_dec <= d:
+                elapsed += (vn - v0) / a + (vn - v1) / a + (d - d_acc - d_dec) / vn
+            else:
+                # Never reaches the nominal speed
+                vp = (2*a*d + v0*v0 + v1*v1) / 2
+                if v1*v1 > vp:
+                    vp = v1*v1
+                if v0*v0 > vp:
+                    vp = v0*v0
+                vp = sqrt(vp)
+                elapsed += (vp - v0) / a + (vp - v1) / a
+
+            if (base + i + 1) % CHECKPOINT_BLOCKS == 0:
+                self.checkpoints.append( (self.offsets[i], elapsed) )
+
+        self.elapsed = elapsed
+        self.entry = sqrt(entries[count]) if count < n else MINIMUM_PLANNER_SPEED
+        rest = n - count
+        if rest:
+            memmove(self.lengths, self.lengths + count, rest * sizeof(double))
+            memmove(self.accelerations, self.accelerations + count, rest * sizeof(double))
+            memmove(self.nominals, self.nominals + count, rest * sizeof(double))
+            memmove(self.max_entries, self.max_entries + count, rest * sizeof(double))
+            memmove(self.offsets, self.offsets + count, rest * sizeof(long long))
+        self.count = rest
+        return 0
+
+    cdef int pop_mark(self) except -1:
+        """ Record the first pending layer start at the current elapsed time. """
+        index, layer, offset = self.layer_marks[self.mark_index]
+        self.layers.append( (layer, offset, self.elapsed) )
+        self.checkpoints.append( (offset, self.elapsed) )
+        self.mark_index += 1
+        if self.mark_index < len(self.layer_marks):
+            self.next_mark = self.layer_marks[self.mark_index][0]
+        else:
+            self.layer_marks = []
+            self.mark_index = 0
+            self.next_mark = NO_MARK
+        return 0
+
+    def synchronize(self):
+        """
+        Plan all the pending moves, like the firmware does when it waits for
+        the planner buffer to be empty.
+        """
+        self.plan(self.count, True)
+        self.entry = 0.0
+        self.has_previous = False
+        self.previous_nominal = 0.0
+
+    def mark_layer(self, layer, long long offset):
+        """ Record the start of **layer** before the next move. """
+        if not self.layer_marks:
+            self.next_mark = self.moves
+        self.layer_marks.append( (self.moves, layer, offset) )
+
+    cdef int process(self, const char *line, Py_ssize_t length, long long offset) except -1:
+        """
+        Process a gcode line without comments.
+        """
+        cdef Py_ssize_t pos = 0, start, size
+        cdef const char *command
+        cdef Py_ssize_t command_length
+        cdef const char *token
+        cdef double value, x, y, i = 0.0, j = 0.0, r = 0.0
+        cdef double delta[4]
+        cdef bint has_r = False, arc
+        cdef int axis
+        cdef char code
+
+        while pos < length and is_space(line[pos]):
+            pos += 1
+        if pos == length:
+            return 0
+        start = pos
+        while pos < length and not is_space(line[pos]):
+            pos += 1
+        command = line + start
+        command_length = pos - start
+
+        if command_length == 2 and command[0] == 'G' and '0' <= command[1] <= '3':
+            arc = command[1] == '2' or command[1] == '3'
+            x = self.position[0]
+            y = self.position[1]
+            delta[0] = delta[1] = delta[2] = delta[3] = 0.0
+            while True:
+                while pos < length and is_space(line[pos]):
+                    pos += 1
+                if pos == length:
+                    break
+                start = pos
+                while pos < length and not is_space(line[pos]):
+                    pos += 1
+                token = line + start
+                size = pos - start
+                if not parse_value(token + 1, size - 1, &value):
+                    continue
+                code = token[0]
+                if code == 'F':
+                    if value > 0:
+                        self.feedrate = value / 60.0
+                    continue
+                axis = axis_index(code)
+                if axis < 0:
+                    if code == 'I':
+                        i = value
+                    elif code == 'J':
+                        j = value
+                    elif code == 'R':
+                        r = value
+                        has_r = True
+                    continue
+                if self.relative or (axis == 3 and self.relative_e):
+                    delta[axis] = value
+                    self.position[axis] += value
+                else:
+                    delta[axis] = value - self.position[axis]
+                    self.position[axis] = value
+            if arc:
+                self.add_arc(x, y, delta, i, j, r, has_r, command[1] == '2', offset)
+            else:
+                self.add_move(delta[0], delta[1], delta[2], delta[3], offset)
+        elif is_word(command, command_length, 'G90', 3):
+            self.relative = False
+        elif is_word(command, command_length, 'G91', 3):
+            self.relative = True
+        elif is_word(command, command_length, 'M82', 3):
+            self.relative_e = False
+        elif is_word(command, command_length, 'M83', 3):
+            self.relative_e = True
+        elif is_word(command, command_length, 'G92', 3):
+            while True:
+                while pos < length and is_space(line[pos]):
+                    pos += 1
+                if pos == length:
+                    break
+                start = pos
+                while pos < length and not is_space(line[pos]):
+                    pos += 1
+                axis = axis_index(line[start])
+                if axis >= 0 and parse_value(line + start + 1, pos - start - 1, &value):
+                    self.position[axis] = value
+        elif (is_word(command, command_length, 'G4', 2) or
+              is_word(command, command_length, 'G28', 3) or
+              is_word(command, command_length, 'G29', 3) or
+              is_word(command, command_length, 'G30', 3) or
+              is_word(command, command_length, 'M400', 4) or
+              is_word(command, command_length, 'M109', 4) or
+              is_word(command, command_length, 'M190', 4) or
+              is_word(command, command_length, 'M0', 2) or
+              is_word(command, command_length, 'M1', 2)):
+            self.synchronize()
+            if is_word(command, command_length, 'G4', 2):
+                while True:
+                    while pos < length and is_space(line[pos]):
+                        pos += 1
+                    if pos == length:
+                        break
+                    start = pos
+                    while pos < length and not is_space(line[pos]):
+                        pos += 1
+                    if not parse_value(line + start + 1, pos - start - 1, &value):
+                        continue
+                    if line[start] == 'P':
+                        self.elapsed += value / 1000.0
+                    elif line[start] == 'S':
+                        self.elapsed += value
+            elif is_word(command, command_length, 'G28', 3):
+                self.position[0] = self.position[1] = self.position[2] = 0.0
+        return 0
+
+    def process_line(self, line, long long offset = 0):
+        """
+        Process a gcode line without comments.
+
+        :param offset: Byte offset of the end of the line
+        """
+        if isinstance(line, unicode):
+            line = line.encode('utf-8')
+        cdef bytes data = line
+        self.process(data, len(data), offset)
+
+    def process_block(self, bytes data, long long offset, get_layer = None):
+        """
+        Process complete lines of a file, comments included. Only the last
+        line of the file may have no newline.
+
+        :param data: File content
+        :param offset: Byte offset of **data** in the file
+        :param get_layer: Function returning the layer started by a line with a comment or ``None``
+        """
+        cdef const char *buffer = data
+        cdef Py_ssize_t size = len(data)
+        cdef Py_ssize_t pos = 0, end, line_end
+        cdef const char *newline
+        cdef const char *comment
+
+        while pos < size:
+            newline = <const char *>memchr(buffer + pos, '\n', size - pos)
+            if newline:
+                line_end = newline - buffer
+                end = line_end + 1
+            else:
+                line_end = end = size
+
+            comment = <const char *>memchr(buffer + pos, ';', line_end - pos)
+            if comment:
+                if get_layer is not None:
+                    layer = get_layer( PyBytes_FromStringAndSize(buffer + pos, line_end - pos) )
+                    if layer is not None:
+                        self.mark_layer(layer, offset + end)
+                line_end = comment - buffer
+
+            self.process(buffer + pos, line_end - pos, offset + end)
+            pos = end
+
+    def finish(self):
+        """
+        Plan the remaining moves.
+
+        :returns: Total time, checkpoints and layer starts, see `TimeEstimate`
+        :rtype: tuple
+        """
+        self.synchronize()
+        for index, layer, offset in self.layer_marks[self.mark_index:]:
+            self.layers.append( (layer, offset, self.elapsed) )
+        self.layer_marks = []
+        self.mark_index = 0
+        self.next_mark = NO_MARK
+        return self.elapsed, self.checkpoints, self.layers
@@ -1,4 +1,5 @@
 from distutils.core import setup, Extension
+from distutils import sysconfig
 import os, sys
 import subprocess
 
@@ -51,31 +52,56 @@ def pkgconfig(*packages, **kw):
     
 ################################################################################
 
-# Ensure C++ compiler is used
-os.environ["CC"] = os.environ["CXX"]
-
-#~ pkgcfg_args = pkgconfig('opencv')
-
-# Add NumPY include path
+# Extensions are built in place into the fabui python tree with
+#   python setup.py build_ext --inplace
+package_dir = {
+    'printrun'          : os.path.join('..', 'fabui', 'ext', 'py', 'printrun'),
+    'fabtotum.speedups' : os.path.join('..', 'fabui', 'ext', 'py', 'fabtotum', 'speedups')
+}
+
+ext_modules = []
+
+# GCoder line class and parser, optional: printrun.gcoder falls back to the
+# pure python implementation. The generated C source is used without Cython.
+# The print time planner is optional as well, fabtotum.utils.gcodetime falls
+# back to its python planner.
+try:
+    from Cython.Build import cythonize
+    ext_modules += cythonize([ Extension('printrun.gcoder_line', sources=["gcoder_line.pyx"]),
+                               Extension('fabtotum.speedups.gcodetime_planner', sources=["gcodetime_planner.pyx"]) ])
+except ImportError:
+    ext_modules.append( Extension('printrun.gcoder_line', sources=["gcoder_line.c"]) )
+    ext_modules.append( Extension('fabtotum.speedups.gcodetime_planner', sources=["gcodetime_planner.c"]) )
+
+# Triangulation needs the colibri-buildroot toolchain and sysroot
 sysroot = os.environ.get('_python_sysroot')
-vi = sys.version_info
-python_subdir = "python{0}.{1}".format(vi.major, vi.minor)
-numpy_inc = os.path.join(sysroot, 'usr/lib', python_subdir, 'site-packages/numpy/core/include')
-
-#~ pkgcfg_args['include_dirs'].append(numpy_inc)
-#~ pkgcfg_args['libraries'].append('boost_python')
-#~ pkgcfg_args['extra_link_args'].append('-DMY_FLAG')
 
-extra_compile_args = sysconfig.get_config_var('CFLAGS').split()
-extra_compile_args += ["-std=c++11", "-Wall", "-Wextra"]
-
-hello_ext = Extension('fabtotum.speedups.triangulation',
-                    sources=["triangulation.cpp", 
-                             "pyboost_cv2_converter.cpp", 
-                             "pyboost_cv3_converter.cpp"],
-                    extra_compile_args=extra_compile_args,
-                    #~ **pkgcfg_args
-                 )
+if sysroot:
+    # Ensure C++ compiler is used
+    os.environ["CC"] = os.environ["CXX"]
+    
+    #~ pkgcfg_args = pkgconfig('opencv')
+    
+    # Add NumPY include path
+    vi = sys.version_info
+    python_subdir = "python{0}.{1}".format(vi.major, vi.minor)
+    numpy_inc = os.path.join(sysroot, 'usr/lib', python_subdir, 'site-packages/numpy/core/include')
+    
+    #~ pkgcfg_args['include_dirs'].append(numpy_inc)
+    #~ pkgcfg_args['libraries'].append('boost_python')
+    #~ pkgcfg_args['extra_link_args'].append('-DMY_FLAG')
+    
+    extra_compile_args = sysconfig.get_config_var('CFLAGS').split()
+    extra_compile_args += ["-std=c++11", "-Wall", "-Wextra"]
+    
+    hello_ext = Extension('fabtotum.speedups.triangulation',
+                        sources=["triangulation.cpp", 
+                                 "pyboost_cv2_converter.cpp", 
+                                 "pyboost_cv3_converter.cpp"],
+                        extra_compile_args=extra_compile_args,
+                        #~ **pkgcfg_args
+                     )
+    ext_modules.append(hello_ext)
 
 setup (
     name            = 'speedups',
@@ -83,6 +109,7 @@ setup (
     author          = 'Daniel Kesler',
     author_email    = 'kesler.daniel@gmail.com',
     license         = 'GPLv3',
-    description     = 'Triangulation accelerator',
-    ext_modules     = [hello_ext]
+    description     = 'Triangulation, GCoder and print time accelerators',
+    package_dir     = package_dir,
+    ext_modules     = ext_modules
 )